@@ -25,6 +25,9 @@ from .currency_feature import CurrencyFeature								# 💱 Фіча для пе
 # 📋 Кнопки головного меню
 from .main_menu_feature import MainMenuFeature										# 📋 Фіча з головним меню (inline/reply клавіатури)
 
+# 🧵 Трейси повільних запитів (/traces)
+from .traces_feature import TracesFeature									# 🧵 Адмін-фіча з водоспадами трейсів
+
 
 # ================================
 # 🔓 ЕКСПОРТ АПІ ПАКЕТУ
@@ -34,4 +37,5 @@ __all__ = [															# 🔓 Обмежуємо публічний API па
     "CoreCommandsFeature",												# 📬 Базові команди (/start, /help)
     "CurrencyFeature",
     "MainMenuFeature",												# 📋 Головне меню бота
+    "TracesFeature",												# 🧵 Водоспади повільних запитів
 ]
@@ -0,0 +1,126 @@
+# 🧵 app/bot/commands/traces_feature.py
+"""
+🧵 Адмін-команда `/traces [N]` — останні повільні запити у вигляді водоспадів.
+
+🔹 Бере завершені трейси з буфера `Tracer` (поріг `slow_ms`)
+🔹 Кожен трейс — окреме повідомлення `<pre>` із рендером `render_waterfall`
+🔹 Доступ лише для `admin_user_ids` (порожній список — команда нікому не доступна)
+"""
+
+from __future__ import annotations
+
+# 🌐 Зовнішні бібліотеки
+from telegram import Update                                                # ✉️ Подія від Telegram
+from telegram.ext import Application, CommandHandler                       # 🤖 Реєстрація команд у застосунку
+
+# 🔠 Системні імпорти
+import html                                                                # 🛡️ Екранування для <pre>
+import logging                                                             # 🧾 Логування операцій
+from typing import Collection, FrozenSet, cast                             # 🧰 Типізація
+
+# 🧩 Внутрішні модулі проєкту
+from app.bot.commands.base import BaseFeature                              # 🏛️ Базовий контракт фічі
+from app.bot.services.custom_context import CustomContext                  # 🧠 Кастомний контекст апдейту
+from app.bot.services.types import CallbackHandlerType                     # 🔗 Сигнатура обробника
+from app.bot.ui import static_messages as msg                              # 📝 Статичні повідомлення
+from app.config.setup.constants import AppConstants                        # ⚙️ Константи застосунку
+from app.errors.error_handler import make_error_handler                    # 🛡️ Обгортка для безпечного виклику
+from app.errors.exception_handler_service import ExceptionHandlerService   # 🚑 Централізована обробка помилок
+from app.shared.tracing import Tracer, render_waterfall                    # 🧵 Трейси та водоспад
+from app.shared.utils.logger import LOG_NAME                               # 🏷️ Ім'я кореневого логера
+
+# ================================
+# 🧾 ЛОГЕР ТА КОНСТАНТИ МОДУЛЯ
+# ================================
+logger = logging.getLogger(LOG_NAME)                                       # 🧾 Модульний логер
+_DEFAULT_LIMIT = 5                                                         # 🔢 Скільки трейсів без аргументу
+_MAX_LIMIT = 20                                                            # 🚧 Верхня межа N
+_MAX_MESSAGE_CHARS = 3900                                                  # ✂️ Запас до ліміту Telegram (4096)
+
+
+# ================================
+# 🧵 ФІЧА ТРЕЙСІВ
+# ================================
+class TracesFeature(BaseFeature):
+    """
+    🧵 Показує останні повільні запити з розбивкою часу по етапах.
+    """
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        constants: AppConstants,
+        exception_handler: ExceptionHandlerService,
+        *,
+        slow_ms: float = 0.0,
+        admin_user_ids: Collection[int] = (),
+    ) -> None:
+        self.tracer = tracer                                               # 🧵 Джерело завершених трейсів
+        self.const = constants                                             # ⚙️ Команди та UI-константи
+        self.slow_ms = max(0.0, float(slow_ms))                            # 🐢 Поріг «повільного» запиту
+        self.admin_user_ids: FrozenSet[int] = frozenset(int(uid) for uid in admin_user_ids)  # 🔐 Дозволені користувачі
+
+        safe_wrapper = make_error_handler(exception_handler)               # 🛡️ Фабрика безпечних викликів
+        self._safe_show_traces = cast(
+            CallbackHandlerType,
+            safe_wrapper(self.show_traces),
+        )                                                                  # 🧰 Безпечний обробник /traces
+        logger.info("🧵 TracesFeature initialised (slow_ms=%.0f)", self.slow_ms)
+        if not self.admin_user_ids:
+            logger.warning("🔐 telemetry.traces.admin_user_ids порожній — /traces недоступна нікому.")
+
+    # ================================
+    # 🔌 РЕЄСТРАЦІЯ КОМАНД
+    # ================================
+    def register_handlers(self, application: Application) -> None:
+        """
+        Реєструє командний обробник `/traces`.
+        """
+        commands = self.const.LOGIC.COMMANDS                               # 🧭 Простір імен команд
+        application.add_handler(CommandHandler(commands.TRACES, self._safe_show_traces))  # ➕ /traces
+        logger.info("📝 Traces command registered (/traces)")               # 🧾 Фіксуємо реєстрацію
+
+    # ================================
+    # 🧵 ПОКАЗ ТРЕЙСІВ
+    # ================================
+    async def show_traces(self, update: Update, context: CustomContext) -> None:
+        """
+        Відправляє водоспади N останніх повільних запитів.
+        """
+        if update.message is None:
+            return
+        user_id = getattr(update.effective_user, "id", None)
+        if user_id is None or user_id not in self.admin_user_ids:         # 🔐 Порожній список — доступ закрито
+            logger.warning("🔐 /traces denied for user=%s", user_id)        # 🧾 Аудит спроби доступу
+            await update.message.reply_text(msg.TRACES_FORBIDDEN)
+            return
+
+        limit = self._parse_limit(update.message.text or "")              # 🔢 N з аргументу команди
+        traces = self.tracer.recent_slow(limit, min_ms=self.slow_ms)      # 🐢 Найновіші повільні трейси
+        if not traces:
+            await update.message.reply_text(msg.TRACES_EMPTY.format(slow_ms=int(self.slow_ms)))
+            return
+
+        parse_mode = self.const.UI.DEFAULT_PARSE_MODE                      # 🅿️ Єдиний parse_mode
+        for trace in traces:
+            body = render_waterfall(trace)[:_MAX_MESSAGE_CHARS]           # 🌊 Текстовий водоспад
+            await update.message.reply_text(f"<pre>{html.escape(body)}</pre>", parse_mode=parse_mode)
+        logger.info("🧵 /traces shown (%d of limit %d)", len(traces), limit)  # 🧾 Лог дії
+
+    # ================================
+    # 🧰 ДОПОМІЖНІ МЕТОДИ
+    # ================================
+    @staticmethod
+    def _parse_limit(raw: str) -> int:
+        """🔢 `/traces 7` → 7; без аргументу чи з некоректним — значення за замовчуванням."""
+        parts = raw.split(maxsplit=1)
+        if len(parts) < 2:
+            return _DEFAULT_LIMIT
+        try:
+            value = int(parts[1].strip())
+        except ValueError:
+            return _DEFAULT_LIMIT
+        return max(1, min(_MAX_LIMIT, value))
+
+
+__all__ = ["TracesFeature"]
@@ -11,8 +11,9 @@
 # 🧩 Внутрішні модулі проєкту
 from .product_handler import ProductHandler									# 🛍️ Обробка сторінки товару (парсинг, побудова повідомлень)
 from .collection_handler import CollectionHandler							# 📚 Обробка сторінок колекцій (оркестрація, пагінація)
-from .collection_runner import CollectionRunner							# 🏃 Запуск/планування задач по колекціях (ітерація елементів)
+from .collection_runner import CollectionPipelineSettings, CollectionRunner	# 🏃 Запуск/планування задач по колекціях (ітерація елементів)
 from .image_sender import ImageSender									# 🖼️ Надсилання зображень товарів у Telegram
+from .progressive_card import ProgressiveCardSender						# 📬 Прогресивна доставка картки
 
 
 # ================================
@@ -22,5 +23,7 @@ __all__ = [
     "ProductHandler",												# 🛍️ Для роботи з окремими товарами
     "CollectionHandler",											# 📚 Для роботи з колекціями
     "CollectionRunner",											# 🏃 Хелпер для циклів/задач по колекціях
+    "CollectionPipelineSettings",									# 📤 Налаштування конвеєра надсилання
     "ImageSender",												# 🖼️ Утиліта надсилання зображень у чат
+    "ProgressiveCardSender",										# 📬 Streaming-доставка картки товару
 ]
@@ -28,11 +28,15 @@ from app.infrastructure.collection_processing.collection_processing_service impo
     CollectionProcessingService,
 )                                                                          # 🧵 Сервіс збору посилань з колекції
 from app.domain.products.entities import Url                               # 🔗 Value-object посилання продукту
+from app.infrastructure.services.collection_job_store import CollectionJobStore  # 💾 Чекпоінти запусків колекцій
+from app.infrastructure.services.seen_products_index import SeenProductsIndex  # 🗂️ Індекс уже оброблених товарів
+from app.shared.utils.adaptive_limiter import AdaptiveConcurrencyLimiter   # 🚦 AIMD-обмежувач паралелізму
 from app.shared.utils.logger import LOG_NAME                               # 🏷️ Ім'я логера
 from app.shared.utils.url_parser_service import UrlParserService           # 🔎 Парсер/валідація URL + регіон
 from .collection_runner import (                                           # 🏃 Оркестратор багатопотокової обробки
     CollectionItemState,
     CollectionItemStatus,
+    CollectionPipelineSettings,
     CollectionProgressSnapshot,
     CollectionRunner,
 )
@@ -72,11 +76,17 @@ class CollectionHandler:
         max_items: Optional[int] = 50,
         concurrency: int = 4,
         per_item_retries: int = 2,
+        seen_index: Optional[SeenProductsIndex] = None,
+        changed_only: bool = False,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        pipeline: Optional[CollectionPipelineSettings] = None,
+        job_store: Optional[CollectionJobStore] = None,
     ) -> None:
         self._url_parser = url_parser_service									# 🔎 Сервіс валідації/розбору URL та визначення регіону
         self._proc_service = collection_processing_service						# 🧵 Джерело посилань товарів із сторінки колекції
         self._exception_handler = exception_handler							# 🧯 Єдина точка обробки винятків
         self._const = constants											# ⚙️ Константи застосунку (UI/логіка/ліміти)
+        self._changed_only_default = bool(changed_only)						# ⏭️ Режим «лише змінені» за замовчуванням
 
         # М'яке читання блоків із констант (не ламаємо старі конфіги)
         coll_cfg = getattr(getattr(self._const, "COLLECTION", object()), "__dict__", {})	# 🧩 Опційний неймспейс COLLECTION
@@ -93,24 +103,43 @@ class CollectionHandler:
             concurrency=eff_concurrency,								# 🧵 Скільки одночасних воркерів
             per_item_retries=eff_retries,								# ♻️ Скільки спроб для одного товару
             progress_interval_sec=eff_progress_sec,						# ⏱️ Дельта між апдейтами прогресу
+            seen_index=seen_index,									# 🗂️ handle → fingerprint по колекціях
+            limiter=limiter,										# 🚦 Адаптивний ліміт (None — фіксований concurrency)
+            pipeline=pipeline,										# 📤 Відправники / черга / порядок джерела
+            job_store=job_store,									# 💾 Продовження перерваних запусків
         )
         logger.info(
-            "🧾 CollectionHandler init max_items=%s concurrency=%s per_item_retries=%s progress_interval=%s",
+            "🧾 CollectionHandler init max_items=%s concurrency=%s adaptive=%s per_item_retries=%s progress_interval=%s changed_only=%s pipeline=%s",
             self._max_items,
             eff_concurrency,
+            f"{limiter.settings.min_limit}..{limiter.settings.max_limit}" if limiter else "off",
             eff_retries,
             eff_progress_sec,
+            self._changed_only_default,
+            pipeline,
         )                                                                 # 🧾 Фіксуємо конфіг DI
 
     # ==========================
     # ▶️ ПУБЛІЧНИЙ МЕТОД
     # ==========================
-    async def handle_collection(self, update: Update, context: CustomContext, url: Optional[str] = None) -> None:
+    async def handle_collection(
+        self,
+        update: Update,
+        context: CustomContext,
+        url: Optional[str] = None,
+        *,
+        changed_only: Optional[bool] = None,
+        preserve_order: Optional[bool] = None,
+    ) -> None:
         """
         Приймає посилання на колекцію, запускає обробку та показує прогрес.
+
+        `changed_only=True` — надсилати лише нові/змінені товари (None — значення з конфігу).
+        `preserve_order=True` — картки надсилаються в порядку колекції (None — значення з конфігу).
         """
         progress_msg: Optional[Message] = None								# 💬 Повідомлення, яке оновлюємо під час прогресу
         can_edit_progress = True										# 🛡️ Після першої помилки редагування — більше не пробуємо
+        last_progress_text = ""										# 🪞 Останній показаний текст (без дубль-редагувань)
         user_id: str = "unknown"										# 🆔 Ініціалізація для логів (перед guard)
         effective_url: str = ""										# 🔗 Початковий URL (може не бути заданий)
 
@@ -191,13 +220,14 @@ class CollectionHandler:
                 return getattr(context, "mode", None) != collection_mode_value	# 🛑 Якщо юзер змінив режим — зупиняємося
 
             async def _on_progress(snapshot: CollectionProgressSnapshot) -> None:
-                nonlocal can_edit_progress
+                nonlocal can_edit_progress, last_progress_text
                 if progress_msg and can_edit_progress:
+                    text = self._build_progress_text(snapshot)
+                    if text == last_progress_text:
+                        return								# 🪞 «Message is not modified» вимкнув би редагування
                     try:
-                        await progress_msg.edit_text(
-                            self._build_progress_text(snapshot),
-                            parse_mode=parse_mode,
-                        )
+                        await progress_msg.edit_text(text, parse_mode=parse_mode)
+                        last_progress_text = text
                     except Exception:
                         can_edit_progress = False
 
@@ -205,24 +235,48 @@ class CollectionHandler:
             # ▶️ ЗАПУСК RUNNER
             # ==========================
             logger.info("🚀 Collection runner start user=%s total_urls=%s", user_id, len(urls))
+            effective_changed_only = self._changed_only_default if changed_only is None else bool(changed_only)
             done_count, health_summary = await self._runner.run(
-                update, context, urls, _on_progress, _is_cancelled
+                update,
+                context,
+                urls,
+                _on_progress,
+                _is_cancelled,
+                collection_url=effective_url,
+                changed_only=effective_changed_only,
+                job_owner=None if user_id == "unknown" else str(user_id),
+                preserve_order=preserve_order,
             )												# 🚀 Паралельна обробка посилань з колекції
 
             logger.info("🏁 Collection finished user=%s processed=%s", user_id, done_count)
             logger.info(
-                "🩺 Collection health: total=%d ok=%d alt_fallback=%d failed=%d",
+                "🩺 Collection health: total=%d ok=%d alt_fallback=%d failed=%d skipped=%d resumed_done=%d deduplicated=%d",
                 health_summary.total,
                 health_summary.ok,
                 health_summary.alt_fallback,
                 health_summary.failed,
+                health_summary.skipped,
+                health_summary.resumed_done,
+                health_summary.deduplicated,
             )
-            if health_summary.total:
+            if not health_summary.total and health_summary.skipped:
+                if progress_msg and can_edit_progress:
+                    with contextlib.suppress(Exception):
+                        await progress_msg.edit_text(
+                            msg.COLL_NOTHING_CHANGED.format(skipped=health_summary.skipped)
+                        )										# ♻️ Усе без змін — нічого не надсилаємо
+            elif health_summary.total or health_summary.resumed:
                 summary_text = msg.COLL_HEALTH_SUMMARY.format(
                     ok=health_summary.ok,
                     alt_fallback=health_summary.alt_fallback,
                     failed=health_summary.failed,
                 )
+                if health_summary.skipped:
+                    summary_text += "\n" + msg.COLL_SKIPPED_UNCHANGED.format(skipped=health_summary.skipped)
+                if health_summary.resumed:
+                    summary_text += "\n" + msg.COLL_RESUMED.format(done=health_summary.resumed_done)
+                if health_summary.deduplicated:
+                    summary_text += "\n" + msg.COLL_DEDUPLICATED.format(count=health_summary.deduplicated)
                 await context.bot.send_message(
                     chat_id=user_id,
                     text=summary_text,
@@ -3,23 +3,29 @@
 🏃 CollectionRunner — керує паралельною обробкою товарів з колекції.
 
 🔹 Можливості:
-    • Обмежує паралелізм через семафор (керований рівень concurrency)
+    • Адаптивний (AIMD) паралелізм: ліміт росте на здорових вікнах і падає на 429 / Cloudflare / таймаутах
     • Ретраї з експоненційною затримкою для кожного товару (exponential backoff)
-    • Троттлить оновлення прогресу, щоб не заспамити UI-редагуваннями
+    • Конвеєр «підготовка → надсилання»: обмежена черга, власний паралелізм і пауза відправників
+    • Опційний порядок джерела: буфер перевпорядкування з обмеженим вікном
+    • Один тікер прогресу: рендер не частіше за `progress_interval_sec` і лише за dirty-прапорцем
     • Акуратно завершує задачі при `CancelledError` (graceful cancellation)
+    • Чекпоінти завдання (`CollectionJobStore`): перерваний запуск продовжується з незавершених товарів
+    • Режим «лише змінені»: пропускає товари з тим самим fingerprint у `SeenProductsIndex`
+    • Трейс `collection.item` на кожен товар: обробка й надсилання в одному водоспаді
 """
 
 # 🌐 Зовнішні бібліотеки
 from telegram import Update                                             # 📬 Telegram Update (використовується у handler)
+from telegram.error import RetryAfter, TimedOut                         # 🚦 Тротлінг з боку Telegram
 
 # 🔠 Системні імпорти
 import asyncio                                                          # 🔄 Асинхронність / таски / семафори
 import contextlib                                                       # 🧰 Безпечне подавлення винятків
 import logging                                                          # 🧾 Логування подій
 import time                                                             # ⏱️ Вимірювання часу для тротлінгу
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Awaitable, Callable, List, Optional, Sequence, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
 # 🧩 Внутрішні модулі проєкту
 from app.bot.handlers.product.product_handler import (                  # 🛍️ Обробник одного товару (UI‑шар)
@@ -28,7 +34,29 @@ from app.bot.handlers.product.product_handler import (                  # 🛍
 )
 from app.bot.services.custom_context import CustomContext               # 🧠 Розширений контекст бота
 from app.infrastructure.services.collection_health import CollectionHealthSummary  # 🩺 Звіти про здоров'я колекції
+from app.infrastructure.services.collection_job_store import CollectionJob, CollectionJobStore  # 💾 Чекпоінти запусків
+from app.infrastructure.services.seen_products_index import (           # 🗂️ Індекс уже оброблених товарів
+    SeenProductsIndex,
+    product_fingerprint,
+)
+from app.shared.cache.product_hints_cache import ProductHintsCache      # 🧷 Підказки з products.json
+from app.shared.errors import CloudflareBlockError, HttpError, RequestTimeout  # 🚨 Сигнали перевантаження
+from app.shared.metrics.collection import (                             # 📈 Ліміт паралелізму / конвеєр
+    COLLECTION_CONCURRENCY_LIMIT,
+    COLLECTION_PIPELINE_BUFFER_DEPTH,
+    COLLECTION_SEND_LAG_SECONDS,
+)
+from app.shared.tracing import STATUS_ERROR, STATUS_OK, Trace, get_tracer  # 🧵 Трейси товарів колекції
+from app.shared.utils.adaptive_limiter import (                         # 🚦 AIMD-обмежувач паралелізму
+    AdaptiveConcurrencyLimiter,
+    AdaptiveLimitSettings,
+    LimiterSignal,
+)
 from app.shared.utils.logger import LOG_NAME                            # 🏷️ Ім'я логера з єдиного централізованого місця
+from app.shared.utils.single_flight import (                            # 🛬 Дедуплікація спільної роботи
+    SingleFlightRegistry,
+    activate as activate_single_flight,
+)
 
 
 # ==========================
@@ -36,6 +64,10 @@ from app.shared.utils.logger import LOG_NAME                            # 🏷
 # ==========================
 logger = logging.getLogger(LOG_NAME)
 
+_THROTTLE_MARKERS = ("429", "too many requests", "rate limit", "cloudflare", "timeout", "timed out")  # 🚦 Ознаки перевантаження
+_THROTTLE_ERRORS = (CloudflareBlockError, RequestTimeout, RetryAfter, TimedOut, TimeoutError)
+_THROTTLE_STATUSES = {429, 503}
+
 
 class CollectionItemState(str, Enum):
     """Стан окремого товару в рамках колекції."""
@@ -71,6 +103,23 @@ class CollectionProgressSnapshot:
     statuses: Tuple[CollectionItemStatus, ...]
 
 
+@dataclass(frozen=True)
+class CollectionPipelineSettings:
+    """Налаштування конвеєра «підготовка → надсилання»."""
+
+    send_concurrency: int = 1                                           # 📤 Скільки карток надсилаємо одночасно
+    send_interval_sec: float = 0.0                                      # ⏱️ Мінімальна пауза між стартами надсилань
+    queue_size: int = 8                                                 # 📥 Межа черги готових карток (backpressure)
+    preserve_order: bool = False                                        # 🔢 Надсилати в порядку колекції
+    reorder_window: int = 8                                             # 🪟 Наскільки підготовка може випереджати надсилання
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "send_concurrency", max(1, int(self.send_concurrency)))
+        object.__setattr__(self, "send_interval_sec", max(0.0, float(self.send_interval_sec)))
+        object.__setattr__(self, "queue_size", max(1, int(self.queue_size)))
+        object.__setattr__(self, "reorder_window", max(1, int(self.reorder_window)))
+
+
 # ==========================
 # 🏛️ КЛАС RUNNER
 # ==========================
@@ -85,20 +134,34 @@ class CollectionRunner:
         concurrency: int = 4,
         per_item_retries: int = 2,
         progress_interval_sec: float = 2.5,
+        seen_index: Optional[SeenProductsIndex] = None,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        pipeline: Optional[CollectionPipelineSettings] = None,
+        job_store: Optional[CollectionJobStore] = None,
     ) -> None:
         """
         ⚙️ Ініціалізує Runner необхідними залежностями та політиками виконання.
 
         Args:
             product_handler: Обробник одного товару (UI‑шар), який уміє опрацьовувати URL.
-            concurrency: Скільки товарів обробляємо одночасно (розмір семафора).
+            concurrency: Скільки товарів обробляємо одночасно (фіксовано, якщо `limiter` не передано).
             per_item_retries: Кількість повторних спроб на один URL (включно з першою спробою + N ретраїв).
             progress_interval_sec: Мінімальний інтервал між оновленнями прогресу (сек).
+            seen_index: Персистентний індекс handle → fingerprint (для режиму «лише змінені»).
+            limiter: Адаптивний обмежувач паралелізму; переживає запуски, тож вивчений ліміт зберігається.
+            pipeline: Паралелізм/пауза відправників, межа черги та режим порядку джерела.
+            job_store: Чекпоінти завдань (стан товарів + id повідомлень) для продовження після перерви.
         """
         self._product_handler = product_handler								# 🛍️ Зберігаємо посилання на UI‑обробник товару
-        self._sem = asyncio.Semaphore(concurrency)							# 🚦 Семафор лімітує кількість одночасних задач
+        self._limiter = limiter or AdaptiveConcurrencyLimiter(
+            AdaptiveLimitSettings(initial=concurrency, min_limit=concurrency, max_limit=concurrency),
+            on_change=COLLECTION_CONCURRENCY_LIMIT.set,
+        )																	# 🚦 Лімітує кількість одночасних задач
         self._retries = per_item_retries									# 🔁 Політика кількості ретраїв на товар
         self._progress_interval = progress_interval_sec						# ⏱️ Мінімальний інтервал пушів прогресу
+        self._seen_index = seen_index										# 🗂️ Індекс оброблених товарів (опційно)
+        self._pipeline = pipeline or CollectionPipelineSettings()			# 📤 Конвеєр надсилання
+        self._job_store = job_store											# 💾 Чекпоінти завдань (опційно)
 
     # ==========================
     # ▶️ ПУБЛІЧНИЙ МЕТОД
@@ -110,84 +173,131 @@ class CollectionRunner:
         urls: List[str],
         on_progress: Callable[[CollectionProgressSnapshot], Awaitable[None]],
         is_cancelled: Callable[[], bool],
+        *,
+        collection_url: Optional[str] = None,
+        changed_only: bool = False,
+        job_owner: Optional[str] = None,
+        preserve_order: Optional[bool] = None,
     ) -> tuple[int, CollectionHealthSummary]:
         """
         ▶️ Запускає обробку списку URL з контролем паралелізму, ретраїв і тротлінгу.
 
+        Args:
+            collection_url: URL колекції — ключ для `SeenProductsIndex` (без нього індекс не використовується).
+            changed_only: Пропустити товари, fingerprint яких не змінився з попереднього запуску.
+            job_owner: Власник завдання (чат); разом з `collection_url` вмикає чекпоінти й продовження.
+            preserve_order: Перевизначає `pipeline.preserve_order` для цього запуску (None — як у налаштуваннях).
+
         Returns:
             tuple[int, CollectionHealthSummary]: (успішно відправлено, health-звіт).
         """
+        health = CollectionHealthSummary()                              # 🩺 Метрики стану колекції
+        job: Optional[CollectionJob] = None                             # 💾 Чекпоінт поточного запуску
+        if self._job_store and collection_url and job_owner:
+            job, resumed = self._job_store.open(job_owner, collection_url, urls)
+            if resumed:
+                health.register_resumed(job.done_count)
+                logger.info(
+                    "♻️ Продовжуємо завдання колекції: %d/%d уже надіслано.", job.done_count, len(job.urls)
+                )
+            urls = job.pending_urls()
+        interrupted = False                                             # 🛑 Скасовано — чекпоінт лишається
+        fingerprints = self._fingerprints_for(urls) if collection_url and self._seen_index else {}
+        if changed_only and collection_url and self._seen_index:
+            seen_index = self._seen_index
+            kept = [u for u in urls if not seen_index.is_unchanged(collection_url, u, fingerprints.get(u))]
+            health.register_skipped(len(urls) - len(kept))
+            logger.info("⏭️ Changed-only: %d/%d товарів без змін пропущено.", health.skipped, len(urls))
+            urls = kept
+        processed_fingerprints: Dict[str, Optional[str]] = {}          # 🗂️ Що записати в індекс після запуску
+
         success_count = 0                                               # 🔢 Лічильник успішно надісланих карточок
         completed_count = 0                                             # 🔢 Скільки товарів уже завершено (успіх + фейл)
         total = len(urls)                                               # 📦 Загальна кількість
-        last_push_time = 0.0                                            # 🕓 Останній час оновлення прогресу
-        health = CollectionHealthSummary()                              # 🩺 Метрики стану колекції
         statuses: List[CollectionItemStatus] = [
             CollectionItemStatus(index=i, url=url) for i, url in enumerate(urls)
-        ]
-        status_lock = asyncio.Lock()
+        ]                                                               # 🧊 Елементи не мутуються — лише замінюються
+        progress_dirty = asyncio.Event()                                # 🚩 Є зміни, яких ще не показали
+
+        pipeline = self._pipeline
+        if preserve_order is not None and preserve_order != pipeline.preserve_order:
+            pipeline = replace(pipeline, preserve_order=preserve_order)    # 🔢 Порядок джерела лише для цього запуску
+        ready: asyncio.Queue = asyncio.Queue(maxsize=pipeline.queue_size)  # 📥 Підготовлені картки
+        send_queue: asyncio.Queue = (
+            asyncio.Queue(maxsize=pipeline.queue_size) if pipeline.preserve_order else ready
+        )                                                               # 📤 Черга відправників
+        send_workers = 1 if pipeline.preserve_order else pipeline.send_concurrency  # 🔢 Порядок = один відправник
+        reorder_buffer: Dict[int, Tuple[Optional[PreparedProductCard], float]] = {}
+        next_in_order = 0                                               # 🔢 Наступний індекс для черги відправника
+        order_window = asyncio.Condition()
+        send_gate = asyncio.Lock()
+        next_send_at = 0.0                                              # ⏱️ Найраніший старт наступного надсилання
+        tracer = get_tracer()
+        item_traces: Dict[int, Optional[Trace]] = {}                    # 🧵 Трейс живе від черги до надсилання
 
         def _resolve_title(card: Optional[PreparedProductCard], idx: int) -> str:
             data = getattr(card.result, "data", None) if card else None
             title = getattr(getattr(data, "content", object()), "title", "") if data else ""
             return title or f"#{idx + 1}"
 
-        async def _push_progress(force: bool = False) -> None:
-            nonlocal last_push_time
-            now = time.monotonic()
-            if not force and completed_count < total and (now - last_push_time) < self._progress_interval:
-                return
-            last_push_time = now
-            async with status_lock:
-                snapshot_statuses = tuple(
-                    CollectionItemStatus(
-                        index=s.index,
-                        url=s.url,
-                        title=s.title,
-                        state=s.state,
-                        detail=s.detail,
-                    )
-                    for s in statuses
-                )
+        async def _render_progress() -> None:
+            progress_dirty.clear()
             try:
                 await on_progress(
                     CollectionProgressSnapshot(
                         completed=completed_count,
                         total=total,
                         successes=success_count,
-                        statuses=snapshot_statuses,
+                        statuses=tuple(statuses),                       # 🧊 Копія посилань, не статусів
                     )
                 )
             except Exception:  # noqa: BLE001
                 pass
 
-        async def _update_status(
+        async def _progress_ticker() -> None:
+            """🕰️ Рендерить прогрес з фіксованою каденцією, лише коли щось змінилось."""
+            while True:
+                await progress_dirty.wait()
+                await _render_progress()
+                await asyncio.sleep(self._progress_interval)
+
+        def _update_status(
             idx: int,
             state: CollectionItemState,
             *,
             detail: Optional[str] = None,
             title: Optional[str] = None,
-            force: bool = False,
         ) -> None:
-            async with status_lock:
-                current = statuses[idx]
-                if title:
-                    current.title = title
-                current.state = state
-                current.detail = detail
-            if force:
-                await _push_progress(force=True)
-
-        async def _process_one_url(idx: int, url: str) -> Tuple[int, Optional[PreparedProductCard]]:
+            current = statuses[idx]
+            statuses[idx] = replace(current, state=state, detail=detail, title=title or current.title)
+            progress_dirty.set()
+
+        async def _process_one_url(idx: int, url: str) -> None:
+            item_traces[idx] = tracer.start("collection.item", url=url, index=idx + 1)
+            with tracer.activate(item_traces[idx]):
+                if pipeline.preserve_order:
+                    async with order_window:                            # 🪟 Не відбігаємо далеко від надісланого
+                        await order_window.wait_for(lambda: idx < completed_count + pipeline.reorder_window)
+                _, prepared = await _run_item(idx, url)
+            await ready.put((idx, prepared, time.monotonic()))          # 📥 Backpressure: чекаємо, якщо відправка відстає
+
+        async def _run_item(idx: int, url: str) -> Tuple[int, Optional[PreparedProductCard]]:
+            nonlocal interrupted
             if is_cancelled():
-                await _update_status(idx, CollectionItemState.FAILED, detail="Скасовано", force=True)
+                interrupted = True
+                _update_status(idx, CollectionItemState.FAILED, detail="Скасовано")
                 return idx, None
 
-            async with self._sem:
+            async with self._limiter.slot() as permit:
+                if is_cancelled():                                      # 🛑 Поки чекали слот, користувач пішов
+                    interrupted = True
+                    _update_status(idx, CollectionItemState.FAILED, detail="Скасовано")
+                    return idx, None
                 delay = 0.6
                 for attempt in range(self._retries + 1):
+                    started = time.monotonic()
                     try:
-                        await _update_status(idx, CollectionItemState.PROCESSING)
+                        _update_status(idx, CollectionItemState.PROCESSING)
                         prepared = await self._product_handler.handle_url(
                             update,
                             context,
@@ -195,12 +305,15 @@ class CollectionRunner:
                             update_currency=False,
                             send_immediately=False,
                         )
+                        self._limiter.record(permit, time.monotonic() - started, self._signal_for_card(prepared))
                         return idx, prepared
                     except asyncio.CancelledError:
                         logger.info("🛑 Cancelled item: %s", url)
-                        await _update_status(idx, CollectionItemState.FAILED, detail="Скасовано", force=True)
+                        interrupted = True
+                        _update_status(idx, CollectionItemState.FAILED, detail="Скасовано")
                         return idx, None
                     except Exception as exc:  # noqa: BLE001
+                        self._limiter.record(permit, time.monotonic() - started, self._signal_for_error(exc))
                         logger.warning(
                             "[CollectionRunner] Помилка (%s/%s) на %s: %s",
                             attempt + 1,
@@ -208,11 +321,10 @@ class CollectionRunner:
                             url,
                             exc,
                         )
-                        await _update_status(
+                        _update_status(
                             idx,
                             CollectionItemState.RETRYING,
                             detail=str(exc),
-                            force=True,
                         )
                         if attempt >= self._retries:
                             return idx, None
@@ -221,76 +333,198 @@ class CollectionRunner:
 
             return idx, None
 
-        tasks = [asyncio.create_task(_process_one_url(i, url)) for i, url in enumerate(urls)]
-        await _push_progress(force=True)
-
-        try:
-            for fut in asyncio.as_completed(tasks):
-                idx, prepared_card = await fut
-                completed_count += 1
-
-                if prepared_card and prepared_card.result.ok and prepared_card.media_stack:
-                    data = prepared_card.result.data
-                    if not data:
-                        health.register_failed()
-                        await _update_status(
-                            idx,
-                            CollectionItemState.FAILED,
-                            detail="Порожні дані картки",
-                            force=True,
+        async def _reorder() -> None:
+            """🔢 Випускає картки в порядку джерела; решта чекає в буфері."""
+            nonlocal next_in_order
+            while next_in_order < total:
+                idx, prepared, ready_at = await ready.get()
+                reorder_buffer[idx] = (prepared, ready_at)
+                while next_in_order in reorder_buffer:
+                    prepared, ready_at = reorder_buffer.pop(next_in_order)
+                    await send_queue.put((next_in_order, prepared, ready_at))
+                    next_in_order += 1
+                COLLECTION_PIPELINE_BUFFER_DEPTH.labels(buffer="reorder").set(len(reorder_buffer))
+
+        async def _await_send_slot() -> None:
+            """⏱️ Мінімальна пауза між стартами надсилань (спільна для всіх відправників)."""
+            nonlocal next_send_at
+            async with send_gate:
+                delay = next_send_at - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_send_at = time.monotonic() + pipeline.send_interval_sec
+
+        async def _deliver(idx: int, prepared_card: Optional[PreparedProductCard], ready_at: float) -> List[int]:
+            """📤 Надсилає картку (або фіксує невдачу); повертає id надісланих повідомлень."""
+            nonlocal success_count
+            if prepared_card and prepared_card.result.ok and prepared_card.media_stack:
+                data = prepared_card.result.data
+                if not data:
+                    health.register_failed()
+                    _update_status(
+                        idx,
+                        CollectionItemState.FAILED,
+                        detail="Порожні дані картки",
+                    )
+                    return []
+                try:
+                    await _await_send_slot()
+                    COLLECTION_SEND_LAG_SECONDS.observe(time.monotonic() - ready_at)
+                    with tracer.activate(item_traces.get(idx)):
+                        message_ids = await self._product_handler.send_prepared_card(
+                            update,
+                            context,
+                            prepared_card,
+                            include_region_notice=False,
                         )
-                    else:
-                        try:
-                            await self._product_handler.send_prepared_card(
-                                update,
-                                context,
-                                prepared_card,
-                                include_region_notice=False,
-                            )
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception as exc:  # noqa: BLE001
-                            logger.warning("Не вдалося надіслати картку %s: %s", data.url, exc)
-                            health.register_failed()
-                            await _update_status(
-                                idx,
-                                CollectionItemState.FAILED,
-                                detail=str(exc),
-                                title=data.content.title,
-                                force=True,
-                            )
-                        else:
-                            success_count += 1
-                            health.register_ok(prepared_card.result.alt_fallback_used)
-                            await _update_status(
-                                idx,
-                                CollectionItemState.OK,
-                                title=data.content.title,
-                                detail=None,
-                                force=True,
-                            )
-                else:
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("Не вдалося надіслати картку %s: %s", data.url, exc)
                     health.register_failed()
-                    reason = ""
-                    if prepared_card and prepared_card.result.error_message:
-                        reason = prepared_card.result.error_message
-                    await _update_status(
+                    _update_status(
                         idx,
                         CollectionItemState.FAILED,
-                        detail=reason or "Не вдалося обробити товар",
-                        title=_resolve_title(prepared_card, idx),
-                        force=True,
+                        detail=str(exc),
+                        title=data.content.title,
                     )
+                else:
+                    success_count += 1
+                    processed_fingerprints[urls[idx]] = fingerprints.get(urls[idx])
+                    health.register_ok(prepared_card.result.alt_fallback_used)
+                    _update_status(
+                        idx,
+                        CollectionItemState.OK,
+                        title=data.content.title,
+                        detail=None,
+                    )
+                    return list(message_ids or [])
+            else:
+                health.register_failed()
+                reason = ""
+                if prepared_card and prepared_card.result.error_message:
+                    reason = prepared_card.result.error_message
+                _update_status(
+                    idx,
+                    CollectionItemState.FAILED,
+                    detail=reason or "Не вдалося обробити товар",
+                    title=_resolve_title(prepared_card, idx),
+                )
+            return []
+
+        async def _send_worker() -> None:
+            nonlocal completed_count
+            while True:
+                item = await send_queue.get()
+                if item is None:
+                    return                                              # 🏁 Сигнал завершення
+                COLLECTION_PIPELINE_BUFFER_DEPTH.labels(buffer="send_queue").set(send_queue.qsize())
+                idx, prepared_card, ready_at = item
+                message_ids: List[int] = []
+                try:
+                    message_ids = await _deliver(idx, prepared_card, ready_at)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("[CollectionRunner] Збій доставки #%s: %s", idx + 1, exc)
+                    _update_status(idx, CollectionItemState.FAILED, detail=str(exc))
+                if job is not None and self._job_store is not None:
+                    self._job_store.mark(job, urls[idx], statuses[idx].state.value, message_ids=message_ids)  # 💾 Чекпоінт
+                completed_count += 1
+                ok = statuses[idx].state == CollectionItemState.OK
+                tracer.finish(item_traces.pop(idx, None), status=STATUS_OK if ok else STATUS_ERROR)
+                progress_dirty.set()
+                if pipeline.preserve_order:
+                    async with order_window:
+                        order_window.notify_all()                       # 🪟 Вікно зсунулось
+
+        shared_work = SingleFlightRegistry("collection")               # 🛬 Спільні OCR/AI-операції товарів запуску
+        with activate_single_flight(shared_work):                       # 🧵 Задачі успадковують реєстр через контекст
+            tasks = [asyncio.create_task(_process_one_url(i, url)) for i, url in enumerate(urls)]
+            senders = [asyncio.create_task(_send_worker()) for _ in range(send_workers)]
+            reorderer = asyncio.create_task(_reorder()) if pipeline.preserve_order else None
+        pipeline_tasks = [*tasks, *senders, *([reorderer] if reorderer else [])]
+        await _render_progress()
+        ticker = asyncio.create_task(_progress_ticker())               # 🕰️ Єдине джерело редагувань прогресу
 
-                await _push_progress(force=False)
-
+        try:
+            await asyncio.gather(*tasks)                                # 🧪 Підготовка завершена
+            if reorderer:
+                await reorderer                                         # 🔢 Буфер порядку спорожнено
+            for _ in senders:
+                await send_queue.put(None)
+            await asyncio.gather(*senders)                              # 📤 Усе надіслано
         except asyncio.CancelledError:
             logger.info("🛑 CollectionRunner cancelled")
-            for task in tasks:
-                task.cancel()
+            interrupted = True
         finally:
+            for task in pipeline_tasks:
+                task.cancel()                                           # 🧹 No-op для завершених
             with contextlib.suppress(Exception):
-                await asyncio.gather(*tasks, return_exceptions=True)
+                await asyncio.gather(*pipeline_tasks, return_exceptions=True)
+            ticker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await ticker
+            await _render_progress()                                    # 🏁 Фінальний стан — завжди
+            for gauge_buffer in ("send_queue", "reorder"):
+                COLLECTION_PIPELINE_BUFFER_DEPTH.labels(buffer=gauge_buffer).set(0)
+            for item_trace in item_traces.values():
+                tracer.finish(item_trace, status=STATUS_ERROR)          # 🛑 Не дійшли до надсилання
+            shared_work.close()
+            health.register_deduplicated(shared_work.deduplicated)
+            if shared_work.deduplicated:
+                logger.info(
+                    "♻️ Дедупліковано спільних операцій: %d (%s)",
+                    shared_work.deduplicated,
+                    shared_work.deduplicated_by_namespace(),
+                )
+            if collection_url and self._seen_index and processed_fingerprints:
+                self._seen_index.record(collection_url, processed_fingerprints)	# 💾 Лише успішно надіслані
+            if job is not None and self._job_store is not None and not interrupted and completed_count == total:
+                self._job_store.complete(job)                           # 🏁 Запуск дійшов до кінця — чекпоінт не потрібен
 
         return success_count, health
+
+    # ==========================
+    # 🚦 СИГНАЛИ ДЛЯ ОБМЕЖУВАЧА
+    # ==========================
+    @classmethod
+    def _signal_for_card(cls, card: Optional[PreparedProductCard]) -> LimiterSignal:
+        """🚦 Успішна картка — OK; невдала — THROTTLED, якщо причина схожа на перевантаження, інакше ERROR."""
+        result = getattr(card, "result", None)
+        if result is None:
+            return LimiterSignal.ERROR
+        if result.ok:
+            return LimiterSignal.OK
+        cause = getattr(result, "_cause", None)
+        if cause is not None and cls._signal_for_error(cause) is LimiterSignal.THROTTLED:
+            return LimiterSignal.THROTTLED
+        return cls._signal_for_message(result.error_message)
+
+    @classmethod
+    def _signal_for_error(cls, exc: BaseException) -> LimiterSignal:
+        """🚦 429 / Cloudflare / таймаути — THROTTLED, решта винятків — ERROR."""
+        if isinstance(exc, _THROTTLE_ERRORS) or "timeout" in type(exc).__name__.lower():
+            return LimiterSignal.THROTTLED
+        if isinstance(exc, HttpError) and exc.status_code in _THROTTLE_STATUSES:
+            return LimiterSignal.THROTTLED
+        return cls._signal_for_message(str(exc))
+
+    @staticmethod
+    def _signal_for_message(message: Optional[str]) -> LimiterSignal:
+        text = (message or "").lower()
+        return LimiterSignal.THROTTLED if any(marker in text for marker in _THROTTLE_MARKERS) else LimiterSignal.ERROR
+
+    # ==========================
+    # 🧬 FINGERPRINTS
+    # ==========================
+    @staticmethod
+    def _fingerprints_for(urls: Sequence[str]) -> Dict[str, Optional[str]]:
+        """🧬 Fingerprint для кожного URL з `ProductHintsCache` (None — підказки немає, товар обробляємо)."""
+        hints = ProductHintsCache()
+        out: Dict[str, Optional[str]] = {}
+        for url in urls:
+            hint = hints.get(url)
+            out[url] = product_fingerprint(hint) if hint is not None else None
+        return out
  
@@ -7,6 +7,9 @@
 🔹 Безпечно працює при відсутності update.message (fallback через context.bot).
 🔹 Не передає None у PTB v21 (жодних reportArgumentType / OptionalMemberAccess).
 🔹 Централізовано делегує помилки в ExceptionHandlerService.
+🔹 Кожен виклик Telegram — спан `telegram.send_photo` / `telegram.send_media_group` в активному трейсі.
+🔹 Кеш `file_id` (URL/SHA256 → id найбільшого PhotoSize): повторні фото йдуть за id, без upload;
+   «wrong file identifier» інвалідовує запис і повторює надсилання з оригіналом.
 """
 
 # 🌐 Зовнішні бібліотеки
@@ -15,7 +18,7 @@ from telegram.constants import ChatAction
 from telegram.error import BadRequest, RetryAfter, NetworkError, TimedOut              # 🚨 Типи помилок Telegram
 
 # 🔠 Системні імпорти
-from typing import Optional, Sequence, TypeAlias, Union, List, Dict, Any                # 🧰 Типізація
+from typing import Optional, Sequence, Tuple, TypeAlias, Union, List, Dict, Any         # 🧰 Типізація
 import asyncio                                                                          # ⏱️ Асинхронні затримки / sleep
 import logging                                                                          # 🧾 Логування
 import random                                                                           # 🎲 Джиттер для backoff
@@ -25,7 +28,9 @@ from app.bot.services.custom_context import CustomContext
 from app.bot.ui import static_messages as msg                                           # 💬 Статичні повідомлення UI
 from app.config.setup.constants import AppConstants                                     # ⚙️ Константи застосунку
 from app.errors.exception_handler_service import ExceptionHandlerService                # 🧯 Єдиний хендлер винятків
-from app.infrastructure.services.product_media_preparer import ProductMediaPreparationError  # 🧰 Кастомні помилки медіа
+from app.infrastructure.services.product_media_preparer import PreparedImageFile, ProductMediaPreparationError  # 🧰 Файли стеку та помилки медіа
+from app.infrastructure.services.telegram_file_id_cache import TelegramFileIdCache, image_cache_keys  # 📎 Кеш file_id
+from app.shared.tracing import traced                                                   # 🧵 Спани надсилання
 from app.shared.utils.logger import LOG_NAME                                            # 🏷️ Ім'я логера
 
 # ==============================
@@ -53,9 +58,15 @@ class ImageSender:
     Повертає список відправлених повідомлень (`telegram.Message`) для подальших дій (редагування/видалення).
     """
 
-    def __init__(self, exception_handler: ExceptionHandlerService, constants: AppConstants) -> None:
+    def __init__(
+        self,
+        exception_handler: ExceptionHandlerService,
+        constants: AppConstants,
+        file_id_cache: Optional[TelegramFileIdCache] = None,
+    ) -> None:
         self.exception_handler = exception_handler                                    			# 🧯 Централізована обробка помилок
         self.const = constants                                                        			# ⚙️ Доступ до констант (UI/SENDING тощо)
+        self.file_id_cache = file_id_cache                                            			# 📎 URL/SHA256 → file_id (None — вимкнено)
 
     # ==============================
     # 🔄 ПУБЛІЧНИЙ ІНТЕРФЕЙС
@@ -104,12 +115,12 @@ class ImageSender:
 
             total = len(unique_media)                                                       			# 🔢 Скільки всього фото?
             if total == 1:
-                m = await self._send_single_photo(                                           			# 🖼️ Режим одиночного фото
+                m = await traced("telegram.send_photo", self._send_single_photo(             			# 🖼️ Режим одиночного фото
                     update, context, unique_media[0],
                     caption=caption, parse_mode=final_parse_mode,
                     reply_to_message_id=reply_to_message_id,
                     disable_notification=disable_notification, protect_content=protect_content,
-                )
+                ))
                 if m: sent.append(m)                                                        			# ✅ Додаємо, якщо успішно
                 return sent
 
@@ -121,13 +132,13 @@ class ImageSender:
                 chunk = list(unique_media[i : i + _MAX_MEDIA_PER_GROUP])                    			# ✂️ Беремо шматок до 10
                 first_caption = caption if i == 0 else None                                  			# 🏷️ Підпис лише на першому елементі групи
 
-                batch_msgs = await self._send_media_group_chunk(                             			# 📦 Відправляємо батч
+                batch_msgs = await traced("telegram.send_media_group", self._send_media_group_chunk(  	# 📦 Відправляємо батч
                     update, context, chunk,
                     first_caption=first_caption, parse_mode=final_parse_mode,
                     reply_to_message_id=reply_to_message_id if i == 0 else None,            			# 🔗 reply — лише на першій групі
                     disable_notification=disable_notification, protect_content=protect_content,
                     batch_index=i // _MAX_MEDIA_PER_GROUP + 1, total_batches=total_batches,
-                )
+                ), photos=len(chunk))
                 sent.extend(batch_msgs)                                                     			# ➕ Акумулюємо повідомлення
                 await asyncio.sleep(batch_pause)                                            			# 🧘 Трохи відпочиваємо, аби не ввалитися в rate limit
 
@@ -175,6 +186,22 @@ class ImageSender:
         """
         return {} if value is None else {key: value}                                        			# ✅ Лише встановлені значення
 
+    def _build_media_group(
+        self,
+        refs: Sequence[MediaRef],
+        first_caption: Optional[str],
+        parse_mode: Optional[str],
+    ) -> List[InputMediaPhoto]:
+        """🧱 Формує payload media group: підпис лише на першому елементі."""
+        media: List[InputMediaPhoto] = []
+        for idx, m in enumerate(refs):
+            kw: Dict[str, Any] = {}
+            cap = first_caption if idx == 0 and first_caption else None                   			# 🏷️ Підпис лише на першому елементі
+            kw.update(self._kv_if_set("caption", cap))
+            kw.update(self._kv_if_set("parse_mode", parse_mode))
+            media.append(InputMediaPhoto(media=m, **kw))                                  			# 🧩 Додаємо елемент до групи
+        return media
+
     async def _retry_sleep(self, retry_after: Optional[float], attempt: int) -> None:
         """
         ⏳ Затримка між спробами: експоненційний backoff з невеликим джиттером.
@@ -184,6 +211,52 @@ class ImageSender:
             return
         delay = _BASE_DELAY_SEC * (2 ** attempt) + random.uniform(0, 0.25)                 			# 📈 Експонента + 🎲 джиттер
         await asyncio.sleep(delay)                                                          			# 💤 Спимо перед повтором
+
+    # ==============================
+    # 📎 КЕШ FILE_ID
+    # ==============================
+    @staticmethod
+    def _cache_keys(item: MediaRef) -> Tuple[str, ...]:
+        """🔑 Ключі кешу: URL-рядок або `PreparedImageFile` (URL + SHA256); file_id/інші InputFile — без ключів."""
+        if isinstance(item, PreparedImageFile):
+            return image_cache_keys(url=item.source_url, sha256=item.sha256)
+        if isinstance(item, str) and item.startswith(("http://", "https://")):
+            return image_cache_keys(url=item)
+        return ()
+
+    def _resolve_cached(self, item: MediaRef) -> Tuple[MediaRef, bool]:
+        """📎 Підміняє фото на кешований `file_id`; другий елемент — чи була підміна."""
+        if self.file_id_cache is None:
+            return item, False
+        keys = self._cache_keys(item)
+        file_id = self.file_id_cache.get(keys) if keys else None
+        return (file_id, True) if file_id else (item, False)
+
+    def _remember(self, items: Sequence[MediaRef], messages: Sequence[Optional[Message]]) -> None:
+        """💾 Запам'ятовує `file_id` найбільшого PhotoSize для кожного надісланого фото."""
+        if self.file_id_cache is None:
+            return
+        for item, message in zip(items, messages):
+            photo_sizes = getattr(message, "photo", None) or ()
+            keys = self._cache_keys(item)
+            if keys and photo_sizes:
+                largest = max(photo_sizes, key=lambda size: (size.width or 0) * (size.height or 0))  # 🖼️ Найбільший розмір
+                self.file_id_cache.put(keys, largest.file_id)
+
+    def _forget(self, items: Sequence[MediaRef]) -> None:
+        """🗑️ Інвалідовує записи кешу для фото, які Telegram відхилив за id."""
+        if self.file_id_cache is None:
+            return
+        for item in items:
+            keys = self._cache_keys(item)
+            if keys:
+                self.file_id_cache.invalidate(keys)
+
+    @staticmethod
+    def _is_stale_file_id_error(error: Exception) -> bool:
+        """🧪 Telegram не впізнав `file_id` (інший бот, видалений файл тощо)."""
+        text = str(error).lower()
+        return "file identifier" in text or "file_id" in text or "file reference" in text
         
     async def _send_text_safe(
         self,
@@ -242,18 +315,28 @@ class ImageSender:
         kwargs.update(self._kv_if_set("disable_notification", disable_notification))
         kwargs.update(self._kv_if_set("protect_content", protect_content))
 
+        payload, from_cache = self._resolve_cached(photo)                               			# 📎 file_id замість upload, якщо є
         for attempt in range(_MAX_RETRIES):
             try:
                 if has_message and update.message:
-                    return await update.message.reply_photo(photo=photo, **kwargs)         			# 🖼️ Надсилання як reply
-                if chat_id is not None:
-                    return await context.bot.send_photo(chat_id=chat_id, photo=photo, **kwargs) 		# 🖼️ Надсилання напряму в чат
-                logger.error("Немає chat_id для відправки одного фото.")                   			# 🚫 Критичний фолбек
-                return None
+                    sent = await update.message.reply_photo(photo=payload, **kwargs)       			# 🖼️ Надсилання як reply
+                elif chat_id is not None:
+                    sent = await context.bot.send_photo(chat_id=chat_id, photo=payload, **kwargs)  	# 🖼️ Надсилання напряму в чат
+                else:
+                    logger.error("Немає chat_id для відправки одного фото.")               			# 🚫 Критичний фолбек
+                    return None
+                if not from_cache:
+                    self._remember([photo], [sent])                                        			# 💾 Новий file_id у кеш
+                return sent
             except RetryAfter as e:
                 logger.warning("⏳ Rate limit (single) #%s, спимо…", attempt + 1)           			# 🧱 Впираємось у ліміт — чекаємо
                 await self._retry_sleep(getattr(e, "retry_after", None), attempt)
             except (BadRequest, NetworkError) as e:
+                if from_cache and self._is_stale_file_id_error(e):
+                    logger.warning("📎 Кешований file_id відхилено (single): %s — надсилаємо оригінал", e)
+                    self._forget([photo])                                                  			# 🗑️ Інвалідовуємо запис
+                    payload, from_cache = photo, False
+                    continue
                 logger.error("❌ BadRequest/NetworkError (single): %s", e)                  			# 🚨 Невиправна помилка — виходимо з циклу
                 break
 
@@ -284,13 +367,8 @@ class ImageSender:
         chat_id = update.effective_chat.id if update.effective_chat else None             			# 🆔 Куди надсилати
         has_message = bool(update.message)                                                			# 📩 Чи можемо відповісти на повідомлення
 
-        media: List[InputMediaPhoto] = []                                                 			# 🧱 Формуємо payload для media group
-        for idx, m in enumerate(media_items):
-            kw: Dict[str, Any] = {}
-            cap = first_caption if idx == 0 and first_caption else None                   			# 🏷️ Підпис лише на першому елементі
-            kw.update(self._kv_if_set("caption", cap))
-            kw.update(self._kv_if_set("parse_mode", parse_mode))
-            media.append(InputMediaPhoto(media=m, **kw))                                  			# 🧩 Додаємо елемент до групи
+        resolved = [self._resolve_cached(m) for m in media_items]                        			# 📎 file_id замість upload, якщо є
+        media = self._build_media_group([ref for ref, _ in resolved], first_caption, parse_mode)  	# 🧱 Payload для media group
 
         call_kwargs: Dict[str, Any] = {}                                                  			# 🧱 Додаткові параметри виклику
         call_kwargs.update(self._kv_if_set("reply_to_message_id", reply_to_message_id))
@@ -308,6 +386,8 @@ class ImageSender:
                     sent = await context.bot.send_media_group(chat_id=chat_id, media=media, **call_kwargs)  # 📦 Відправка напряму
 
                 logger.debug("✅ Батч %s/%s відправлено: %s елементів", batch_index, total_batches, len(media))  # 🧾 Технічний лог
+                fresh = [i for i, (_, cached) in enumerate(resolved) if not cached and i < len(sent)]  	# 🆕 Фото, що йшли upload/URL
+                self._remember([media_items[i] for i in fresh], [sent[i] for i in fresh])       	# 💾 Нові file_id у кеш
                 return list(sent)
             except RetryAfter as e:
                 logger.warning("⏳ Rate limit (group) #%s/%s, батч %s/%s — чекаю: %s", attempt + 1, _MAX_RETRIES, batch_index, total_batches, e)
@@ -325,6 +405,13 @@ class ImageSender:
                 await self._retry_sleep(None, attempt)
                 continue
             except (BadRequest, NetworkError) as e:
+                stale = [item for item, (_, cached) in zip(media_items, resolved) if cached]
+                if stale and self._is_stale_file_id_error(e):
+                    logger.warning("📎 Кешований file_id відхилено (group): %s — надсилаємо оригінали", e)
+                    self._forget(stale)                                                    			# 🗑️ Інвалідовуємо записи батчу
+                    resolved = [(m, False) for m in media_items]
+                    media = self._build_media_group(list(media_items), first_caption, parse_mode)
+                    continue
                 if attempt < _MAX_RETRIES - 1:
                     logger.warning(
                         "⚠️ Transport error (group) #%s/%s, батч %s/%s: %s — пробую повторити.",
@@ -8,6 +8,8 @@
     • За потреби оновлює курси валют (через CurrencyManager)
     • Делегує парсинг/підготовку даних ProductProcessingService
     • Відправляє підготовлені повідомлення через ProductMessenger
+    • У streaming-режимі шле блоки картки по мірі готовності етапів (ProgressiveCardSender)
+    • Кожен запит — трейс `product.request` (обробка, медіа та надсилання в одному водоспаді)
 
 ✅ Принципи:
     • SRP — клас відповідає тільки за “оркестрацію” обробки запиту користувача
@@ -27,8 +29,9 @@ from telegram.constants import ChatAction  # 🖋️ Статус "друкує"
 import asyncio  # 🔄 Обробка асинхронних відмін
 import contextlib  # 🛡️ Безпечне подавлення винятків у побічних діях
 import logging  # 🧾 Логування
+import time  # ⏱️ Time-to-first-message
 from dataclasses import dataclass  # 🧱 DTO для підготовлених карток
-from typing import Optional, Sequence, TYPE_CHECKING  # 🧰 Типізація
+from typing import List, Optional, Sequence, TYPE_CHECKING  # 🧰 Типізація
 
 # 🧩 Внутрішні модулі проєкту
 from app.bot.services.custom_context import CustomContext  # 🧠 Розширений контекст застосунку
@@ -47,9 +50,15 @@ from app.infrastructure.services.product_media_preparer import (  # 🖼️ Пі
     ProductMediaPreparer,
     ProductMediaPreparationError,
 )
+from app.shared.metrics.delivery import (  # 📊 Метрики доставки картки
+    PRODUCT_TIME_TO_FIRST_MESSAGE,
+    PRODUCT_TIME_TO_FULL_CARD,
+)
+from app.shared.tracing import get_tracer, span, traced  # 🧵 Трейс запиту
 from app.shared.utils.logger import LOG_NAME  # 🏷️ Ім’я логера
 from app.shared.utils.url_parser_service import UrlParserService  # 🔗 Валідація/нормалізація URL
 from .image_sender import MediaRef  # 🖼️ Типи медіа, які приймає ImageSender
+from .progressive_card import ProgressiveCardSender  # 📬 Прогресивна доставка картки
 
 if TYPE_CHECKING:
     from app.bot.ui.messengers.product_messenger import ProductMessenger  # ✉️ Відправник блоків про товар
@@ -87,6 +96,8 @@ class ProductHandler:
         exception_handler: ExceptionHandlerService,
         constants: AppConstants,
         url_parser_service: UrlParserService,
+        *,
+        streaming: bool = False,
     ):
         """Ініціалізує залежності обробника.
 
@@ -98,6 +109,7 @@ class ProductHandler:
             exception_handler: Централізований обробник винятків (логування + UX).
             constants: Глобальні константи застосунку (UI/налаштування).
             url_parser_service: Валідація та нормалізація посилань.
+            streaming: Надсилати блоки картки по мірі готовності етапів (лише для одиночного товару).
         """
         self.currency_manager = currency_manager  # 💱 Курси валют (оновлення/кеш)
         self.processing_service = processing_service  # 🛠️ Повний процесинг товару
@@ -106,6 +118,7 @@ class ProductHandler:
         self.exception_handler = exception_handler  # 🧯 Єдиний обробник винятків
         self.const = constants  # ⚙️ Константи застосунку/UI
         self.url_parser = url_parser_service  # 🔗 Валідація/нормалізація URL
+        self.streaming = streaming  # 📬 Прогресивна доставка картки
 
         logger.info("🔧 ProductHandler ініціалізовано.")  # 🧾 Діагностичний лог
 
@@ -122,8 +135,28 @@ class ProductHandler:
         send_immediately: bool = True,
     ) -> Optional[PreparedProductCard]:
         """Основний вхід: приймає URL, виконує процесинг і (опційно) надсилає результат."""
+        with get_tracer().trace("product.request", url=url or "", streaming=send_immediately and self.streaming):
+            return await self._handle_url(
+                update,
+                context,
+                url,
+                update_currency,
+                send_immediately=send_immediately,
+            )
+
+    async def _handle_url(
+        self,
+        update: Update,
+        context: CustomContext,
+        url: Optional[str],
+        update_currency: bool,
+        *,
+        send_immediately: bool,
+    ) -> Optional[PreparedProductCard]:
+        """Тіло `handle_url` (вже всередині трейсу)."""
         user_id: str = "N/A"
         final_url: str = ""
+        started_at = time.perf_counter()  # ⏱️ Точка відліку time-to-first-message
 
         try:
             if not update.message:
@@ -158,10 +191,14 @@ class ProductHandler:
                 final_url = self.url_parser.normalize(final_url)  # type: ignore[attr-defined]
 
             if update_currency:
-                await self.currency_manager.update_all_rates_if_needed()
+                with span("currency.refresh"):
+                    await self.currency_manager.update_all_rates_if_needed()
 
             logger.info("📩 product.handle_url | user=%s upd=%s url=%s", user_id, upd_id, final_url)
 
+            if send_immediately and self.streaming:
+                return await self._handle_streaming(update, context, final_url, started_at)
+
             processing_result = await self.processing_service.process_url(final_url)
             prepared_card = PreparedProductCard(result=processing_result)
 
@@ -223,7 +260,9 @@ class ProductHandler:
 
             if send_immediately:
                 try:
+                    PRODUCT_TIME_TO_FIRST_MESSAGE.labels(mode="batch").observe(time.perf_counter() - started_at)
                     await self.send_prepared_card(update, context, prepared_card, include_region_notice=True)
+                    PRODUCT_TIME_TO_FULL_CARD.labels(mode="batch").observe(time.perf_counter() - started_at)
                 except ProductMediaPreparationError as exc:
                     failure = ProductProcessingResult.fail(
                         ProcessingErrorCode.MediaPreparationFailed,
@@ -252,12 +291,12 @@ class ProductHandler:
         prepared_card: PreparedProductCard,
         *,
         include_region_notice: bool = False,
-    ) -> None:
-        """Надсилає вже підготовлений результат (використовується в колекціях)."""
+    ) -> List[int]:
+        """Надсилає вже підготовлений результат (використовується в колекціях); повертає id повідомлень."""
         data = prepared_card.result.data
         if data is None:
             logger.error("send_prepared_card called без даних")
-            return
+            return []
 
         media_stack = prepared_card.media_stack
         if not media_stack:
@@ -273,7 +312,7 @@ class ProductHandler:
                 )
 
         try:
-            await self.messenger.send(update, context, data, media_stack=media_stack)
+            message_ids = await traced("telegram.send_card", self.messenger.send(update, context, data, media_stack=media_stack))
         except ProductMediaPreparationError as exc:
             failure = ProductProcessingResult.fail(
                 ProcessingErrorCode.MediaPreparationFailed,
@@ -284,6 +323,100 @@ class ProductHandler:
             prepared_card.result = failure
             logger.warning("product.media_send_failed | url=%s reason=%s", data.url, exc)
             raise
+        return list(message_ids or [])
+
+    async def _handle_streaming(
+        self,
+        update: Update,
+        context: CustomContext,
+        final_url: str,
+        started_at: float,
+    ) -> PreparedProductCard:
+        """Прогресивна доставка: фото + назва після парсингу, решта блоків — по мірі готовності етапів."""
+        assert update.message is not None  # 🛡️ Перевірено у handle_url
+        sender = ProgressiveCardSender(
+            self.messenger,
+            self.media_preparer,
+            update,
+            context,
+            url=final_url,
+            started_at=started_at,
+            size_chart_stage=getattr(self.processing_service, "size_chart_service", None) is not None,
+        )
+        consumer = asyncio.create_task(sender.run())
+        try:
+            processing_result = await self.processing_service.process_url(final_url, on_stage=sender.on_stage)
+        except BaseException:
+            consumer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await consumer
+            raise
+        sender.finish()
+        await consumer
+
+        if not processing_result.ok or processing_result.data is None:
+            if processing_result.ok:
+                logger.error("Invariant violation: result.ok=True, але data=None | url=%s", final_url)
+                processing_result = ProductProcessingResult.fail(
+                    ProcessingErrorCode.UnexpectedError,
+                    "Не вдалося сформувати дані товару.",
+                )
+            await update.message.reply_text(processing_result.error_message or msg.PRODUCT_FETCH_ERROR)
+            logger.warning(
+                "product.handle_url fail (streaming) | code=%s url=%s cause=%r",
+                getattr(processing_result.error_code, "name", "N/A"),
+                final_url,
+                getattr(processing_result, "_cause", None),
+            )
+            return PreparedProductCard(processing_result)
+
+        data = processing_result.data
+        media_stack: Optional[Sequence[MediaRef]] = None
+        if not sender.preview_sent:  # 🖼️ Прев'ю не вдалося — фото з фінального контенту
+            try:
+                media_stack = await self._prepare_media_stack(data)
+                if sender.first_message_sec is None:  # 🗃️ Етапів не було (кеш) — уся картка одразу
+                    prepared_card = PreparedProductCard(processing_result, media_stack)
+                    PRODUCT_TIME_TO_FIRST_MESSAGE.labels(mode="streaming").observe(time.perf_counter() - started_at)
+                    await self.send_prepared_card(update, context, prepared_card, include_region_notice=True)
+                    PRODUCT_TIME_TO_FULL_CARD.labels(mode="streaming").observe(time.perf_counter() - started_at)
+                    return prepared_card
+                await self.messenger.send_preview(update, context, title=data.content.title, media_stack=media_stack)
+            except ProductMediaPreparationError as exc:
+                await update.message.reply_text(msg.PRODUCT_MEDIA_FAILED)
+                logger.warning("product.media_prepare_failed | url=%s reason=%s", final_url, exc)
+                return PreparedProductCard(
+                    ProductProcessingResult.fail(
+                        ProcessingErrorCode.MediaPreparationFailed,
+                        str(exc),
+                        cause=exc,
+                        data=data,
+                    )
+                )
+
+        validation_error = self._validate_card_ready(data)
+        if validation_error:
+            logger.warning("product.card_validation_failed (streaming) | url=%s reason=%s", final_url, validation_error)
+            if self._should_show_admin_details(context):
+                failure = ProductProcessingResult.fail(
+                    ProcessingErrorCode.CardValidationFailed,
+                    validation_error,
+                    data=data,
+                )
+                await update.message.reply_text(self._build_admin_failure_message(failure))
+
+        parse_mode = getattr(getattr(self.const, "UI", object()), "DEFAULT_PARSE_MODE", "HTML")
+        with contextlib.suppress(Exception):
+            await update.message.reply_text(
+                msg.PRODUCT_REGION_DETECTED.format(region=data.region_display),
+                parse_mode=parse_mode,
+            )
+        logger.info(
+            "📬 product.streamed | url=%s first_message_sec=%s",
+            final_url,
+            f"{sender.first_message_sec:.2f}" if sender.first_message_sec is not None else "N/A",
+        )
+        return PreparedProductCard(processing_result, media_stack)
 
     def _validate_card_ready(self, data: ProcessedProductData) -> Optional[str]:
         """Перевіряє, що всі критичні блоки картки присутні."""
@@ -307,9 +440,9 @@ class ProductHandler:
 
     async def _prepare_media_stack(self, data: ProcessedProductData) -> Sequence[MediaRef]:
         """Викачує та повертає стек фото у вигляді InputFile."""
-        stack: PreparedMediaStack = await self.media_preparer.prepare_stack(
-            data.content.images,
-            title=data.content.title or data.url,
+        stack: PreparedMediaStack = await traced(
+            "media.prepare",
+            self.media_preparer.prepare_stack(data.content.images, title=data.content.title or data.url),
         )
         if not stack.files:
             raise ProductMediaPreparationError("Не вдалося підготувати жодного фото товару.")
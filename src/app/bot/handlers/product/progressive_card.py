@@ -0,0 +1,193 @@
+# 📬 app/bot/handlers/product/progressive_card.py
+"""
+📬 progressive_card.py — прогресивна доставка картки товару, поки йде обробка.
+
+🔹 Слухає завершення етапів `ProductProcessingService` (`on_stage`) через чергу.
+🔹 Після `parse` готує фото і одразу шле прев'ю (альбом + назва) — це перше повідомлення.
+🔹 `content` → опис + прайс; `availability` дописує блок наявності в уже надісланий опис (edit).
+🔹 Музика та size chart надсилаються, щойно готові їхні етапи (але не раніше опису).
+🔹 Фіксує time-to-first-message та час до повної картки у Prometheus.
+🔹 Надсилання кожного блоку — спан `telegram.<етап>` у трейсі запиту.
+"""
+
+from __future__ import annotations
+
+# 🌐 Зовнішні бібліотеки
+from telegram import Message, Update                                     # 🤖 Telegram-типи
+
+# 🔠 Системні імпорти
+import asyncio                                                           # 🔄 Черга подій етапів
+import dataclasses                                                       # 🧩 Підстановка colors_text
+import logging                                                           # 🧾 Логування
+import time                                                              # ⏱️ Вимірювання TTFM
+from typing import Any, Awaitable, Callable, List, Optional, TYPE_CHECKING  # 🧰 Типізація
+
+# 🧩 Внутрішні модулі проєкту
+from app.bot.services.custom_context import CustomContext                # 🧠 Розширений контекст
+from app.infrastructure.content.product_content_service import ProductContentDTO  # 📝 Контент картки
+from app.infrastructure.services.product_media_preparer import (        # 🖼️ Підготовка фото
+    ProductMediaPreparationError,
+    ProductMediaPreparer,
+)
+from app.infrastructure.services.product_processing_service import ProductProcessingService  # 🎨 colors_text
+from app.infrastructure.services.stage_graph import StageOutcome        # 📋 Результат етапу
+from app.shared.metrics.delivery import (                                # 📊 Метрики доставки
+    PRODUCT_TIME_TO_FIRST_MESSAGE,
+    PRODUCT_TIME_TO_FULL_CARD,
+)
+from app.shared.tracing import span                                      # 🧵 Спани надсилання блоків
+from app.shared.utils.logger import LOG_NAME                             # 🏷️ Ім’я логера
+
+if TYPE_CHECKING:
+    from app.bot.ui.messengers.product_messenger import ProductMessenger  # ✉️ Відправник блоків
+
+logger = logging.getLogger(LOG_NAME)
+
+AVAILABILITY_PENDING_TEXT = "⏳ Перевіряємо наявність…"                  # 🎨 Тимчасовий блок кольорів
+
+_DONE = object()                                                         # 🏁 Сентинел кінця потоку етапів
+
+
+# ================================
+# 📬 ПРОГРЕСИВНИЙ ВІДПРАВНИК
+# ================================
+class ProgressiveCardSender:
+    """
+    📬 Одноразовий відправник картки: `on_stage` кладе події в чергу, `run()` їх розсилає по черзі.
+    """
+
+    def __init__(
+        self,
+        messenger: "ProductMessenger",
+        media_preparer: ProductMediaPreparer,
+        update: Update,
+        context: CustomContext,
+        *,
+        url: str,
+        started_at: Optional[float] = None,
+        size_chart_stage: bool = True,
+    ) -> None:
+        self.messenger = messenger                                       # ✉️ UI-блоки
+        self.media_preparer = media_preparer                             # 🖼️ Фото для прев'ю
+        self.update = update
+        self.context = context
+        self.url = url
+        self._size_chart_stage = size_chart_stage                        # 📏 Чи чекати етап size_chart
+        self._started_at = started_at if started_at is not None else time.perf_counter()
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        self._title: str = ""
+        self._page_source: str = ""
+        self._content: Optional[ProductContentDTO] = None                # 📝 Контент без colors_text
+        self._colors_text: Optional[str] = None                          # 🎨 Прийде з availability
+        self._description_msg: Optional[Message] = None                  # ✏️ Для edit після availability
+        self._deferred: List[Callable[[], Awaitable[None]]] = []         # ⏸️ Блоки, що чекають опису
+        self.preview_sent = False                                        # 🖼️ Чи пішли фото
+        self.description_sent = False                                    # 📝 Чи пішов опис
+        self.first_message_sec: Optional[float] = None                   # ⏱️ TTFM цієї картки
+
+    # ================================
+    # 📣 ВХІД ПОДІЙ
+    # ================================
+    def on_stage(self, outcome: StageOutcome) -> None:
+        """📣 Слухач для `ProductProcessingService.process_url(on_stage=...)` — лише ставить у чергу."""
+        self._queue.put_nowait(outcome)
+
+    def finish(self) -> None:
+        """🏁 Обробка завершена — після черги `run()` дошле відкладене та вийде."""
+        self._queue.put_nowait(_DONE)
+
+    # ================================
+    # 🚚 РОЗСИЛКА
+    # ================================
+    async def run(self) -> None:
+        """🚚 Послідовно перетворює події етапів на повідомлення (порядок у чаті стабільний)."""
+        while True:
+            item = await self._queue.get()
+            if item is _DONE:
+                break
+            try:
+                with span(f"telegram.{item.name}"):
+                    await self._dispatch(item)
+                    await self._flush_deferred()
+            except asyncio.CancelledError:
+                raise
+            except ProductMediaPreparationError as exc:
+                logger.warning("product.stream_preview_failed | url=%s reason=%s", self.url, exc)
+            except Exception:  # noqa: BLE001 — один блок не валить інші
+                logger.warning("product.stream_block_failed | url=%s stage=%s", self.url, item.name, exc_info=True)
+        await self._flush_deferred(force=True)
+        if self.first_message_sec is not None:                           # 🗃️ Без етапів (кеш) картку шле handler
+            PRODUCT_TIME_TO_FULL_CARD.labels(mode="streaming").observe(time.perf_counter() - self._started_at)
+
+    async def _dispatch(self, outcome: StageOutcome) -> None:
+        if outcome.name == "parse" and outcome.ok:
+            parser, product_info = outcome.value
+            self._title = product_info.title or ""
+            self._page_source = getattr(parser, "page_source", "") or ""
+            if not self._size_chart_stage and self._page_source:
+                self._defer_size_chart()                                 # 📏 Окремого етапу немає — HTML уже є
+            await self._send_preview(list(product_info.images or ()) or [product_info.image_url])
+        elif outcome.name == "availability":
+            self._colors_text = ProductProcessingService.colors_text_from(outcome.value if outcome.ok else None)
+            if self._description_msg is not None and self._content is not None:
+                await self.messenger.edit_description(self._description_msg, self._with_colors(self._content))
+        elif outcome.name == "content" and outcome.ok:
+            content, _ = outcome.value
+            self._content = content
+            self._description_msg = await self.messenger.send_description(self.update, self._with_colors(content))
+            self._mark_first_message()
+            await self.messenger.send_price(self.update, content)
+            self.description_sent = True
+        elif outcome.name == "music" and outcome.ok:
+            music_text = getattr(outcome.value, "raw_text", "") or ""
+            self._defer(lambda: self.messenger.send_music_block(
+                self.update, self.context, music_text, self._title.upper(),
+            ))
+        elif outcome.name == "size_chart" and outcome.ok and self._page_source:
+            self._defer_size_chart()
+
+    async def _send_preview(self, images: List[str]) -> None:
+        stack = await self.media_preparer.prepare_stack([img for img in images if img], title=self._title or self.url)
+        if not stack.files:
+            raise ProductMediaPreparationError("Не вдалося підготувати жодного фото товару.")
+        await self.messenger.send_preview(self.update, self.context, title=self._title, media_stack=tuple(stack.files))
+        self.preview_sent = True
+        self._mark_first_message()
+
+    # ================================
+    # 🧰 ВНУТРІШНЄ
+    # ================================
+    def _with_colors(self, content: ProductContentDTO) -> ProductContentDTO:
+        return dataclasses.replace(content, colors_text=self._colors_text or AVAILABILITY_PENDING_TEXT)
+
+    def _defer_size_chart(self) -> None:
+        page_source = self._page_source
+        self._defer(lambda: self.messenger.send_size_chart(
+            self.update, self.context, url=self.url, page_source=page_source,
+        ))
+
+    def _defer(self, block: Callable[[], Awaitable[None]]) -> None:
+        self._deferred.append(block)
+
+    async def _flush_deferred(self, *, force: bool = False) -> None:
+        """⏯️ Відкладені блоки йдуть після опису; `force` — наприкінці, навіть якщо опису не буде."""
+        if not self.description_sent and not force:
+            return
+        while self._deferred:
+            block = self._deferred.pop(0)
+            try:
+                await block()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.warning("product.stream_deferred_failed | url=%s", self.url, exc_info=True)
+
+    def _mark_first_message(self) -> None:
+        if self.first_message_sec is not None:
+            return
+        self.first_message_sec = time.perf_counter() - self._started_at
+        PRODUCT_TIME_TO_FIRST_MESSAGE.labels(mode="streaming").observe(self.first_message_sec)
+        logger.info("⏱️ product.first_message | url=%s sec=%.2f", self.url, self.first_message_sec)
+
+
+__all__ = ["AVAILABILITY_PENDING_TEXT", "ProgressiveCardSender"]
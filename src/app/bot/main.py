@@ -70,11 +70,18 @@ def build_application(token: str) -> Application:
     logger.debug("🧱 Створюємо DI-контейнер")											# 🧱 Лог створення контейнера
     container = Container(config)													# 🧩 Інстансуємо контейнер
 
+    async def _on_shutdown(_: Application) -> None:
+        """
+        Закриває пули з'єднань контейнера після зупинки PTB.
+        """
+        await container.shutdown()												# 🧹 Graceful shutdown
+
     logger.debug("🤖 Будуємо Application через ApplicationBuilder")								# 🤖 Лог побудови PTB Application
     application = (
         ApplicationBuilder()
         .token(token)														# 🔑 Передаємо токен
         .context_types(ContextTypes(context=CustomContext))								# 🧠 Підключаємо CustomContext
+        .post_shutdown(_on_shutdown)												# 🧹 Звільняємо ресурси контейнера
         .build()															# 🏗️ Створюємо Application
     )
 
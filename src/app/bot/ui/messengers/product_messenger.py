@@ -5,18 +5,19 @@
 🔹 Відправляє текстовий опис, заголовок і прайс-звіт у правильній послідовності
 🔹 Додає додаткові блоки (музика, фото/альбоми, таблиці розмірів)
 🔹 Делегує бізнес-логіку допоміжним сервісам, концентруючись на оркестрації UI
+🔹 Окремі блоки (прев'ю з фото, опис, прайс, музика, size chart) доступні поодинці — для прогресивної доставки
 """
 
 from __future__ import annotations
 
 # 🌐 Зовнішні бібліотеки
-from telegram import Update                                              # 🤖 Telegram Bot API (type stubs можуть бути відсутні)
+from telegram import Message, Update                                     # 🤖 Telegram Bot API (type stubs можуть бути відсутні)
 
 # 🔠 Системні імпорти
 import asyncio                                                           # ⏱️ Асинхронні паузи між блоками
 import logging                                                           # 🧾 Логування перебігу сценарію
 import re                                                                # 🔍 Нормалізація музичних рекомендацій
-from typing import Final, Optional, Sequence                           # 🧰 Типи для медіастеку
+from typing import Final, List, Optional, Sequence                     # 🧰 Типи для медіастеку
 
 # 🧩 Внутрішні модулі проєкту
 from app.bot.handlers.product.image_sender import (                     # 🖼️ Відправка фотографій/альбомів
@@ -30,6 +31,7 @@ from app.config.setup.constants import AppConstants                      # ⚙
 from app.errors.exception_handler_service import ExceptionHandlerService # 🛡️ Централізована обробка винятків
 from app.infrastructure.music.music_sender import MusicSender            # 🎵 Надсилання музичних рекомендацій
 from app.infrastructure.services.product_media_preparer import ProductMediaPreparationError  # 🧰 Помилки медіа
+from app.infrastructure.content.product_content_service import ProductContentDTO  # 📝 Контент картки
 from app.infrastructure.services.product_processing_service import (
     ProcessedProductData,                                                # 📦 Агрегований результат обробки товару
 )
@@ -43,6 +45,12 @@ logger: Final = logging.getLogger(LOG_NAME)                              # 🧾
 _BLOCK_PAUSE_SEC: Final[float] = 0.10                                    # ⏳ Паузи між блоками для уникнення rate-limit
 
 
+def _message_ids(*messages: object) -> List[int]:
+    """💬 id повідомлень Telegram (None та обʼєкти без id пропускаються)."""
+    ids = (getattr(message, "message_id", None) for message in messages)
+    return [message_id for message_id in ids if isinstance(message_id, int)]
+
+
 # ================================
 # 🏛️ КООРДИНАТОР ВІДПРАВКИ ТОВАРУ
 # ================================
@@ -79,13 +87,16 @@ class ProductMessenger:
         data: ProcessedProductData,
         *,
         media_stack: Optional[Sequence[MediaRef]] = None,
-    ) -> None:
+    ) -> List[int]:
         """
         🚚 Відправляє опис, заголовок, прайс, музику, фото та таблицю розмірів.
+
+        Повертає id надісланих текстових блоків і фото (для чекпоінтів колекцій).
         """
+        message_ids: List[int] = []                                       # 💬 Що вже з'явилося в чаті
         try:
             if update.message is None:                                    # 🚫 Callback без повідомлення → нічого надсилати
-                return                                                   # 🛑 Завершуємо сценарій
+                return message_ids                                       # 🛑 Завершуємо сценарій
 
             chat_id = getattr(update.effective_chat, "id", None)          # 🆔 Chat ID для діагностики
             user_id = getattr(update.effective_user, "id", None)          # 👤 User ID для аудиту
@@ -96,22 +107,25 @@ class ProductMessenger:
             )
             parse_mode = self.const.UI.DEFAULT_PARSE_MODE                 # 🅿️ Режим розмітки (HTML/Markdown)
 
-            await update.message.reply_text(                              # 📨 Основний опис товару
+            sent = await update.message.reply_text(                       # 📨 Основний опис товару
                 description_text,
                 parse_mode=parse_mode,
             )
+            message_ids.extend(_message_ids(sent))
             await asyncio.sleep(_BLOCK_PAUSE_SEC)                         # ⏳ Пауза, щоб не впертись у rate-limit
 
-            await update.message.reply_text(                              # 🏷️ Назва товару капсом
+            sent = await update.message.reply_text(                       # 🏷️ Назва товару капсом
                 f"<b>{title_upper}</b>",
                 parse_mode=parse_mode,
             )
+            message_ids.extend(_message_ids(sent))
             await asyncio.sleep(_BLOCK_PAUSE_SEC)                         # ⏳ Коротка пауза перед наступним блоком
 
-            await update.message.reply_text(                              # 💵 Прайс-звіт
+            sent = await update.message.reply_text(                       # 💵 Прайс-звіт
                 data.content.price_message,
                 parse_mode=parse_mode,
             )
+            message_ids.extend(_message_ids(sent))
 
             logger.info(                                                  # 🧾 Фіксуємо успішну відправку основних блоків
                 "📨 Текстові блоки відправлено | chat_id=%s user_id=%s title=%s",
@@ -120,18 +134,19 @@ class ProductMessenger:
                 title_upper,
             )
 
-            await self._send_music_block(update, context, data.music_text, title_upper)  # 🎵 Музичні рекомендації
+            await self.send_music_block(update, context, data.music_text, title_upper)  # 🎵 Музичні рекомендації
 
             final_media = media_stack if media_stack is not None else data.content.images
             if not final_media:
                 logger.warning("🖼️ Стек фото порожній | title=%s", title_upper)
-                return
+                return message_ids
 
             sent_media = await self.image_sender.send_images(             # 🖼️ Фото/альбоми товару
                 update=update,
                 context=context,
                 images=final_media,
             ) or []                                                       # 🔁 Гарантуємо список навіть у разі None
+            message_ids.extend(_message_ids(*sent_media))
             logger.info(                                                  # 🧾 Лог відправлених фото
                 "🖼️ Фото відправлено | chat_id=%s user_id=%s requested=%d sent=%d",
                 chat_id,
@@ -159,11 +174,89 @@ class ProductMessenger:
             raise                                                         # 🔁 Пробросимо вище — хай обробник вирішує
         except Exception as error:  # noqa: BLE001
             await self.exception_handler.handle(error, update)            # 🛡️ Делегуємо обробку винятку
+        return message_ids
+
+    # ================================
+    # 🧱 ОКРЕМІ БЛОКИ (ПРОГРЕСИВНА ДОСТАВКА)
+    # ================================
+    async def send_preview(
+        self,
+        update: Update,
+        context: CustomContext,
+        *,
+        title: str,
+        media_stack: Sequence[MediaRef],
+    ) -> List[Message]:
+        """
+        🖼️ Перше повідомлення картки: фото/альбом з назвою товару в підписі.
+        """
+        caption = f"<b>{(title or '').upper()}</b>"                       # 🏷️ Назва капсом як у повній картці
+        return await self.image_sender.send_images(
+            update=update,
+            context=context,
+            images=media_stack,
+            caption=caption,
+            parse_mode=self.const.UI.DEFAULT_PARSE_MODE,
+        ) or []
+
+    async def send_description(self, update: Update, content: ProductContentDTO) -> Optional[Message]:
+        """
+        📝 Надсилає опис товару; повертає `Message`, щоб пізніше дописати блок наявності.
+        """
+        if update.message is None:
+            return None
+        return await update.message.reply_text(
+            self.formatter.format_description(content),
+            parse_mode=self.const.UI.DEFAULT_PARSE_MODE,
+        )
+
+    async def edit_description(self, message: Message, content: ProductContentDTO) -> None:
+        """
+        ✏️ Оновлює вже надісланий опис (наприклад, коли прийшов блок наявності).
+        """
+        try:
+            await message.edit_text(
+                self.formatter.format_description(content),
+                parse_mode=self.const.UI.DEFAULT_PARSE_MODE,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:  # noqa: BLE001
+            logger.warning("✏️ Не вдалося оновити опис товару: %s", error)   # ⚠️ Старий текст лишається
+
+    async def send_price(self, update: Update, content: ProductContentDTO) -> None:
+        """
+        💵 Надсилає прайс-звіт.
+        """
+        if update.message is None or not content.price_message:
+            return
+        await update.message.reply_text(
+            content.price_message,
+            parse_mode=self.const.UI.DEFAULT_PARSE_MODE,
+        )
+
+    async def send_size_chart(
+        self,
+        update: Update,
+        context: CustomContext,
+        *,
+        url: str,
+        page_source: str,
+    ) -> None:
+        """
+        📏 Надсилає таблиці розмірів із уже завантаженого HTML.
+        """
+        await self.size_chart_handler.size_chart_command(
+            update=update,
+            context=context,
+            url=url,
+            page_source=page_source,
+        )
 
     # ================================
     # 🎵 ДОПОМІЖНИЙ БЛОК МУЗИКИ
     # ================================
-    async def _send_music_block(
+    async def send_music_block(
         self,
         update: Update,
         context: CustomContext,
@@ -67,6 +67,18 @@ CURRENCY_RATE_OUT_OF_RANGE: Final[str] = (
 )														# ⚠️ Перевірка діапазону значення курсу
 
 
+# ================================
+# 🧵 ТРЕЙСИ (ADMIN)
+# ================================
+TRACES_EMPTY: Final[str] = (
+    "🧵 Повільних запитів (≥ {slow_ms} мс) ще не було."
+)																	# 🕳️ Буфер трейсів порожній
+
+TRACES_FORBIDDEN: Final[str] = (
+    "🔐 Команда доступна лише адміністраторам."
+)																	# 🔐 Користувача немає в admin_user_ids
+
+
 # ================================
 # 📋 ГОЛОВНЕ МЕНЮ (MAIN MENU)
 # ================================
@@ -127,6 +139,10 @@ COLL_HEALTH_SUMMARY: Final[str] = (
     "• З ALT-фолбеком: {alt_fallback}\n"
     "• Помилки: {failed}"
 )																					# 🩺 Короткий звіт про здоров’я колекції
+COLL_SKIPPED_UNCHANGED: Final[str] = "⏭️ Пропущено без змін: {skipped}"					# ⏭️ Режим «лише змінені»
+COLL_NOTHING_CHANGED: Final[str] = "♻️ Усі {skipped} товарів без змін — нічого надсилати."		# ♻️ Усе вже оброблено
+COLL_RESUMED: Final[str] = "♻️ Продовжено перерване завдання: {done} товарів уже було надіслано раніше."	# ♻️ Чекпоінт колекції
+COLL_DEDUPLICATED: Final[str] = "🛬 Спільних OCR/AI-операцій без повтору: {count}"		# 🛬 Single-flight у межах запуску
 COLL_EMPTY: Final[str] = "❌ Не вдалося знайти товари в цій колекції."						# ❌ Порожня колекція
 COLL_INVALID_URL: Final[str] = "❌ Некоректне посилання на колекцію."						# ❌ Валідація URL колекції
 COLL_CANCELLED: Final[str] = "⏹️ Обробку колекції скасовано."							# ⏹️ Скасовано користувачем/помилкою
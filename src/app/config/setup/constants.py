@@ -135,6 +135,7 @@ class _Commands:
     HELP: Final[str] = "help"                                            # ℹ️ /help
     RATE: Final[str] = "rate"                                            # 💱 /rate
     SET_RATE: Final[str] = "set_rate"                                    # ✏️ /set_rate
+    TRACES: Final[str] = "traces"                                        # 🧵 /traces (адмін)
 
 
 @dataclass(frozen=True, slots=True)
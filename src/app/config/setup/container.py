@@ -15,6 +15,7 @@ from __future__ import annotations
 # 🔠 Системні імпорти
 import logging                                                           # 🧾 Базові засоби логування
 from decimal import Decimal, InvalidOperation                            # 🪙 Конвертація конфігурацій грошей
+from pathlib import Path                                                 # 📁 Корінь шаблонів промптів
 from typing import TYPE_CHECKING, Any, Dict, Optional, cast              # 🧮 Допоміжні типи та касти
 
 # 🧩 Внутрішні модулі проєкту
@@ -23,11 +24,13 @@ from typing import TYPE_CHECKING, Any, Dict, Optional, cast              # 🧮
 from app.bot.commands.core_commands_feature import CoreCommandsFeature   # 🧱 Базові команди бота
 from app.bot.commands.currency_feature import CurrencyFeature            # 💱 Курсові команди
 from app.bot.commands.main_menu_feature import MainMenuFeature           # 📋 Побудова головного меню
+from app.bot.commands.traces_feature import TracesFeature                # 🧵 Адмін-команда /traces
 from app.bot.handlers.callback_handler import CallbackHandler            # 🔄 Централізований callback-хендлер
 from app.bot.handlers.link_handler import LinkHandler                    # 🔗 Обробка вхідних посилань
 from app.bot.handlers.price_calculator_handler import PriceCalculationHandler  # 🧮 Хендлер розрахунку ціни
 from app.bot.handlers.order_handler import OrderFileHandler                   # 📂 Обробка .txt-файлів замовлень
 from app.bot.handlers.product.collection_handler import CollectionHandler  # 🧺 Пакетна обробка колекцій
+from app.bot.handlers.product.collection_runner import CollectionPipelineSettings  # 📤 Конвеєр надсилання колекцій
 from app.bot.handlers.product.image_sender import ImageSender            # 🖼️ Відправка медіа
 from app.bot.handlers.product.product_handler import ProductHandler      # 🛒 Бізнес-логіка товарів
 from app.bot.handlers.size_chart_handler_bot import SizeChartHandlerBot  # 📏 Обробка таблиць розмірів
@@ -74,9 +77,20 @@ from app.infrastructure.music.music_sender import MusicSender            # 📤
 from app.infrastructure.music.yt_downloader import YtDownloader          # ⬇️ Завантаження з YouTube
 from app.infrastructure.parsers.factory_adapter import ParserFactoryAdapter  # 🔌 Адаптер фабрики парсерів
 from app.infrastructure.parsers.parser_factory import ParserFactory      # 🧩 Фабрика парсерів
+from app.infrastructure.catalog.product_catalog_index import ProductCatalogIndex  # 📚 Локальний каталог товарів
 from app.infrastructure.services.banner_drop_service import BannerDropService      # 🪧 Banner drop
+from app.infrastructure.services.processed_product_cache import (  # 🗃️ Кеш готових карток
+    ProcessedProductCache,
+    content_version,
+    rates_fingerprint,
+)
 from app.infrastructure.services.product_media_preparer import ProductMediaPreparer  # 🖼️ Підготовка фото
 from app.infrastructure.services.product_processing_service import ProductProcessingService  # 🛠️ Комплексна обробка товару
+from app.infrastructure.services.image_normalizer import ImageNormalizer, NormalizeSettings  # 🪄 Ресайз фото перед upload
+from app.infrastructure.services.collection_job_store import CollectionJobStore  # 💾 Чекпоінти колекцій
+from app.infrastructure.services.seen_products_index import SeenProductsIndex  # 🗂️ Індекс оброблених товарів
+from app.infrastructure.services.processed_banner_index import DEFAULT_BANNER_INDEX_PATH, ProcessedBannerIndex  # 🪧 Опубліковані банери
+from app.infrastructure.services.telegram_file_id_cache import DEFAULT_FILE_ID_CACHE_PATH, TelegramFileIdCache  # 📎 Кеш file_id
 
 # 📏 Інфраструктура: доступність та size chart
 from app.infrastructure.availability.availability_handler import AvailabilityHandler  # 📬 Обробка звітів доступності
@@ -86,6 +100,7 @@ from app.infrastructure.availability.cache_service import AvailabilityCacheServi
 from app.infrastructure.availability.formatter import ColorSizeFormatter  # 🎨 Форматер кольорів та розмірів
 from app.infrastructure.availability.report_builder import AvailabilityReportBuilder  # 🧱 Побудова звітів
 from app.infrastructure.size_chart.image_downloader import ImageDownloader  # 🖼️ Викачування зображень
+from app.infrastructure.web.http_client_pool import HttpClientPool, HttpPoolConfig  # 🔌 Спільний пул HTTP-з'єднань
 from app.infrastructure.size_chart.ocr_service import OCRService         # 👁️ Розпізнавання тексту
 from app.infrastructure.size_chart.general import YoungLAProductGenderDetector  # 🚻 Детектор статі товарів YoungLA
 from app.infrastructure.size_chart.size_chart_service import SizeChartService  # 📏 Побудова таблиць розмірів
@@ -97,7 +112,12 @@ from app.infrastructure.url import YoungLAUrlStrategy                    # 🧭
 from app.infrastructure.web.webdriver_service import WebDriverService    # 🌐 Selenium/Chrome клієнт
 from app.infrastructure.web.youngla_order_service import YoungLAOrderService  # 🛒 Автоматизація кошика YoungLA
 from app.shared.cache.html_lru_cache import HtmlLruCache                 # 🧊 LRU-кеш HTML/ALT
+from app.shared.cache.media_store import DEFAULT_MEDIA_STORE_DIR, MediaStore  # 🗄️ Спільне сховище зображень
+from app.shared.cache.product_hints_cache import ProductHintsCache       # 🧷 Назви товарів із products.json
+from app.shared.metrics.collection import COLLECTION_CONCURRENCY_LIMIT  # 🚦 Gauge ліміту колекцій
 from app.shared.metrics.exporters import maybe_start_prometheus          # 📈 Bootstrap метрик
+from app.shared.tracing import DEFAULT_TRACES_PATH, JsonlTraceSink, Tracer, configure_tracer  # 🧵 Трейси запитів
+from app.shared.utils.adaptive_limiter import AdaptiveConcurrencyLimiter, AdaptiveLimitSettings  # 🚦 AIMD
 from app.shared.utils.interfaces import IUrlParsingStrategy              # 🧠 Контракт стратегій URL
 from app.shared.utils.logger import LOG_NAME, init_logging_from_config   # 🧾 Конфіг логування
 from app.shared.utils.url_parser_service import UrlParserService         # 🔗 Багатостратегічний парсер URL
@@ -193,6 +213,7 @@ class Container:
         self.constants: AppConstants = CONST                              # 🧱 Глобальні константи застосунку
         logger.info("🚀 Стартуємо побудову контейнера залежностей")       # 🧾 Фіксуємо старт ініціалізації
         self._bootstrap_metrics_if_enabled()                              # 📈 Можливий запуск експорту метрик
+        self._setup_tracing()                                             # 🧵 Глобальний трейсер + JSONL
         self._setup_error_handlers()                                      # 🛡️ Включаємо глобальні стратегії помилок
         self._setup_utility_services()                                    # 🧰 Підготовлюємо утилітарні сервіси
         self._setup_ai_and_content()                                      # 🤖 Налаштовуємо AI та контентний стек
@@ -225,6 +246,134 @@ class Container:
         except Exception:                                                # ⚠️ Будь-яка помилка експортера
             logger.exception("⚠️ Не вдалося стартувати експортер метрик")  # 🧾 Додаємо трасування
 
+    def _setup_tracing(self) -> None:
+        """
+        Налаштовує глобальний трейсер запитів (`telemetry.traces`).
+        """
+        node = self.config.get("telemetry.traces", {}) or {}             # 🧾 Блок конфігурації
+        enabled = bool(node.get("enabled", True))                        # 🔛 Чи збираємо трейси
+        sink = JsonlTraceSink(
+            str(node.get("path") or DEFAULT_TRACES_PATH),
+            min_total_ms=float(node.get("min_total_ms", 0) or 0),
+        ) if enabled else None                                           # 📤 JSONL-приймач
+        self.tracer = configure_tracer(
+            Tracer(
+                sink,
+                enabled=enabled,
+                keep=_int_or_default(node.get("keep", 200), 200),
+                max_spans=_int_or_default(node.get("max_spans", 256), 256),
+            )
+        )                                                                # 🧵 Глобальний трейсер
+        self.traces_slow_ms = float(node.get("slow_ms", 3000) or 0)      # 🐢 Поріг для /traces
+        self.traces_admin_ids = [int(uid) for uid in (node.get("admin_user_ids") or [])]  # 🔐 Доступ до /traces
+        logger.debug("🧵 Трасування: enabled=%s slow_ms=%.0f", enabled, self.traces_slow_ms)
+
+    # ================================
+    # 🔌 HTTP-З'ЄДНАННЯ
+    # ================================
+    def _build_image_http_pool(self) -> HttpClientPool:
+        """
+        Створює спільний пул HTTP-з'єднань (`http.image_pool`): фото з CDN, `products.json`, `suggest.json`.
+        """
+        node = self.config.get("http.image_pool", {}) or {}             # 🧾 Блок конфігурації
+        defaults = HttpPoolConfig()
+        return HttpClientPool(
+            HttpPoolConfig(
+                max_connections=_int_or_default(node.get("max_connections"), defaults.max_connections),
+                max_keepalive_connections=_int_or_default(
+                    node.get("max_keepalive_connections"), defaults.max_keepalive_connections
+                ),
+                keepalive_expiry_s=float(node.get("keepalive_expiry_sec", defaults.keepalive_expiry_s) or 0),
+                http2=bool(node.get("http2", defaults.http2)),
+            )
+        )
+
+    def _build_media_store(self) -> Optional[MediaStore]:
+        """
+        Створює спільне контентно-адресоване сховище зображень (`media_store`) або None.
+        """
+        node = self.config.get("media_store", {}) or {}                 # 🧾 Блок конфігурації
+        if not bool(node.get("enabled", True)):
+            return None
+        return MediaStore(
+            self.config.get("files.media_store_dir", DEFAULT_MEDIA_STORE_DIR),
+            max_bytes=_int_or_default(node.get("max_mb"), 512) * 1024 * 1024,
+            ttl_sec=float(node.get("ttl_sec", 24 * 3600) or 0),
+        )
+
+    def _build_collection_limiter(self, initial: int) -> Optional[AdaptiveConcurrencyLimiter]:
+        """
+        Створює AIMD-обмежувач паралелізму колекцій (`collection.adaptive`) або None (фіксований concurrency).
+        """
+        node = self.config.get("collection.adaptive", {}) or {}         # 🧾 Блок конфігурації
+        if not bool(node.get("enabled", True)):
+            return None
+        defaults = AdaptiveLimitSettings()
+        return AdaptiveConcurrencyLimiter(
+            AdaptiveLimitSettings(
+                initial=initial,
+                min_limit=_int_or_default(node.get("min"), defaults.min_limit),
+                max_limit=_int_or_default(node.get("max"), defaults.max_limit),
+                window=_int_or_default(node.get("window"), defaults.window),
+                target_p95_sec=float(node.get("target_p95_sec", defaults.target_p95_sec)),
+                max_error_rate=float(node.get("max_error_rate", defaults.max_error_rate)),
+                decrease_factor=float(node.get("decrease_factor", defaults.decrease_factor)),
+            ),
+            on_change=COLLECTION_CONCURRENCY_LIMIT.set,
+        )
+
+    def _build_collection_pipeline(self) -> CollectionPipelineSettings:
+        """
+        Зчитує налаштування конвеєра «підготовка → надсилання» колекцій (`collection.pipeline`).
+        """
+        node = self.config.get("collection.pipeline", {}) or {}         # 🧾 Блок конфігурації
+        defaults = CollectionPipelineSettings()
+        return CollectionPipelineSettings(
+            send_concurrency=_int_or_default(node.get("send_concurrency"), defaults.send_concurrency),
+            send_interval_sec=float(node.get("send_interval_sec", defaults.send_interval_sec) or 0),
+            queue_size=_int_or_default(node.get("queue_size"), defaults.queue_size),
+            preserve_order=bool(node.get("preserve_order", defaults.preserve_order)),
+            reorder_window=_int_or_default(node.get("reorder_window"), defaults.reorder_window),
+        )
+
+    def _build_image_normalizer(self) -> Optional[ImageNormalizer]:
+        """
+        Створює нормалізатор фото карток (`product_card.normalize`) або None, якщо вимкнено.
+        """
+        node = self.config.get("product_card.normalize", {}) or {}      # 🧾 Блок конфігурації
+        if not bool(node.get("enabled", True)):
+            return None
+        defaults = NormalizeSettings()
+        return ImageNormalizer(
+            NormalizeSettings(
+                max_side=_int_or_default(node.get("max_side"), defaults.max_side),
+                quality=_int_or_default(node.get("quality"), defaults.quality),
+                format=str(node.get("format") or defaults.format).upper(),
+            ),
+            cache_dir=self.config.get("files.media_renditions_dir", "./var/media/renditions"),
+            executor=str(node.get("executor") or "thread"),
+            max_workers=_int_or_default(node.get("max_workers"), 2),
+        )
+
+    # ================================
+    # 🧹 ЗАВЕРШЕННЯ РОБОТИ
+    # ================================
+    async def shutdown(self) -> None:
+        """
+        Звільняє довгоживучі ресурси контейнера (пули з'єднань) при зупинці бота.
+        """
+        await self.image_http_pool.aclose()                               # 🔌 Закриваємо з'єднання з CDN
+        search_closer = getattr(self.search_resolver, "aclose", None)
+        if callable(search_closer):
+            await search_closer()                                         # 🔍 Теплі сторінки пошуку
+        await self.catalog_index.aflush()                                 # 📚 Останні зміни каталогу на диск
+        if self.telegram_file_id_cache is not None:
+            await self.telegram_file_id_cache.flush()                     # 📎 Відкладені file_id на диск
+        if self.image_normalizer is not None:
+            self.image_normalizer.shutdown()                              # 🪄 Зупиняємо пул Pillow
+        self.banner_drop_service.shutdown()                               # 🪧 Пул нарізки банерів
+        logger.info("🧹 Контейнер: ресурси звільнено")
+
     # ================================
     # 🛡️ ОБРОБКА ПОМИЛОК
     # ================================
@@ -248,8 +397,17 @@ class Container:
         """
         Ініціалізує клієнти інфраструктури, кеші та допоміжні сервіси.
         """
+        self.image_http_pool = self._build_image_http_pool()                             # 🔌 Спільний HTTP-пул (CDN + Shopify JSON)
         self.webdriver_service = WebDriverService(config_service=self.config)             # 🌐 Selenium/Chrome клієнт
-        self.youngla_order_service = YoungLAOrderService(config_service=self.config)      # 🛒 Автоматизоване додавання до кошика
+        self.catalog_index = ProductCatalogIndex(
+            self.config.get("files.catalog_index_path", "./var/catalog/index.json"),
+            fresh_sec=self.config.get("catalog.fresh_sec", 604800, cast=float) or 604800,
+            flush_interval_sec=self.config.get("catalog.flush_interval_sec", 30, cast=float) or 30,
+        )                                                                                # 📚 Локальний каталог товарів
+        self.youngla_order_service = YoungLAOrderService(
+            config_service=self.config,
+            catalog_index=self.catalog_index,
+        )                                                                                # 🛒 Автоматизоване додавання до кошика
         self.currency_manager = CurrencyManager(config_service=self.config)               # 💱 Робота з курсами валют
         strategy_chain: list[IUrlParsingStrategy] = [
             YoungLAUrlStrategy(self.config),                                             # 🧭 Брендова стратегія YoungLA
@@ -275,9 +433,15 @@ class Container:
         self.formatter = MessageFormatter()                                              # 📝 Форматування текстів
         self.availability_cache = AvailabilityCacheService()                             # 🧊 Кеш доступності
         self.color_size_formatter = ColorSizeFormatter(config_service=self.config)       # 🎨 Перетворення кольорів/розмірів
+        self.telegram_file_id_cache = TelegramFileIdCache(
+            self.config.get("files.telegram_file_ids_path", DEFAULT_FILE_ID_CACHE_PATH),
+            max_entries=_int_or_default(self.config.get("product_card.file_id_cache_max_entries", 5000, cast=int), 5000),
+            flush_sec=self.config.get("product_card.file_id_cache_flush_sec", 2.0, cast=float) or 2.0,
+        ) if bool(self.config.get("product_card.file_id_cache", True)) else None      # 📎 URL/SHA256 → Telegram file_id
         self.image_sender = ImageSender(
             exception_handler=self.exception_handler_service,
             constants=self.constants,
+            file_id_cache=self.telegram_file_id_cache,
         )                                                                                # 🖼️ Відправка зображень з захистом
         logger.debug(
             "🧰 Базові сервіси готові (lang=%s, alt_cache=%s)",
@@ -311,6 +475,7 @@ class Container:
         self.ocr_service = OCRService(
             openai_service=self.openai_service,
             prompt_service=self.prompt_service,
+            downloader=ImageDownloader(client_pool=self.image_http_pool),
         )                                                                                # 👁️ OCR через OpenAI
         self.font_service = FontService(config_service=self.config)                      # ✍️ Шрифти для таблиць
         self.table_generator_factory = TableGeneratorFactory(font_service=self.font_service)  # 📊 Побудова таблиць
@@ -396,6 +561,8 @@ class Container:
             weight_resolver=self.weight_resolver,
             config_service=self.config,
             url_parser_service=self.url_parser_service,
+            catalog_index=self.catalog_index,
+            http_pool=self.image_http_pool,
         )                                                                                # 🧩 Фабрика парсерів
         self.parser_factory_adapter = ParserFactoryAdapter(self.parser_factory)          # 🔌 Адаптер фабрики
         self.availability_report_builder = AvailabilityReportBuilder(
@@ -415,6 +582,31 @@ class Container:
     # ================================
     # 🚀 ВИСОКОРІВНЕВІ СЕРВІСИ
     # ================================
+    def _build_processed_product_cache(self) -> Optional[ProcessedProductCache]:
+        """
+        Створює кеш `ProcessedProductData`, якщо його увімкнено в `processing.cache`.
+        """
+        if not bool(self.config.get("processing.cache.enabled", True)):
+            return None
+        disk_dir = None
+        if bool(self.config.get("processing.cache.disk_enabled", False)):
+            disk_dir = self.config.get("files.processed_cache_dir", "./var/processed_cache")
+        version = content_version(
+            self.config.get("processing.cache.version", "1"),
+            self.config.get("openai.model", ""),
+            self.config.get("openai.prompts", {}),
+            prompts_root=Path(__file__).resolve().parents[2] / "shared" / "prompts",
+        )                                                                                # 🧬 Конфіг + шаблони промптів
+        return ProcessedProductCache(
+            ttl_sec=self.config.get("processing.cache.ttl_sec", 900, cast=float) or 0,
+            availability_ttl_sec=self.config.get("processing.cache.availability_ttl_sec", 120, cast=float) or 0,
+            max_entries=self.config.get("processing.cache.max_entries", 128, cast=int) or 128,
+            max_bytes=self.config.get("processing.cache.max_bytes", 33554432, cast=int) or 33554432,
+            disk_dir=disk_dir,
+            version=version,
+            currency_fingerprint=lambda: rates_fingerprint(self.currency_manager.get_all_rates()),
+        )
+
     def _setup_high_level_services(self) -> None:
         """
         Будує високорівневі обробники, месенджери та пайплайни обробки.
@@ -448,9 +640,22 @@ class Container:
             price_handler=self.price_calculator,
             alt_text_generator=self.alt_text_generator,
         )                                                                                # 📝 Збагачення контенту
-        self.image_downloader = ImageDownloader(compute_sha256=True)                     # 🖼️ Завантаження з SHA кешем
+        self.image_normalizer = self._build_image_normalizer()                           # 🪄 Ресайз/перекодування фото
+        self.media_store = self._build_media_store()                                     # 🗄️ Спільне сховище зображень
+        self.image_downloader = ImageDownloader(
+            compute_sha256=True,
+            client_pool=self.image_http_pool,
+            media_store=self.media_store,
+        )                                                                                # 🖼️ Size-chart та банери
         self.product_media_preparer = ProductMediaPreparer(                               # 🧰 Підготовка стеку фото
-            downloader=ImageDownloader(max_attempts=3, backoff_base_s=0.8),
+            downloader=ImageDownloader(
+                max_attempts=3,
+                backoff_base_s=0.8,
+                client_pool=self.image_http_pool,
+                media_store=self.media_store,
+            ),
+            max_concurrency=_int_or_default(self.config.get("product_card.media_concurrency", 4, cast=int), 4),
+            normalizer=self.image_normalizer,
         )
         self.size_chart_finder = YoungLASizeChartFinder()                                # 🧭 Пошук таблиць YoungLA
         self.product_gender_detector = YoungLAProductGenderDetector()                    # 🚻 Детектор статі товару
@@ -461,6 +666,7 @@ class Container:
             size_chart_finder=self.size_chart_finder,
             product_gender_detector=self.product_gender_detector,
         )                                                                                # 📏 Побудова таблиць розмірів
+        self.processed_product_cache = self._build_processed_product_cache()  # 🗃️ Кеш готових карток (або None)
         self.processing_service = ProductProcessingService(
             parser_factory=self.parser_factory,
             availability_processing_service=self.availability_processing_service,
@@ -468,6 +674,9 @@ class Container:
             music_recommendation=self.music_recommendation,
             url_parser_service=self.url_parser_service,
             size_chart_service=self.size_chart_service,
+            catalog_index=self.catalog_index,
+            stage_timeouts=self.config.get("processing.stage_timeouts_sec", {}) or {},
+            result_cache=self.processed_product_cache,
         )                                                                                # ⚙️ Комплексна обробка товару
         self.size_chart_messenger = SizeChartMessenger(
             image_sender=self.image_sender,
@@ -496,6 +705,7 @@ class Container:
             exception_handler=self.exception_handler_service,
             constants=self.constants,
             url_parser_service=self.url_parser_service,
+            streaming=bool(self.config.get("product_card.streaming", False)),
         )                                                                                # 🛒 Основний продукт-хендлер
         self.collection_processing_service = CollectionProcessingService(
             parser_factory=self.parser_factory_adapter,
@@ -504,6 +714,18 @@ class Container:
         collection_max_items = _optional_int(self.config.get("collection.max_items", 50, cast=int), 50)  # 🔢 Обмеження елементів
         collection_concurrency = _int_or_default(self.config.get("collection.concurrency", 4, cast=int), 4)  # 🚦 Паралельність
         collection_retries = _int_or_default(self.config.get("collection.per_item_retries", 2, cast=int), 2)  # ♻️ Повтори
+        self.seen_products_index = SeenProductsIndex(
+            self.config.get("files.seen_products_dir", "./var/seen_products")
+        )                                                                                # 🗂️ Індекс оброблених товарів
+        self.collection_job_store = CollectionJobStore(
+            self.config.get("files.collection_jobs_dir", "./var/collection_jobs"),
+            max_age_sec=float(self.config.get("collection.resume_max_age_sec", 24 * 3600) or 0),
+        )                                                                                # 💾 Чекпоінти запусків колекцій
+        pending_jobs = self.collection_job_store.unfinished()
+        if pending_jobs:
+            logger.info(
+                "💾 Незавершених завдань колекцій: %d — продовжаться при повторній команді", len(pending_jobs)
+            )                                                                            # ♻️ Звіт після рестарту
         self.collection_handler = CollectionHandler(
             product_handler=self.product_handler,
             url_parser_service=self.url_parser_service,
@@ -513,6 +735,11 @@ class Container:
             max_items=collection_max_items,
             concurrency=collection_concurrency,
             per_item_retries=collection_retries,
+            seen_index=self.seen_products_index,
+            changed_only=bool(self.config.get("collection.changed_only", False)),
+            limiter=self._build_collection_limiter(collection_concurrency),
+            pipeline=self._build_collection_pipeline(),
+            job_store=self.collection_job_store if bool(self.config.get("collection.resume", True)) else None,
         )                                                                                # 🧺 Хендлер колекцій
         logger.debug(
             "🚀 High-level сервіси готові (collections max=%s, concurrency=%s)",
@@ -521,12 +748,26 @@ class Container:
         )                                                                                # 🧾 Стан високорівневих сервісів
         banner_cfg = self.config.get("banner_drop", {}) or {}
         banner_max_titles = _int_or_default(banner_cfg.get("max_product_titles"), 9)
-        banner_cache = _int_or_default(banner_cfg.get("processed_cache_size"), 5)
+        banner_cache = _int_or_default(banner_cfg.get("processed_cache_size"), 200)
+        banner_hints = (
+            ProductHintsCache(
+                max_entries=self.config.get("parser.collection.shopify_json.hints_max_entries", 2048, cast=int) or 2048,
+                ttl_sec=self.config.get("parser.collection.shopify_json.hints_ttl_sec", 900, cast=int) or 900,
+            )
+            if bool(self.config.get("parser.collection.shopify_json.seed_hints", True))
+            else None
+        )                                                                                # 🧷 Той самий синглтон, що сіє products.json
         self.banner_drop_service = BannerDropService(
             webdriver_service=self.webdriver_service,
             url_parser_service=self.url_parser_service,
             collection_processing_service=self.collection_processing_service,
-            product_processing_service=self.processing_service,
+            header_service=self.product_header_service,
+            hints_cache=banner_hints,
+            media_store=self.media_store,
+            banner_index=ProcessedBannerIndex(
+                self.config.get("files.banner_index_path", DEFAULT_BANNER_INDEX_PATH),
+                max_entries=banner_cache,
+            ),                                                                           # 🪧 Переживає рестарт
             ai_service=self.ai_task_service,
             image_downloader=self.image_downloader,
             image_sender=self.image_sender,
@@ -535,6 +776,11 @@ class Container:
             exception_handler=self.exception_handler_service,
             max_product_titles=banner_max_titles,
             processed_cache_size=banner_cache,
+            title_concurrency=_int_or_default(banner_cfg.get("title_concurrency"), 6),
+            title_budget_sec=float(banner_cfg.get("title_budget_sec") or 8.0),
+            concurrency=_int_or_default(banner_cfg.get("concurrency"), 3),
+            slice_executor=str(banner_cfg.get("slice_executor") or "thread"),
+            slice_workers=_int_or_default(banner_cfg.get("slice_workers"), 1),
         )                                                                                # 🪧 Banner drop сценарій
 
     # ================================
@@ -553,6 +799,13 @@ class Container:
                 constants=self.constants,
                 exception_handler=self.exception_handler_service,
             ),                                                                           # 💱 Курсові фічі
+            TracesFeature(
+                tracer=self.tracer,
+                constants=self.constants,
+                exception_handler=self.exception_handler_service,
+                slow_ms=self.traces_slow_ms,
+                admin_user_ids=self.traces_admin_ids,
+            ),                                                                           # 🧵 Водоспади повільних запитів
         ]                                                                                # 📦 Список фіч
         self.callback_handler = CallbackHandler(
             registry=self.callback_registry,
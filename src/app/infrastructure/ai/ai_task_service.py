@@ -3,6 +3,7 @@
 📬 Вискорівневий сервіс AI-завдань (вага, переклад, слогани).
 
 🔹 Ділегує виклики OpenAI через наші `PromptService` та `OpenAIService`.
+🔹 Однакові промпти під час запуску колекції дедуплікуються (single-flight).
 🔹 Має локальний TTL-кеш для перекладів з опційною файловою прослойкою.
 🔹 ЕмІтує сервісні телеметричні події та логує всі ключові кроки.
 """
@@ -30,6 +31,8 @@ from app.domain.ai.task_contracts import (							# 🤝 Контракти до
     IWeightEstimator,
 )
 from app.shared.utils.logger import LOG_NAME						# 🏷️ Базовий логер
+from app.shared.utils.single_flight import single_flight			# 🛬 Спільні виклики в межах запуску
+from .dto import ChatPrompt											# 💬 DTO промпта
 from .open_ai_serv import OpenAIService								# 🤖 Робота з OpenAI API
 from .prompt_service import PromptService							# ✏️ Побудова промптів
 from .telemetry_ai import TelemetrySink								# 📈 Телеметрія сервісу
@@ -218,6 +221,14 @@ class AITaskService(IWeightEstimator, ITranslator, ISloganGenerator, IBannerPost
         )                                                              # 🪵 Лог для діагностики
         return key                                                     # ↩️ Використовуємо як ключ кешу
 
+    async def _complete(self, kind: str, prompt: ChatPrompt, *, key: Optional[str] = None) -> Optional[str]:
+        """🛬 Виклик OpenAI; однаковий промпт у межах запуску колекції виконується один раз."""
+        return await single_flight(
+            f"ai.{kind}",
+            key or prompt.fingerprint(),
+            lambda: self._openai.chat_completion(prompt),
+        )
+
     def _emit(self, name: str, payload: Dict[str, Any]) -> None:
         """📡 Безпечна обгортка для TelemetrySink."""
         try:
@@ -235,7 +246,7 @@ class AITaskService(IWeightEstimator, ITranslator, ISloganGenerator, IBannerPost
             {"title_len": len(title or ""), "desc_len": len(description or ""), "has_image": bool(image_url)},
         )
         prompt = self._prompts.weight(title=title, description=description, image_url=image_url)  # ✏️ Створюємо промпт
-        response = await self._openai.chat_completion(prompt)			# 🤖 Запит до OpenAI
+        response = await self._complete("weight", prompt)				# 🤖 Запит до OpenAI
         if not response:
             self._emit("ai.weight.result", {"ok": False, "reason": "empty"})
             logger.warning("⚖️ Відповідь ваги порожня — fallback 1000 г")
@@ -277,7 +288,7 @@ class AITaskService(IWeightEstimator, ITranslator, ISloganGenerator, IBannerPost
             self._emit("ai.translate.cache", {"hit": False})            # 🛰️ Нема в кеші → збираємо з нуля
 
         prompt = self._prompts.translation(text=text)					# ✏️ Будуємо промпт
-        response = await self._openai.chat_completion(prompt)			# 🤖 OpenAI
+        response = await self._complete("translate", prompt, key=cache_key)	# 🤖 OpenAI
         if not response:
             self._emit("ai.translate.result", {"ok": False, "reason": "empty"})
             logger.warning("🌐 Переклад: відповідь порожня")
@@ -340,7 +351,7 @@ class AITaskService(IWeightEstimator, ITranslator, ISloganGenerator, IBannerPost
             {"title_len": len(title or ""), "desc_len": len(description or "")},
         )
         prompt = self._prompts.slogan(title=title, description=description)  # ✏️ Готуємо промпт
-        response = await self._openai.chat_completion(prompt)				 # 🤖 OpenAI
+        response = await self._complete("slogan", prompt)				 # 🤖 OpenAI
         if not response:
             self._emit("ai.slogan.result", {"ok": False, "reason": "empty", "fallback": True})
             logger.warning("✨ Слоган: порожня відповідь — повертаємо дефолт")
@@ -379,7 +390,7 @@ class AITaskService(IWeightEstimator, ITranslator, ISloganGenerator, IBannerPost
             vibe_hint=vibe_hint or "",
             link_count=max(0, link_count),
         )
-        response = await self._openai.chat_completion(prompt)
+        response = await self._complete("banner_post", prompt)
         if not response:
             self._emit("ai.banner_post.result", {"ok": False, "reason": "empty", "fallback": True})
             logger.warning("🪧 Banner post: порожня відповідь — повертаємо fallback.")
@@ -13,6 +13,7 @@ from __future__ import annotations
 # (немає)																# 🚫 DTO агрегує тільки stdlib
 
 # 🔠 Системні імпорти
+import hashlib															# 🔐 Відбиток промпта
 import logging															# 🧾 Логи створення DTO
 from dataclasses import dataclass										# 🧱 Оголошення структур
 from enum import Enum													# 🧮 Ролі повідомлень
@@ -85,5 +86,14 @@ class ChatPrompt:
             },
         )																# 🪵 Допоміжний лог
 
+    def fingerprint(self) -> str:
+        """🔑 Стабільний sha256 промпта (модель, параметри, повідомлення) — ключ дедуплікації."""
+        digest = hashlib.sha256()
+        digest.update(f"{self.model or ''}|{self.temperature}|{self.max_tokens}".encode("utf-8"))
+        for message in self.messages:
+            digest.update(b"\x1e")
+            digest.update(f"{message.role.value}\x1f{message.content}".encode("utf-8"))
+        return digest.hexdigest()
+
 
 __all__ = ["Role", "ChatMessage", "ChatPrompt"]						# 📦 Публічний API модуля
@@ -15,6 +15,7 @@ from __future__ import annotations
 # 🔠 Системні імпорти
 import asyncio														# ⏱️ Паралельні виклики парсерів
 import logging														# 🧾 Логування кроків сценарію
+import time															# ⏱️ Вік підказок із колекцій
 from typing import Any, Dict, List, Mapping, Optional				# 📐 Типізація
 
 # 🧩 Внутрішні модулі проєкту
@@ -33,7 +34,10 @@ from app.infrastructure.availability.metrics import (				# 📈 Prometheus-лі
 )
 from app.infrastructure.availability.report_builder import AvailabilityReportBuilder  # 📝 Формування текстів
 from app.infrastructure.parsers.parser_factory import ParserFactory	# 🧩 Створення парсерів товарів
+from app.shared.cache.product_hints_cache import ProductHintsCache	# 🧷 Наявність із products.json
+from app.shared.tracing import traced								# 🧵 Спан на регіон
 from app.shared.utils.logger import LOG_NAME						# 🏷️ Спільний неймспейс логів
+from app.shared.utils.size_norm import normalize_stock_map			# 📏 Канонічні розміри підказок
 from app.shared.utils.url_parser_service import UrlParserService	# 🔍 Нормалізація URL під регіони
 
 
@@ -119,6 +123,10 @@ class AvailabilityManager:
             self._config.get("availability.cache_ttl_sec", 300, int) or 300
         )
 
+        self._hint_max_age_sec: float = float(						# 🧷 Вік підказки products.json (0 — не використовувати)
+            self._config.get("availability.hint_max_age_sec", 120, float) or 0
+        )
+
         regions_cfg = self._config.get("regions", {}, dict) or {}		# 🌍 Сирий блок конфіга по регіонах
         self._region_labels: Dict[str, str] = dict(					# 🏷️ Лейбли для легенди звіту
             regions_cfg.get("labels", {}) or {}
@@ -191,7 +199,7 @@ class AvailabilityManager:
             extra={"product_path": product_path, "regions": region_codes},
         )																# 🪵 Протоколюємо завдання
         tasks = [
-            self._fetch_region_data(code, product_path)
+            traced(f"availability.{code}", self._fetch_region_data(code, product_path), region=code)
             for code in region_codes
         ]																# 👥 Готуємо задачі на кожен регіон
         results = await asyncio.gather(*tasks)							# 🤝 Чекаємо завершення всіх задач
@@ -217,6 +225,14 @@ class AvailabilityManager:
             empty_stock = RegionStock(region_code=region_code, stock_data={})  # 📭 Порожній результат
             return empty_stock											# ↩️ Повертаємо UNKNOWN-регіон
 
+        hinted_stock = self._stock_from_hint(url)						# 🧷 Свіжа наявність із колекції
+        if hinted_stock:
+            logger.debug(
+                "🧷 availability.region_from_hint",
+                extra={"product_path": product_path, "region": region_code},
+            )															# 🪵 Сторінку регіону не завантажуємо
+            return RegionStock(region_code=region_code, stock_data=_adapt_stock_data(hinted_stock))
+
         try:
             parser = self._parser_factory.create_product_parser(		# 🧩 Створюємо регіональний парсер
                 url,
@@ -262,5 +278,24 @@ class AvailabilityManager:
             )															# 🪵 Показуємо стектрейс
             return RegionStock(region_code=region_code, stock_data={})  # 📭 Повертаємо UNKNOWN
 
+    def _stock_from_hint(self, url: str) -> Optional[Dict[str, Dict[str, bool]]]:
+        """
+        🧷 Наявність регіону з підказки `products.json`, якщо вона свіжа.
+
+        Підказка прив'язана до URL конкретного регіону, тож інші регіони завантажуються як раніше.
+        """
+        if self._hint_max_age_sec <= 0:
+            return None
+        hint = ProductHintsCache().get(url)
+        if hint is None or not hint.stock:
+            return None
+        if time.time() - hint.fetched_at > self._hint_max_age_sec:
+            return None
+        aliases = self._config.get("sizes.aliases", {}, dict) or {}
+        return normalize_stock_map(
+            hint.stock,
+            aliases={str(key): str(value) for key, value in aliases.items() if value is not None},
+        )
+
 
 __all__ = ["AvailabilityManager"]										# 📦 Експортуємо публічний клас
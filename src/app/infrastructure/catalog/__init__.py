@@ -0,0 +1,14 @@
+# 📚 app/infrastructure/catalog/__init__.py
+"""
+📚 Локальний каталог товарів YoungLA.
+
+🔹 `ProductCatalogIndex` — інвертований індекс (назва/handle/SKU/кольори) з персистентністю.
+🔹 Наповнюється з колекцій (`products.json`) та повного парсингу товарів.
+🔹 Відповідає пошуку та замовленням без звернення до сайту.
+"""
+
+from __future__ import annotations
+
+from .product_catalog_index import CatalogEntry, CatalogMatch, ProductCatalogIndex, catalog_handle
+
+__all__ = ["CatalogEntry", "CatalogMatch", "ProductCatalogIndex", "catalog_handle"]
@@ -0,0 +1,400 @@
+# 📚 app/infrastructure/catalog/product_catalog_index.py
+"""
+📚 ProductCatalogIndex — локальний каталог товарів для офлайн-пошуку та пошуку за SKU.
+
+🔹 Наповнюється інкрементально: підказки з колекцій (`ProductHint`) та розпарсені товари (`ProductInfo`).
+🔹 Зберігає handle, назву, SKU/артикули, кольори, розміри, фото та час оновлення запису.
+🔹 Відповідає на запити через інвертований індекс: точний збіг → префікс → fuzzy.
+🔹 Персистентний JSON на диску (атомарний запис, відкладений flush).
+🔹 Під event loop запис іде фоновою задачею через `asyncio.to_thread`; `aflush()` — примусово при зупинці.
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import asyncio                                                      # ⏳ Відкладений flush поза event loop
+import bisect                                                       # 🔎 Префіксний пошук у словнику токенів
+import difflib                                                      # 🧮 Fuzzy-схожість токенів
+import json                                                         # 🧾 Серіалізація
+import logging                                                      # 🧾 Логування
+import os                                                           # 🔁 Атомарна заміна файлу
+import threading                                                    # 🔒 Захист стану
+import time                                                         # ⏱️ Freshness
+from dataclasses import asdict, dataclass, field                    # 🧱 DTO
+from pathlib import Path                                            # 📁 Шляхи
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple  # 🧰 Типи
+from urllib.parse import urlsplit                                   # 🔗 Handle з URL
+
+# 🧩 Внутрішні модулі проєкту
+from app.domain.products.entities import ProductInfo                # 📦 Розпарсений товар
+from app.shared.cache.product_hints_cache import ProductHint        # 🧷 Підказка з колекції
+from app.shared.utils.logger import LOG_NAME                        # 🏷️ Базовий логер
+from app.shared.utils.search_text import normalize_query, tokenize_query  # 🔤 Токенізація
+
+logger = logging.getLogger(f"{LOG_NAME}.catalog")
+
+_INDEX_VERSION = 1                                                  # 🔢 Версія формату файлу
+_EXACT_SCORE = 1.0                                                  # 🎯 Точний збіг токена
+_PREFIX_SCORE = 0.8                                                 # ✂️ Префіксний збіг
+_FUZZY_SCORE = 0.6                                                  # 🌫️ Схожий токен (опечатка)
+_FUZZY_MIN_RATIO = 0.8                                              # 🧮 Поріг difflib
+_FUZZY_MIN_LEN = 4                                                  # 📏 Коротші токени fuzzy не шукаємо
+_PREFIX_MIN_LEN = 2                                                 # 📏 Мінімальна довжина префікса
+_DEFAULT_SIZE = "DEFAULT"                                           # 🧩 Технічний ключ без опції
+
+
+# ================================
+# 🧱 DTO
+# ================================
+@dataclass(slots=True)
+class CatalogEntry:
+    """📦 Запис каталогу про один товар."""
+
+    handle: str                                                     # 🏷️ Shopify handle (ключ)
+    url: str                                                        # 🔗 Канонічний URL
+    title: str = ""                                                 # 🏷️ Назва
+    skus: Tuple[str, ...] = ()                                      # 🔖 Артикули варіантів
+    colors: Tuple[str, ...] = ()                                    # 🎨 Кольори
+    sizes: Tuple[str, ...] = ()                                     # 📏 Розміри
+    images: Tuple[str, ...] = ()                                    # 🖼️ Фото
+    updated_at: float = field(default_factory=time.time)            # ⏱️ Останнє оновлення
+
+    def tokens(self) -> Set[str]:
+        """🔤 Токени для інвертованого індексу."""
+        parts = [self.title, self.handle.replace("-", " "), *self.skus, *self.colors]
+        return {token for part in parts for token in tokenize_query(part)}
+
+    def is_fresh(self, max_age_sec: Optional[float], now: Optional[float] = None) -> bool:
+        if not max_age_sec or max_age_sec <= 0:
+            return True
+        return ((now or time.time()) - self.updated_at) <= max_age_sec
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogMatch:
+    """🎯 Результат пошуку в каталозі."""
+
+    entry: CatalogEntry                                             # 📦 Запис
+    score: float                                                    # 📊 Середній бал по токенах запиту [0, 1]
+
+
+def catalog_handle(url: str) -> str:
+    """🏷️ Handle товару з `/products/<handle>`."""
+    path = urlsplit((url or "").strip()).path.rstrip("/")
+    marker = "/products/"
+    idx = path.find(marker)
+    if idx == -1:
+        return ""
+    return path[idx + len(marker):].split("/", 1)[0].lower()
+
+
+def _normalize_sku(raw: str) -> str:
+    return normalize_query(raw).replace(" ", "")
+
+
+def _merge(old: Tuple[str, ...], new: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys([*old, *(item for item in new if item)]))
+
+
+# ================================
+# 📚 ІНДЕКС
+# ================================
+class ProductCatalogIndex:
+    """📚 Інвертований індекс каталогу з персистентністю на диску."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        fresh_sec: float = 7 * 24 * 3600,
+        flush_interval_sec: float = 30.0,
+        autoload: bool = True,
+    ) -> None:
+        self._path = Path(path)                                     # 📁 Файл каталогу
+        self._fresh_sec = float(fresh_sec)                          # ⏳ Вік, після якого запис «застарів»
+        self._flush_interval = max(0.0, float(flush_interval_sec))  # 💾 Пауза між записами на диск
+        self._lock = threading.RLock()
+        self._entries: Dict[str, CatalogEntry] = {}                 # 🏷️ handle → запис
+        self._postings: Dict[str, Set[str]] = {}                    # 🔤 токен → handles
+        self._by_sku: Dict[str, str] = {}                           # 🔖 sku → handle
+        self._vocab: List[str] = []                                 # 🔤 Відсортований словник (префікси)
+        self._vocab_dirty = False
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._flush_task: Optional[asyncio.Task[None]] = None       # ⏳ Запланований фоновий запис
+        if autoload:
+            self._load()
+
+    # ================================
+    # ✍️ НАПОВНЕННЯ
+    # ================================
+    def upsert(self, entry: CatalogEntry) -> None:
+        """✍️ Додає/оновлює запис, зливаючи артикули, кольори, розміри та фото."""
+        handle = entry.handle.strip().lower()
+        if not handle:
+            return
+        with self._lock:
+            current = self._entries.get(handle)
+            if current is not None:
+                self._unindex(current)
+                entry = CatalogEntry(
+                    handle=handle,
+                    url=entry.url or current.url,
+                    title=entry.title or current.title,
+                    skus=_merge(current.skus, entry.skus),
+                    colors=_merge(current.colors, entry.colors),
+                    sizes=_merge(current.sizes, entry.sizes),
+                    images=tuple(entry.images) or current.images,
+                    updated_at=max(entry.updated_at, current.updated_at),
+                )
+            else:
+                entry.handle = handle
+            self._entries[handle] = entry
+            self._index(entry)
+            self._dirty = True
+        self._maybe_flush()
+
+    def upsert_hints(self, hints: Iterable[ProductHint]) -> int:
+        """🧷 Пакетно додає підказки з колекцій; повертає кількість записів."""
+        count = 0
+        for hint in hints:
+            handle = hint.handle or catalog_handle(hint.url)
+            if not handle:
+                continue
+            colors = [c for c in (hint.stock or {}) if c != _DEFAULT_SIZE]
+            sizes = [s for sizes in (hint.stock or {}).values() for s in sizes if s != _DEFAULT_SIZE]
+            self.upsert(CatalogEntry(
+                handle=handle,
+                url=hint.url,
+                title=hint.title,
+                skus=tuple(hint.skus),
+                colors=tuple(dict.fromkeys(colors)),
+                sizes=tuple(dict.fromkeys(sizes)),
+                images=tuple(hint.images),
+                updated_at=hint.fetched_at,
+            ))
+            count += 1
+        return count
+
+    def upsert_product(self, url: str, product: ProductInfo, *, sku: Optional[str] = None) -> bool:
+        """📦 Додає розпарсений товар (назва, наявність, фото); повертає True, якщо записано."""
+        handle = catalog_handle(url)
+        if not handle:
+            return False
+        stock: Mapping[str, Mapping[str, bool]] = product.stock_data or {}
+        colors = [c for c in stock if c != _DEFAULT_SIZE]
+        sizes = [s for sizes in stock.values() for s in sizes if s != _DEFAULT_SIZE]
+        images = [product.image_url, *product.images] if product.image_url else list(product.images)
+        self.upsert(CatalogEntry(
+            handle=handle,
+            url=url.split("?", 1)[0].split("#", 1)[0],
+            title=product.title,
+            skus=(sku,) if sku else (),
+            colors=tuple(dict.fromkeys(colors)),
+            sizes=tuple(dict.fromkeys(sizes)),
+            images=tuple(dict.fromkeys(i for i in images if i)),
+        ))
+        return True
+
+    # ================================
+    # 🔎 ЗАПИТИ
+    # ================================
+    def get(self, handle: str) -> Optional[CatalogEntry]:
+        with self._lock:
+            return self._entries.get((handle or "").strip().lower())
+
+    def lookup_sku(self, sku: str, *, max_age_sec: Optional[float] = None) -> Optional[CatalogEntry]:
+        """🔖 Точний пошук за артикулом або handle."""
+        key = _normalize_sku(sku)
+        if not key:
+            return None
+        with self._lock:
+            handle = self._by_sku.get(key) or (sku or "").strip().lower()
+            entry = self._entries.get(handle)
+        if entry is None or not entry.is_fresh(self._max_age(max_age_sec)):
+            return None
+        return entry
+
+    def search(self, query: str, limit: int = 10, *, max_age_sec: Optional[float] = None) -> List[CatalogMatch]:
+        """🔎 Усі токени запиту мають збігтися (точно/префіксом/fuzzy); сортування за балом."""
+        q_tokens = tokenize_query(query)
+        if not q_tokens or limit <= 0:
+            return []
+        with self._lock:
+            self._ensure_vocab()
+            totals: Optional[Dict[str, float]] = None
+            for token in q_tokens:
+                token_scores = self._match_token(token)
+                if totals is None:
+                    totals = token_scores
+                else:
+                    totals = {h: totals[h] + s for h, s in token_scores.items() if h in totals}
+                if not totals:
+                    return []
+            assert totals is not None
+            now = time.time()
+            max_age = self._max_age(max_age_sec)
+            matches = [
+                CatalogMatch(entry=self._entries[h], score=round(total / len(q_tokens), 4))
+                for h, total in totals.items()
+                if h in self._entries and self._entries[h].is_fresh(max_age, now)
+            ]
+        matches.sort(key=lambda m: (-m.score, m.entry.title, m.entry.handle))
+        return matches[:limit]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ================================
+    # 🔤 ІНВЕРТОВАНИЙ ІНДЕКС
+    # ================================
+    def _index(self, entry: CatalogEntry) -> None:
+        for token in entry.tokens():
+            bucket = self._postings.get(token)
+            if bucket is None:
+                self._postings[token] = bucket = set()
+                self._vocab_dirty = True
+            bucket.add(entry.handle)
+        for sku in entry.skus:
+            key = _normalize_sku(sku)
+            if key:
+                self._by_sku[key] = entry.handle
+
+    def _unindex(self, entry: CatalogEntry) -> None:
+        for token in entry.tokens():
+            bucket = self._postings.get(token)
+            if bucket is None:
+                continue
+            bucket.discard(entry.handle)
+            if not bucket:
+                del self._postings[token]
+                self._vocab_dirty = True
+        for sku in entry.skus:
+            key = _normalize_sku(sku)
+            if self._by_sku.get(key) == entry.handle:
+                del self._by_sku[key]
+
+    def _ensure_vocab(self) -> None:
+        if self._vocab_dirty:
+            self._vocab = sorted(self._postings)
+            self._vocab_dirty = False
+
+    def _match_token(self, token: str) -> Dict[str, float]:
+        """🎯 handle → найкращий бал для одного токена запиту."""
+        scores: Dict[str, float] = {}
+
+        def _credit(vocab_token: str, score: float) -> None:
+            for handle in self._postings.get(vocab_token, ()):
+                if scores.get(handle, 0.0) < score:
+                    scores[handle] = score
+
+        _credit(token, _EXACT_SCORE)
+        if len(token) >= _PREFIX_MIN_LEN:
+            start = bisect.bisect_left(self._vocab, token)
+            for vocab_token in self._vocab[start:]:
+                if not vocab_token.startswith(token):
+                    break
+                if vocab_token != token:
+                    _credit(vocab_token, _PREFIX_SCORE)
+        if not scores and len(token) >= _FUZZY_MIN_LEN:
+            start = bisect.bisect_left(self._vocab, token[0])
+            matcher = difflib.SequenceMatcher(a=token, autojunk=False)
+            for vocab_token in self._vocab[start:]:
+                if not vocab_token.startswith(token[0]):
+                    break
+                if abs(len(vocab_token) - len(token)) > 2:
+                    continue
+                matcher.set_seq2(vocab_token)
+                if matcher.ratio() >= _FUZZY_MIN_RATIO:
+                    _credit(vocab_token, _FUZZY_SCORE)
+        return scores
+
+    def _max_age(self, override: Optional[float]) -> Optional[float]:
+        return self._fresh_sec if override is None else override
+
+    # ================================
+    # 💾 ДИСК
+    # ================================
+    def _maybe_flush(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:                                        # 🧵 Без event loop — блокувати нічого
+            if (time.monotonic() - self._last_flush) >= self._flush_interval:
+                self.flush()
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        """⏳ Чекає решту `flush_interval_sec` і пише каталог у потоці."""
+        try:
+            delay = self._flush_interval - (time.monotonic() - self._last_flush)
+            await asyncio.sleep(max(0.0, delay))
+            await asyncio.to_thread(self.flush)
+        except asyncio.CancelledError:
+            return
+        except Exception:
+            logger.exception("❌ Помилка відкладеного запису каталогу.")
+
+    async def aflush(self) -> None:
+        """🧽 Примусовий запис без очікування інтервалу (зупинка бота)."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done():
+            task.cancel()
+        await asyncio.to_thread(self.flush)
+
+    def flush(self) -> None:
+        """💾 Синхронно записує каталог на диск (якщо є зміни); під event loop — лише через потік."""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {
+                "version": _INDEX_VERSION,
+                "updated_at": time.time(),
+                "entries": [asdict(entry) for entry in self._entries.values()],
+            }
+            self._dirty = False
+            self._last_flush = time.monotonic()
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+            tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self._path)
+            logger.debug("💾 Каталог збережено: %d записів → %s", len(payload["entries"]), self._path)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Не вдалося записати каталог %s: %s", self._path, exc)
+            with self._lock:
+                self._dirty = True
+
+    def _load(self) -> None:
+        if not self._path.exists():
+            return
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+            raw_entries = payload.get("entries") or []
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Пошкоджений каталог %s: %s — починаємо з нуля.", self._path, exc)
+            return
+        with self._lock:
+            for raw in raw_entries:
+                try:
+                    entry = CatalogEntry(
+                        handle=str(raw["handle"]).lower(),
+                        url=str(raw.get("url") or ""),
+                        title=str(raw.get("title") or ""),
+                        skus=tuple(raw.get("skus") or ()),
+                        colors=tuple(raw.get("colors") or ()),
+                        sizes=tuple(raw.get("sizes") or ()),
+                        images=tuple(raw.get("images") or ()),
+                        updated_at=float(raw.get("updated_at") or 0.0),
+                    )
+                except (KeyError, TypeError, ValueError):
+                    continue
+                self._entries[entry.handle] = entry
+                self._index(entry)
+        logger.info("📚 Каталог завантажено: %d записів (%s)", len(self._entries), self._path)
+
+
+__all__ = ["CatalogEntry", "CatalogMatch", "ProductCatalogIndex", "catalog_handle"]
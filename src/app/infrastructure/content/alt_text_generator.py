@@ -3,6 +3,7 @@
 🖼️ Генерує alt-тексти для зображень продуктів через OpenAI.
 
 🔹 Підтримує кешування результатів у `HtmlLruCache`, щоб не дублювати запити.  
+🔹 Однаковий промпт під час запуску колекції виконується один раз (single-flight).
 🔹 Використовує українські промпти та додає метрики (успіхи, збої, кеш-хіти).  
 🔹 Працює з `ProductInfo`, повертаючи `{image_url: alt_text}` у порядку вхідних URL.
 """
@@ -24,6 +25,7 @@ from app.infrastructure.ai.prompt_service import PromptService			# 📝 Зава
 from app.shared.cache.html_lru_cache import HtmlLruCache				# 🧠 Кеш для alt-текстів
 from app.shared.metrics.content import ALT_CACHE_HIT, ALT_FAILURE, ALT_SUCCESS	# 📊 Метрики контенту
 from app.shared.utils.logger import LOG_NAME							# 🏷️ Назва логера
+from app.shared.utils.single_flight import single_flight				# 🛬 Спільні виклики в межах запуску
 
 logger = logging.getLogger(LOG_NAME)									# 🧾 Модульний логер alt-генератора
 
@@ -120,24 +122,27 @@ class AltTextGenerator:
         prompt += f"\n\nЗгенеруй рівно {len(misses)} alt-текст(и) у форматі JSON-масиву рядків."
         logger.debug("📝 AltTextGenerator промпт готовий (зображень=%d).", len(misses))
 
-        async with self._sem:											# 🚦 Троттлінг LLM
+        try:
+            chat_prompt = ChatPrompt(
+                messages=[ChatMessage(role=Role.USER, content=prompt)],
+                temperature=0.4,
+                max_tokens=400,
+            )															# 📮 Підготовка запиту до LLM
+            logger.info("🤖 Виклик OpenAI для %d зображень…", len(misses))
+            text = await single_flight(								# 🛬 Однаковий промпт у запуску — один виклик
+                "alt_text",
+                chat_prompt.fingerprint(),
+                lambda: self._complete(chat_prompt),
+            )															# 📨 LLM-відповідь
+            if text is None:
+                raise ValueError("empty_response")
+        except Exception:
             try:
-                chat_prompt = ChatPrompt(
-                    messages=[ChatMessage(role=Role.USER, content=prompt)],
-                    temperature=0.4,
-                    max_tokens=400,
-                )														# 📮 Підготовка запиту до LLM
-                logger.info("🤖 Виклик OpenAI для %d зображень…", len(misses))
-                text = await self._ai.chat_completion(chat_prompt)		# 📨 LLM-відповідь
-                if text is None:
-                    raise ValueError("empty_response")
+                ALT_FAILURE.labels(source="ai", reason="exception").inc()
             except Exception:
-                try:
-                    ALT_FAILURE.labels(source="ai", reason="exception").inc()
-                except Exception:
-                    logger.debug("⚠️ ALT_FAILURE метрика недоступна.")
-                logger.exception("❌ AltTextGenerator: помилка під час виклику OpenAI.")
-                raise
+                logger.debug("⚠️ ALT_FAILURE метрика недоступна.")
+            logger.exception("❌ AltTextGenerator: помилка під час виклику OpenAI.")
+            raise
 
         items: List[str] = []											# 📋 Alt-тексти з відповіді
         try:
@@ -182,3 +187,8 @@ class AltTextGenerator:
         ordered = {url: hits[url] for url in imgs if url in hits}		# 📦 Повертаємо в початковому порядку
         logger.info("✅ AltTextGenerator завершився: повернуто %d alt-текстів.", len(ordered))
         return ordered
+
+    async def _complete(self, chat_prompt: ChatPrompt) -> Optional[str]:
+        """🤖 Виклик LLM під семафором генератора."""
+        async with self._sem:											# 🚦 Троттлінг LLM
+            return await self._ai.chat_completion(chat_prompt)
@@ -27,6 +27,7 @@ from app.infrastructure.adapters import (                           # 🔗 Ко
     PriceMessageFacade,
 )
 from app.infrastructure.content.alt_text_generator import AltTextGenerator  # 🖼️ ALT-тексти
+from app.shared.tracing import traced                               # 🧵 Спан на кожну AI-задачу
 from app.shared.utils.logger import LOG_NAME                        # 🏷️ Імʼя логера
 
 if TYPE_CHECKING:                                                   # 🧠 Лише для типізації
@@ -110,10 +111,10 @@ class ProductContentService:
         price_task = self._price.calculate_and_format(url)            # 💸 Повідомлення ціни
 
         gather_results = await asyncio.gather(
-            slogan_task,
-            translate_task,
-            hashtags_task,
-            price_task,
+            traced("ai.slogan", slogan_task),
+            traced("ai.translate", translate_task),
+            traced("ai.hashtags", hashtags_task),
+            traced("price", price_task),
             return_exceptions=True,
         )
         slogan = cast(str, self._unwrap_required_result("slogan", gather_results[0]))
@@ -161,7 +162,11 @@ class ProductContentService:
 
         if self._alt and image_candidates:
             try:
-                alt_texts = await self._alt.generate(product, tuple(image_candidates))  # 🤖 генеруємо ALT
+                alt_texts = await traced(                                 # 🤖 генеруємо ALT
+                    "ai.alt_text",
+                    self._alt.generate(product, tuple(image_candidates)),
+                    images=len(image_candidates),
+                )
                 logger.debug("🔎 ALT-тексти згенеровано: %d", len(alt_texts))  # 📊 скільки отримали
             except asyncio.CancelledError:
                 logger.info("🛑 ALT-генерацію скасовано для: %s", product.title)  # 🛑 propagate cancel
@@ -25,6 +25,7 @@ from app.domain.music.interfaces import (
 from app.infrastructure.ai.open_ai_serv import OpenAIService
 from app.infrastructure.ai.prompt_service import PromptService  # у stubs може не бути методів
 from app.shared.utils.logger import LOG_NAME
+from app.shared.utils.single_flight import single_flight
 
 # ================================
 # 🧾 ЛОГЕР
@@ -72,7 +73,11 @@ class MusicRecommendation(IMusicRecommender):
             logger.debug("ℹ️ Не вдалося виставити model/temperature у ChatPrompt; продовжую.", exc_info=False)
 
         # Запит до LLM
-        raw = await self._openai.chat_completion(prompt)
+        raw = await single_flight(
+            "ai.music",
+            prompt.fingerprint(),
+            lambda: self._openai.chat_completion(prompt),
+        )  # 🛬 Однакові вхідні дані в межах запуску колекції — один виклик
         if not raw:
             logger.warning("⚠️ AI не повернув відповідь для музичних рекомендацій.")
             return MusicRecommendationResult(tracks=(), raw_text="", model=model)
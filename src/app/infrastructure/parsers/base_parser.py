@@ -27,7 +27,9 @@ from app.domain.products.services.weight_resolver import WeightResolver	# ⚖️
 from app.infrastructure.ai.ai_task_service import AITaskService as TranslatorService	# 🌐 Переклади/AI
 from app.infrastructure.web.webdriver_service import WebDriverService	# 🌍 Завантаження через Playwright
 from app.shared.cache.html_lru_cache import HtmlLruCache			# 🧠 LRU-кеш HTML (IMP-034)
+from app.shared.cache.product_hints_cache import ProductHintsCache	# 🧷 Підказки з колекцій (products.json)
 from app.shared.errors import NetworkError, OcrError, ParseError	# 🚨 Резервні винятки для розширень  # noqa: F401
+from app.shared.tracing import traced								# 🧵 Спан завантаження HTML
 from app.shared.utils.collections import uniq_keep_order			# ♻️ Дедуплікація зі збереженням порядку
 from app.shared.utils.immutables import freeze					# 🧊 Іммʼютабельні структури
 from app.shared.utils.logger import LOG_NAME						# 🏷️ Базове імʼя логера
@@ -181,7 +183,7 @@ class BaseParser(IProductDataProvider):
             ProductInfo: Іммʼютабельна доменна сутність товару.
         """
         try:
-            await self._fetch_and_prepare_soup()                        # 🌍 Завантажуємо HTML-код
+            await traced("fetch", self._fetch_and_prepare_soup(), url=self.url.value)  # 🌍 Завантажуємо HTML-код
             if not self._page_soup:                                     # 🚫 DOM відсутній після завантаження
                 raise ConnectionError("Не вдалося завантажити або розпарсити HTML.")  # 🛑 Допоміжне повідомлення
 
@@ -208,6 +210,11 @@ class BaseParser(IProductDataProvider):
             ProductHeaderDTO: DTO із заголовком, зображенням і URL.
         """
         if self._page_soup is None:                                     # 🔄 DOM ще не готовий
+            hint = ProductHintsCache().get(self.url.value)              # 🧷 Підказка з колекції (без завантаження)
+            if hint is not None and hint.title:
+                logger.debug("🧷 Header з ProductHintsCache: %s", self.url.value)
+                image_hint = hint.images[0] if hint.images else None
+                return ProductHeaderDTO(title=hint.title, image_url=image_hint, product_url=self.url)
             await self._fetch_and_prepare_soup()                        # 🌍 Підтягуємо HTML і парсимо
 
         title = "ТОВАР"                                                 # 🏷️ Базовий заголовок
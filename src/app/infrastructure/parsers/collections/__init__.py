@@ -9,8 +9,10 @@
 from __future__ import annotations
 
 # 🧩 Внутрішні модулі проєкту
+from .shopify_collection_provider import ShopifyCollectionJsonProvider	# 🛍️ Shopify products.json
 from .universal_collection_parser import UniversalCollectionParser			# 🌐 Парсер coll-page (JSON-LD + DOM)
 
 __all__ = [
+    "ShopifyCollectionJsonProvider",										# 🛍️ HTTP-провайдер колекцій Shopify
     "UniversalCollectionParser",											# 🌐 Публічний парсер колекцій YoungLA
 ]
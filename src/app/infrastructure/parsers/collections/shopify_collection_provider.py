@@ -0,0 +1,245 @@
+# 🛍️ app/infrastructure/parsers/collections/shopify_collection_provider.py
+"""
+🛍️ `ShopifyCollectionJsonProvider` — збір посилань колекції через Shopify `products.json`.
+
+🔹 Читає `/collections/<handle>/products.json?limit=250&page=N` звичайним HTTP через спільний `HttpClientPool`, без Chromium.
+🔹 Одночасно наповнює `ProductHintsCache` (title / images / stock) для наступних кроків.
+🔹 Ті самі підказки дописує в локальний каталог (`ProductCatalogIndex`), якщо він переданий.
+🔹 Якщо JSON недоступний, порожній або URL містить фільтри — делегує у `UniversalCollectionParser`.
+"""
+
+from __future__ import annotations
+
+# 🌐 Зовнішні бібліотеки
+
+# 🔠 Системні імпорти
+import asyncio															# ⏱️ CancelledError
+import logging															# 🧾 Логування подій
+from typing import Any, Dict, List, Optional, Tuple						# 🧰 Типізація
+from urllib.parse import parse_qsl, urlsplit, urlunsplit				# 🔗 Розбір URL колекції
+
+# 🧩 Внутрішні модулі проєкту
+from app.infrastructure.catalog.product_catalog_index import ProductCatalogIndex	# 📚 Локальний каталог
+from app.infrastructure.web.http_client_pool import HttpClientPool		# 🔌 Спільний HTTP-пул
+from app.shared.cache.product_hints_cache import ProductHint, ProductHintsCache	# 🧷 Кеш підказок
+from app.shared.utils.logger import LOG_NAME							# 🏷️ Базове імʼя логера
+from app.shared.utils.url_parser_service import UrlParserService		# 🌍 Нормалізація URL
+from .universal_collection_parser import UniversalCollectionParser, _maybe_normalize	# 📚 DOM-fallback
+
+logger = logging.getLogger(f"{LOG_NAME}.parser.collection.shopify")		# 🧾 Модульний логер
+
+# ================================
+# ⚙️ КОНСТАНТИ
+# ================================
+PRODUCTS_JSON_PAGE_LIMIT = 250											# 📦 Максимум Shopify на сторінку
+_FILTER_QUERY_PREFIXES: Tuple[str, ...] = ("filter.", "sort_by", "q")	# 🚫 Фільтри, яких JSON не враховує
+_COLOR_OPTION_NAMES = ("color", "colour", "колір", "цвет")				# 🎨 Назви опції кольору
+_SIZE_OPTION_NAMES = ("size", "розмір", "размер")						# 📏 Назви опції розміру
+_DEFAULT_HEADERS: Dict[str, str] = {
+    "User-Agent": "Mozilla/5.0 (compatible; YLABot/1.0)",
+    "Accept": "application/json",
+}
+
+
+# ================================
+# 🔧 УТИЛІТИ
+# ================================
+def products_json_base(collection_url: str) -> Optional[str]:
+    """🔗 Повертає `https://host/.../collections/<handle>/products.json` або None."""
+
+    parts = urlsplit((collection_url or "").strip())
+    if not parts.scheme or not parts.netloc:
+        return None
+    path = parts.path.rstrip("/")
+    marker = "/collections/"
+    idx = path.find(marker)
+    if idx == -1:
+        return None
+    handle = path[idx + len(marker):].split("/", 1)[0]
+    if not handle:
+        return None
+    prefix = path[: idx + len(marker)] + handle
+    return urlunsplit((parts.scheme, parts.netloc, f"{prefix}/products.json", "", ""))
+
+
+def _has_filters(collection_url: str) -> bool:
+    """🚫 True, якщо URL колекції містить фільтри/сортування (JSON їх проігнорує)."""
+
+    query = urlsplit(collection_url or "").query
+    return any(key.startswith(_FILTER_QUERY_PREFIXES) for key, _ in parse_qsl(query))
+
+
+def _option_index(options: List[Any], names: Tuple[str, ...]) -> Optional[int]:
+    """🔎 Шукає індекс опції товару (Color/Size) за назвою."""
+
+    for idx, option in enumerate(options or []):
+        name = option.get("name") if isinstance(option, dict) else option
+        if isinstance(name, str) and name.strip().lower() in names:
+            return idx
+    return None
+
+
+def variants_to_stock(product: Dict[str, Any]) -> Dict[str, Dict[str, bool]]:
+    """📦 Будує карту наявності color → size → bool із Shopify variants."""
+
+    options = product.get("options") or []
+    color_idx = _option_index(options, _COLOR_OPTION_NAMES)
+    size_idx = _option_index(options, _SIZE_OPTION_NAMES)
+    stock: Dict[str, Dict[str, bool]] = {}
+    for variant in product.get("variants") or []:
+        if not isinstance(variant, dict):
+            continue
+        values = [variant.get(f"option{n}") for n in (1, 2, 3)]
+        color = values[color_idx] if color_idx is not None else None
+        size = values[size_idx] if size_idx is not None else None
+        if color_idx is None and size_idx is None:
+            size = values[0]											# 🧩 Єдина опція без назви — вважаємо розміром
+        color_key = str(color or "DEFAULT").strip() or "DEFAULT"
+        size_key = str(size or "DEFAULT").strip() or "DEFAULT"
+        available = bool(variant.get("available"))
+        stock.setdefault(color_key, {})[size_key] = stock.get(color_key, {}).get(size_key, False) or available
+    return stock
+
+
+# ================================
+# 🛍️ ПРОВАЙДЕР
+# ================================
+class ShopifyCollectionJsonProvider:
+    """
+    🛍️ Реалізує `ICollectionParser` через Shopify `products.json` з фолбеком на DOM-парсер.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        fallback: UniversalCollectionParser,
+        client_pool: HttpClientPool,
+        url_parser_service: UrlParserService,
+        hints_cache: Optional[ProductHintsCache] = None,
+        catalog: Optional[ProductCatalogIndex] = None,
+        timeout_sec: float = 10.0,
+        max_pages: int = 10,
+    ) -> None:
+        self.url = url													# 🌐 URL колекції
+        self._fallback = fallback										# 📚 DOM/Playwright-парсер
+        self._url_parser = url_parser_service							# 🌍 Нормалізація посилань
+        self._hints = hints_cache										# 🧷 Куди сіяти підказки
+        self._catalog = catalog											# 📚 Локальний каталог (опційно)
+        self._timeout = max(1.0, float(timeout_sec))					# ⏱️ Таймаут HTTP
+        self._max_pages = max(1, int(max_pages))						# 🚦 Ліміт сторінок JSON
+        self._client_pool = client_pool									# 🔌 Теплі з'єднання з CDN/магазином
+        self.source: str = "pending"									# 🧭 Звідки взяли посилання (json|fallback)
+
+    # ================================
+    # 🔗 ПУБЛІЧНИЙ МЕТОД
+    # ================================
+    async def get_product_links(self) -> List[str]:
+        """🔗 Повертає посилання з `products.json`, інакше — з DOM-парсера."""
+
+        base = products_json_base(self.url)
+        if base and not _has_filters(self.url):
+            try:
+                products = await self._fetch_products(base)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("⚠️ products.json недоступний (%s): %s — fallback на DOM.", base, exc)
+                products = []
+            links = self._links_and_seed(products)
+            if links:
+                self.source = "json"
+                logger.info("✅ products.json дав %d посилань (%s).", len(links), self.url)
+                return links
+        else:
+            logger.debug("ℹ️ Колекція %s не підходить для products.json — одразу DOM.", self.url)
+
+        self.source = "fallback"
+        return await self._fallback.get_product_links()
+
+    # ================================
+    # 🌐 HTTP
+    # ================================
+    async def _fetch_products(self, base: str) -> List[Dict[str, Any]]:
+        """🌐 Вичитує сторінки JSON, доки не отримаємо неповну сторінку або ліміт."""
+
+        products: List[Dict[str, Any]] = []
+        client = self._client_pool.client()								# 🔌 Спільний клієнт — без нового TLS
+        for page in range(1, self._max_pages + 1):
+            response = await client.get(
+                base,
+                params={"limit": PRODUCTS_JSON_PAGE_LIMIT, "page": page},
+                headers=_DEFAULT_HEADERS,
+                timeout=self._timeout,
+            )
+            response.raise_for_status()
+            payload = response.json()
+            batch = payload.get("products") if isinstance(payload, dict) else None
+            if not isinstance(batch, list) or not batch:
+                break
+            products.extend(item for item in batch if isinstance(item, dict))
+            if len(batch) < PRODUCTS_JSON_PAGE_LIMIT:
+                break													# 🏁 Остання сторінка
+        return products
+
+    # ================================
+    # 🧷 ПОСИЛАННЯ + ПІДКАЗКИ
+    # ================================
+    def _product_url(self, handle: str) -> str:
+        parts = urlsplit(self.url)
+        return _maybe_normalize(self._url_parser, f"{parts.scheme}://{parts.netloc}/products/{handle}")
+
+    def _links_and_seed(self, products: List[Dict[str, Any]]) -> List[str]:
+        """🧷 Перетворює товари на посилання та сіє `ProductHint` у кеш."""
+
+        links: List[str] = []
+        hints: List[ProductHint] = []
+        seen: set[str] = set()
+        for product in products:
+            handle = str(product.get("handle") or "").strip()
+            if not handle:
+                continue
+            url = self._product_url(handle)
+            if not url or url in seen:
+                continue
+            seen.add(url)
+            links.append(url)
+            if self._hints is not None or self._catalog is not None:
+                hints.append(self._build_hint(url, handle, product))
+
+        if hints and self._hints is not None:
+            seeded = self._hints.put_many(hints)
+            logger.debug("🧷 Засіяно %d підказок товарів із products.json.", seeded)
+        if hints and self._catalog is not None:
+            indexed = self._catalog.upsert_hints(hints)					# 💾 Запис на диск — фоновий, відкладений
+            logger.debug("📚 Каталог оновлено: %d товарів із products.json.", indexed)
+        return links
+
+    @staticmethod
+    def _build_hint(url: str, handle: str, product: Dict[str, Any]) -> ProductHint:
+        images: List[str] = []
+        for image in product.get("images") or []:
+            src = image.get("src") if isinstance(image, dict) else image
+            if isinstance(src, str) and src.strip():
+                images.append(("https:" + src) if src.startswith("//") else src)
+        variants = product.get("variants") or []
+        first = variants[0] if variants and isinstance(variants[0], dict) else {}
+        price = first.get("price")
+        skus = tuple(dict.fromkeys(
+            str(variant.get("sku")).strip()
+            for variant in variants
+            if isinstance(variant, dict) and str(variant.get("sku") or "").strip()
+        ))																# 🔖 Унікальні артикули у порядку варіантів
+        return ProductHint(
+            url=url,
+            handle=handle,
+            title=str(product.get("title") or "").strip(),
+            images=tuple(images),
+            stock=variants_to_stock(product),
+            price=str(price) if price is not None else None,
+            skus=skus,
+            source="shopify_products_json",
+        )
+
+
+__all__ = ["ShopifyCollectionJsonProvider", "products_json_base", "variants_to_stock"]
@@ -14,10 +14,12 @@ from __future__ import annotations
 from bs4 import BeautifulSoup												# 🥣 Розбір HTML
 
 # 🔠 Системні імпорти
+import asyncio															# ⚡ Паралельне завантаження сторінок
 import json																# 🧾 Робота з JSON-LD
 import logging															# 🧾 Логування подій
 import re																# 🧮 Перевірка/маніпуляція рядків
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple		# 🧰 Узгоджена типізація
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit	# 🔗 Робота з `?page=N`
 
 # 🧩 Внутрішні модулі проєкту
 from app.config.config_service import ConfigService					# ⚙️ Конфігурація INFRA
@@ -64,6 +66,34 @@ def _strip_query_and_fragment(url: str) -> str:
     return base
 
 
+def _strip_fragment(url: str) -> str:
+    """✂️ Видаляє лише fragment: `page`, `sort_by`, `filter.*` лишаються (сторінки тієї ж вибірки)."""
+
+    if not url:
+        return ""
+    return url.split("#", 1)[0]
+
+
+def _page_number(url: str) -> Optional[int]:
+    """🔢 Повертає значення `?page=N` або None."""
+
+    if not url:
+        return None
+    for key, value in parse_qsl(urlsplit(url).query):
+        if key == "page" and value.isdigit():
+            return int(value)
+    return None
+
+
+def _with_page(url: str, page: int) -> str:
+    """🔗 Підставляє `page=N` у URL, зберігаючи решту query."""
+
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != "page"]
+    query.append(("page", str(page)))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
 def _is_product_like_path(href: str) -> bool:
     """🔍 Перевіряє, чи містить шлях `/products/`."""
 
@@ -171,6 +201,7 @@ class UniversalCollectionParser:
     )
 
     MAX_PAGINATION_PAGES = 5												# 🚦 Обмеження переходів
+    PAGINATION_CONCURRENCY = 3											# ⚡ Скільки сторінок вантажимо одночасно
 
     def __init__(
         self,
@@ -189,6 +220,20 @@ class UniversalCollectionParser:
         self.soup: Optional[BeautifulSoup] = None						# 🥣 Parsed DOM
         self.page_source: Optional[str] = None							# 🧾 HTML сторінки
         self.currency: Optional[str] = self.url_parser_service.get_currency(self.url)  # 💱 Поточна валюта
+        self.parallel_pagination: bool = bool(							# ⚡ Режим паралельної пагінації
+            config_service.get("parser.collection.pagination.parallel", True)
+        )
+        self.pagination_concurrency: int = max(							# 🚦 Ширина «хвилі» сторінок
+            1,
+            int(
+                config_service.get(
+                    "parser.collection.pagination.concurrency",
+                    self.PAGINATION_CONCURRENCY,
+                    cast=int,
+                )
+                or self.PAGINATION_CONCURRENCY
+            ),
+        )
 
     # ================================
     # 🔗 ПУБЛІЧНИЙ МЕТОД
@@ -208,6 +253,19 @@ class UniversalCollectionParser:
         accumulated = self._parse_from_dom(self.soup)						# 🌐 DOM-fallback
 
         base_url = self._base_url()										# 🏠 Базовий домен
+        page_plan = self._detect_page_urls(self.soup, base_url) if self.parallel_pagination else None
+        if page_plan:
+            page_urls, last_known = page_plan
+            width = self.pagination_concurrency if last_known else 1		# 🚶 Кількість невідома — без спекулятивних хвиль
+            unique_links = await self._collect_pages(accumulated, page_urls, width=width)
+            logger.info(
+                "📦 DOM-режим (%s пагінація): зібрано %d посилань з ≤%d сторінок.",
+                "паралельна" if width > 1 else "послідовна",
+                len(unique_links),
+                len(page_urls) + 1,
+            )
+            return unique_links
+
         next_url = self._find_next_url(self.soup, base_url)				# 🔁 Пошук наступної сторінки
         hops = 0															# 🔢 Лічильник сторінок
         while next_url and hops < self.MAX_PAGINATION_PAGES:				# ⏱️ Обмежуємо пагінацію
@@ -228,14 +286,7 @@ class UniversalCollectionParser:
         """🌐 Завантажує сторінку та готує `BeautifulSoup`."""
 
         try:
-            html = await self.webdriver_service.get_page_content(			# 🌐 Отримуємо HTML
-                url,
-                wait_until="networkidle",
-                timeout_ms=30000,
-                retries=1,
-                retry_delay_sec=1,
-                use_stealth=True,
-            )
+            html = await self._download(url)								# 🌐 Отримуємо HTML
         except Exception as exc:
             logger.error("❌ Помилка під час завантаження %s: %s", url, exc)
             self.page_source = None										# 🧹 Очищаємо сторінку
@@ -253,6 +304,34 @@ class UniversalCollectionParser:
         self.soup = None
         return False
 
+    async def _download(self, url: str) -> Optional[str]:
+        """🌐 Єдина точка завантаження HTML через спільний `WebDriverService`."""
+
+        return await self.webdriver_service.get_page_content(
+            url,
+            wait_until="networkidle",
+            timeout_ms=30000,
+            retries=1,
+            retry_delay_sec=1,
+            use_stealth=True,
+        )
+
+    async def _fetch_soup(self, url: str) -> Optional[BeautifulSoup]:
+        """🌐 Завантажує сторінку без зміни стану парсера (безпечно для паралельних викликів)."""
+
+        try:
+            html = await self._download(url)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.error("❌ Помилка під час завантаження %s: %s", url, exc)
+            return None
+
+        if html and len(html) > self.MIN_PAGE_LENGTH_BYTES:
+            return BeautifulSoup(html, self.html_parser)
+        logger.warning("⚠️ Сторінка пагінації порожня або занадто коротка: %s", url)
+        return None
+
     # ================================
     # 📄 JSON-LD
     # ================================
@@ -369,14 +448,14 @@ class UniversalCollectionParser:
         href = _get_attr_str(tag, "href")
         if href:
             href = _ensure_abs(base_url, href)
-            return _strip_query_and_fragment(href)
+            return _strip_fragment(href)									# 🔢 `?page=N` — і є наступна сторінка
 
         for selector in self.NEXT_SELECTORS:								# 🔁 Пробуємо кілька селекторів
             anchor = soup.select_one(selector)
             href = _get_attr_str(anchor, "href")
             if href:
                 href = _ensure_abs(base_url, href)
-                return _strip_query_and_fragment(href)
+                return _strip_fragment(href)
 
         try:
             pagination = soup.select_one(".pagination")
@@ -387,12 +466,73 @@ class UniversalCollectionParser:
                     href = _get_attr_str(next_anchor, "href")
                     if href:
                         href = _ensure_abs(base_url, href)
-                        return _strip_query_and_fragment(href)
+                        return _strip_fragment(href)
         except Exception:
             pass															# 🤫 Пагінація не критична
 
         return None
 
+    def _detect_page_urls(
+        self, soup: Optional[BeautifulSoup], base_url: str
+    ) -> Optional[Tuple[List[str], bool]]:
+        """
+        🔢 Визначає URL сторінок 2..N за шаблоном `?page=N` з першої сторінки.
+
+        Повертає `(urls, last_known)`: якщо в пагінації видно кілька номерів — найбільший і є
+        останньою сторінкою (`last_known=True`); якщо лише один номер/«Next» — кількість невідома,
+        сторінки йдуть до ліміту, а обхід буде послідовним. None — шаблон `?page=N` не знайдено.
+        Query колекції (`sort_by`, `filter.*`) зберігається, замінюється лише `page`.
+        """
+
+        if not soup:
+            return None
+
+        hrefs: List[str] = []
+        try:
+            for selector in ('link[rel="next"]', *self.NEXT_SELECTORS, ".pagination a[href]", 'a[href*="page="]'):
+                for element in soup.select(selector):
+                    href = _get_attr_str(element, "href")
+                    if href:
+                        hrefs.append(_ensure_abs(base_url, href))
+        except Exception as exc:
+            logger.debug("Pagination detection failed: %s", exc)
+            return None
+
+        numbered = [(num, href) for href in hrefs if (num := _page_number(href)) is not None and num >= 2]
+        if not numbered:
+            return None
+
+        max_page = self.MAX_PAGINATION_PAGES + 1							# 🚦 Перша сторінка + MAX переходів
+        distinct = {num for num, _ in numbered}
+        last_known = len(distinct) > 1
+        last_page = min(max(distinct), max_page) if last_known else max_page
+        template = _strip_fragment(self.url)								# 🧩 Та сама вибірка, що й сторінка 1
+        logger.debug("🔢 Пагінація ?page=N: сторінки 2..%d (відомо: %s).", last_page, sorted(distinct))
+        return [_with_page(template, page) for page in range(2, last_page + 1)], last_known
+
+    async def _collect_pages(self, first_page_links: List[str], page_urls: List[str], *, width: int) -> List[str]:
+        """
+        ⚡ Вантажить сторінки «хвилями» по `width` і зливає посилання у порядку сторінок.
+
+        Зупиняється на першій сторінці, що не дала нових посилань (або не завантажилась),
+        тож наступні хвилі не запускаються; `width=1` — послідовний обхід без зайвих запитів.
+        """
+
+        out = _uniq_keep_order(first_page_links)
+        seen: Set[str] = set(out)
+        step = max(1, width)
+        for start in range(0, len(page_urls), step):
+            wave = page_urls[start : start + step]
+            soups = await asyncio.gather(*(self._fetch_soup(url) for url in wave))
+            for url, soup in zip(wave, soups):								# 🔁 Зберігаємо порядок сторінок
+                fresh = [link for link in self._parse_from_dom(soup) if link not in seen]
+                if not fresh:
+                    logger.info("⏹️ Сторінка %s не дала нових посилань — зупиняємо пагінацію.", url)
+                    return out
+                seen.update(fresh)
+                out.extend(fresh)
+        return out
+
     # ================================
     # 🔗 БАЗА РЕГІОНУ/ДОМЕНУ
     # ================================
@@ -4,7 +4,8 @@
 
 🔹 Інкапсулює загальні залежності (webdriver, перекладач, конфіги, ваги).
 🔹 Вирівнює параметри (HTML-парсер, локаль, таймаути) та пише діагностику.
-🔹 Повертає строго типізовані інстанси `BaseParser`, `UniversalCollectionParser`, `ProductSearchResolver`.
+🔹 Повертає строго типізовані інстанси `BaseParser`, `UniversalCollectionParser`, `ProductSearchResolver` (пошук — за кешем `CachedProductSearchProvider`).
+🔹 Для колекцій спершу пробує Shopify `products.json` (HTTP), далі — DOM-парсер.
 """
 
 from __future__ import annotations
@@ -15,16 +16,23 @@ from typing import Any, Final, Optional, final									# 🧰 Типи та fina
 
 # 🧩 Внутрішні модулі проєкту
 from app.config.config_service import ConfigService	# ⚙️ Доступ до конфіга
+from app.domain.products.interfaces import IProductSearchProvider	# 🤝 Контракт пошуку
 from app.domain.products.services.weight_resolver import WeightResolver	# ⚖️ Обрахунок ваги
+from app.infrastructure.catalog.product_catalog_index import ProductCatalogIndex	# 📚 Локальний каталог
 from app.infrastructure.ai.ai_task_service import AITaskService as TranslatorService	# 🌐 Переклад/AI
+from app.infrastructure.web.http_client_pool import HttpClientPool	# 🔌 Спільний HTTP-пул
 from app.infrastructure.web.webdriver_service import WebDriverService	# 🕸️ Завантаження сторінок
 from app.shared.utils.locale import normalize_locale	# 🗺️ Єдина нормалізація локалі
 from app.shared.utils.logger import LOG_NAME	# 🏷️ Базове імʼя логера
+from app.shared.cache.product_hints_cache import ProductHintsCache	# 🧷 Підказки товарів з колекцій
 from app.shared.utils.url_parser_service import UrlParserService	# 🔗 Допоміжні дії з URL
 
 from ._infra_options import ParserInfraOptions as _InfraOptions	# 🧱 Інфра-опції за замовчуванням
 from .base_parser import BaseParser	# 🧱 Парсер товару
+from .collections.shopify_collection_provider import ShopifyCollectionJsonProvider	# 🛍️ Shopify products.json
 from .collections.universal_collection_parser import UniversalCollectionParser	# 📚 Парсер колекцій
+from .contracts import ICollectionParser	# 🤝 Контракт парсера колекцій
+from .product_search.cached_search_provider import CachedProductSearchProvider	# ♻️ Кеш запит → URL
 from .product_search.search_resolver import ProductSearchResolver	# 🔍 Провайдер пошуку
 
 # ================================
@@ -53,6 +61,8 @@ class ParserFactory:
         "_config_service",	# ⚙️ Джерело конфігів
         "_url_parser_service",	# 🔗 Нормалізація посилань
         "_default_options",	# 🧾 Інфра-опції за замовчуванням
+        "_catalog_index",	# 📚 Локальний каталог товарів
+        "_http_pool",	# 🔌 Спільний HTTP-пул
         "_log",	# 🧾 Інстансний логер
     )
 
@@ -67,6 +77,8 @@ class ParserFactory:
         config_service: ConfigService,
         url_parser_service: UrlParserService,
         default_options: _InfraOptions | None = None,
+        catalog_index: ProductCatalogIndex | None = None,
+        http_pool: HttpClientPool | None = None,
     ) -> None:
         """
         ⚙️ Зберігає залежності та готує дефолтні опції.
@@ -77,6 +89,8 @@ class ParserFactory:
         self._config_service = config_service	# ⚙️ Конфігураційний сервіс
         self._url_parser_service = url_parser_service	# 🔗 Нормалізація URL
         self._default_options = default_options or _InfraOptions.default()	# 🧾 Інфра-опції з fallback
+        self._catalog_index = catalog_index	# 📚 Каталог для колекцій та пошуку
+        self._http_pool = http_pool	# 🔌 products.json / suggest.json без нових TLS-з'єднань
         self._log = logging.getLogger(f"{logger.name}.instance")				# 🧾 Локальний логер фабрики
         self._log.debug(
             "🏗️ ParserFactory ініціалізовано (webdriver=%s translator=%s options=%s).",
@@ -180,32 +194,65 @@ class ParserFactory:
         self._log.debug("🧾 Product parser готовий: %s.", parser)
         return parser
 
-    def create_collection_parser(self, url: str) -> UniversalCollectionParser:
+    def create_collection_parser(self, url: str) -> ICollectionParser:
         """
-        📚 Створює парсер колекцій із дефолтними інфра-опціями.
+        📚 Створює парсер колекцій: Shopify `products.json` із фолбеком на `UniversalCollectionParser`.
         """
         self._ensure_non_empty_url(url, "ParserFactory.create_collection_parser")	# 🛡️ Перевіряємо URL
         norm_url = self._normalize_url(url)	# 🔗 Нормалізуємо адресу
         html_parser = self._pick_html_parser(self._default_options.html_parser)	# 🧮 Фіксуємо HTML-парсер
         self._log.info("📚 Створюємо collection parser (url=%s, parser=%s).", norm_url, html_parser)	# 🪵 Діагностика
-        return UniversalCollectionParser(
+        dom_parser = UniversalCollectionParser(
             url=norm_url,	# 🔗 Нормалізований URL
             webdriver_service=self._webdriver_service,	# 🌐 Драйвер
             config_service=self._config_service,	# ⚙️ Конфіги
             url_parser_service=self._url_parser_service,	# 🔗 URL-утиліти
             html_parser=html_parser,	# 🧮 Парсер DOM
-        )	# 🏗️ Повертаємо екземпляр
+        )	# 🏗️ DOM/Playwright-парсер (фолбек)
 
-    def create_search_provider(self) -> ProductSearchResolver:
+        cfg = self._config_service
+        if self._http_pool is None or not bool(cfg.get("parser.collection.shopify_json.enabled", True)):	# 🔌 JSON-джерело вимкнено / немає пулу
+            return dom_parser
+
+        hints_cache: Optional[ProductHintsCache] = None
+        if bool(cfg.get("parser.collection.shopify_json.seed_hints", True)):	# 🧷 Сіємо підказки товарів
+            hints_cache = ProductHintsCache(
+                max_entries=cfg.get("parser.collection.shopify_json.hints_max_entries", 2048, cast=int) or 2048,
+                ttl_sec=cfg.get("parser.collection.shopify_json.hints_ttl_sec", 900, cast=int) or 900,
+            )
+        return ShopifyCollectionJsonProvider(
+            norm_url,
+            fallback=dom_parser,	# 📚 Якщо JSON не спрацює
+            client_pool=self._http_pool,	# 🔌 Спільний HTTP-пул
+            url_parser_service=self._url_parser_service,	# 🔗 Нормалізація
+            hints_cache=hints_cache,	# 🧷 Кеш підказок
+            catalog=self._catalog_index,	# 📚 Локальний каталог
+            timeout_sec=cfg.get("parser.collection.shopify_json.timeout_sec", 10.0, cast=float) or 10.0,	# ⏱️ HTTP-таймаут
+            max_pages=cfg.get("parser.collection.shopify_json.max_pages", 10, cast=int) or 10,	# 🚦 Ліміт сторінок
+        )	# 🏗️ Повертаємо провайдер
+
+    def create_search_provider(self) -> IProductSearchProvider:
         """
-        🔍 Повертає строго типізований провайдер пошуку товарів.
+        🔍 Повертає провайдер пошуку товарів (за замовчуванням — з кешем запит → URL).
         """
         self._log.info("🔍 Створюємо search provider (locale=%s).", self._default_options.locale)	# 🪵 Фіксуємо подію
+        cfg = self._config_service
+        cache_enabled = bool(cfg.get("search.cache.enabled", True))
         provider = ProductSearchResolver(
             webdriver_service=self._webdriver_service,	# 🌐 Драйвер
             url_parser_service=self._url_parser_service,	# 🔗 Утиліти URL
             config_service=self._config_service,	# ⚙️ Конфіги
             infra_options=self._default_options,	# 🧾 Інфра-опції
+            catalog=self._catalog_index,	# 📚 Офлайн-відповіді з каталогу
+            raise_on_failure=cache_enabled,	# 🚨 Кеш відрізняє збій від «нічого не знайдено»
+            client_pool=self._http_pool,	# 🔌 suggest.json через спільний пул
         )	# 🏗️ Повертаємо провайдер
         self._log.debug("🔍 Провайдер пошуку створено: %s.", provider)
-        return provider
+        if not cache_enabled:
+            return provider
+        return CachedProductSearchProvider(
+            provider,
+            ttl_sec=cfg.get("search.cache.ttl_sec", 1800, cast=float) or 0.0,	# ⏳ TTL знайдених
+            negative_ttl_sec=cfg.get("search.cache.negative_ttl_sec", 120, cast=float) or 0.0,	# ⏳ TTL «нічого»
+            max_entries=cfg.get("search.cache.max_entries", 512, cast=int) or 512,	# 🔢 Місткість
+        )	# ♻️ Кеш поверх Playwright-пошуку
@@ -3,10 +3,12 @@
 🔎 Парсери результатів пошуку YoungLA.
 
 🔹 `ProductSearchResolver` — витягує посилання товарів зі сторінки пошуку.
+🔹 `CachedProductSearchProvider` — кеш «запит → URL» поверх будь-якого провайдера пошуку.
 """
 
 from __future__ import annotations
 
+from .cached_search_provider import CachedProductSearchProvider, SearchCacheStats, normalize_query	# ♻️ Кеш запитів
 from .search_resolver import ProductSearchResolver	# 🔍 Основний резолвер UI-пошуку
 
-__all__ = ["ProductSearchResolver"]	# 📦 Публічний експорт search-резолвера
+__all__ = ["CachedProductSearchProvider", "ProductSearchResolver", "SearchCacheStats", "normalize_query"]	# 📦 Публічний експорт search-резолвера
@@ -0,0 +1,228 @@
+# ♻️ app/infrastructure/parsers/product_search/cached_search_provider.py
+"""
+♻️ CachedProductSearchProvider — кеш «запит → URL» поверх будь-якого `IProductSearchProvider`.
+
+🔹 Нормалізує запит (регістр, пробіли, пунктуація, транслітерація кирилиці) у ключ кешу.
+🔹 Тримає позитивні результати `ttl_sec`, а «нічого не знайдено» — коротший `negative_ttl_sec`.
+🔹 Збій провайдера (`NetworkError`) не кешується: запит повертає порожній результат, наступний — повторює пошук.
+🔹 Паралельні однакові запити зливаються в один виклик провайдера (per-key lock).
+🔹 Рахує hit/miss у Prometheus та віддає локальну статистику через `stats()`.
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import asyncio															# 🔒 Per-key locks
+import logging															# 🧾 Логування
+import time																# ⏱️ TTL
+from collections import OrderedDict										# 🔁 LRU
+from dataclasses import dataclass										# 🧱 Записи кешу
+from typing import Dict, List, Optional, Tuple, Union					# 🧰 Типізація
+
+# 🧩 Внутрішні модулі проєкту
+from app.domain.products.entities import Url							# 📦 Доменний URL
+from app.domain.products.interfaces import (							# 🤝 Контракт провайдера пошуку
+    IProductSearchProvider,
+    SEARCH_DEFAULT_LIMIT,
+    SearchResult,
+)
+from app.shared.errors import NetworkError								# 🌐 Збій пошуку — не кешуємо
+from app.shared.metrics.search import SEARCH_CACHE_HIT, SEARCH_CACHE_MISS	# 📊 Метрики кешу
+from app.shared.utils.logger import LOG_NAME							# 🏷️ Базове імʼя логера
+from app.shared.utils.search_text import normalize_query				# 🔤 Ключ кешу з запиту
+
+logger = logging.getLogger(f"{LOG_NAME}.parsers.search_cache")			# 🧾 Іменований логер модуля
+
+# ================================
+# 🧱 ЗАПИСИ ТА СТАТИСТИКА
+# ================================
+_CacheValue = Union[Optional[Url], Tuple[int, Tuple[SearchResult, ...]]]
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: _CacheValue													# 📦 Url/None або (запитаний limit, результати)
+    expires_at: float													# ⏱️ Момент протухання
+    negative: bool														# 🕳️ «Нічого не знайдено»
+
+
+@dataclass(slots=True)
+class SearchCacheStats:
+    """📊 Лічильники кешу пошуку за час життя процесу."""
+
+    hits: int = 0														# ✅ Позитивні потрапляння
+    negative_hits: int = 0												# 🕳️ Потрапляння у негативний кеш
+    misses: int = 0														# 🌐 Реальні виклики провайдера
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.negative_hits + self.misses
+        return (self.hits + self.negative_hits) / lookups if lookups else 0.0
+
+
+# ================================
+# ♻️ КЕШУЮЧИЙ ПРОВАЙДЕР
+# ================================
+class CachedProductSearchProvider(IProductSearchProvider):
+    """♻️ Декоратор `IProductSearchProvider` із LRU+TTL кешем та негативним кешуванням."""
+
+    def __init__(
+        self,
+        inner: IProductSearchProvider,
+        *,
+        ttl_sec: float = 1800.0,
+        negative_ttl_sec: float = 120.0,
+        max_entries: int = 512,
+    ) -> None:
+        self._inner = inner												# 🔍 Реальний провайдер (Playwright)
+        self._ttl = max(0.0, float(ttl_sec))							# ⏳ TTL знайдених результатів
+        self._negative_ttl = max(0.0, float(negative_ttl_sec))			# ⏳ TTL «нічого не знайдено»
+        self._max = max(1, int(max_entries))							# 🔢 Місткість LRU
+        self._data: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()	# 🗂️ (kind, query) → запис
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}			# 🔒 Злиття однакових запитів
+        self._stats = SearchCacheStats()								# 📊 Локальна статистика
+
+    # ================================
+    # 🤝 ІНТЕРФЕЙС ДОМЕННОГО ПРОВАЙДЕРА
+    # ================================
+    async def resolve_one(self, query: str) -> Optional[Url]:
+        """🔍 Перший результат із кешу або від провайдера."""
+        norm = normalize_query(query)
+        if not norm:
+            return await self._inner.resolve_one(query)
+        key = ("one", norm)
+        found, value = self._lookup_one(norm)
+        if found:
+            return value
+        async with self._lock_for(key):
+            found, value = self._lookup_one(norm)						# 🔁 Поки чекали — міг заповнити інший
+            if found:
+                return value
+            self._register_miss(norm)
+            try:
+                url = await self._inner.resolve_one(query)
+            except NetworkError as exc:
+                self._log_failure(norm, exc)
+                return None
+            self._store(key, url, negative=url is None)
+            return url
+
+    async def resolve_many(self, query: str, limit: int = SEARCH_DEFAULT_LIMIT) -> List[SearchResult]:
+        """📚 До `limit` результатів із кешу або від провайдера."""
+        norm = normalize_query(query)
+        if not norm:
+            return await self._inner.resolve_many(query, limit)
+        key = ("many", norm)
+        found, results = self._lookup_many(norm, limit)
+        if found:
+            return results
+        async with self._lock_for(key):
+            found, results = self._lookup_many(norm, limit)
+            if found:
+                return results
+            self._register_miss(norm)
+            try:
+                results = await self._inner.resolve_many(query, limit)
+            except NetworkError as exc:
+                self._log_failure(norm, exc)
+                return []
+            self._store(key, (int(limit), tuple(results)), negative=not results)
+            return list(results)
+
+    # ================================
+    # 📊 СТАТИСТИКА / КЕРУВАННЯ
+    # ================================
+    def stats(self) -> SearchCacheStats:
+        """📊 Копія поточних лічильників."""
+        return SearchCacheStats(self._stats.hits, self._stats.negative_hits, self._stats.misses)
+
+    def invalidate(self, query: str) -> None:
+        """🧹 Видаляє всі записи для запиту."""
+        norm = normalize_query(query)
+        for kind in ("one", "many"):
+            self._data.pop((kind, norm), None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def aclose(self) -> None:
+        """📴 Звільняє ресурси внутрішнього провайдера (теплі сторінки пошуку)."""
+        closer = getattr(self._inner, "aclose", None)
+        if callable(closer):
+            await closer()
+
+    # ================================
+    # 🧰 ВНУТРІШНЄ
+    # ================================
+    def _lookup_one(self, norm: str) -> Tuple[bool, Optional[Url]]:
+        entry = self._get(("one", norm))
+        if entry is not None:
+            self._register_hit(norm, entry.negative)
+            return True, entry.value  # type: ignore[return-value]
+        many = self._get(("many", norm))								# ♻️ Перший результат з resolve_many
+        if many is not None and not many.negative:
+            _, results = many.value  # type: ignore[misc]
+            self._register_hit(norm, negative=False)
+            return True, results[0].url
+        return False, None
+
+    def _lookup_many(self, norm: str, limit: int) -> Tuple[bool, List[SearchResult]]:
+        entry = self._get(("many", norm))
+        if entry is None:
+            return False, []
+        cached_limit, results = entry.value  # type: ignore[misc]
+        exhausted = len(results) < cached_limit							# 📄 Видача вичерпана — більше не буде
+        if cached_limit >= limit or exhausted:
+            self._register_hit(norm, entry.negative)
+            return True, list(results[:limit])
+        return False, []
+
+    def _get(self, key: Tuple[str, str]) -> Optional[_Entry]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._data.pop(key, None)									# 🧹 Протухлий запис
+            lock = self._locks.get(key)
+            if lock is not None and not lock.locked():
+                self._locks.pop(key, None)
+            return None
+        self._data.move_to_end(key, last=True)
+        return entry
+
+    def _store(self, key: Tuple[str, str], value: _CacheValue, *, negative: bool) -> None:
+        ttl = self._negative_ttl if negative else self._ttl
+        if ttl <= 0:
+            return
+        self._data[key] = _Entry(value=value, expires_at=time.monotonic() + ttl, negative=negative)
+        self._data.move_to_end(key, last=True)
+        while len(self._data) > self._max:
+            evicted, _ = self._data.popitem(last=False)
+            self._locks.pop(evicted, None)
+
+    def _lock_for(self, key: Tuple[str, str]) -> asyncio.Lock:
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[key] = lock
+        return lock
+
+    def _register_hit(self, norm: str, negative: bool) -> None:
+        if negative:
+            self._stats.negative_hits += 1
+        else:
+            self._stats.hits += 1
+        SEARCH_CACHE_HIT.labels(kind="negative" if negative else "positive").inc()
+        logger.debug("♻️ Search cache hit (query='%s' negative=%s hit_rate=%.2f)", norm, negative, self._stats.hit_rate)
+
+    @staticmethod
+    def _log_failure(norm: str, exc: NetworkError) -> None:
+        logger.warning("⚠️ Пошук недоступний (query='%s'): %s — результат не кешуємо.", norm, exc)
+
+    def _register_miss(self, norm: str) -> None:
+        self._stats.misses += 1
+        SEARCH_CACHE_MISS.inc()
+        logger.debug("🌐 Search cache miss (query='%s' hit_rate=%.2f)", norm, self._stats.hit_rate)
+
+
+__all__ = ["CachedProductSearchProvider", "SearchCacheStats", "normalize_query"]
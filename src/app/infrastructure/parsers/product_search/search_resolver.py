@@ -2,7 +2,14 @@
 """
 🔍 ProductSearchResolver — асинхронний UI-пошук товарів YoungLA через Playwright.
 
+🔹 Спершу дивиться в локальний каталог (`ProductCatalogIndex`), далі — Shopify `/search/suggest.json`
+   звичайним HTTP через спільний `HttpClientPool` (без пулу fast path вимкнено); Playwright-сценарій — останній fallback. Каталог відповідає сам лише на точний
+   артикул/handle або коли заповнює весь ліміт; інакше доповнює живу видачу сайту.
 🔹 Відкриває сайт, ініціює діалог пошуку та збирає посилання з predictive/повної видачі.
+🔹 За наявності `WebDriverService` тримає невеликий пул «теплих» сторінок пошуку у спільному Chromium:
+   запит = fill + очікування predictive, без запуску браузера на кожен пошук; коли всі сторінки
+   зайняті — разовий контекст у тому ж браузері, тож паралельні запити не стоять у черзі.
+🔹 Вимірює латентність cold/warm/overflow/launch (`latency_snapshot()`).
 🔹 Підтримує конфігурацію через overrides → ParserInfraOptions → ConfigService → дефолти.
 🔹 Логує всі значущі кроки українською, спрощуючи діагностику headless-пошуку.
 """
@@ -10,12 +17,17 @@
 from __future__ import annotations
 
 # 🌐 Зовнішні бібліотеки
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError, async_playwright	# 🕹️ Playwright API
+from playwright.async_api import BrowserContext, Page, Response, TimeoutError as PlaywrightTimeoutError, async_playwright	# 🕹️ Playwright API
 
 # 🔠 Системні імпорти
 import asyncio	# ⏱️ Retry-бекофф
 import logging	# 🧾 Логування сценаріїв
-from typing import Final, List, Optional, Sequence, Tuple, cast	# 🧰 Типізація
+import statistics	# 📊 Медіана латентності
+import time	# ⏱️ Вимір латентності
+from collections import deque	# 🧺 Вікно останніх вимірів
+from dataclasses import dataclass, field	# 🧱 Слот теплої сторінки
+from typing import Any, Deque, Dict, Final, List, Optional, Sequence, Tuple, cast	# 🧰 Типізація
+from urllib.parse import parse_qs, urlsplit	# 🔗 Розбір запиту predictive
 
 # 🧩 Внутрішні модулі проєкту
 from app.config.config_service import ConfigService	# ⚙️ Конфіги
@@ -26,7 +38,10 @@ from app.domain.products.interfaces import (	# 🤝 Контракти пров
     SEARCH_MAX_LIMIT,
     SearchResult,
 )
+from app.infrastructure.catalog.product_catalog_index import ProductCatalogIndex	# 📚 Локальний каталог
 from app.infrastructure.parsers._infra_options import ParserInfraOptions	# 🧱 Інфра-налаштування
+from app.infrastructure.web.http_client_pool import HttpClientPool	# 🔌 Спільний HTTP-пул
+from app.shared.errors import NetworkError	# 🌐 Збій пошуку (не «нічого не знайдено»)
 from app.shared.utils.logger import LOG_NAME	# 🏷️ Базове імʼя логера
 
 # ================================
@@ -35,6 +50,19 @@ from app.shared.utils.logger import LOG_NAME	# 🏷️ Базове імʼя л
 logger = logging.getLogger(f"{LOG_NAME}.parsers.search_resolver")	# 🧾 Іменований логер модуля
 
 
+# ================================
+# ♨️ СЛОТ ТЕПЛОЇ СТОРІНКИ
+# ================================
+@dataclass(slots=True)
+class _WarmSlot:
+    """♨️ Одна тепла сторінка пулу: власний контекст, один запит за раз."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)	# 🔒 Сторінка зайнята запитом
+    context: Optional[BrowserContext] = None	# 🪟 Контекст у спільному Chromium
+    page: Optional[Page] = None	# 📄 Сторінка з відкритим діалогом пошуку
+    ready: bool = False	# ✅ Сторінка на головній і діалог відкритий
+
+
 # ================================
 # 🏛️ ПОШУКОВИЙ РЕЗОЛВЕР
 # ================================
@@ -50,6 +78,19 @@ class ProductSearchResolver(IProductSearchProvider):
     DEFAULT_MAX_RESULTS_HARDCAP: Final[int] = 30	# 📄 Жорсткий верхній ліміт
     DEFAULT_RETRY_ATTEMPTS: Final[int] = 2	# 🔁 Спроби пошуку
     DEFAULT_RETRY_BACKOFF_MS: Final[int] = 600	# ⏱️ Початковий бекофф
+    DEFAULT_WARM_PAGES: Final[int] = 2	# ♨️ Розмір пулу теплих сторінок
+    WARM_RENDER_SETTLE_MS: Final[int] = 150	# 🎨 Пауза на рендер predictive після відповіді suggest
+    LATENCY_WINDOW: Final[int] = 200	# 🧺 Скільки останніх вимірів тримати на режим
+    PREDICTIVE_SUGGEST_PATH: Final[str] = "/search/suggest"	# ⚡ Shopify endpoint predictive-пошуку
+    SUGGEST_JSON_PATH: Final[str] = "/search/suggest.json"	# ⚡ JSON-варіант predictive-пошуку
+    SUGGEST_JSON_MAX_LIMIT: Final[int] = 10	# 📄 Shopify віддає не більше 10 товарів
+    DEFAULT_SUGGEST_TIMEOUT_SEC: Final[float] = 5.0	# ⏱️ HTTP-таймаут suggest.json
+    DEFAULT_CATALOG_MIN_SCORE: Final[float] = 0.8	# 📚 Мінімальний бал збігу в каталозі (префікс і краще)
+    DEFAULT_VIEWPORT: Final[Dict[str, int]] = {"width": 1280, "height": 800}	# 🖥️ Розмір вікна
+    DEFAULT_USER_AGENT: Final[str] = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    )	# 🕵️ UA по замовчуванню
 
     OPEN_SEARCH_CANDIDATES: Final[Tuple[str, ...]] = (
         'a[href="/search"]',
@@ -96,6 +137,9 @@ class ProductSearchResolver(IProductSearchProvider):
         retry_attempts: Optional[int] = None,
         retry_backoff_ms: Optional[int] = None,
         infra_options: Optional[ParserInfraOptions] = None,	# 🧾 Єдині опції інфри
+        client_pool: Optional[HttpClientPool] = None,	# 🔌 Спільний HTTP-пул для suggest.json (None — без fast path)
+        catalog: Optional[ProductCatalogIndex] = None,	# 📚 Локальний каталог товарів
+        raise_on_failure: bool = False,	# 🚨 Збій Playwright → NetworkError замість порожньої видачі
     ) -> None:
         self._webdriver_service = webdriver_service	# 🕹️ Зберігаємо сервіс браузера
         self._url_parser_service = url_parser_service	# 🔗 Сервіс нормалізації URL
@@ -133,6 +177,27 @@ class ProductSearchResolver(IProductSearchProvider):
 
         self._ua_override = getattr(self._opts, "user_agent", None) if self._opts else None	# 🕵️ Кастомний UA
         self._locale_override = getattr(self._opts, "locale", None) if self._opts else None	# 🌍 Кастомна локаль
+
+        self._suggest_enabled = (
+            (bool(self._cfg.get("search.suggest_json.enabled", True)) if self._cfg else True) and client_pool is not None
+        )	# ⚡ HTTP fast path (потрібен спільний пул)
+        self._suggest_timeout_sec = (
+            float(self._cfg.get("search.suggest_json.timeout_sec", self.DEFAULT_SUGGEST_TIMEOUT_SEC, cast=float) or self.DEFAULT_SUGGEST_TIMEOUT_SEC)
+            if self._cfg
+            else self.DEFAULT_SUGGEST_TIMEOUT_SEC
+        )	# ⏱️ Таймаут suggest.json
+        self._client_pool = client_pool	# 🔌 Теплі TLS-з'єднання з магазином
+        self._catalog = catalog	# 📚 Офлайн-відповіді
+        self._raise_on_failure = bool(raise_on_failure)	# 🚨 Кеш відрізняє збій від порожньої видачі
+        self._catalog_min_score = (
+            float(self._cfg.get("search.catalog.min_score", self.DEFAULT_CATALOG_MIN_SCORE, cast=float) or self.DEFAULT_CATALOG_MIN_SCORE)
+            if self._cfg
+            else self.DEFAULT_CATALOG_MIN_SCORE
+        )	# 📚 Поріг довіри до каталогу
+
+        warm_pages = max(1, _cfg_int("search.warm_pages", self.DEFAULT_WARM_PAGES))	# ♨️ Розмір пулу
+        self._warm_slots: List[_WarmSlot] = [_WarmSlot() for _ in range(warm_pages)]	# ♨️ Теплі сторінки
+        self._latency: Dict[str, Deque[float]] = {}	# ⏱️ mode → останні виміри (мс)
         logger.debug(
             "🔍 ProductSearchResolver ініціалізовано (goto=%s idle=%s predictive=%s max_def=%s max_cap=%s)",
             self._goto_timeout_ms,
@@ -147,8 +212,8 @@ class ProductSearchResolver(IProductSearchProvider):
     # ================================
     async def resolve_one(self, query: str) -> Optional[Url]:
         """🔍 Повертає перший знайдений товар як `Url` або `None`."""
-        href = await self._search_first_href(query)	# 🔗 Шукаємо одиночне посилання
-        result_url = Url(self._canonicalize(href)) if href else None	# 🏷️ Канонізуємо URL
+        found = await self._resolve_found(query, 1, retries=False)	# 📚 Каталог → ⚡ HTTP → 🕹️ браузер
+        result_url = Url(self._canonicalize(found[0][0])) if found else None	# 🏷️ Канонізуємо URL
         logger.info("🔍 resolve_one завершено (query='%s' found=%s)", query, bool(result_url))	# 🪵 Статистика
         return result_url	# 🔁 Повертаємо результат
 
@@ -157,11 +222,60 @@ class ProductSearchResolver(IProductSearchProvider):
         if not limit or limit <= 0:	# 🧮 Невалідний ліміт
             limit = self._max_results_default	# 📄 Фіксуємо дефолт
         safe_limit = min(max(1, int(limit)), int(min(SEARCH_MAX_LIMIT, self._max_results_hardcap)))	# 🛡️ Обмежуємо
-        links = await self._search_many_with_retries(query, safe_limit)	# 🔁 Виконуємо пошук із ретраями
-        results = [SearchResult(url=Url(self._canonicalize(href)), title=None, score=1.0) for href in links]	# 📦 Будуємо DTO
+        found = await self._resolve_found(query, safe_limit, retries=True)
+        results = [
+            SearchResult(url=Url(self._canonicalize(href)), title=title, score=1.0)
+            for href, title in found
+        ]	# 📦 DTO (назви — з JSON/каталогу, якщо відомі)
         logger.info("📚 resolve_many: query='%s' requested=%s returned=%s", query, limit, len(results))	# 🪵 Статистика
         return results	# 🔁 Повертаємо список
 
+    async def _resolve_found(self, query: str, limit: int, *, retries: bool) -> List[Tuple[str, Optional[str]]]:
+        """
+        🧭 [(href, title)] у ранжуванні сайту, доповнені каталогом.
+
+        Каталог відповідає сам лише на точний артикул/handle або коли заповнює весь `limit`;
+        інакше — живі результати (suggest.json, далі Playwright) плюс локальні збіги, яких там немає.
+        """
+        local, authoritative = self._catalog_lookup(query, limit)	# 📚 Офлайн-відповідь
+        if authoritative:
+            return local
+        live = await self._suggest_json(query, limit)	# ⚡ HTTP fast path
+        if not live:
+            try:
+                if retries:
+                    links = await self._search_many_with_retries(query, limit)	# 🔁 Playwright із ретраями
+                else:
+                    first = await self._search_first_href(query)	# 🔗 Один результат без ретраїв
+                    links = [first] if first else []
+            except NetworkError:
+                if not local:
+                    raise
+                logger.warning("⚠️ Живий пошук недоступний (query='%s') — лише каталог.", query)
+                links = []
+            live = [(href, None) for href in links]
+        return self._merge_found(live, local, limit)
+
+    def _merge_found(
+        self,
+        live: Sequence[Tuple[str, Optional[str]]],
+        local: Sequence[Tuple[str, Optional[str]]],
+        limit: int,
+    ) -> List[Tuple[str, Optional[str]]]:
+        """🧬 Живі результати першими; каталог додає назви та відсутні товари до `limit`."""
+        titles = {self._canonicalize(href): title for href, title in local if title}
+        merged: List[Tuple[str, Optional[str]]] = []
+        seen: set[str] = set()
+        for href, title in [*live, *local]:
+            key = self._canonicalize(href)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            merged.append((href, title or titles.get(key)))
+            if len(merged) >= limit:
+                break
+        return merged
+
     @classmethod
     async def resolve(cls, query: str) -> Optional[str]:
         """♻️ Back-compat: повертає лише перший URL як рядок, використовуючи дефолтні таймінги."""
@@ -169,6 +283,95 @@ class ProductSearchResolver(IProductSearchProvider):
         links = await temp_instance._search_many_impl(query, 1)	# 🔍 Шукаємо один результат
         return links[0] if links else None	# 🔁 Повертаємо рядок або None
 
+    # ================================
+    # 📚 ЛОКАЛЬНИЙ КАТАЛОГ
+    # ================================
+    def _catalog_lookup(self, raw_query: str, limit: int) -> Tuple[List[Tuple[str, Optional[str]]], bool]:
+        """
+        📚 Повертає ([(url, title)], достатньо) зі свіжих записів каталогу з балом ≥ порогу.
+
+        «Достатньо» — точний збіг артикула/handle або каталог заповнив увесь `limit`.
+        """
+        if self._catalog is None:
+            return [], False
+        started = time.perf_counter()
+        query = self._sanitize_query(raw_query)
+        entry = self._catalog.lookup_sku(query) if " " not in query else None	# 🔖 Точний артикул/handle
+        if entry is not None:
+            found: List[Tuple[str, Optional[str]]] = [(entry.url, entry.title or None)]
+        else:
+            found = [
+                (match.entry.url, match.entry.title or None)
+                for match in self._catalog.search(query, limit)
+                if match.score >= self._catalog_min_score and match.entry.url
+            ]
+        found = found[:limit]
+        authoritative = entry is not None or len(found) >= limit
+        if found:
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            self._record_latency("catalog", elapsed_ms)
+            logger.info(
+                "📚 Каталог відповів: query='%s' found=%s final=%s за %.3f мс",
+                query,
+                len(found),
+                authoritative,
+                elapsed_ms,
+            )
+        return found, authoritative
+
+    # ================================
+    # ⚡ SHOPIFY SUGGEST.JSON
+    # ================================
+    async def _suggest_json(self, raw_query: str, limit: int) -> List[Tuple[str, Optional[str]]]:
+        """⚡ Повертає [(href, title)] із `/search/suggest.json` або [] (тоді працює Playwright)."""
+        query = self._sanitize_query(raw_query)
+        if not self._suggest_enabled or not query:
+            return []
+        params = {
+            "q": query,
+            "resources[type]": "product",
+            "resources[limit]": str(max(1, min(int(limit), self.SUGGEST_JSON_MAX_LIMIT))),
+            "resources[options][unavailable_products]": "last",
+        }
+        started = time.perf_counter()
+        try:
+            client = cast(HttpClientPool, self._client_pool).client()	# 🔌 Без нового TLS-рукостискання
+            response = await client.get(
+                self.BASE_URL.rstrip("/") + self.SUGGEST_JSON_PATH,
+                params=params,
+                headers={"User-Agent": self._ua_override or self.DEFAULT_USER_AGENT, "Accept": "application/json"},
+                timeout=self._suggest_timeout_sec,
+            )
+            response.raise_for_status()
+            payload = response.json()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ suggest.json недоступний (query='%s'): %s — fallback на Playwright.", query, exc)
+            return []
+
+        products = ((payload.get("resources") or {}).get("results") or {}).get("products") if isinstance(payload, dict) else None
+        found: List[Tuple[str, Optional[str]]] = []
+        seen: set[str] = set()
+        for product in products or []:
+            if not isinstance(product, dict):
+                continue
+            handle = str(product.get("handle") or "").strip()
+            raw_url = str(product.get("url") or "").split("?", 1)[0].strip()	# ✂️ Прибираємо _pos/_sid/_ss
+            href = f"/products/{handle}" if handle else raw_url
+            if not href or href in seen:
+                continue
+            seen.add(href)
+            title = str(product.get("title") or "").strip() or None
+            found.append((href, title))
+            if len(found) >= limit:
+                break
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        if found:
+            self._record_latency("suggest_json", elapsed_ms)
+        logger.info("⚡ suggest.json: query='%s' found=%s за %.0f мс", query, len(found), elapsed_ms)
+        return found
+
     # ================================
     # 🔁 RETRY-КОНТУР
     # ================================
@@ -190,10 +393,12 @@ class ProductSearchResolver(IProductSearchProvider):
                     exc,
                 )	# 🪵 Лог помилки
                 if attempt >= attempts:	# 🚫 Вичерпали спроби
+                    logger.error("❌ Пошук '%s' провалено після %s спроб.", query, attempts + 1)	# 🧨 Кінцевий збій
+                    if self._raise_on_failure:
+                        raise
                     break
                 await asyncio.sleep(backoff / 1000.0)	# 💤 Чекаємо перед наступною спробою
                 backoff *= 2	# 📈 Експоненційно збільшуємо бекофф
-        logger.error("❌ Пошук '%s' провалено після %s спроб.", query, attempts + 1)	# 🧨 Кінцевий збій
         return []	# 🪣 Немає результатів
 
     # ================================
@@ -205,53 +410,129 @@ class ProductSearchResolver(IProductSearchProvider):
         return links[0] if links else None	# 🔁 Віддаємо рядок
 
     async def _search_many_impl(self, raw_query: str, limit: int) -> List[str]:
-        """🧠 Основний сценарій Playwright-пошуку з predictive та повною видачею."""
+        """🧠 Основний сценарій пошуку: тепла сторінка спільного браузера або власний Chromium."""
         query = self._sanitize_query(raw_query)	# 🧼 Очищаємо запит
         logger.info("🔍 YLA search стартував: query='%s' limit=%s", query, limit)	# 🪵 Стартовий лог
 
+        started = time.perf_counter()	# ⏱️ Старт виміру
+        if callable(getattr(self._webdriver_service, "new_context", None)):
+            mode, links = await self._search_on_warm_page(query, limit)	# ♨️ Спільний браузер
+        else:
+            mode, links = "launch", await self._search_with_own_browser(query, limit)	# 🚀 Legacy: браузер на запит
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        self._record_latency(mode, elapsed_ms)
+        logger.info("⏱️ YLA search (%s) завершено за %.0f мс (query='%s' found=%s)", mode, elapsed_ms, query, len(links))
+        return links
+
+    async def _search_on_warm_page(self, query: str, limit: int) -> Tuple[str, List[str]]:
+        """♨️ Виконує запит на вільній теплій сторінці; повертає (cold|warm|overflow, посилання)."""
+        slot = next((candidate for candidate in self._warm_slots if not candidate.lock.locked()), None)
+        if slot is None:	# 🚦 Усі теплі сторінки зайняті — не чекаємо в черзі
+            return "overflow", await self._search_on_fresh_context(query, limit)
+        async with slot.lock:
+            mode = "warm" if slot.ready and slot.page is not None and not slot.page.is_closed() else "cold"
+            try:
+                page = await self._ensure_warm_page(slot)	# 📄 Головна + відкритий діалог
+                return mode, await self._run_query(page, query, limit, wait_for_suggest=True, slot=slot)
+            except asyncio.CancelledError:
+                await self._reset_warm_page(slot)	# 🧹 Стан сторінки невідомий
+                raise
+            except PlaywrightTimeoutError as exc:	# ⏱️ Таймаут Playwright
+                logger.exception("⏱️ YoungLA search timeout (query='%s').", query)	# 🪵 Лог
+                await self._reset_warm_page(slot)
+                self._raise_if_configured(exc)
+                return mode, []	# 🪣 Без результатів
+            except Exception as exc:	# ⚠️ Інші збої
+                logger.exception("💥 YoungLA search fatal error: %s", exc)	# 🪵 Повний traceback
+                await self._reset_warm_page(slot)
+                self._raise_if_configured(exc)
+                return mode, []	# 🪣 Порожній список
+
+    async def _search_on_fresh_context(self, query: str, limit: int) -> List[str]:
+        """🪟 Разовий контекст у спільному Chromium, коли пул теплих сторінок зайнятий."""
+        context = await self._new_search_context()
+        try:
+            page = await context.new_page()	# 📄 Нова вкладка
+            await self._goto(page, self.BASE_URL)	# 🌐 Відкриваємо головну
+            await self._open_search(page)	# 🖱️ Відкриваємо діалог пошуку
+            return await self._run_query(page, query, limit, wait_for_suggest=False)
+        except asyncio.CancelledError:
+            raise
+        except PlaywrightTimeoutError as exc:	# ⏱️ Таймаут Playwright
+            logger.exception("⏱️ YoungLA search timeout (query='%s').", query)	# 🪵 Лог
+            self._raise_if_configured(exc)
+            return []	# 🪣 Без результатів
+        except Exception as exc:	# ⚠️ Інші збої
+            logger.exception("💥 YoungLA search fatal error: %s", exc)	# 🪵 Повний traceback
+            self._raise_if_configured(exc)
+            return []	# 🪣 Порожній список
+        finally:
+            try:
+                await context.close()	# 🧼 Контекст більше не потрібен
+            except Exception:
+                logger.debug("⚠️ Не вдалося закрити разовий контекст пошуку.", exc_info=True)
+
+    async def _new_search_context(self) -> BrowserContext:
+        """🪟 Окремий контекст у спільному процесі браузера."""
+        return await self._webdriver_service.new_context(
+            user_agent=self._ua_override or self.DEFAULT_USER_AGENT,
+            locale=self._locale_override or "en-US",
+            viewport=dict(self.DEFAULT_VIEWPORT),
+        )
+
+    async def _ensure_warm_page(self, slot: _WarmSlot) -> Page:
+        """📄 Повертає теплу сторінку слота: створює контекст у спільному Chromium та відкриває діалог пошуку."""
+        if slot.page is None or slot.page.is_closed():
+            await self._reset_warm_page(slot)
+            slot.context = await self._new_search_context()	# 🪟 Окремий контекст, спільний процес браузера
+            slot.page = await slot.context.new_page()	# 📄 Нова вкладка
+        page = slot.page
+        if not slot.ready:
+            await self._goto(page, self.BASE_URL)	# 🌐 Відкриваємо головну
+            await self._open_search(page)	# 🖱️ Відкриваємо діалог пошуку
+            slot.ready = True
+        return page
+
+    async def _reset_warm_page(self, slot: _WarmSlot) -> None:
+        """🧹 Закриває теплий контекст слота; наступний запит відкриє його заново."""
+        slot.ready = False
+        context, slot.context, slot.page = slot.context, None, None
+        if context is not None:
+            try:
+                await context.close()	# 🧼 Закриття
+            except Exception:
+                logger.debug("⚠️ Не вдалося закрити теплий контекст пошуку.", exc_info=True)
+
+    async def aclose(self) -> None:
+        """📴 Звільняє теплі сторінки (спільний браузер лишається за `WebDriverService`)."""
+        for slot in self._warm_slots:
+            async with slot.lock:
+                await self._reset_warm_page(slot)
+
+    async def _search_with_own_browser(self, query: str, limit: int) -> List[str]:
+        """🚀 Legacy-шлях: окремий Chromium на кожен запит (коли `WebDriverService` недоступний)."""
         async with async_playwright() as playwright:	# 🕹️ Створюємо Playwright-контекст
             browser = await playwright.chromium.launch(headless=True)	# 🧠 Запускаємо браузер
             context = await browser.new_context(
-                viewport={"width": 1280, "height": 800},	# 🖥️ Розмір вікна
-                user_agent=self._ua_override
-                or (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
-                ),	# 🕵️ UA по замовчуванню
+                viewport=dict(self.DEFAULT_VIEWPORT),	# 🖥️ Розмір вікна
+                user_agent=self._ua_override or self.DEFAULT_USER_AGENT,	# 🕵️ UA
                 locale=self._locale_override or "en-US",	# 🌍 Локаль браузера
             )
             page = await context.new_page()	# 📄 Нова вкладка
             try:
                 await self._goto(page, self.BASE_URL)	# 🌐 Відкриваємо головну
                 await self._open_search(page)	# 🖱️ Відкриваємо діалог пошуку
-                await page.fill(self.SEARCH_INPUT, "")	# 🧼 Очищаємо поле вводу
-                await page.fill(self.SEARCH_INPUT, query)	# ⌨️ Вводимо запит
-
-                predictive_links = await self._collect_first_hrefs(
-                    page,
-                    self.PREDICTIVE_FIRST_PRODUCT_LINKS,
-                    limit,
-                    self._predictive_timeout_ms,
-                )	# ⚡ Збираємо predictive
-                if predictive_links:	# ✅ Знайшли в підказках
-                    logger.info("⚡ Predictive-пошук повернув %s результатів.", len(predictive_links))	# 🪵 Лог
-                    return predictive_links	# 🔁 Повертаємо список
-
-                await self._open_full_results(page)	# 📄 Переходимо на повну видачу
-                return await self._collect_first_hrefs(
-                    page,
-                    self.RESULTS_FIRST_LINKS,
-                    limit,
-                    self._idle_timeout_ms,
-                )	# 📄 Повертаємо результати зі сторінки
+                return await self._run_query(page, query, limit, wait_for_suggest=False)
 
             except asyncio.CancelledError:
                 raise
-            except PlaywrightTimeoutError:	# ⏱️ Таймаут Playwright
+            except PlaywrightTimeoutError as exc:	# ⏱️ Таймаут Playwright
                 logger.exception("⏱️ YoungLA search timeout (query='%s').", query)	# 🪵 Лог
+                self._raise_if_configured(exc)
                 return []	# 🪣 Без результатів
             except Exception as exc:	# ⚠️ Інші збої
                 logger.exception("💥 YoungLA search fatal error: %s", exc)	# 🪵 Повний traceback
+                self._raise_if_configured(exc)
                 return []	# 🪣 Порожній список
             finally:
                 for closer in (page.close, context.close, browser.close):	# 🧹 Закриваємо ресурси
@@ -260,6 +541,88 @@ class ProductSearchResolver(IProductSearchProvider):
                     except Exception:
                         continue
 
+    async def _run_query(
+        self,
+        page: Page,
+        query: str,
+        limit: int,
+        *,
+        wait_for_suggest: bool,
+        slot: Optional[_WarmSlot] = None,
+    ) -> List[str]:
+        """⌨️ Вводить запит у відкритий діалог і збирає predictive, інакше — повну видачу."""
+        await page.fill(self.SEARCH_INPUT, "")	# 🧼 Очищаємо поле вводу
+        if wait_for_suggest:
+            await self._fill_and_wait_suggest(page, query)	# ⚡ Не читаємо підказки попереднього запиту
+        else:
+            await page.fill(self.SEARCH_INPUT, query)	# ⌨️ Вводимо запит
+
+        predictive_links = await self._collect_first_hrefs(
+            page,
+            self.PREDICTIVE_FIRST_PRODUCT_LINKS,
+            limit,
+            self._predictive_timeout_ms,
+        )	# ⚡ Збираємо predictive
+        if predictive_links:	# ✅ Знайшли в підказках
+            logger.info("⚡ Predictive-пошук повернув %s результатів.", len(predictive_links))	# 🪵 Лог
+            return predictive_links	# 🔁 Повертаємо список
+
+        if slot is not None:
+            slot.ready = False	# 🧭 Сторінка йде з головної — наступний запит перевідкриє діалог
+        await self._open_full_results(page)	# 📄 Переходимо на повну видачу
+        return await self._collect_first_hrefs(
+            page,
+            self.RESULTS_FIRST_LINKS,
+            limit,
+            self._idle_timeout_ms,
+        )	# 📄 Повертаємо результати зі сторінки
+
+    async def _fill_and_wait_suggest(self, page: Page, query: str) -> None:
+        """⚡ Вводить запит і чекає відповідь `/search/suggest` саме для нього."""
+        expected = query.strip().lower()
+
+        def _is_own_suggest(response: Response) -> bool:
+            parts = urlsplit(response.url)
+            if self.PREDICTIVE_SUGGEST_PATH not in parts.path:
+                return False
+            sent = parse_qs(parts.query).get("q", [""])[0]
+            return sent.strip().lower() == expected
+
+        try:
+            async with page.expect_response(_is_own_suggest, timeout=self._predictive_timeout_ms) as response_info:
+                await page.fill(self.SEARCH_INPUT, query)	# ⌨️ Вводимо запит
+            await response_info.value
+            await page.wait_for_timeout(self.WARM_RENDER_SETTLE_MS)	# 🎨 Даємо темі відрендерити підказки
+        except PlaywrightTimeoutError:
+            logger.debug("⏱️ Відповідь predictive для '%s' не дочекались — читаємо DOM як є.", query)
+
+    def _raise_if_configured(self, exc: BaseException) -> None:
+        """🚨 У режимі `raise_on_failure` перетворює збій браузера на `NetworkError`."""
+        if self._raise_on_failure:
+            raise NetworkError("search failed", url=self.BASE_URL, detail=str(exc) or type(exc).__name__) from exc
+
+    # ================================
+    # ⏱️ ЛАТЕНТНІСТЬ
+    # ================================
+    def _record_latency(self, mode: str, elapsed_ms: float) -> None:
+        window = self._latency.setdefault(mode, deque(maxlen=self.LATENCY_WINDOW))
+        window.append(elapsed_ms)
+
+    def latency_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """📊 mode (catalog|suggest_json|cold|warm|overflow|launch) → count / avg / p50 / max у мілісекундах."""
+        snapshot: Dict[str, Dict[str, Any]] = {}
+        for mode, window in self._latency.items():
+            if not window:
+                continue
+            values = list(window)
+            snapshot[mode] = {
+                "count": len(values),
+                "avg_ms": round(sum(values) / len(values), 1),
+                "p50_ms": round(statistics.median(values), 1),
+                "max_ms": round(max(values), 1),
+            }
+        return snapshot
+
     # ================================
     # 🧰 ДОПОМІЖНІ МЕТОДИ
     # ================================
@@ -4,12 +4,20 @@
 
 🔹 `ProductProcessingService` — збирає весь контент для картки товару.
 🔹 `ProcessedProductData` — DTO результату з агрегованими даними.
+🔹 `StageGraph` — маленький DAG асинхронних етапів із таймаутами та критичним шляхом.
 """
 
 from __future__ import annotations
 
 from .banner_drop_service import BannerDropService                                  # 🪧 Оркестратор BannerDrop
 from .collection_health import CollectionHealthSummary                            # 🩺 Звіти про здоров'я колекції
+from .collection_job_store import CollectionJob, CollectionJobStore                # 💾 Чекпоінти запусків колекцій
+from .image_normalizer import ImageNormalizer                                      # 🪄 Ресайз фото перед upload
+from .processed_banner_index import ProcessedBannerIndex                          # 🪧 Опубліковані банери
+from .processed_product_cache import ProcessedProductCache                        # 🗃️ Кеш готових карток
+from .seen_products_index import SeenProductsIndex                                # 🗂️ Індекс уже оброблених товарів
+from .stage_graph import StageGraph, StageGraphResult, StageOutcome                # 🕸️ DAG етапів обробки
+from .telegram_file_id_cache import TelegramFileIdCache                            # 📎 Кеш Telegram file_id для фото
 from .product_processing_service import (
     ProcessedProductData,													# 📦 DTO єдиної відповіді для бота/UI
     ProductProcessingService,												# 🧰 Оркестратор обробки товару
@@ -18,6 +26,16 @@ from .product_processing_service import (
 __all__ = [
     "BannerDropService",													# 🪧 Сервіс автоматизації Poster-drop
     "CollectionHealthSummary",												# 🩺 Метрики здоров'я колекції
+    "CollectionJob",														# 💾 Стан запуску колекції
+    "CollectionJobStore",													# 💾 Чекпоінти для продовження
+    "ImageNormalizer",														# 🪄 Нормалізація фото
+    "ProcessedBannerIndex",													# 🪧 Банери, які вже надіслано
+    "ProcessedProductCache",												# 🗃️ Кеш ProcessedProductData
     "ProcessedProductData",													# 📦 DTO з агрегованими даними товару
     "ProductProcessingService",											# 🧰 Оркестратор повної обробки товару
+    "SeenProductsIndex",													# 🗂️ Персистентний індекс колекцій
+    "StageGraph",															# 🕸️ DAG етапів
+    "StageGraphResult",														# 📦 Підсумок прогону графа
+    "StageOutcome",															# 📋 Результат етапу
+    "TelegramFileIdCache",													# 📎 URL/SHA256 → file_id
 ]
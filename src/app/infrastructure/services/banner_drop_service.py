@@ -5,9 +5,17 @@
 Кроки:
 1. Завантажує HTML через WebDriverService.
 2. Шукає банерні слайди з посиланнями на колекції.
-3. Скачує банер, ріже на три вертикальні частини.
-4. Збирає назви товарів з наявних колекцій та генерує текст через AI.
+3. Скачує банер, ріже на три вертикальні частини (Pillow — у пулі виконавців; частини кешуються
+   в `MediaStore` за sha256 банера).
+4. Збирає назви товарів з наявних колекцій (підказки `products.json` або header-only парсинг,
+   паралельно й у межах бюджету часу) та генерує текст через AI.
 5. Надсилає альбом у Telegram й запускає стандартний режим парсингу колекцій.
+
+Опубліковані банери пам'ятає `ProcessedBannerIndex` (за URL з версією `?v=` і за sha256 вмісту) — після
+рестарту не повторюються, а замінений під тим самим шляхом банер завантажується й звіряється за вмістом.
+Банери та їхні колекції обробляються паралельно (до `concurrency` одночасно на кожному рівні);
+товари всіх колекцій ділять спільний обмежувач `CollectionRunner`, а картки кожної колекції
+надсилаються в порядку джерела.
 """
 
 from __future__ import annotations
@@ -21,12 +29,14 @@ from telegram.helpers import escape_markdown
 
 # 🔠 Системні імпорти
 import asyncio                                                                     # ⏱️ Контроль одночасних запусків
+import hashlib                                                                     # 🔐 Digest банера
 import html                                                                        # 🔐 Екранування HTML
 import logging                                                                     # 🧾 Логування сервісу
-from collections import deque                                                     # ♻️ Простий LRU для банерів
-from dataclasses import dataclass                                                 # 🧱 DTO для знайдених банерів
+import time                                                                        # ⏱️ Бюджет збору назв
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor  # 🧵 Пул для Pillow
+from dataclasses import dataclass, field                                          # 🧱 DTO для знайдених банерів
 from io import BytesIO                                                            # 💾 Робота з байтами зображення
-from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Union         # 🧰 Типи
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union         # 🧰 Типи
 from urllib.parse import urljoin                                                  # 🌐 Побудова абсолютних URL
 
 # 🧩 Внутрішні модулі проєкту
@@ -40,16 +50,52 @@ from app.infrastructure.ai.ai_task_service import AITaskService
 from app.infrastructure.collection_processing.collection_processing_service import (
     CollectionProcessingService,
 )                                                                                 # 📚 Збір URL товарів
-from app.infrastructure.services.product_processing_service import (              # 🧠 Дані про товари
-    ProductProcessingService,
-)
+from app.infrastructure.content.product_header_service import ProductHeaderService  # 📰 Header-only парсинг
 from app.infrastructure.size_chart.image_downloader import ImageDownloader        # 📥 Завантаження зображень
+from app.infrastructure.services.processed_banner_index import ProcessedBannerIndex  # 🪧 Опубліковані банери
 from app.infrastructure.web.webdriver_service import WebDriverService             # 🌐 Завантаження HTML
+from app.shared.cache.media_store import MediaStore                               # 🗄️ Частини банера за digest
+from app.shared.cache.product_hints_cache import ProductHintsCache                # 🧷 Назви з products.json
 from app.shared.utils.logger import LOG_NAME                                      # 🏷️ Базовий логер
 from app.shared.utils.url_parser_service import UrlParserService                  # 🔗 Нормалізація URL
 
 logger = logging.getLogger(f"{LOG_NAME}.banner_drop")                            # 🧾 Логер сервісу
 
+_HEADER_PLACEHOLDER = "🔗 ТОВАР"                                                   # 🛡️ Заглушка ProductHeaderService
+_SLICE_PARTS = 3                                                                   # ✂️ Скільки вертикальних частин
+_SLICE_CONTENT_TYPES = {"png": "image/png", "jpg": "image/jpeg"}                  # 🏷️ Розширення → Content-Type
+
+
+# ================================
+# ✂️ НАРІЗКА (виконується в пулі)
+# ================================
+def slice_banner_bytes(raw_bytes: bytes, parts: int = _SLICE_PARTS) -> List[Tuple[bytes, str]]:
+    """
+    ✂️ Ріже банер на `parts` вертикальних частин; повертає [(байти, розширення)].
+
+    Модульна функція — щоб її можна було передати в ProcessPool.
+    """
+    slices: List[Tuple[bytes, str]] = []
+    with Image.open(BytesIO(raw_bytes)) as banner:
+        width, height = banner.size
+        fmt = (banner.format or "JPEG").upper()
+        target_format = "PNG" if fmt == "PNG" else "JPEG"
+        for idx in range(parts):
+            left = round(width * idx / parts)
+            right = round(width * (idx + 1) / parts)
+            if right <= left:
+                right = min(width, left + 1)
+            crop = banner.crop((left, 0, right, height))
+            if target_format == "JPEG" and crop.mode in {"RGBA", "P"}:
+                crop = crop.convert("RGB")
+            buffer = BytesIO()
+            params: Dict[str, Any] = {"format": target_format}
+            if target_format == "JPEG":
+                params["quality"] = 90
+            crop.save(buffer, **params)
+            slices.append((buffer.getvalue(), "png" if target_format == "PNG" else "jpg"))
+    return slices
+
 
 # ================================
 # 🧱 DTO
@@ -64,6 +110,22 @@ class BannerCandidate:
     button_labels: List[str]
 
 
+@dataclass(slots=True)
+class _BannerFanout:
+    """Спільні обмеження одного проходу головної: банери й колекції паралельно."""
+
+    candidate_slots: asyncio.Semaphore
+    collection_slots: asyncio.Semaphore
+    claimed_links: Set[str] = field(default_factory=set)
+
+    def claim(self, link: str) -> bool:
+        """Повертає True, якщо колекцію ще не запускав інший банер цього проходу."""
+        if link in self.claimed_links:
+            return False
+        self.claimed_links.add(link)
+        return True
+
+
 # ================================
 # 🪧 ОСНОВНИЙ СЕРВІС
 # ================================
@@ -76,20 +138,29 @@ class BannerDropService:
         webdriver_service: WebDriverService,
         url_parser_service: UrlParserService,
         collection_processing_service: CollectionProcessingService,
-        product_processing_service: ProductProcessingService,
+        header_service: ProductHeaderService,
         ai_service: AITaskService,
         image_downloader: ImageDownloader,
         image_sender: ImageSender,
         collection_handler: CollectionHandler,
         constants: AppConstants,
         exception_handler: ExceptionHandlerService,
+        hints_cache: Optional[ProductHintsCache] = None,
+        media_store: Optional[MediaStore] = None,
+        banner_index: Optional[ProcessedBannerIndex] = None,
         max_product_titles: int = 9,
-        processed_cache_size: int = 5,
+        processed_cache_size: int = 200,
+        title_concurrency: int = 6,
+        title_budget_sec: float = 8.0,
+        concurrency: int = 3,
+        slice_executor: str = "thread",
+        slice_workers: int = 1,
     ) -> None:
         self._webdriver = webdriver_service
         self._url_parser = url_parser_service
         self._collection_processing = collection_processing_service
-        self._product_processing = product_processing_service
+        self._header_service = header_service
+        self._hints = hints_cache
         self._ai_service = ai_service
         self._image_downloader = image_downloader
         self._image_sender = image_sender
@@ -97,16 +168,38 @@ class BannerDropService:
         self._constants = constants
         self._exception_handler = exception_handler
         self._max_titles = max(1, int(max_product_titles))
+        self._title_concurrency = max(1, int(title_concurrency))
+        self._title_budget_sec = max(0.1, float(title_budget_sec))
+        self._concurrency = max(1, int(concurrency))
+        self._media_store = media_store
         self._cache_limit = max(1, int(processed_cache_size))
-        self._processed_queue: Deque[str] = deque()
-        self._processed_lookup: Set[str] = set()
+        self._banner_index = (
+            banner_index if banner_index is not None else ProcessedBannerIndex(None, max_entries=self._cache_limit)
+        )                                                                         # 🪧 Без шляху — лише в пам'яті
+        workers = max(1, int(slice_workers))
+        self._slice_pool: Executor = (
+            ProcessPoolExecutor(max_workers=workers) if slice_executor == "process" else ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="banner-slice"
+            )
+        )                                                                         # 🧵 Pillow поза event loop
         self._lock = asyncio.Lock()
         self._default_home = "https://www.youngla.com/"
         logger.info(
             "🪧 banner_drop.init",
-            extra={"max_titles": self._max_titles, "cache_limit": self._cache_limit},
+            extra={
+                "max_titles": self._max_titles,
+                "cache_limit": self._cache_limit,
+                "title_concurrency": self._title_concurrency,
+                "title_budget_sec": self._title_budget_sec,
+                "concurrency": self._concurrency,
+                "media_store": self._media_store is not None,
+            },
         )
 
+    def shutdown(self) -> None:
+        """🧹 Зупиняє пул нарізки банерів."""
+        self._slice_pool.shutdown(wait=False, cancel_futures=True)
+
     # ================================
     # 📬 ПУБЛІЧНИЙ API
     # ================================
@@ -138,15 +231,32 @@ class BannerDropService:
 
                 candidates = self._extract_banners(html, base_url=target_url)
                 logger.info("🪧 banner_drop.found", extra={"count": len(candidates)})
-                processed_any = False
+                fresh: List[BannerCandidate] = []
                 for candidate in candidates:
-                    if self._is_cached(candidate.image_url):
+                    if self._banner_index.contains(url=candidate.image_url):  # 🔢 URL разом із `?v=` — без завантаження
                         logger.debug("🪧 banner_drop.skip_cached", extra={"image": candidate.image_url})
                         continue
-                    handled = await self._handle_candidate(candidate, update, context, parse_mode)
-                    if handled:
-                        self._remember_banner(candidate.image_url)
-                        processed_any = True
+                    fresh.append(candidate)
+
+                fanout = _BannerFanout(
+                    candidate_slots=asyncio.Semaphore(self._concurrency),
+                    collection_slots=asyncio.Semaphore(self._concurrency),
+                )
+                outcomes = await asyncio.gather(
+                    *(self._handle_candidate(candidate, update, context, parse_mode, fanout) for candidate in fresh),
+                    return_exceptions=True,
+                )
+                processed_any = False
+                for candidate, outcome in zip(fresh, outcomes):
+                    if isinstance(outcome, asyncio.CancelledError):
+                        raise outcome
+                    if isinstance(outcome, BaseException):
+                        logger.warning(
+                            "🪧 banner_drop.candidate_failed",
+                            extra={"image": candidate.image_url, "error": str(outcome)},
+                        )
+                        continue
+                    processed_any = processed_any or bool(outcome)
 
                 if not processed_any and message:
                     await message.reply_text(msg.BANNER_DROP_NO_NEW, parse_mode=parse_mode)
@@ -168,6 +278,20 @@ class BannerDropService:
         update: Update,
         context: CustomContext,
         parse_mode: Optional[str],
+        fanout: "_BannerFanout",
+    ) -> bool:
+        async with fanout.candidate_slots:
+            posted = await self._post_banner(candidate, update, context, parse_mode)
+        if posted:
+            await self._run_collection_handlers(update, context, candidate.collection_links, fanout)
+        return posted
+
+    async def _post_banner(
+        self,
+        candidate: BannerCandidate,
+        update: Update,
+        context: CustomContext,
+        parse_mode: Optional[str],
     ) -> bool:
         try:
             image_data = await self._image_downloader.fetch(candidate.image_url)
@@ -175,7 +299,13 @@ class BannerDropService:
             logger.warning("🪧 banner_drop.image_failed", extra={"url": candidate.image_url, "error": str(exc)})
             return False
 
-        media_group = self._slice_banner(image_data.content)
+        digest = hashlib.sha256(image_data.content).hexdigest()
+        if self._banner_index.contains(sha256=digest):
+            self._banner_index.remember(url=candidate.image_url, sha256=digest)   # 🔗 Новий URL того ж банера
+            logger.debug("🪧 banner_drop.skip_cached", extra={"image": candidate.image_url, "digest": digest[:12]})
+            return False
+
+        media_group = await self._slice_banner(image_data.content, digest)
         if not media_group:
             logger.warning("🪧 banner_drop.slice_empty", extra={"url": candidate.image_url})
             return False
@@ -203,52 +333,127 @@ class BannerDropService:
             caption=caption,
             parse_mode=parse_mode,
         )
-        await self._run_collection_handlers(update, context, candidate.collection_links)
+        self._banner_index.remember(url=candidate.image_url, sha256=digest)   # 💾 Альбом надіслано — не повторюємо
         return True
 
     async def _collect_product_titles(self, collection_links: Sequence[str]) -> List[str]:
-        titles: List[str] = []
+        """
+        Збирає до `max_titles` назв товарів без повної обробки карток.
+
+        Посилання всіх колекцій тягнуться паралельно (products.json засіває підказки),
+        назва береться з `ProductHintsCache`, інакше — header-only парсинг сторінки.
+        Усе вкладається в `title_budget_sec`: що не встигло — пропускаємо.
+        """
+        deadline = time.monotonic() + self._title_budget_sec
+        link_lists = await self._gather_within(
+            [self._collection_product_links(link) for link in collection_links], deadline
+        )
+
+        product_urls: List[str] = []
         seen_products: Set[str] = set()
-        for link in collection_links:
+        for links in link_lists:
+            for product_url in links or []:
+                url_value = getattr(product_url, "value", str(product_url))
+                if url_value and url_value not in seen_products:
+                    seen_products.add(url_value)
+                    product_urls.append(url_value)
+
+        titles: List[str] = []
+        semaphore = asyncio.Semaphore(self._title_concurrency)
+        cursor = 0
+        while cursor < len(product_urls) and len(titles) < self._max_titles and time.monotonic() < deadline:
+            batch = product_urls[cursor : cursor + self._max_titles - len(titles)]
+            cursor += len(batch)
+            batch_titles = await self._gather_within(
+                [self._product_title(url, semaphore) for url in batch], deadline
+            )
+            titles.extend(title for title in batch_titles if title)
+
+        logger.info(
+            "🪧 banner_drop.titles",
+            extra={"titles": len(titles), "products": len(product_urls), "looked_up": cursor},
+        )
+        return titles[: self._max_titles]
+
+    async def _collection_product_links(self, link: str) -> List[Any]:
+        try:
+            return list(await self._collection_processing.get_product_links(link))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("🪧 banner_drop.collection_failed", extra={"url": link, "error": str(exc)})
+            return []
+
+    async def _product_title(self, url: str, semaphore: asyncio.Semaphore) -> Optional[str]:
+        hint = self._hints.get(url) if self._hints is not None else None
+        if hint is not None and hint.title.strip():
+            return hint.title.strip()                                             # 🧷 Без мережі
+
+        product_path = (self._url_parser.extract_product_slug(url) or "").strip().strip("/")
+        if not product_path:
+            return None
+        async with semaphore:
             try:
-                product_links = await self._collection_processing.get_product_links(link)
+                header = await self._header_service.create_header(product_path)
+            except asyncio.CancelledError:
+                raise
             except Exception as exc:  # noqa: BLE001
-                logger.warning("🪧 banner_drop.collection_failed", extra={"url": link, "error": str(exc)})
-                continue
+                logger.warning("🪧 banner_drop.product_failed", extra={"url": url, "error": str(exc)})
+                return None
+        title = (getattr(header, "title", "") or "").strip()
+        return title if title and title != _HEADER_PLACEHOLDER else None
 
-            for product_url in product_links:
-                url_value = getattr(product_url, "value", str(product_url))
-                if url_value in seen_products:
-                    continue
-                seen_products.add(url_value)
-                try:
-                    result = await self._product_processing.process_url(url_value)
-                except Exception as exc:  # noqa: BLE001
-                    logger.warning("🪧 banner_drop.product_failed", extra={"url": url_value, "error": str(exc)})
-                    continue
-                if not result.ok or not result.data or not result.data.content:
-                    continue
-                title = getattr(result.data.content, "title", "")
-                if title:
-                    titles.append(title.strip())
-                if len(titles) >= self._max_titles:
-                    return titles
-        return titles
+    @staticmethod
+    async def _gather_within(coros: Sequence[Any], deadline: float) -> List[Any]:
+        """Виконує корутини паралельно до `deadline`; незавершені скасовує (результат None), порядок зберігається."""
+        if not coros:
+            return []
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        _, pending = await asyncio.wait(tasks, timeout=max(0.0, deadline - time.monotonic()))
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning("🪧 banner_drop.title_budget_exceeded", extra={"cancelled": len(pending)})
+        return [
+            task.result() if task.done() and not task.cancelled() and task.exception() is None else None
+            for task in tasks
+        ]
 
     async def _run_collection_handlers(
-        self, update: Update, context: CustomContext, links: Sequence[str]
+        self,
+        update: Update,
+        context: CustomContext,
+        links: Sequence[str],
+        fanout: "_BannerFanout",
     ) -> None:
+        """
+        Запускає колекції банера паралельно (не більше `concurrency` на весь прохід).
+
+        Кожна колекція надсилає картки в порядку джерела; товари всіх колекцій ділять
+        спільний обмежувач `CollectionRunner`. Колекцію, яку вже запустив інший банер, пропускаємо.
+        """
         modes = getattr(getattr(self._constants, "LOGIC", object()), "MODES", object())
         collection_mode = getattr(modes, "COLLECTION", "collection")
-        for link in links:
-            try:
-                context.mode = collection_mode
-                context.url = link
-                await self._collection_handler.handle_collection(update, context, url=link)
-            except asyncio.CancelledError:
-                raise
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("🪧 banner_drop.collection_handler_failed", extra={"url": link, "error": str(exc)})
+        context.mode = collection_mode
+
+        async def _run_one(link: str) -> None:
+            async with fanout.collection_slots:
+                try:
+                    await self._collection_handler.handle_collection(
+                        update, context, url=link, preserve_order=True
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "🪧 banner_drop.collection_handler_failed", extra={"url": link, "error": str(exc)}
+                    )
+
+        fresh_links = [link for link in links if fanout.claim(link)]
+        if len(fresh_links) < len(links):
+            logger.debug("🪧 banner_drop.collection_shared", extra={"skipped": len(links) - len(fresh_links)})
+        await asyncio.gather(*(_run_one(link) for link in fresh_links))
 
     def _extract_banners(self, html: str, base_url: str) -> List[BannerCandidate]:
         soup = BeautifulSoup(html, "lxml")
@@ -323,40 +528,60 @@ class BannerDropService:
             return node.get_text(" ", strip=True)[:200]
         return ""
 
-    def _slice_banner(self, raw_bytes: bytes) -> List[InputFile]:
+    async def _slice_banner(self, raw_bytes: bytes, digest: str) -> List[InputFile]:
+        """Частини банера з `MediaStore` (за digest) або щойно нарізані в пулі виконавців."""
+        slices = await self._stored_slices(digest)
+        if slices is None:
+            loop = asyncio.get_running_loop()
+            try:
+                slices = await loop.run_in_executor(self._slice_pool, slice_banner_bytes, raw_bytes)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("🪧 banner_drop.slice_fail", extra={"error": str(exc)})
+                return []
+            await self._store_slices(digest, slices)
+        return [
+            InputFile(
+                BytesIO(content),
+                filename=f"banner_{idx + 1}.{ext}",
+                attach=True,  # 📎 Щоб Telegram дозволив відправляти альбом
+            )
+            for idx, (content, ext) in enumerate(slices)
+        ]
+
+    @staticmethod
+    def _slice_key(digest: str, idx: int) -> str:
+        return f"banner-slice://{digest}/{idx}"
+
+    async def _stored_slices(self, digest: str) -> Optional[List[Tuple[bytes, str]]]:
+        store = self._media_store
+        if store is None:
+            return None
         try:
-            with Image.open(BytesIO(raw_bytes)) as banner:
-                width, height = banner.size
-                fmt = (banner.format or "JPEG").upper()
-                target_format = "PNG" if fmt == "PNG" else "JPEG"
-                media: List[InputFile] = []
-                for idx in range(3):
-                    left = round(width * idx / 3)
-                    right = round(width * (idx + 1) / 3)
-                    if right <= left:
-                        right = min(width, left + 1)
-                    crop = banner.crop((left, 0, right, height))
-                    if target_format == "JPEG" and crop.mode in {"RGBA", "P"}:
-                        crop = crop.convert("RGB")
-                    buffer = BytesIO()
-                    save_format = target_format
-                    params: Dict[str, Any] = {"format": save_format}
-                    if save_format == "JPEG":
-                        params["quality"] = 90
-                    crop.save(buffer, **params)
-                    buffer.seek(0)
-                    ext = "png" if save_format == "PNG" else "jpg"
-                    media.append(
-                        InputFile(
-                            buffer,
-                            filename=f"banner_{idx + 1}.{ext}",
-                            attach=True,  # 📎 Щоб Telegram дозволив відправляти альбом
-                        )
-                    )
-                return media
+            slices: List[Tuple[bytes, str]] = []
+            for idx in range(_SLICE_PARTS):
+                entry = await asyncio.to_thread(store.lookup, self._slice_key(digest, idx))
+                if entry is None:
+                    return None
+                ext = "png" if entry.content_type == _SLICE_CONTENT_TYPES["png"] else "jpg"
+                slices.append((await asyncio.to_thread(store.read, entry), ext))
         except Exception as exc:  # noqa: BLE001
-            logger.warning("🪧 banner_drop.slice_fail", extra={"error": str(exc)})
-            return []
+            logger.warning("🪧 banner_drop.slice_store_read_failed", extra={"digest": digest[:12], "error": str(exc)})
+            return None
+        logger.debug("🪧 banner_drop.slices_cached", extra={"digest": digest[:12]})
+        return slices
+
+    async def _store_slices(self, digest: str, slices: Sequence[Tuple[bytes, str]]) -> None:
+        store = self._media_store
+        if store is None:
+            return
+        for idx, (content, ext) in enumerate(slices):
+            try:
+                await asyncio.to_thread(
+                    store.put, self._slice_key(digest, idx), content, content_type=_SLICE_CONTENT_TYPES[ext]
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("🪧 banner_drop.slice_store_write_failed", extra={"digest": digest[:12], "error": str(exc)})
+                return
 
     @staticmethod
     def _normalize_home_url(raw: Optional[str]) -> str:
@@ -397,15 +622,5 @@ class BannerDropService:
             return escape_markdown(caption, version=2)
         return caption
 
-    def _remember_banner(self, image_url: str) -> None:
-        self._processed_queue.append(image_url)
-        self._processed_lookup.add(image_url)
-        while len(self._processed_queue) > self._cache_limit:
-            dropped = self._processed_queue.popleft()
-            self._processed_lookup.discard(dropped)
-
-    def _is_cached(self, image_url: str) -> bool:
-        return image_url in self._processed_lookup
-
 
 __all__ = ["BannerDropService"]
@@ -3,6 +3,9 @@
 🩺 CollectionHealthSummary — прості показники здоров'я поточної колекції.
 
 🔹 Накопичуємо кількість успішних товарів, ALT-фолбеків та невдалих айтемів.
+🔹 Окремо рахуємо товари, пропущені в режимі «лише змінені» (не входять у `total`).
+🔹 Для продовженого завдання — скільки товарів уже надіслав попередній (перерваний) запуск.
+🔹 Скільки OCR/AI-операцій товари запуску отримали зі спільного (single-flight) результату.
 🔹 Використовується під час обробки колекції, щоб логувати та показувати короткий звіт.
 """
 
@@ -19,6 +22,10 @@ class CollectionHealthSummary:
     ok: int = 0
     alt_fallback: int = 0
     failed: int = 0
+    skipped: int = 0
+    resumed: bool = False
+    resumed_done: int = 0
+    deduplicated: int = 0
 
     def register_ok(self, alt_fallback_used: bool) -> None:
         """🔢 Обновити, якщо продукт оброблено успішно."""
@@ -33,5 +40,18 @@ class CollectionHealthSummary:
         self.total += 1
         self.failed += 1
 
+    def register_skipped(self, count: int = 1) -> None:
+        """⏭️ Обновити, якщо товар пропущено як незмінений."""
+        self.skipped += max(0, int(count))
+
+    def register_resumed(self, already_done: int) -> None:
+        """♻️ Запуск продовжує перерване завдання; `already_done` товарів не повторюємо."""
+        self.resumed = True
+        self.resumed_done += max(0, int(already_done))
+
+    def register_deduplicated(self, count: int) -> None:
+        """🛬 Операції, які не виконувались повторно, бо інший товар уже робив ту саму роботу."""
+        self.deduplicated += max(0, int(count))
+
 
 __all__ = ["CollectionHealthSummary"]
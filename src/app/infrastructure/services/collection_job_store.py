@@ -0,0 +1,178 @@
+# 💾 app/infrastructure/services/collection_job_store.py
+"""
+💾 CollectionJobStore — чекпоінти запусків колекцій на диску.
+
+🔹 Завдання = (власник, колекція): список URL, стан кожного товару та id надісланих повідомлень.
+🔹 Перерваний запуск (рестарт бота, скасування) лишає файл — повторна команда продовжує з незавершених.
+🔹 Повністю завершений запуск видаляє чекпоінт; застарілі (старші за `max_age_sec`) ігноруються.
+🔹 Файли JSON по одному на завдання, запис атомарний (tmp + os.replace).
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import hashlib                                                      # 🔐 Ключі файлів
+import json                                                         # 🧾 Серіалізація чекпоінта
+import logging                                                      # 🧾 Логування
+import os                                                           # 🔁 Атомарна заміна файлу
+import threading                                                    # 🔒 Захист запису
+import time                                                         # ⏱️ Мітки часу
+from dataclasses import dataclass, field                            # 🧱 DTO
+from pathlib import Path                                            # 📁 Шляхи
+from typing import Dict, Iterable, List, Optional, Sequence          # 🧰 Типи
+
+# 🧩 Внутрішні модулі проєкту
+from app.infrastructure.services.seen_products_index import collection_key  # 🔑 Ключ колекції
+from app.shared.utils.logger import LOG_NAME                        # 🏷️ Базовий логер
+
+logger = logging.getLogger(f"{LOG_NAME}.collection_jobs")
+
+_JOB_VERSION = 1                                                    # 🔢 Версія формату файлу
+DONE_STATE = "ok"                                                   # ✅ Стан, після якого товар не повторюємо
+
+
+# ================================
+# 🧱 ЗАВДАННЯ
+# ================================
+@dataclass
+class CollectionJob:
+    """🧱 Стан одного запуску колекції."""
+
+    job_id: str                                                     # 🆔 Ключ файлу
+    owner: str                                                      # 👤 Чат/користувач
+    collection_url: str                                             # 🔗 URL колекції
+    urls: List[str]                                                 # 📋 Товари в порядку колекції
+    states: Dict[str, str] = field(default_factory=dict)            # 🚦 url → CollectionItemState.value
+    message_ids: Dict[str, List[int]] = field(default_factory=dict) # 💬 url → id надісланих повідомлень
+    created_at: float = field(default_factory=time.time)            # ⏱️ Перший запуск
+    resumes: int = 0                                                # ♻️ Скільки разів продовжували
+
+    def is_done(self, url: str) -> bool:
+        """✅ Товар уже успішно надіслано."""
+        return self.states.get(url) == DONE_STATE
+
+    def pending_urls(self) -> List[str]:
+        """⏳ Товари, які ще треба обробити (у порядку колекції)."""
+        return [url for url in self.urls if not self.is_done(url)]
+
+    @property
+    def done_count(self) -> int:
+        return sum(1 for url in self.urls if self.is_done(url))
+
+
+# ================================
+# 💾 СХОВИЩЕ
+# ================================
+class CollectionJobStore:
+    """💾 Файлові чекпоінти завдань колекцій."""
+
+    def __init__(self, base_dir: str | Path, *, max_age_sec: float = 24 * 3600) -> None:
+        self._base_dir = Path(base_dir)
+        self._max_age_sec = max(0.0, float(max_age_sec))
+        self._lock = threading.Lock()
+
+    def open(self, owner: str, collection_url: str, urls: Sequence[str]) -> tuple[CollectionJob, bool]:
+        """
+        📂 Продовжує незавершене завдання або створює нове.
+
+        Returns:
+            (завдання, чи це продовження). Нові URL колекції дописуються в кінець списку завдання.
+        """
+        job_id = self._job_id(owner, collection_url)
+        with self._lock:
+            job = self._read(job_id)
+            if job is not None and self._max_age_sec and time.time() - job.created_at > self._max_age_sec:
+                logger.info("🗑️ Застаріле завдання колекції %s — починаємо заново.", collection_url)
+                job = None
+            resumed = job is not None
+            if job is None:
+                job = CollectionJob(job_id=job_id, owner=str(owner), collection_url=collection_url, urls=list(urls))
+            else:
+                known = set(job.urls)
+                job.urls.extend(url for url in urls if url not in known)
+                job.resumes += 1
+            self._write(job)
+        return job, resumed
+
+    def mark(self, job: CollectionJob, url: str, state: str, *, message_ids: Iterable[int] = ()) -> None:
+        """🚦 Фіксує стан товару (і id повідомлень) та зберігає чекпоінт."""
+        with self._lock:
+            job.states[url] = state
+            ids = [int(message_id) for message_id in message_ids if message_id is not None]
+            if ids:
+                job.message_ids[url] = ids
+            self._write(job)
+
+    def complete(self, job: CollectionJob) -> None:
+        """🏁 Завдання завершене — чекпоінт більше не потрібен."""
+        with self._lock:
+            try:
+                self._path_for(job.job_id).unlink(missing_ok=True)
+            except OSError as exc:
+                logger.warning("⚠️ Не вдалося видалити чекпоінт %s: %s", job.job_id, exc)
+
+    def unfinished(self) -> List[CollectionJob]:
+        """📋 Усі збережені (незавершені) завдання — для звіту після рестарту."""
+        if not self._base_dir.exists():
+            return []
+        with self._lock:
+            jobs = [self._read(path.stem) for path in sorted(self._base_dir.glob("*.json"))]
+        return [job for job in jobs if job is not None]
+
+    # ================================
+    # 💾 ДИСК
+    # ================================
+    @staticmethod
+    def _job_id(owner: str, collection_url: str) -> str:
+        raw = f"{owner}|{collection_key(collection_url)}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+
+    def _path_for(self, job_id: str) -> Path:
+        return self._base_dir / f"{job_id}.json"
+
+    def _read(self, job_id: str) -> Optional[CollectionJob]:
+        path = self._path_for(job_id)
+        if not path.exists():
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            return CollectionJob(
+                job_id=job_id,
+                owner=str(payload.get("owner", "")),
+                collection_url=str(payload.get("collection", "")),
+                urls=[str(url) for url in payload.get("urls") or []],
+                states={str(url): str(state) for url, state in (payload.get("states") or {}).items()},
+                message_ids={
+                    str(url): [int(message_id) for message_id in ids]
+                    for url, ids in (payload.get("message_ids") or {}).items()
+                },
+                created_at=float(payload.get("created_at", 0.0)),
+                resumes=int(payload.get("resumes", 0)),
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Пошкоджений чекпоінт %s: %s — починаємо з нуля.", path, exc)
+            return None
+
+    def _write(self, job: CollectionJob) -> None:
+        path = self._path_for(job.job_id)
+        payload = {
+            "version": _JOB_VERSION,
+            "owner": job.owner,
+            "collection": job.collection_url,
+            "created_at": job.created_at,
+            "updated_at": time.time(),
+            "resumes": job.resumes,
+            "urls": job.urls,
+            "states": job.states,                                   # 🚦 url → стан
+            "message_ids": job.message_ids,                         # 💬 url → [message_id]
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, path)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Не вдалося записати чекпоінт %s: %s", path, exc)
+
+
+__all__ = ["DONE_STATE", "CollectionJob", "CollectionJobStore"]
@@ -0,0 +1,231 @@
+# 🪄 app/infrastructure/services/image_normalizer.py
+"""
+🪄 Нормалізація фото перед upload у Telegram.
+
+🔹 Зменшує до корисної для Telegram роздільності (`max_side`, за замовчуванням 1280 px).
+🔹 Перекодовує в JPEG/WebP з заданою якістю, прибирає EXIF/ICC (орієнтацію застосовує до пікселів).
+🔹 Pillow працює в пулі потоків або процесів — event loop не блокується.
+🔹 Результати кешуються на диску за адресою вмісту: sha256(оригінал) + відбиток налаштувань;
+   дисковий I/O кешу — через `asyncio.to_thread`.
+🔹 Якщо результат не менший за оригінал (і зменшення не потрібне), лишається оригінал —
+   у кеші це порожній файл-маркер, тож повторно Pillow вже не запускається.
+🔹 Заощаджені байти та час — у Prometheus (`MEDIA_NORMALIZE_*`).
+"""
+
+from __future__ import annotations
+
+# 🌐 Зовнішні бібліотеки
+from PIL import Image, ImageOps                                     # 🖼️ Декодування / ресайз / кодування
+
+# 🔠 Системні імпорти
+import asyncio                                                      # 🔄 run_in_executor
+import hashlib                                                      # 🔐 Ключі кешу
+import io                                                           # 💾 Буфери
+import logging                                                      # 🧾 Логування
+import os                                                           # 🔁 Атомарний запис
+import time                                                         # ⏱️ Метрики
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor  # 🧵 Пули
+from dataclasses import dataclass, replace                          # 🧱 DTO
+from pathlib import Path                                            # 📁 Дисковий кеш
+from typing import Optional                                         # 🧰 Типи
+
+# 🧩 Внутрішні модулі проєкту
+from app.infrastructure.size_chart.image_downloader import ImageData  # 📦 Байти фото
+from app.shared.metrics.media import MEDIA_NORMALIZE_BYTES_SAVED_TOTAL, MEDIA_NORMALIZE_SECONDS
+from app.shared.utils.logger import LOG_NAME                        # 🏷️ Базовий логер
+
+logger = logging.getLogger(f"{LOG_NAME}.image_normalizer")
+
+_CONTENT_TYPES = {"JPEG": "image/jpeg", "WEBP": "image/webp"}       # 🏷️ Формат → Content-Type
+_EXTENSIONS = {"JPEG": ".jpg", "WEBP": ".webp"}                     # 📎 Формат → розширення
+_PASS_THROUGH = b""                                                 # 🏷️ Маркер кешу: «надсилати оригінал»
+
+
+# ================================
+# ⚙️ НАЛАШТУВАННЯ
+# ================================
+@dataclass(frozen=True)
+class NormalizeSettings:
+    """⚙️ Параметри перекодування."""
+
+    max_side: int = 1280                                            # 📏 Довша сторона після ресайзу
+    quality: int = 82                                               # 🎚️ Якість JPEG/WebP
+    format: str = "JPEG"                                            # 🧾 JPEG | WEBP
+
+    @property
+    def fingerprint(self) -> str:
+        """🧬 Частина ключа кешу: зміна налаштувань = нові рендиції."""
+        return f"{self.format.upper()}-{int(self.max_side)}-q{int(self.quality)}"
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizedImage:
+    """📦 Результат нормалізації (або оригінал, якщо так вигідніше)."""
+
+    content: bytes                                                  # 💾 Байти для upload
+    content_type: Optional[str]                                     # 🏷️ Тип вмісту
+    original_bytes: int                                             # 📏 Розмір оригіналу
+    changed: bool                                                   # 🪄 Чи перекодовано
+
+    @property
+    def bytes_saved(self) -> int:
+        return max(0, self.original_bytes - len(self.content))
+
+
+# ================================
+# 🧮 ЧИСТА ФУНКЦІЯ (виконується в пулі)
+# ================================
+def normalize_image_bytes(content: bytes, settings: NormalizeSettings) -> Optional[bytes]:
+    """
+    🧮 Ресайз + перекодування без метаданих.
+
+    Повертає нові байти або None, якщо нормалізація невигідна (анімація, результат більший
+    за оригінал без потреби в ресайзі). Модульна функція — щоб її можна було передати в ProcessPool.
+    """
+    fmt = settings.format.upper()
+    with Image.open(io.BytesIO(content)) as image:
+        if getattr(image, "is_animated", False):
+            return None                                             # 🎞️ Анімацію не чіпаємо
+        needs_resize = max(image.size) > settings.max_side
+        image = ImageOps.exif_transpose(image)                      # 🔄 Орієнтацію — в пікселі, EXIF — геть
+        if image.mode in ("RGBA", "LA", "P") or "transparency" in image.info:
+            rgba = image.convert("RGBA")
+            background = Image.new("RGB", rgba.size, (255, 255, 255))  # ⬜ Прозорість → білий фон
+            background.paste(rgba, mask=rgba.getchannel("A"))
+            image = background
+        elif image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")                            # 🎨 CMYK / I;16 тощо → RGB
+        if needs_resize:
+            image.thumbnail((settings.max_side, settings.max_side), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        save_kwargs = {"quality": int(settings.quality)}
+        if fmt == "JPEG":
+            save_kwargs.update(optimize=True, progressive=True)
+        else:
+            save_kwargs.update(method=4)
+        image.save(buffer, format=fmt, **save_kwargs)               # 🧾 Без exif= / icc_profile= — метадані не пишемо
+    result = buffer.getvalue()
+    if not needs_resize and len(result) >= len(content):
+        return None                                                 # 📏 Перекодування не дало виграшу
+    return result
+
+
+# ================================
+# 🪄 СЕРВІС
+# ================================
+class ImageNormalizer:
+    """🪄 Асинхронна нормалізація фото з пулом виконавців і дисковим кешем."""
+
+    def __init__(
+        self,
+        settings: Optional[NormalizeSettings] = None,
+        *,
+        cache_dir: Optional[str | Path] = None,
+        executor: str = "thread",
+        max_workers: int = 2,
+    ) -> None:
+        self.settings = settings or NormalizeSettings()
+        if self.settings.format.upper() not in _CONTENT_TYPES:
+            logger.warning("⚠️ Невідомий формат %s — використовуємо JPEG", self.settings.format)
+            self.settings = replace(self.settings, format="JPEG")
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        workers = max(1, int(max_workers))
+        self._executor: Executor = (
+            ProcessPoolExecutor(max_workers=workers) if executor == "process" else ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="image-normalize"
+            )
+        )                                                           # 🧵 Pillow поза event loop
+
+    @property
+    def extension(self) -> str:
+        """📎 Розширення файлу для нормалізованих фото."""
+        return _EXTENSIONS[self.settings.format.upper()]
+
+    async def normalize(self, image: ImageData) -> NormalizedImage:
+        """🪄 Повертає нормалізовані байти (з кешу або щойно перекодовані); у разі збою — оригінал."""
+        started = time.perf_counter()
+        original_size = len(image.content)
+        cache_path = self._cache_path(image)
+        cached = await asyncio.to_thread(self._read_cache, cache_path) if cache_path else None
+        if cached == _PASS_THROUGH:
+            result = NormalizedImage(image.content, image.content_type, original_size, changed=False)
+            self._observe("cached", started, result)
+            return result
+        if cached is not None:
+            result = NormalizedImage(cached, self._content_type, original_size, changed=True)
+            self._observe("cached", started, result)
+            return result
+
+        loop = asyncio.get_running_loop()
+        try:
+            encoded = await loop.run_in_executor(self._executor, normalize_image_bytes, image.content, self.settings)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Нормалізація не вдалася для %s: %s — надсилаємо оригінал", image.url, exc)
+            result = NormalizedImage(image.content, image.content_type, original_size, changed=False)
+            self._observe("failed", started, result)
+            return result
+
+        if encoded is None:
+            if cache_path is not None:
+                await asyncio.to_thread(self._write_cache, cache_path, _PASS_THROUGH)
+            result = NormalizedImage(image.content, image.content_type, original_size, changed=False)
+            self._observe("skipped", started, result)
+            return result
+
+        if cache_path is not None:
+            await asyncio.to_thread(self._write_cache, cache_path, encoded)
+        result = NormalizedImage(encoded, self._content_type, original_size, changed=True)
+        self._observe("normalized", started, result)
+        logger.debug(
+            "🪄 %s: %d → %d байт (%s)", image.url, original_size, len(encoded), self.settings.fingerprint
+        )
+        return result
+
+    def shutdown(self) -> None:
+        """🧹 Зупиняє пул виконавців."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ================================
+    # 🧰 ДОПОМІЖНІ
+    # ================================
+    @property
+    def _content_type(self) -> str:
+        return _CONTENT_TYPES[self.settings.format.upper()]
+
+    @staticmethod
+    def _observe(outcome: str, started: float, result: NormalizedImage) -> None:
+        MEDIA_NORMALIZE_SECONDS.labels(outcome=outcome).observe(time.perf_counter() - started)
+        if result.bytes_saved:
+            MEDIA_NORMALIZE_BYTES_SAVED_TOTAL.inc(result.bytes_saved)
+
+    def _cache_path(self, image: ImageData) -> Optional[Path]:
+        if self._cache_dir is None:
+            return None
+        source = image.sha256 or hashlib.sha256(image.content).hexdigest()
+        key = hashlib.sha256(f"{source}:{self.settings.fingerprint}".encode("utf-8")).hexdigest()
+        return self._cache_dir / key[:2] / f"{key}{self.extension}"
+
+    @staticmethod
+    def _read_cache(path: Optional[Path]) -> Optional[bytes]:
+        if path is None or not path.exists():
+            return None
+        try:
+            return path.read_bytes()
+        except OSError as exc:
+            logger.warning("⚠️ Не вдалося прочитати рендицію %s: %s", path, exc)
+            return None
+
+    @staticmethod
+    def _write_cache(path: Optional[Path], content: bytes) -> None:
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            tmp.write_bytes(content)
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.warning("⚠️ Не вдалося записати рендицію %s: %s", path, exc)
+
+
+__all__ = ["ImageNormalizer", "NormalizeSettings", "NormalizedImage", "normalize_image_bytes"]
@@ -0,0 +1,100 @@
+# 🪧 app/infrastructure/services/processed_banner_index.py
+"""
+🪧 ProcessedBannerIndex — персистентний перелік уже опублікованих банерів головної.
+
+🔹 Ключі як у `TelegramFileIdCache`: `url:<host/path[?v=…]>` (до завантаження) та `sha256:<hex>` (вміст).
+🔹 URL-ключ містить версію CDN: банер, замінений під тим самим шляхом з новим `?v=`, не відсіюється
+   до завантаження — його звіряють за sha256 (новий вміст публікується, той самий — ні).
+🔹 Значення — час публікації; той самий банер під іншим CDN-шляхом теж впізнається за вмістом.
+🔹 Переживає рестарт бота: один JSON-файл, LRU-межа `max_entries`, запис атомарний (tmp + os.replace).
+🔹 Без `path` працює лише в пам'яті.
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import json                                                         # 🧾 Серіалізація індексу
+import logging                                                      # 🧾 Логування
+import os                                                           # 🔁 Атомарна заміна файлу
+import threading                                                    # 🔒 Захист запису
+import time                                                         # ⏱️ Мітки часу
+from collections import OrderedDict                                 # 🧮 LRU-порядок
+from pathlib import Path                                            # 📁 Шляхи
+from typing import Optional                                         # 🧰 Типи
+
+# 🧩 Внутрішні модулі проєкту
+from app.infrastructure.services.telegram_file_id_cache import image_cache_keys  # 🔑 url:/sha256: ключі
+from app.shared.utils.logger import LOG_NAME                        # 🏷️ Базовий логер
+
+logger = logging.getLogger(f"{LOG_NAME}.banner_index")
+
+_INDEX_VERSION = 1                                                  # 🔢 Версія формату файлу
+DEFAULT_BANNER_INDEX_PATH = "./var/banner_drop/processed.json"      # 📁 Шлях за замовчуванням
+
+
+# ================================
+# 🪧 ІНДЕКС
+# ================================
+class ProcessedBannerIndex:
+    """🪧 Банери, які вже надіслано (за URL та за вмістом), з LRU-витісненням."""
+
+    def __init__(self, path: Optional[str | Path] = DEFAULT_BANNER_INDEX_PATH, *, max_entries: int = 200) -> None:
+        self._path = Path(path) if path else None
+        self._max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[str, float]" = self._read()     # 🧠 key → posted_at
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def contains(self, *, url: Optional[str] = None, sha256: Optional[str] = None) -> bool:
+        """📖 Чи публікувався банер з таким URL або вмістом."""
+        with self._lock:
+            return any(key in self._items for key in image_cache_keys(url=url, sha256=sha256))
+
+    def remember(self, *, url: Optional[str] = None, sha256: Optional[str] = None) -> None:
+        """💾 Позначає банер опублікованим (під усіма відомими ключами)."""
+        keys = image_cache_keys(url=url, sha256=sha256)
+        if not keys:
+            return
+        now = time.time()
+        with self._lock:
+            for key in keys:
+                self._items[key] = self._items.get(key, now)
+                self._items.move_to_end(key)
+            while len(self._items) > self._max_entries:
+                self._items.popitem(last=False)                     # 🧹 Найстаріший запис
+            self._write()
+
+    # ================================
+    # 💾 ДИСК
+    # ================================
+    def _read(self) -> "OrderedDict[str, float]":
+        if self._path is None or not self._path.exists():
+            return OrderedDict()
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+            items = payload.get("items") or {}
+            return OrderedDict((str(key), float(value)) for key, value in items.items())
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Пошкоджений індекс банерів %s: %s — починаємо з нуля.", self._path, exc)
+            return OrderedDict()
+
+    def _write(self) -> None:
+        if self._path is None:
+            return
+        payload = {
+            "version": _INDEX_VERSION,
+            "updated_at": time.time(),
+            "items": dict(self._items),                             # 🏷️ key → posted_at (порядок = LRU)
+        }
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self._path)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Не вдалося записати індекс банерів %s: %s", self._path, exc)
+
+
+__all__ = ["DEFAULT_BANNER_INDEX_PATH", "ProcessedBannerIndex"]
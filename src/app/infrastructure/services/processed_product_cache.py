@@ -0,0 +1,274 @@
+# 🗃️ app/infrastructure/services/processed_product_cache.py
+"""
+🗃️ ProcessedProductCache — кеш готових `ProcessedProductData` для повторних посилань.
+
+🔹 Ключ: канонічний URL + регіон + версія конфігу/промптів + відбиток курсів валют.
+🔹 Пам'ять: LRU з TTL, обмеженням кількості записів і приблизного обсягу (`max_bytes`):
+   запис тримає HTML сторінки (`page_source` потрібен size-chart кроку при надсиланні), тож межа — в байтах.
+🔹 Диск (опційно): pickle-файл на запис, атомарний запис (tmp + os.replace), той самий TTL;
+   (де)серіалізація та файловий I/O — через `asyncio.to_thread`, тож API кешу асинхронний.
+🔹 Зміна курсів міняє ключ (старі записи просто не знаходяться і витісняються LRU/TTL).
+🔹 Наявність старіє швидше за контент: `availability_stale()` підказує, коли її перерахувати.
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import asyncio                                                      # 🔄 Дисковий шар поза event loop
+import hashlib                                                      # 🔐 Ключі та відбитки
+import logging                                                      # 🧾 Логування
+import os                                                           # 🔁 Атомарна заміна файлу
+import pickle                                                       # 💾 Серіалізація DTO на диск
+import threading                                                    # 🔒 Захист LRU
+import time                                                         # ⏱️ TTL
+from collections import OrderedDict                                 # 🔁 LRU
+from dataclasses import dataclass                                   # 🧱 Запис кешу
+from decimal import Decimal                                         # 💱 Курси
+from pathlib import Path                                            # 📁 Шляхи
+from typing import Callable, Dict, Mapping, Optional, TYPE_CHECKING, TypeVar  # 🧰 Типи
+
+# 🧩 Внутрішні модулі проєкту
+from app.shared.cache.product_hints_cache import hint_key           # 🔑 Нормалізація URL товару
+from app.shared.utils.logger import LOG_NAME                        # 🏷️ Базовий логер
+
+if TYPE_CHECKING:
+    from app.infrastructure.services.product_processing_service import ProcessedProductData
+
+logger = logging.getLogger(f"{LOG_NAME}.processed_cache")
+
+_DISK_FORMAT = 1                                                    # 🔢 Версія формату файлів
+_T = TypeVar("_T")
+
+
+# ================================
+# 🔧 УТИЛІТИ
+# ================================
+def rates_fingerprint(rates: Mapping[str, Decimal | float | str]) -> str:
+    """💱 Короткий відбиток поточних курсів (зміна курсу → новий ключ кешу)."""
+    payload = ";".join(f"{code}={rates[code]}" for code in sorted(rates))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def content_version(*parts: object, prompts_root: Optional[Path] = None) -> str:
+    """🧬 Версія «конфіг + промпти»: будь-яка зміна шаблону чи параметра дає новий ключ."""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+    if prompts_root is not None and prompts_root.is_dir():
+        for path in sorted(p for p in prompts_root.rglob("*") if p.is_file()):
+            digest.update(str(path.relative_to(prompts_root)).encode("utf-8"))
+            try:
+                digest.update(path.read_bytes())
+            except OSError:
+                continue
+    return digest.hexdigest()[:12]
+
+
+def approx_size(data: "ProcessedProductData") -> int:
+    """📏 Приблизний обсяг запису: HTML сторінки + текстове подання контенту."""
+    return len(getattr(data, "page_source", "") or "") + len(repr(getattr(data, "content", "")))
+
+
+# ================================
+# 🧱 ЗАПИС
+# ================================
+@dataclass(slots=True)
+class CachedProduct:
+    """📦 Готовий результат із мітками часу."""
+
+    data: "ProcessedProductData"
+    stored_at: float                                                # ⏱️ Коли зібрали повний результат
+    availability_at: float                                          # ⏱️ Коли востаннє рахували наявність
+
+
+# ================================
+# 🗃️ КЕШ
+# ================================
+class ProcessedProductCache:
+    """🗃️ Двошаровий (пам'ять + опційний диск) кеш `ProcessedProductData`."""
+
+    def __init__(
+        self,
+        *,
+        ttl_sec: float = 900.0,
+        availability_ttl_sec: float = 120.0,
+        max_entries: int = 128,
+        max_bytes: int = 32 * 1024 * 1024,
+        disk_dir: Optional[str | Path] = None,
+        version: str = "",
+        currency_fingerprint: Optional[Callable[[], str]] = None,
+    ) -> None:
+        self._ttl = max(0.0, float(ttl_sec))                        # ⏳ Життя повного результату
+        self._availability_ttl = max(0.0, float(availability_ttl_sec))  # ⏳ Скільки довіряємо наявності
+        self._max = max(1, int(max_entries))                        # 🔢 Межа пам'яті (записи)
+        self._max_bytes = max(1, int(max_bytes))                    # 📏 Межа пам'яті (≈ байти)
+        self._disk_dir = Path(disk_dir) if disk_dir else None       # 💾 Опційний дисковий шар
+        self._version = version                                     # 🧬 Версія конфігу/промптів
+        self._currency = currency_fingerprint                       # 💱 Відбиток курсів
+        self._data: "OrderedDict[str, CachedProduct]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}                            # 📏 key → приблизний обсяг
+        self._bytes = 0                                             # 📏 Сумарний обсяг у пам'яті
+        self._lock = threading.Lock()
+
+    # ================================
+    # 🔑 КЛЮЧІ
+    # ================================
+    def key_for(self, url: str, region: str) -> str:
+        """🔑 URL + регіон + версія + курси → ключ."""
+        currency = ""
+        if self._currency is not None:
+            try:
+                currency = self._currency()
+            except Exception:  # noqa: BLE001
+                logger.debug("⚠️ Не вдалося отримати відбиток курсів.", exc_info=True)
+        raw = "|".join((hint_key(url), (region or "").lower(), self._version, currency))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    # ================================
+    # 📖 ЧИТАННЯ / 💾 ЗАПИС
+    # ================================
+    async def get(self, url: str, region: str) -> Optional[CachedProduct]:
+        """📖 Свіжий запис із пам'яті або диска, інакше None."""
+        if self._ttl <= 0:
+            return None
+        key = self.key_for(url, region)
+        now = time.time()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and now - entry.stored_at > self._ttl:
+                self._forget(key)                                   # 🧹 Протухлий запис
+                entry = None
+            if entry is not None:
+                self._data.move_to_end(key, last=True)
+                return entry
+        entry = await self._disk_call(self._read_disk, key, now)
+        if entry is not None:
+            with self._lock:
+                self._remember(key, entry)                          # ♻️ Підіймаємо з диска в пам'ять
+        return entry
+
+    async def put(self, url: str, region: str, data: "ProcessedProductData") -> None:
+        """💾 Кладе повний результат у пам'ять і (опційно) на диск."""
+        if self._ttl <= 0:
+            return
+        now = time.time()
+        await self._store(self.key_for(url, region), CachedProduct(data=data, stored_at=now, availability_at=now))
+
+    async def refresh_availability(self, url: str, region: str, data: "ProcessedProductData") -> None:
+        """🔄 Оновлює дані після перерахунку наявності, зберігаючи вік контенту."""
+        key = self.key_for(url, region)
+        with self._lock:
+            current = self._data.get(key)
+        stored_at = current.stored_at if current is not None else time.time()
+        await self._store(key, CachedProduct(data=data, stored_at=stored_at, availability_at=time.time()))
+
+    def availability_stale(self, entry: CachedProduct) -> bool:
+        """⏳ True, якщо наявність у записі старша за `availability_ttl_sec`."""
+        return self._availability_ttl > 0 and time.time() - entry.availability_at > self._availability_ttl
+
+    # ================================
+    # 🧹 ІНВАЛІДАЦІЯ
+    # ================================
+    async def invalidate(self, url: str, region: str) -> None:
+        """🧹 Видаляє запис товару (пам'ять + диск)."""
+        key = self.key_for(url, region)
+        with self._lock:
+            self._forget(key)
+        await self._disk_call(self._delete_disk, key)
+
+    async def clear(self) -> None:
+        """🧹 Повністю очищає пам'ять і дисковий шар."""
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._bytes = 0
+        await self._disk_call(self._clear_disk)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def memory_bytes(self) -> int:
+        """📏 Приблизний обсяг записів у пам'яті."""
+        return self._bytes
+
+    # ================================
+    # 🧰 ВНУТРІШНЄ
+    # ================================
+    async def _store(self, key: str, entry: CachedProduct) -> None:
+        with self._lock:
+            self._remember(key, entry)
+        await self._disk_call(self._write_disk, key, entry)
+
+    async def _disk_call(self, func: Callable[..., _T], *args: object) -> Optional[_T]:
+        """🧵 Дисковий шар (pickle + файли) — у потоці; без `disk_dir` нічого не робимо."""
+        if self._disk_dir is None:
+            return None
+        return await asyncio.to_thread(func, *args)
+
+    def _remember(self, key: str, entry: CachedProduct) -> None:
+        self._forget(key)
+        size = approx_size(entry.data)
+        if size > self._max_bytes:                                  # 📏 Завеликий запис — лише диск (якщо є)
+            return
+        self._data[key] = entry
+        self._sizes[key] = size
+        self._bytes += size
+        while self._data and (len(self._data) > self._max or self._bytes > self._max_bytes):
+            evicted, _ = self._data.popitem(last=False)             # 🧹 LRU-витіснення
+            self._bytes -= self._sizes.pop(evicted, 0)
+
+    def _forget(self, key: str) -> None:
+        if self._data.pop(key, None) is not None:
+            self._bytes -= self._sizes.pop(key, 0)
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        return self._disk_dir / f"{key}.pkl" if self._disk_dir is not None else None
+
+    def _read_disk(self, key: str, now: float) -> Optional[CachedProduct]:
+        path = self._disk_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            fmt, entry = pickle.loads(path.read_bytes())
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Пошкоджений запис кешу %s: %s — видаляємо.", path, exc)
+            path.unlink(missing_ok=True)
+            return None
+        if fmt != _DISK_FORMAT or not isinstance(entry, CachedProduct) or now - entry.stored_at > self._ttl:
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def _delete_disk(self, key: str) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            logger.debug("⚠️ Не вдалося видалити %s", path, exc_info=True)
+
+    def _clear_disk(self) -> None:
+        if self._disk_dir is None or not self._disk_dir.is_dir():
+            return
+        for path in self._disk_dir.glob("*.pkl"):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                continue
+
+    def _write_disk(self, key: str, entry: CachedProduct) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".pkl.tmp")
+            tmp.write_bytes(pickle.dumps((_DISK_FORMAT, entry), protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp, path)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Не вдалося записати кеш %s: %s", path, exc)
+
+
+__all__ = ["CachedProduct", "ProcessedProductCache", "approx_size", "content_version", "rates_fingerprint"]
@@ -2,9 +2,12 @@
 """
 🧰 Підготовка стеку медіа для карток товару.
 
-🔹 Викачує всі URL зображень із ретраями через `ImageDownloader`.
-🔹 Перевіряє, що стек не порожній, і повертає готові `InputFile`.
-🔹 Будь-яка помилка (битий URL, таймаут, невалідний контент) → `ProductMediaPreparationError`.
+🔹 Викачує URL зображень паралельно (не більше `max_concurrency` одночасно) через спільний `ImageDownloader`.
+🔹 Порядок фото у стеку збігається з порядком URL, незалежно від того, яке завантажилось першим.
+🔹 Часткова успішність: биті фото відкидаються (з попередженням), помилка — лише коли не вдалось жодне.
+🔹 Час кожного фото і всього стеку йде у Prometheus (`MEDIA_IMAGE_FETCH_SECONDS`, `MEDIA_STACK_PREPARE_SECONDS`).
+🔹 Файли стеку — `PreparedImageFile`: пам'ятають джерельний URL і SHA256 для кешу Telegram `file_id`.
+🔹 Опційний `ImageNormalizer` зменшує й перекодовує фото перед upload (у пулі, з дисковим кешем).
 """
 
 from __future__ import annotations
@@ -13,15 +16,20 @@ from __future__ import annotations
 from telegram import InputFile
 
 # 🔠 Системні імпорти
+import asyncio
 import io
 import logging
 import os
-from dataclasses import dataclass
-from typing import Final, List, Sequence
+import time
+from dataclasses import dataclass, field
+from typing import Final, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 # 🧩 Внутрішні модулі проєкту
-from app.infrastructure.size_chart.image_downloader import ImageDownloader
+from app.infrastructure.services.image_normalizer import ImageNormalizer, NormalizedImage
+from app.infrastructure.size_chart.image_downloader import ImageData, ImageDownloader
+from app.shared.metrics.media import MEDIA_IMAGE_FETCH_SECONDS, MEDIA_STACK_PREPARE_SECONDS
+from app.shared.tracing import span
 from app.shared.utils.logger import LOG_NAME
 
 logger: Final = logging.getLogger(f"{LOG_NAME}.media_preparer")
@@ -31,11 +39,24 @@ class ProductMediaPreparationError(RuntimeError):
     """❌ Помилка підготовки стеку медіа."""
 
 
+class PreparedImageFile(InputFile):
+    """📎 `InputFile` із джерельним URL та SHA256 — ключами для кешу `file_id`."""
+
+    __slots__ = ("source_url", "sha256")
+
+    def __init__(self, content: bytes, *, filename: str, source_url: str, sha256: str | None) -> None:
+        super().__init__(io.BytesIO(content), filename=filename, attach=True)  # 📎 attach:// для media group
+        self.source_url = source_url
+        self.sha256 = sha256
+
+
 @dataclass(slots=True)
 class PreparedMediaStack:
     """📦 Результат підготовки стеку фото."""
 
     files: List[InputFile]
+    failed_urls: List[str] = field(default_factory=list)            # 🕳️ Фото, які не вдалося завантажити
+    bytes_saved: int = 0                                            # 🪄 Заощаджено нормалізацією
 
 
 class ProductMediaPreparer:
@@ -46,37 +67,87 @@ class ProductMediaPreparer:
         downloader: ImageDownloader,
         *,
         max_images: int = 10,
+        max_concurrency: int = 4,
+        normalizer: Optional[ImageNormalizer] = None,
     ) -> None:
         self._downloader = downloader
+        self._normalizer = normalizer
         self._max_images = max(1, int(max_images))
+        self._max_concurrency = max(1, int(max_concurrency))
 
     async def prepare_stack(self, urls: Sequence[str], *, title: str | None = None) -> PreparedMediaStack:
-        """Завантажує всі зображення та повертає список `InputFile`."""
+        """Паралельно завантажує зображення та повертає `InputFile` у вихідному порядку."""
         unique_urls = self._normalize_urls(urls)
         if not unique_urls:
             raise ProductMediaPreparationError("Список зображень порожній або невалідний.")
 
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        name = title or "N/A"
+
+        async def _fetch_one(
+            idx: int, img_url: str
+        ) -> Tuple[Optional[ImageData], Optional[NormalizedImage], Optional[BaseException]]:
+            async with semaphore:
+                fetch_started = time.perf_counter()
+                try:
+                    with span("media.download", idx=idx):
+                        image_data = await self._downloader.fetch(img_url)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:  # noqa: BLE001
+                    MEDIA_IMAGE_FETCH_SECONDS.labels(outcome="failed").observe(time.perf_counter() - fetch_started)
+                    logger.warning("🖼️ Не вдалося завантажити фото %s (%s): %s", idx, name, exc)
+                    return None, None, exc
+                MEDIA_IMAGE_FETCH_SECONDS.labels(outcome="ok").observe(time.perf_counter() - fetch_started)
+                if self._normalizer is None:
+                    return image_data, None, None
+                with span("media.normalize", idx=idx):
+                    return image_data, await self._normalizer.normalize(image_data), None
+
+        results = await asyncio.gather(*(
+            _fetch_one(idx, img_url) for idx, img_url in enumerate(unique_urls, start=1)
+        ))                                                          # 📋 gather зберігає порядок URL
+
         prepared_files: List[InputFile] = []
-        for idx, img_url in enumerate(unique_urls, start=1):
-            try:
-                image_data = await self._downloader.fetch(img_url)
-            except Exception as exc:  # noqa: BLE001
-                name = title or f"#{idx}"
-                logger.warning("🖼️ Не вдалося завантажити фото %s (%s): %s", idx, name, exc)
-                raise ProductMediaPreparationError(f"Не вдалося завантажити фото #{idx}: {exc}") from exc
-
-            buffer = io.BytesIO(image_data.content)
+        failed_urls: List[str] = []
+        first_error: Optional[BaseException] = None
+        bytes_saved = 0
+        for idx, (img_url, (image_data, normalized, error)) in enumerate(zip(unique_urls, results), start=1):
+            if image_data is None:
+                failed_urls.append(img_url)
+                first_error = first_error or error
+                continue
             filename = self._build_filename(img_url, idx, image_data.content_type)
+            content = image_data.content
+            if normalized is not None and normalized.changed and self._normalizer is not None:
+                content = normalized.content
+                bytes_saved += normalized.bytes_saved
+                filename = f"{os.path.splitext(filename)[0]}{self._normalizer.extension}"  # 📎 Розширення = новий формат
             prepared_files.append(
-                InputFile(
-                    buffer,
+                PreparedImageFile(
+                    content,
                     filename=filename,
-                    attach=True,  # 📎 Потрібно для media group (attach://)
+                    source_url=img_url,
+                    sha256=image_data.sha256,                       # 🔐 SHA256 оригіналу — ключ кешу file_id
                 )
             )
-
-        logger.debug("🖼️ Готово %d фото для: %s", len(prepared_files), (title or "N/A"))
-        return PreparedMediaStack(files=prepared_files)
+        MEDIA_STACK_PREPARE_SECONDS.observe(time.perf_counter() - started)
+
+        if not prepared_files:
+            raise ProductMediaPreparationError(
+                f"Не вдалося завантажити жодного з {len(unique_urls)} фото: {first_error}"
+            ) from first_error
+        if failed_urls:
+            logger.warning("🖼️ Частковий стек для %s: %d/%d фото", name, len(prepared_files), len(unique_urls))
+        logger.debug(
+            "🖼️ Готово %d фото для: %s (%.0fms, заощаджено %d байт)",
+            len(prepared_files),
+            name,
+            (time.perf_counter() - started) * 1000.0,
+            bytes_saved,
+        )
+        return PreparedMediaStack(files=prepared_files, failed_urls=failed_urls, bytes_saved=bytes_saved)
 
     def _normalize_urls(self, urls: Sequence[str]) -> List[str]:
         seen: set[str] = set()
@@ -112,6 +183,7 @@ class ProductMediaPreparer:
 
 
 __all__ = [
+    "PreparedImageFile",
     "PreparedMediaStack",
     "ProductMediaPreparer",
     "ProductMediaPreparationError",
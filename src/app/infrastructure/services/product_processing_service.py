@@ -3,9 +3,12 @@
 🧠 `ProductProcessingService` — оркестратор повного циклу обробки товару.
 
 🔹 Парсить карточку (`ParserFactory`) і витягує `ProductInfo`.  
-🔹 Запускає наявність та музичні рекомендації паралельно.  
-🔹 Генерує контент для бота (`ProductContentService`).  
+🔹 Після парсингу паралельно (граф `StageGraph`) запускає наявність, музику, контент і size chart.  
+🔹 Кожен етап має власний таймаут; збій обовʼязкового етапу скасовує решту.  
 🔹 (Опційно) інтегрує size-chart пайплайн для діагностик (IMP-059).  
+🔹 Тривалості етапів і критичний шлях потрапляють у `Diagnostics`.  
+🔹 Кожен виклик — трейс `product` (або спан у вже активному трейсі) зі спанами етапів.  
+🔹 (Опційно) повертає готовий результат із `ProcessedProductCache`, перераховуючи лише застарілу наявність.  
 🔹 Повертає `ProductProcessingResult` з єдиним DTO для UI-шару.
 """
 
@@ -14,13 +17,14 @@ from __future__ import annotations
 # 🔠 Системні імпорти
 import asyncio														# ⏳ Керуємо асинхронними викликами
 import logging														# 🧾 Логування подій сервісу
-from dataclasses import dataclass									# 🧱 DTO та результати
+from dataclasses import dataclass, field, replace					# 🧱 DTO та результати
 from enum import Enum, auto											# 🏷️ Коди помилок
-from typing import Any, Optional, TYPE_CHECKING					# 🧰 Типізація та TYPE_CHECKING
+from typing import Any, Dict, Mapping, Optional, Tuple, TYPE_CHECKING	# 🧰 Типізація та TYPE_CHECKING
 
 # 🧩 Внутрішні модулі проєкту
 from app.domain.ai import ProductPromptDTO							# 🧠 Промти для музики
 from app.domain.products.entities import ProductInfo				# 📦 Дані про товар
+from app.infrastructure.catalog.product_catalog_index import ProductCatalogIndex	# 📚 Локальний каталог
 from app.infrastructure.availability.availability_processing_service import (
     AvailabilityProcessingService,									# ✅ Звіт про наявність
 )
@@ -31,6 +35,18 @@ from app.infrastructure.content.product_content_service import (
 )
 from app.infrastructure.music.music_recommendation import MusicRecommendation	# 🎵 Добір музики
 from app.infrastructure.parsers.parser_factory import ParserFactory			# 🧩 Фабрика парсерів
+from app.infrastructure.services.processed_product_cache import (			# 🗃️ Кеш готових результатів
+    CachedProduct,
+    ProcessedProductCache,
+)
+from app.infrastructure.services.stage_graph import (							# 🕸️ DAG етапів обробки
+    STATUS_FAILED,
+    STATUS_TIMEOUT,
+    StageGraph,
+    StageListener,
+    StageOutcome,
+)
+from app.shared.tracing import get_tracer, traced								# 🧵 Трейс запиту
 from app.shared.utils.logger import LOG_NAME									# 🏷️ Базове ім'я логера
 from app.shared.utils.url_parser_service import UrlParserService				# 🌍 Метадані URL
 
@@ -45,6 +61,18 @@ else:																		# 🧮 У рантаймі модуль може бути
 
 logger = logging.getLogger(LOG_NAME)										# 🧾 Створюємо іменований логер
 
+DEFAULT_STAGE_TIMEOUTS_SEC: Dict[str, float] = {							# ⏱️ Таймаути етапів (0 — без ліміту)
+    "parse": 180.0,
+    "availability": 90.0,
+    "music": 60.0,
+    "content": 180.0,
+    "size_chart": 120.0,
+}
+
+
+class _EmptyProductError(ValueError):
+    """🕳️ Парсер відпрацював, але базових даних (title) немає."""
+
 
 # ================================
 # 🩺 DTO ДІАГНОСТИК (IMP-059)
@@ -66,6 +94,10 @@ class Diagnostics:
     size_chart_error: Optional[str] = None									# ⚠️ Деталі збою size chart
     ai_quota_problem: bool = False											# 🚦 Ознака проблем із квотою AI
     ai_error_raw: Optional[str] = None										# 🧾 Сирий текст помилки AI
+    stage_timings_ms: Mapping[str, float] = field(default_factory=dict)	# ⏱️ Тривалість кожного етапу графа
+    critical_path: Tuple[str, ...] = ()										# 🧭 Ланцюжок етапів, що визначив загальний час
+    critical_path_ms: float = 0.0											# ⏱️ Час критичного шляху
+    cache_hit: bool = False													# 🗃️ Результат узято з ProcessedProductCache
 
 
 # ================================
@@ -149,10 +181,9 @@ class ProductProcessingService:
     """
     🏛️ Оркеструє повний цикл обробки товару:
         1) парсинг картки,
-        2) отримання звіту про наявність,
-        3) генерація контенту,
-        4) підбір музики,
-        5) опційний size-chart OCR з діагностиками (IMP-059).
+        2) паралельно: звіт про наявність, генерація контенту, підбір музики,
+           опційний size-chart OCR з діагностиками (IMP-059),
+        3) збирання `ProcessedProductData` з тривалостями етапів і критичним шляхом.
     """
 
     def __init__(
@@ -164,6 +195,9 @@ class ProductProcessingService:
         url_parser_service: UrlParserService,
         *,
         size_chart_service: Optional["SizeChartService"] = None,
+        catalog_index: Optional[ProductCatalogIndex] = None,
+        stage_timeouts: Optional[Mapping[str, float]] = None,
+        result_cache: Optional[ProcessedProductCache] = None,
     ) -> None:
         self.parser_factory = parser_factory								# 🧩 Постачальник парсерів
         self.availability_processing_service = availability_processing_service	# ✅ Сервіс наявності
@@ -171,6 +205,14 @@ class ProductProcessingService:
         self.music_recommendation = music_recommendation					# 🎵 Музичні рекомендації
         self.url_parser_service = url_parser_service						# 🌍 Метадані URL
         self.size_chart_service = size_chart_service						# 📏 Опційний size-chart сервіс
+        self.catalog_index = catalog_index									# 📚 Інкрементальне наповнення каталогу
+        self.result_cache = result_cache									# 🗃️ Кеш готових результатів
+        self.stage_timeouts: Dict[str, float] = dict(DEFAULT_STAGE_TIMEOUTS_SEC)	# ⏱️ Пер-етапні таймаути
+        for name, value in (stage_timeouts or {}).items():
+            try:
+                self.stage_timeouts[str(name)] = max(0.0, float(value))
+            except (TypeError, ValueError):
+                logger.warning("⚠️ Некоректний таймаут етапу %s=%r — ігноруємо.", name, value)
         logger.debug(
             "🧠 ProductProcessingService ready (size_chart_enabled=%s)",
             self.size_chart_service is not None,
@@ -199,8 +241,23 @@ class ProductProcessingService:
     # ================================
     # 🔗 ПУБЛІЧНЕ API
     # ================================
-    async def process_url(self, url: str) -> ProductProcessingResult:
-        """🔗 Головний сценарій: URL → ProductProcessingResult."""
+    async def process_url(
+        self,
+        url: str,
+        *,
+        on_stage: Optional[StageListener] = None,
+    ) -> ProductProcessingResult:
+        """🔗 Головний сценарій: URL → ProductProcessingResult.
+
+        `on_stage` (опційно) отримує `StageOutcome` кожного етапу одразу після його завершення —
+        так UI може надсилати блоки картки, не чекаючи найповільнішого етапу.
+        """
+
+        with get_tracer().trace("product", url=url):						# 🧵 Корінь або вкладений спан
+            return await self._process_url(url, on_stage=on_stage)
+
+    async def _process_url(self, url: str, *, on_stage: Optional[StageListener]) -> ProductProcessingResult:
+        """🔗 Тіло `process_url` (вже всередині трейсу)."""
 
         logger.info("⚙️ Старт обробки URL: %s", url)						# 🧾 Фіксуємо старт пайплайна
 
@@ -215,30 +272,7 @@ class ProductProcessingService:
 
         product_sku = self._extract_sku_from_url(url)					# 🔖 Прагнемо витягнути артикул з URL
 
-        # 1) Парсимо картку
-        try:
-            parser = self.parser_factory.create_product_parser(url)			# 🧩 Підбираємо парсер
-            logger.debug("🧩 Використано парсер %s для %s.", parser.__class__.__name__, url)
-            product_info = await parser.get_product_info()					# 🧾 Тягнемо дані товару
-            logger.info("📦 Отримано дані товару: title='%s'", (product_info.title or "").strip()[:80])
-        except asyncio.CancelledError:										# 🛑 Скасування корутини
-            logger.info("🛑 Відміна process_url для %s", url)
-            raise
-        except Exception as exc:												# 🔥 Інші помилки парсингу
-            logger.exception("🔥 Непередбачена помилка парсингу: %s", url)
-            return ProductProcessingResult.fail(
-                ProcessingErrorCode.ParsingFailed,
-                "Не вдалося обробити сторінку товару.",
-                cause=exc,
-            )
-        if not isinstance(product_info, ProductInfo) or not (product_info.title or "").strip():
-            logger.error("❌ Не вдалося отримати базову інформацію про товар: %s", url)
-            return ProductProcessingResult.fail(
-                ProcessingErrorCode.ParsingFailed,
-                "Не вдалося отримати дані про товар.",
-            )
-
-        # 2) Регіон/slug (UI-метадані)
+        # 1) Граф етапів: parse → {availability, music, content, size_chart} → assemble
         try:
             region_display = self.url_parser_service.get_region_label(url)	# 🌍 Людяний регіон для UI
         except Exception:													# 🛟 Fallback, якщо сервіс недоступний
@@ -247,86 +281,87 @@ class ProductProcessingService:
         else:
             logger.debug("🌍 Region/локаль: %s", region_display)
 
-        # 3) Паралельно: availability + music
-        availability_task = asyncio.create_task(self.availability_processing_service.process(url))  # 🔄 Розрахунок наявності
-
-        product_dto = ProductPromptDTO(										# 🧠 DTO для музичної рекомендації
-            title=product_info.title or "",
-            description=product_info.description or "",
-            image_url=product_info.image_url or "",
-        )
-        music_task = asyncio.create_task(self.music_recommendation.recommend(product_dto))  # 🎵 Асинхронна музика
-
-        availability_data: Any = None
-        try:
-            availability_data = await availability_task
-        except asyncio.CancelledError:
-            music_task.cancel()
-            raise
-        except Exception as exc:
-            logger.warning("⚠️ Не вдалося отримати дані про наявність: %s", exc, exc_info=True)
+        if self.result_cache is not None:
+            cached = await self.result_cache.get(url, region_display)
+            if cached is not None:
+                return await self._serve_cached(url, region_display, cached)
 
-        music_result: Any = None
-        music_error: Optional[str] = None
+        graph = self._build_stage_graph(url, product_sku)
         try:
-            music_result = await music_task
-        except asyncio.CancelledError:
+            run = await graph.run(on_complete=on_stage)
+        except asyncio.CancelledError:										# 🛑 Скасування корутини
+            logger.info("🛑 Відміна process_url для %s", url)
             raise
-        except Exception as exc:
-            logger.warning("⚠️ Музичні рекомендації впали: %s", exc, exc_info=True)
-            music_error = str(exc)
-
-        # 4) Текст кольори/розміри (із availability)
-        colors_text = (														# 🎨 Формуємо текст про наявність
-            getattr(getattr(availability_data, "reports", None), "public_report", None)
-            or "Не вдалося отримати дані про наявність."
+        logger.info(
+            "🕸️ Етапи %s: total=%.0fms critical=%s",
+            url,
+            run.total_ms,
+            " → ".join(run.critical_path),
         )
 
-        # 5) Контент для картки
-        try:
-            content_data, content_diag = await self.content_service.build_product_content(	# 📝 Генеруємо опис/хештеги
-                product_info,
-                url=url,
-                colors_text=colors_text,
+        parse_outcome = run.outcomes["parse"]
+        if isinstance(parse_outcome.error, _EmptyProductError):
+            logger.error("❌ Не вдалося отримати базову інформацію про товар: %s", url)
+            return ProductProcessingResult.fail(
+                ProcessingErrorCode.ParsingFailed,
+                "Не вдалося отримати дані про товар.",
             )
-        except asyncio.CancelledError:
-            raise
-        except Exception as exc:												# 🔥 Контент не зібрано
-            logger.exception("❌ Не вдалося зібрати контент для товару: %s", exc)
+        if not parse_outcome.ok:											# 🔥 Помилки парсингу
+            logger.error("🔥 Непередбачена помилка парсингу (%s): %s", parse_outcome.status, url, exc_info=parse_outcome.error)
+            return ProductProcessingResult.fail(
+                ProcessingErrorCode.ParsingFailed,
+                "Не вдалося обробити сторінку товару.",
+                cause=parse_outcome.error,
+            )
+        parser, _ = parse_outcome.value
+
+        # 2) Контент (обовʼязковий етап)
+        content_outcome = run.outcomes["content"]
+        if not content_outcome.ok:											# 🔥 Контент не зібрано
+            logger.error("❌ Не вдалося зібрати контент для товару (%s): %s", content_outcome.status, content_outcome.error)
             return ProductProcessingResult.fail(
                 ProcessingErrorCode.ContentBuildFailed,
                 "Не вдалося згенерувати контент для товару.",
-                cause=exc,
+                cause=content_outcome.error,
             )
+        content_data, content_diag = content_outcome.value
+
+        # 3) Наявність → текст кольори/розміри (потрібен лише при збиранні DTO)
+        availability_outcome = run.outcomes["availability"]
+        if not availability_outcome.ok:
+            logger.warning("⚠️ Не вдалося отримати дані про наявність (%s): %s", availability_outcome.status, availability_outcome.error)
+        colors_text = self.colors_text_from(run.value("availability"))		# 🎨 Формуємо текст про наявність
+        content_data = replace(content_data, colors_text=colors_text)		# 🧩 Підставляємо у готовий контент
         logger.info(
             "📝 Контент зібрано: images=%d hashtags=%d",
             len(content_data.images or []),
             len(getattr(content_data, "hashtags", []) or []),
         )
 
-        # 6) 🆕 Size-chart OCR (best-effort) → diagnostics.has_size_chart/ocr_status
+        # 4) Музика
+        music_outcome = run.outcomes["music"]
+        music_result: Any = run.value("music")
+        music_error: Optional[str] = None
+        if not music_outcome.ok:
+            logger.warning("⚠️ Музичні рекомендації впали (%s): %s", music_outcome.status, music_outcome.error)
+            music_error = self._describe_stage_error(music_outcome)
+
+        # 5) Size-chart OCR (best-effort) → diagnostics.has_size_chart/ocr_status
         sc_has_chart = False												# 📏 Чи з'явився size chart
         sc_status = "not_run"												# 🧬 Початковий статус OCR
         size_chart_error: Optional[str] = None
         page_source = getattr(parser, "page_source", "") or ""				# 🧾 HTML для diagnostics
-
-        if self.size_chart_service is not None and page_source:		# ✅ Сервіс доступний і маємо HTML
-            try:
-                chart_artifacts = await self.size_chart_service.process_all_size_charts(
-                     page_source,
-                     product_sku=product_sku,
-                )  # 📏 Запускаємо пайплайн з урахуванням SKU
-                chart_paths = chart_artifacts.ordered_paths()
-                sc_has_chart = bool(chart_paths)							# 📌 Виставляємо прапорець
-                sc_status = "ok" if sc_has_chart else "not_found"			# 🧾 Статус OCR
-                logger.debug("📏 SizeChart результат: %s (%s)", sc_status, chart_artifacts.as_dict())
-            except asyncio.CancelledError:
-                raise
-            except Exception as exc:											# 🔥 Size-chart деградував — лог і рухаємось
-                logger.warning("⚠️ SizeChart пайплайн впав: %s", exc, exc_info=True)
-                sc_has_chart = False
-                sc_status = "failed"
-                size_chart_error = str(exc)
+        size_chart_outcome = run.outcomes.get("size_chart")
+        if size_chart_outcome is not None and size_chart_outcome.ok and size_chart_outcome.value is not None:
+            chart_artifacts = size_chart_outcome.value
+            chart_paths = chart_artifacts.ordered_paths()
+            sc_has_chart = bool(chart_paths)								# 📌 Виставляємо прапорець
+            sc_status = "ok" if sc_has_chart else "not_found"				# 🧾 Статус OCR
+            logger.debug("📏 SizeChart результат: %s (%s)", sc_status, chart_artifacts.as_dict())
+        elif size_chart_outcome is not None and size_chart_outcome.status in (STATUS_FAILED, STATUS_TIMEOUT):
+            logger.warning("⚠️ SizeChart пайплайн впав (%s): %s", size_chart_outcome.status, size_chart_outcome.error)
+            sc_status = "failed"
+            size_chart_error = self._describe_stage_error(size_chart_outcome)
 
         if not sc_has_chart and size_chart_error is None:
             if sc_status == "not_found":
@@ -334,11 +369,11 @@ class ProductProcessingService:
             elif sc_status == "failed":
                 size_chart_error = "Алгоритм розпізнавання розмірів завершився помилкою."
 
-        # 7) 🆕 Підрахунок зображень у фінальному контенті
+        # 6) Підрахунок зображень у фінальному контенті
         images_count = len(content_data.images or [])						# 🖼️ Кількість картинок
         logger.debug("🖼️ У фінальному контенті %d зображень.", images_count)
 
-        # 8) Збір результату
+        # 7) Збір результату (assemble)
         ai_quota_problem = content_diag.ai_quota_problem
         ai_error_raw = content_diag.ai_error_raw
         if not ai_quota_problem and self._looks_like_ai_quota_error(music_error):
@@ -366,13 +401,120 @@ class ProductProcessingService:
                 size_chart_error=size_chart_error,
                 ai_quota_problem=ai_quota_problem,
                 ai_error_raw=ai_error_raw,
+                stage_timings_ms=run.timings_ms(),
+                critical_path=run.critical_path,
+                critical_path_ms=run.critical_path_ms,
             ),
         )
+        if self.result_cache is not None and availability_outcome.ok:		# 🗃️ Кешуємо лише з реальною наявністю
+            await self.result_cache.put(url, region_display, result_data)
         return ProductProcessingResult.success(
             result_data,
             alt_fallback_used=result_data.alt_fallback_used,
         )																		# ✅ Повертаємо успіх
 
+    async def _serve_cached(self, url: str, region_display: str, cached: CachedProduct) -> ProductProcessingResult:
+        """🗃️ Віддає кешований результат; застарілу наявність перераховує (і оновлює запис)."""
+
+        data = cached.data
+        if self.result_cache is not None and self.result_cache.availability_stale(cached):
+            timeout = self.stage_timeouts.get("availability") or None
+            try:
+                availability_data = await traced(
+                    "availability",
+                    asyncio.wait_for(self.availability_processing_service.process(url), timeout),
+                    cached=True,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:										# 🛟 Лишаємо попередній блок наявності
+                logger.warning("⚠️ Не вдалося оновити наявність для кешованого %s: %s", url, exc)
+            else:
+                if availability_data is not None:
+                    colors_text = self.colors_text_from(availability_data)
+                    if colors_text != data.content.colors_text:
+                        logger.info("🔄 Наявність змінилась — оновлюємо кешований результат: %s", url)
+                    data = replace(data, content=replace(data.content, colors_text=colors_text))
+                    await self.result_cache.refresh_availability(url, region_display, data)
+        logger.info("🗃️ ProcessedProductCache hit: %s", url)
+        data = replace(data, diagnostics=replace(data.diagnostics, cache_hit=True))
+        return ProductProcessingResult.success(data, alt_fallback_used=data.alt_fallback_used)
+
+    @staticmethod
+    def colors_text_from(availability_data: Any) -> str:
+        """🎨 Текст блоку кольорів/розмірів із результату етапу `availability` (або фолбек)."""
+        return (
+            getattr(getattr(availability_data, "reports", None), "public_report", None)
+            or "Не вдалося отримати дані про наявність."
+        )
+
+    # ================================
+    # 🕸️ ГРАФ ЕТАПІВ
+    # ================================
+    def _build_stage_graph(self, url: str, product_sku: Optional[str]) -> StageGraph:
+        """🕸️ parse → {availability, music, content, size_chart}; assemble робить `process_url`."""
+
+        timeouts = self.stage_timeouts
+        graph = StageGraph()
+
+        async def _parse(_deps: Mapping[str, Any]) -> Tuple[Any, ProductInfo]:
+            parser = self.parser_factory.create_product_parser(url)			# 🧩 Підбираємо парсер
+            logger.debug("🧩 Використано парсер %s для %s.", parser.__class__.__name__, url)
+            product_info = await parser.get_product_info()					# 🧾 Тягнемо дані товару
+            if not isinstance(product_info, ProductInfo) or not (product_info.title or "").strip():
+                raise _EmptyProductError(url)								# ⏭️ Залежні етапи не стартують
+            logger.info("📦 Отримано дані товару: title='%s'", (product_info.title or "").strip()[:80])
+            if self.catalog_index is not None:
+                try:
+                    self.catalog_index.upsert_product(url, product_info, sku=product_sku)	# 📚 Дописуємо в каталог
+                except Exception:											# 🛟 Каталог не повинен ламати картку
+                    logger.debug("⚠️ Не вдалося оновити каталог для %s", url, exc_info=True)
+            return parser, product_info
+
+        async def _availability(_deps: Mapping[str, Any]) -> Any:
+            return await self.availability_processing_service.process(url)	# 🔄 Розрахунок наявності
+
+        async def _music(deps: Mapping[str, Any]) -> Any:
+            _, product_info = deps["parse"]
+            product_dto = ProductPromptDTO(									# 🧠 DTO для музичної рекомендації
+                title=product_info.title or "",
+                description=product_info.description or "",
+                image_url=product_info.image_url or "",
+            )
+            return await self.music_recommendation.recommend(product_dto)	# 🎵 Асинхронна музика
+
+        async def _content(deps: Mapping[str, Any]) -> Tuple[ProductContentDTO, ContentBuildDiagnostics]:
+            _, product_info = deps["parse"]
+            return await self.content_service.build_product_content(		# 📝 colors_text підставимо при assemble
+                product_info,
+                url=url,
+                colors_text="",
+            )
+
+        async def _size_chart(deps: Mapping[str, Any]) -> Any:
+            parser, _ = deps["parse"]
+            page_source = getattr(parser, "page_source", "") or ""
+            if not page_source:
+                return None													# 🕳️ Без HTML OCR не запускаємо
+            return await self.size_chart_service.process_all_size_charts(	# type: ignore[union-attr]
+                page_source,
+                product_sku=product_sku,
+            )
+
+        graph.add("parse", _parse, timeout_sec=timeouts.get("parse"), required=True)
+        graph.add("availability", _availability, deps=("parse",), timeout_sec=timeouts.get("availability"))
+        graph.add("music", _music, deps=("parse",), timeout_sec=timeouts.get("music"))
+        graph.add("content", _content, deps=("parse",), timeout_sec=timeouts.get("content"), required=True)
+        if self.size_chart_service is not None:
+            graph.add("size_chart", _size_chart, deps=("parse",), timeout_sec=timeouts.get("size_chart"))
+        return graph
+
+    @staticmethod
+    def _describe_stage_error(outcome: StageOutcome) -> str:
+        if outcome.status == STATUS_TIMEOUT:
+            return f"Етап '{outcome.name}' перевищив таймаут."
+        return str(outcome.error) if outcome.error is not None else outcome.status
+
     @staticmethod
     def _looks_like_ai_quota_error(message: Optional[str]) -> bool:
         if not message:
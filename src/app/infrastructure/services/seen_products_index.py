@@ -0,0 +1,162 @@
+# 🗂️ app/infrastructure/services/seen_products_index.py
+"""
+🗂️ SeenProductsIndex — персистентний індекс уже оброблених товарів по кожній колекції.
+
+🔹 Для кожної колекції зберігає handle → fingerprint (ціна + наявність варіантів + набір фото).
+🔹 Дозволяє режим «лише змінені»: нові або змінені товари обробляються, решта пропускається.
+🔹 Файли JSON по одному на колекцію, запис атомарний (tmp + os.replace).
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import hashlib                                                      # 🔐 Ключі файлів та fingerprint
+import json                                                         # 🧾 Серіалізація індексу
+import logging                                                      # 🧾 Логування
+import os                                                           # 🔁 Атомарна заміна файлу
+import threading                                                    # 🔒 Захист запису
+import time                                                         # ⏱️ Мітки часу
+from decimal import Decimal, InvalidOperation                       # 💰 Нормалізація ціни
+from pathlib import Path                                            # 📁 Шляхи
+from typing import Dict, Mapping, Optional                          # 🧰 Типи
+from urllib.parse import urlsplit                                   # 🔗 Handle з URL
+
+# 🧩 Внутрішні модулі проєкту
+from app.shared.cache.product_hints_cache import ProductHint        # 🧷 Підказка з products.json
+from app.shared.utils.logger import LOG_NAME                        # 🏷️ Базовий логер
+
+logger = logging.getLogger(f"{LOG_NAME}.seen_products")
+
+_INDEX_VERSION = 1                                                  # 🔢 Версія формату файлу
+
+
+# ================================
+# 🔧 УТИЛІТИ
+# ================================
+def product_handle(url: str) -> str:
+    """🏷️ Повертає handle товару (`/products/<handle>`) або нормалізований шлях."""
+    path = urlsplit((url or "").strip()).path.rstrip("/")
+    marker = "/products/"
+    idx = path.find(marker)
+    if idx != -1:
+        return path[idx + len(marker):].split("/", 1)[0].lower()
+    return path.lower()
+
+
+def collection_key(url: str) -> str:
+    """🔑 Ключ колекції: host + шлях без query/fragment та трейлінг-слешу."""
+    parts = urlsplit((url or "").strip())
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/').lower()}"
+
+
+def _normalize_price(raw: Optional[str]) -> str:
+    if raw is None:
+        return ""
+    try:
+        return str(Decimal(str(raw).strip()).normalize())
+    except (InvalidOperation, ValueError):
+        return str(raw).strip()
+
+
+def _image_identity(url: str) -> str:
+    """🖼️ Ідентичність фото без query (`?v=…`) та протоколу."""
+    parts = urlsplit(url.strip())
+    return f"{parts.netloc.lower()}{parts.path}"
+
+
+def product_fingerprint(hint: ProductHint) -> str:
+    """🧬 Fingerprint товару: ціна + наявність варіантів + набір зображень."""
+    stock = sorted(
+        (color, size, bool(available))
+        for color, sizes in (hint.stock or {}).items()
+        for size, available in sizes.items()
+    )
+    payload = {
+        "price": _normalize_price(hint.price),
+        "stock": stock,
+        "images": sorted({_image_identity(url) for url in hint.images if url}),
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+# ================================
+# 🗂️ ІНДЕКС
+# ================================
+class SeenProductsIndex:
+    """🗂️ Файлове сховище handle → fingerprint для кожної колекції."""
+
+    def __init__(self, base_dir: str | Path) -> None:
+        self._base_dir = Path(base_dir)
+        self._lock = threading.Lock()
+        self._memory: Dict[str, Dict[str, str]] = {}                # 🧠 Кеш прочитаних колекцій
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+        return self._base_dir / f"{digest}.json"
+
+    def fingerprints(self, collection_url: str) -> Dict[str, str]:
+        """📖 Повертає копію мапи handle → fingerprint для колекції."""
+        key = collection_key(collection_url)
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is None:
+                cached = self._read(key)
+                self._memory[key] = cached
+            return dict(cached)
+
+    def is_unchanged(self, collection_url: str, product_url: str, fingerprint: Optional[str]) -> bool:
+        """🔍 True, якщо товар уже бачили з тим самим (непорожнім) fingerprint."""
+        if not fingerprint:
+            return False
+        return self.fingerprints(collection_url).get(product_handle(product_url)) == fingerprint
+
+    def record(self, collection_url: str, items: Mapping[str, Optional[str]]) -> None:
+        """💾 Зливає product_url → fingerprint у індекс колекції та зберігає на диск."""
+        if not items:
+            return
+        key = collection_key(collection_url)
+        with self._lock:
+            current = self._memory.get(key)
+            if current is None:
+                current = self._read(key)
+            for url, fingerprint in items.items():
+                handle = product_handle(url)
+                if handle:
+                    current[handle] = fingerprint or ""
+            self._memory[key] = current
+            self._write(key, collection_url, current)
+
+    # ================================
+    # 💾 ДИСК
+    # ================================
+    def _read(self, key: str) -> Dict[str, str]:
+        path = self._path_for(key)
+        if not path.exists():
+            return {}
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            items = payload.get("items") or {}
+            return {str(handle): str(fingerprint or "") for handle, fingerprint in items.items()}
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Пошкоджений індекс %s: %s — починаємо з нуля.", path, exc)
+            return {}
+
+    def _write(self, key: str, collection_url: str, items: Dict[str, str]) -> None:
+        path = self._path_for(key)
+        payload = {
+            "version": _INDEX_VERSION,
+            "collection": collection_url,
+            "updated_at": time.time(),
+            "items": items,                                         # 🏷️ handle → fingerprint
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, path)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Не вдалося записати індекс %s: %s", path, exc)
+
+
+__all__ = ["SeenProductsIndex", "collection_key", "product_fingerprint", "product_handle"]
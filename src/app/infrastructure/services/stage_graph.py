@@ -0,0 +1,239 @@
+# 🕸️ app/infrastructure/services/stage_graph.py
+"""
+🕸️ StageGraph — маленький DAG асинхронних етапів для оркестраторів.
+
+🔹 Кожен етап стартує одразу після завершення своїх залежностей; незалежні етапи йдуть паралельно.
+🔹 Пер-етапний таймаут (`asyncio.wait_for`) і статуси `ok | failed | timeout | skipped | cancelled`.
+🔹 Збій обовʼязкового (`required`) етапу скасовує решту графа.
+🔹 Після прогону рахує тривалості та критичний шлях (ланцюжок, що визначив загальний час).
+🔹 `on_complete` отримує кожен `StageOutcome` одразу після завершення етапу (прогресивна доставка).
+🔹 Кожен етап — спан в активному трейсі (`app.shared.tracing`).
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import asyncio                                                      # 🔄 Задачі та таймаути
+import logging                                                      # 🧾 Логування
+import time                                                         # ⏱️ Монотонний годинник
+from dataclasses import dataclass                                   # 🧱 DTO етапів
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple  # 🧰 Типи
+
+# 🧩 Внутрішні модулі проєкту
+from app.shared.tracing import span                                 # 🧵 Спан на етап
+from app.shared.utils.logger import LOG_NAME                        # 🏷️ Базовий логер
+
+logger = logging.getLogger(f"{LOG_NAME}.stage_graph")
+
+StageFn = Callable[[Mapping[str, Any]], Awaitable[Any]]             # 🧩 async fn(значення залежностей) → результат
+StageListener = Callable[["StageOutcome"], None]                    # 📣 Синхронний слухач завершення етапу
+
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+STATUS_TIMEOUT = "timeout"
+STATUS_SKIPPED = "skipped"                                          # ⏭️ Залежність не вдалася
+STATUS_CANCELLED = "cancelled"                                      # 🛑 Скасовано через збій required-етапу
+
+
+# ================================
+# 🧱 DTO
+# ================================
+@dataclass(frozen=True, slots=True)
+class _Stage:
+    name: str
+    fn: StageFn
+    deps: Tuple[str, ...]
+    timeout_sec: Optional[float]
+    required: bool
+
+
+@dataclass(frozen=True, slots=True)
+class StageOutcome:
+    """📋 Результат одного етапу з відмітками часу відносно старту графа."""
+
+    name: str
+    status: str
+    value: Any = None
+    error: Optional[BaseException] = None
+    started_ms: float = 0.0
+    finished_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_OK
+
+    @property
+    def duration_ms(self) -> float:
+        return max(0.0, self.finished_ms - self.started_ms)
+
+
+@dataclass(frozen=True, slots=True)
+class StageGraphResult:
+    """📦 Підсумок прогону графа."""
+
+    outcomes: Mapping[str, StageOutcome]
+    critical_path: Tuple[str, ...]
+    total_ms: float
+
+    def value(self, name: str, default: Any = None) -> Any:
+        outcome = self.outcomes.get(name)
+        return outcome.value if outcome is not None and outcome.ok else default
+
+    def timings_ms(self) -> Dict[str, float]:
+        """⏱️ name → тривалість (мс) для етапів, які реально виконувались."""
+        return {
+            name: round(outcome.duration_ms, 1)
+            for name, outcome in self.outcomes.items()
+            if outcome.status not in (STATUS_SKIPPED, STATUS_CANCELLED)
+        }
+
+    @property
+    def critical_path_ms(self) -> float:
+        if not self.critical_path:
+            return 0.0
+        return round(self.outcomes[self.critical_path[-1]].finished_ms, 1)
+
+
+# ================================
+# 🕸️ ГРАФ
+# ================================
+class StageGraph:
+    """🕸️ Одноразовий граф етапів: `add(...)` у топологічному порядку, потім `await run()`."""
+
+    def __init__(self, *, default_timeout_sec: Optional[float] = None) -> None:
+        self._stages: Dict[str, _Stage] = {}
+        self._default_timeout = default_timeout_sec
+
+    def add(
+        self,
+        name: str,
+        fn: StageFn,
+        *,
+        deps: Tuple[str, ...] = (),
+        timeout_sec: Optional[float] = None,
+        required: bool = False,
+    ) -> "StageGraph":
+        """➕ Додає етап. Залежності мають бути додані раніше — так граф гарантовано ациклічний."""
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' already registered.")
+        missing = [dep for dep in deps if dep not in self._stages]
+        if missing:
+            raise ValueError(f"Stage '{name}' depends on unknown stages: {missing}")
+        timeout = timeout_sec if timeout_sec is not None else self._default_timeout
+        self._stages[name] = _Stage(
+            name=name,
+            fn=fn,
+            deps=tuple(deps),
+            timeout_sec=float(timeout) if timeout and timeout > 0 else None,
+            required=required,
+        )
+        return self
+
+    async def run(self, *, on_complete: Optional[StageListener] = None) -> StageGraphResult:
+        """🚀 Виконує граф і повертає outcomes + критичний шлях. CancelledError пробрасується."""
+        origin = time.perf_counter()
+        now_ms = lambda: (time.perf_counter() - origin) * 1000.0   # noqa: E731
+        tasks: Dict[str, "asyncio.Task[StageOutcome]"] = {}
+
+        async def _run_stage(stage: _Stage) -> StageOutcome:
+            outcome = await _execute(stage)
+            if on_complete is not None:
+                try:
+                    on_complete(outcome)
+                except Exception:  # noqa: BLE001 — слухач не повинен ламати граф
+                    logger.debug("⚠️ Слухач етапу '%s' впав.", stage.name, exc_info=True)
+            return outcome
+
+        async def _execute(stage: _Stage) -> StageOutcome:
+            dep_outcomes = [await tasks[dep] for dep in stage.deps]
+            failed = [dep.name for dep in dep_outcomes if not dep.ok]
+            if failed:
+                at = now_ms()
+                return StageOutcome(stage.name, STATUS_SKIPPED, started_ms=at, finished_ms=at)
+            values = {dep.name: dep.value for dep in dep_outcomes}
+            started = now_ms()
+            try:
+                with span(stage.name):
+                    if stage.timeout_sec is not None:
+                        value = await asyncio.wait_for(stage.fn(values), timeout=stage.timeout_sec)
+                    else:
+                        value = await stage.fn(values)
+            except asyncio.TimeoutError as exc:
+                logger.warning("⏱️ Етап '%s' перевищив таймаут %.1fs.", stage.name, stage.timeout_sec or 0.0)
+                return StageOutcome(stage.name, STATUS_TIMEOUT, error=exc, started_ms=started, finished_ms=now_ms())
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("⚠️ Етап '%s' впав: %s", stage.name, exc, exc_info=True)
+                return StageOutcome(stage.name, STATUS_FAILED, error=exc, started_ms=started, finished_ms=now_ms())
+            return StageOutcome(stage.name, STATUS_OK, value=value, started_ms=started, finished_ms=now_ms())
+
+        for stage in self._stages.values():
+            tasks[stage.name] = asyncio.create_task(_run_stage(stage), name=f"stage:{stage.name}")
+
+        outcomes: Dict[str, StageOutcome] = {}
+        pending = set(tasks.values())
+        by_task = {task: name for name, task in tasks.items()}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = by_task[task]
+                    outcomes[name] = task.result() if not task.cancelled() else StageOutcome(name, STATUS_CANCELLED)
+                aborted = [
+                    name for name, outcome in outcomes.items()
+                    if self._stages[name].required and outcome.status in (STATUS_FAILED, STATUS_TIMEOUT)
+                ]
+                if aborted and pending:
+                    logger.info("🛑 Обовʼязковий етап '%s' не вдався — скасовуємо решту графа.", aborted[0])
+                    await self._cancel(pending)
+                    at = now_ms()
+                    for task in pending:
+                        name = by_task[task]
+                        outcomes[name] = StageOutcome(name, STATUS_CANCELLED, started_ms=at, finished_ms=at)
+                    pending = set()
+        except asyncio.CancelledError:
+            await self._cancel(set(tasks.values()))
+            raise
+
+        ordered = {name: outcomes[name] for name in self._stages}
+        return StageGraphResult(
+            outcomes=ordered,
+            critical_path=self._critical_path(ordered),
+            total_ms=round(now_ms(), 1),
+        )
+
+    # ================================
+    # 🧰 ВНУТРІШНЄ
+    # ================================
+    @staticmethod
+    async def _cancel(tasks: "set[asyncio.Task[StageOutcome]]") -> None:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _critical_path(self, outcomes: Mapping[str, StageOutcome]) -> Tuple[str, ...]:
+        """🧭 Від етапу, що завершився останнім, назад через залежність, що завершилась найпізніше."""
+        executed = [o for o in outcomes.values() if o.status not in (STATUS_SKIPPED, STATUS_CANCELLED)]
+        if not executed:
+            return ()
+        current: Optional[StageOutcome] = max(executed, key=lambda o: o.finished_ms)
+        path: List[str] = []
+        while current is not None:
+            path.append(current.name)
+            deps = [outcomes[dep] for dep in self._stages[current.name].deps]
+            current = max(deps, key=lambda o: o.finished_ms) if deps else None
+        return tuple(reversed(path))
+
+
+__all__ = [
+    "STATUS_CANCELLED",
+    "STATUS_FAILED",
+    "STATUS_OK",
+    "STATUS_SKIPPED",
+    "STATUS_TIMEOUT",
+    "StageGraph",
+    "StageGraphResult",
+    "StageListener",
+    "StageOutcome",
+]
@@ -0,0 +1,197 @@
+# 📎 app/infrastructure/services/telegram_file_id_cache.py
+"""
+📎 TelegramFileIdCache — персистентна мапа «зображення → Telegram `file_id`».
+
+🔹 Ключі: `url:<host/path[?v=…]>` (канонічний URL без протоколу; з query лишається тільки версія `v`)
+   та `sha256:<hex>` (вміст). Замінене на CDN фото з новим `?v=` — новий ключ, а не старий `file_id`.
+🔹 Значення: `file_id` найбільшого `PhotoSize`, який Telegram повернув після надсилання.
+🔹 Повторне фото надсилається за id — без завантаження байтів і без повторного fetch URL Telegram-ом.
+🔹 Один JSON-файл, LRU-межа `max_entries`, запис атомарний (tmp + os.replace).
+🔹 Під event loop запис відкладений (debounce `flush_sec`) і йде в потоці; `flush()` — примусово при зупинці.
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import asyncio                                                      # 🔄 Відкладений запис
+import json                                                         # 🧾 Серіалізація мапи
+import logging                                                      # 🧾 Логування
+import os                                                           # 🔁 Атомарна заміна файлу
+import threading                                                    # 🔒 Захист запису
+import time                                                         # ⏱️ Мітки часу
+from collections import OrderedDict                                 # 🧮 LRU-порядок
+from pathlib import Path                                            # 📁 Шляхи
+from typing import Iterable, Optional, Tuple                        # 🧰 Типи
+from urllib.parse import parse_qsl, urlencode, urlsplit             # 🔗 Канонічний URL
+
+# 🧩 Внутрішні модулі проєкту
+from app.shared.metrics.media import MEDIA_FILE_ID_CACHE_TOTAL      # 📈 hit / miss / stored / invalidated
+from app.shared.utils.logger import LOG_NAME                        # 🏷️ Базовий логер
+
+logger = logging.getLogger(f"{LOG_NAME}.file_id_cache")
+
+_CACHE_VERSION = 1                                                  # 🔢 Версія формату файлу
+DEFAULT_FILE_ID_CACHE_PATH = "./var/telegram/file_ids.json"         # 📁 Шлях за замовчуванням
+
+
+# ================================
+# 🔧 УТИЛІТИ
+# ================================
+def canonical_image_url(url: str) -> str:
+    """🔗 `https://CDN/x.jpg?v=1&width=800` → `cdn/x.jpg?v=1` (без протоколу, fragment і query, крім версії)."""
+    parts = urlsplit((url or "").strip())
+    if not parts.netloc:
+        return ""
+    version = [(key, value) for key, value in parse_qsl(parts.query) if key == "v" and value]
+    suffix = f"?{urlencode(version[-1:])}" if version else ""      # 🔢 Версія CDN розрізняє вміст
+    return f"{parts.netloc.lower()}{parts.path}{suffix}"
+
+
+def image_cache_keys(*, url: Optional[str] = None, sha256: Optional[str] = None) -> Tuple[str, ...]:
+    """🔑 Ключі кешу для фото: спершу за URL, потім за вмістом."""
+    keys = []
+    canonical = canonical_image_url(url or "")
+    if canonical:
+        keys.append(f"url:{canonical}")
+    if sha256:
+        keys.append(f"sha256:{sha256.lower()}")
+    return tuple(keys)
+
+
+# ================================
+# 📎 КЕШ
+# ================================
+class TelegramFileIdCache:
+    """📎 Файлове сховище ключ фото → `file_id` з LRU-витісненням."""
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_FILE_ID_CACHE_PATH,
+        *,
+        max_entries: int = 5000,
+        flush_sec: float = 2.0,
+    ) -> None:
+        self._path = Path(path)
+        self._max_entries = max(1, int(max_entries))
+        self._flush_sec = max(0.0, float(flush_sec))               # ⏱️ Debounce запису
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()                            # 🔒 Один запис файлу за раз
+        self._items: "OrderedDict[str, str]" = self._read()       # 🧠 key → file_id
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task[None]] = None       # ⏳ Запланований фоновий запис
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, keys: Iterable[str]) -> Optional[str]:
+        """📖 Перший знайдений `file_id` серед ключів (або None)."""
+        with self._lock:
+            for key in keys:
+                file_id = self._items.get(key)
+                if file_id:
+                    self._items.move_to_end(key)                    # 🧮 Свіжий запис — в кінець LRU
+                    MEDIA_FILE_ID_CACHE_TOTAL.labels(event="hit").inc()
+                    return file_id
+        MEDIA_FILE_ID_CACHE_TOTAL.labels(event="miss").inc()
+        return None
+
+    def put(self, keys: Iterable[str], file_id: str) -> None:
+        """💾 Зберігає `file_id` під усіма ключами фото."""
+        keys = [key for key in keys if key]
+        if not keys or not file_id:
+            return
+        with self._lock:
+            changed = False
+            for key in keys:
+                if self._items.get(key) != file_id:
+                    changed = True
+                self._items[key] = file_id
+                self._items.move_to_end(key)
+            while len(self._items) > self._max_entries:
+                self._items.popitem(last=False)                     # 🧹 Найстаріший запис
+            self._dirty = self._dirty or changed
+        if changed:
+            self._schedule_flush()
+        MEDIA_FILE_ID_CACHE_TOTAL.labels(event="stored").inc()
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        """🗑️ Видаляє ключі (Telegram відхилив `file_id`)."""
+        with self._lock:
+            removed = [key for key in keys if self._items.pop(key, None) is not None]
+            self._dirty = self._dirty or bool(removed)
+        if removed:
+            self._schedule_flush()
+            MEDIA_FILE_ID_CACHE_TOTAL.labels(event="invalidated").inc()
+            logger.info("🗑️ file_id інвалідовано: %s", ", ".join(removed))
+
+    async def flush(self) -> None:
+        """🧽 Примусовий запис без очікування debounce (зупинка бота)."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done():
+            task.cancel()
+        await asyncio.to_thread(self._write)
+
+    # ================================
+    # 💾 ДИСК
+    # ================================
+    def _schedule_flush(self) -> None:
+        """🕒 Debounce-запис під event loop; без loop — одразу (скрипти, тести)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write()
+            return
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()                               # ♻️ Скасовуємо попередній debounce
+        self._flush_task = loop.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        """⏳ Чекає `flush_sec` і пише мапу в потоці, не блокуючи event loop."""
+        try:
+            await asyncio.sleep(self._flush_sec)
+            await asyncio.to_thread(self._write)
+        except asyncio.CancelledError:
+            return
+        except Exception:
+            logger.exception("❌ Помилка відкладеного запису кешу file_id.")
+
+    def _read(self) -> "OrderedDict[str, str]":
+        if not self._path.exists():
+            return OrderedDict()
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+            items = payload.get("items") or {}
+            return OrderedDict((str(key), str(value)) for key, value in items.items() if value)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Пошкоджений кеш file_id %s: %s — починаємо з нуля.", self._path, exc)
+            return OrderedDict()
+
+    def _write(self) -> None:
+        """💾 Синхронно записує мапу (якщо є зміни); під event loop — лише через потік."""
+        with self._io_lock:                                         # 🔒 Знімок і запис — без перестановок
+            with self._lock:
+                if not self._dirty:
+                    return
+                payload = {
+                    "version": _CACHE_VERSION,
+                    "updated_at": time.time(),
+                    "items": dict(self._items),                     # 🏷️ key → file_id (порядок = LRU)
+                }
+                self._dirty = False
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self._path.with_suffix(".json.tmp")
+                tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+                os.replace(tmp, self._path)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("⚠️ Не вдалося записати кеш file_id %s: %s", self._path, exc)
+                with self._lock:
+                    self._dirty = True
+
+
+__all__ = [
+    "DEFAULT_FILE_ID_CACHE_PATH",
+    "TelegramFileIdCache",
+    "canonical_image_url",
+    "image_cache_keys",
+]
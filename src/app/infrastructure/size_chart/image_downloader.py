@@ -6,6 +6,8 @@
 🔹 Перевіряє `Content-Type`, сигнатури PNG/JPEG/GIF/WebP та обмежує розмір.
 🔹 Підтримує ретраї з експоненційним backoff і метрики Prometheus.
 🔹 Повертає або шлях до збереженого файлу (`download`), або байти з SHA256 (`fetch`).
+🔹 Використовує спільний `HttpClientPool` — з'єднання з CDN переживають спроби й зображення.
+🔹 Опційний `MediaStore` — read-through кеш: той самий URL качається один раз за TTL для всіх викликачів.
 """
 
 from __future__ import annotations
@@ -19,7 +21,7 @@ import tempfile														# 🧪 Тимчасові файли для ато
 from dataclasses import dataclass										# 🧱 DTO для результатів
 from enum import Enum													# 🏷️ Типізація помилок
 from pathlib import Path												# 🛤️ Шляхи до файлів
-from typing import Awaitable, Callable, Iterable, Optional, Tuple, Union, cast	# 🧰 Допоміжні типи
+from typing import Any, Awaitable, Callable, Iterable, Optional, Tuple, Union, cast	# 🧰 Допоміжні типи
 
 # 🌐 Зовнішні бібліотеки
 import httpx															# 🌐 HTTP-клієнт
@@ -30,6 +32,8 @@ except Exception:														# pragma: no cover
     Counter = None														# type: ignore
 
 # 🧩 Внутрішні модулі проєкту
+from app.infrastructure.web.http_client_pool import HttpClientPool		# 🔌 Спільний пул з'єднань
+from app.shared.cache.media_store import MediaStore, StoredMedia		# 🗄️ Контентно-адресоване сховище
 from app.shared.utils.logger import LOG_NAME							# 🏷️ Ім'я базового логера
 
 logger = logging.getLogger(f"{LOG_NAME}.downloader")					# 🧾 Локальний логер модуля
@@ -140,6 +144,7 @@ class ImageDownloader:
     def __init__(
         self,
         *,
+        client_pool: HttpClientPool,
         timeout_s: float = 30.0,
         headers: Optional[dict] = None,
         ct_prefixes: Iterable[str] = DEFAULT_CT_PREFIXES,
@@ -149,6 +154,7 @@ class ImageDownloader:
         verify_magic: bool = True,
         compute_sha256: bool = False,
         chunk_size: int = 64 * 1024,
+        media_store: Optional[MediaStore] = None,
     ) -> None:
         self.timeout_s = float(timeout_s)								# ⏳ Таймаут запиту в секундах
         merged_headers = headers or {}
@@ -160,6 +166,8 @@ class ImageDownloader:
         self.verify_magic = bool(verify_magic)							# 🧪 Чи перевіряти сигнатуру
         self.compute_sha256 = bool(compute_sha256)						# 🔐 Чи рахувати хеш під час `download`
         self.chunk_size = int(chunk_size)								# 📦 Розмір шматків при стримінгу
+        self.client_pool = client_pool									# 🔌 Спільний пул контейнера (він же й закриває)
+        self.media_store = media_store									# 🗄️ Спільне сховище (None — без кешу)
         logger.debug(
             "⚙️ ImageDownloader init timeout=%.1fs attempts=%d max_bytes=%d chunk=%d verify_magic=%s compute_sha=%s",
             self.timeout_s,
@@ -195,6 +203,20 @@ class ImageDownloader:
 
     async def download_info(self, img_url: str, output_path: Path) -> DownloadOutcome:
         """🔁 Записує файл на диск з ретраями та повертає результат або помилку."""
+        stored = await self._store_lookup(img_url)
+        if stored is not None:
+            try:
+                path = await asyncio.to_thread(self.media_store.materialize, stored, Path(output_path))  # type: ignore[union-attr]
+                logger.info("🗄️ download_info зі сховища: %s -> %s", img_url, path)
+                return DownloadResult(
+                    path=path,
+                    content_type=stored.content_type,
+                    content_length=stored.size,
+                    bytes_written=stored.size,
+                    sha256=stored.digest,
+                )
+            except OSError as exc:
+                logger.warning("⚠️ Не вдалося взяти %s зі сховища: %s — качаємо", img_url, exc)
         outcome = await self._run_with_retries(							# 🔁 Уніфікований механізм ретраїв
             img_url=img_url,
             handler=self._stream_to_disk,
@@ -204,6 +226,11 @@ class ImageDownloader:
             logger.error("❌ download_info failed: %s (%s)", img_url, outcome.value)
             return outcome												# 🚫 Помилка завантаження
         result = cast(DownloadResult, outcome)							# 💾 Уточнюємо тип для подальшого використання
+        if self.media_store is not None:
+            await self._store_call(
+                self.media_store.put_file, img_url, result.path,
+                content_type=result.content_type, sha256=result.sha256,
+            )															# 🗄️ Ділимося з іншими викликачами
         logger.info(
             "💾 download_info ok: %s -> %s (bytes=%d)",
             img_url,
@@ -218,13 +245,45 @@ class ImageDownloader:
     async def _fetch_outcome(self, img_url: str) -> FetchOutcome:
         """🔄 Внутрішня версія `fetch` з типізованим результатом."""
         logger.debug("📥 _fetch_outcome for %s", img_url)
+        stored = await self._store_lookup(img_url)
+        if stored is not None:
+            try:
+                content = await asyncio.to_thread(self.media_store.read, stored)  # type: ignore[union-attr]
+                logger.debug("🗄️ fetch зі сховища: %s (%s)", img_url, stored.digest[:12])
+                return ImageData(url=img_url, content=content, sha256=stored.digest, content_type=stored.content_type)
+            except OSError as exc:
+                logger.warning("⚠️ Не вдалося прочитати %s зі сховища: %s — качаємо", img_url, exc)
         outcome = await self._run_with_retries(
             img_url=img_url,
             handler=self._stream_to_memory,
         )
         if isinstance(outcome, DownloadError):
             return outcome												# 🚫 Помилка під час завантаження
-        return cast(ImageData, outcome)									# 📦 Повертаємо байти та SHA
+        data = cast(ImageData, outcome)									# 📦 Байти та SHA
+        if self.media_store is not None:
+            await self._store_call(
+                self.media_store.put, img_url, data.content,
+                content_type=data.content_type, sha256=data.sha256,
+            )															# 🗄️ Ділимося з іншими викликачами
+        return data
+
+    # ================================
+    # 🗄️ МЕДІАСХОВИЩЕ
+    # ================================
+    async def _store_lookup(self, img_url: str) -> Optional[StoredMedia]:
+        """🔍 Свіжий запис сховища для URL (або None)."""
+        if self.media_store is None or not img_url:
+            return None
+        return await self._store_call(self.media_store.lookup, img_url)
+
+    @staticmethod
+    async def _store_call(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """🧵 Виконує дискову операцію сховища поза event loop; збої лише логуються."""
+        try:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Медіасховище недоступне (%s): %s", getattr(func, "__name__", func), exc)
+            return None
 
     async def _run_with_retries(
         self,
@@ -248,54 +307,50 @@ class ImageDownloader:
         for attempt in range(1, self.max_attempts + 1):
             try:
                 timeout = httpx.Timeout(self.timeout_s)					# ⏳ Формуємо таймаут
-                async with httpx.AsyncClient(							# 🌐 Створюємо HTTP-клієнт
-                    headers=self.headers,
-                    timeout=timeout,
-                    follow_redirects=True,
-                ) as client:
-                    async with client.stream("GET", img_url) as response:
-                        status_error = self._ensure_status(response, img_url, attempt)
-                        if status_error:
-                            return status_error						# 🚫 HTTP-статус не пройшов перевірку
-
-                        content_type = self._normalize_ct(response.headers.get("Content-Type"))
-                        content_length = self._parse_length(response.headers.get("Content-Length"))
-
-                        ct_error = self._validate_content_type(content_type, img_url)
-                        if ct_error:
-                            return ct_error							# 🚫 Тип контенту не влаштовує
-
-                        size_error = self._validate_length(content_length, img_url)
-                        if size_error:
-                            return size_error							# 🚫 Завеликий файл за Content-Length
-
-                        logger.debug(
-                            "📡 Отримано відповідь %s (ct=%s, length=%s) attempt %d/%d.",
-                            img_url,
-                            content_type or "n/a",
-                            content_length if content_length is not None else "n/a",
-                            attempt,
-                            self.max_attempts,
-                        )
-                        if output_path:
-                            result = await handler(						# 💾 Пишемо на диск
-                                response,
-                                img_url=img_url,
-                                output_path=output_path,
-                                content_type=content_type,
-                                content_length=content_length,
-                            )
-                            logger.debug("💾 Handler завершився для %s (attempt %d).", img_url, attempt)
-                            return result
-
-                        result = await handler(							# 📦 Повертаємо байти
+                client = self.client_pool.client()						# 🔌 Клієнт із теплими з'єднаннями
+                async with client.stream("GET", img_url, headers=self.headers, timeout=timeout) as response:
+                    status_error = self._ensure_status(response, img_url, attempt)
+                    if status_error:
+                        return status_error						# 🚫 HTTP-статус не пройшов перевірку
+
+                    content_type = self._normalize_ct(response.headers.get("Content-Type"))
+                    content_length = self._parse_length(response.headers.get("Content-Length"))
+
+                    ct_error = self._validate_content_type(content_type, img_url)
+                    if ct_error:
+                        return ct_error							# 🚫 Тип контенту не влаштовує
+
+                    size_error = self._validate_length(content_length, img_url)
+                    if size_error:
+                        return size_error							# 🚫 Завеликий файл за Content-Length
+
+                    logger.debug(
+                        "📡 Отримано відповідь %s (ct=%s, length=%s) attempt %d/%d.",
+                        img_url,
+                        content_type or "n/a",
+                        content_length if content_length is not None else "n/a",
+                        attempt,
+                        self.max_attempts,
+                    )
+                    if output_path:
+                        result = await handler(						# 💾 Пишемо на диск
                             response,
                             img_url=img_url,
+                            output_path=output_path,
                             content_type=content_type,
+                            content_length=content_length,
                         )
-                        logger.debug("📦 Handler повернув байти для %s (attempt %d).", img_url, attempt)
+                        logger.debug("💾 Handler завершився для %s (attempt %d).", img_url, attempt)
                         return result
 
+                    result = await handler(							# 📦 Повертаємо байти
+                        response,
+                        img_url=img_url,
+                        content_type=content_type,
+                    )
+                    logger.debug("📦 Handler повернув байти для %s (attempt %d).", img_url, attempt)
+                    return result
+
             except httpx.HTTPError as exc:
                 code = getattr(getattr(exc, "response", None), "status_code", None)	# 🧾 Код статусу, якщо є
                 logger.warning(
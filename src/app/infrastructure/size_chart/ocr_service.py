@@ -96,15 +96,15 @@ class OCRService:
         openai_service: OpenAIService,
         prompt_service: PromptService,
         *,
+        downloader: ImageDownloader,
         request_timeout_s: Optional[float] = None,
         max_retries: Optional[int] = None,
         backoff_s: Optional[float] = None,
-        downloader: Optional[ImageDownloader] = None,
         config: Optional[ConfigService] = None,
     ) -> None:
         self.openai_service = openai_service							# 🤖 API OpenAI Vision
         self.prompt_service = prompt_service							# 💬 Побудова промтів
-        self.downloader = downloader or ImageDownloader()				# 📥 Асинхронний завантажувач
+        self.downloader = downloader									# 📥 Завантажувач на спільному пулі контейнера
         self.cfg = config or ConfigService()							# ⚙️ Джерело конфігурацій
 
         # ⚙️ Таймаути та ретраї
@@ -59,9 +59,11 @@ from app.infrastructure.size_chart.ocr_service import OCRService			# 🔤 OCR с
 from app.infrastructure.size_chart.table_generator_factory import (		# 🖼️ Фабрика генераторів таблиць
     TableGeneratorFactory,
 )
+from app.shared.tracing import traced										# 🧵 Спани download/OCR/генерації
 from app.shared.utils.logger import LOG_NAME								# 🏷️ Ім'я логера
 from app.shared.utils.prompt_service import ChartType as PromptChartType	# 🧠 Типи промтів для OCR
 from app.shared.utils.prompts import ChartType								# 🧾 Публічні типи таблиць
+from app.shared.utils.single_flight import fingerprint, single_flight		# 🛬 Спільний OCR у межах запуску
 
 _GENERAL_MEN_PATTERNS: Tuple[str, ...] = (
     "size_chart_top_jogger",
@@ -598,7 +600,11 @@ class SizeChartService(ISizeChartService):
                 download_path = tmp_dir / f"download_{idx}{extension}"		# 📁 Шлях для завантаження
 
                 download_started = time.time()								# 🕒 Фіксуємо час початку завантаження
-                outcome: DownloadOutcome = await self.downloader.download_info(img_url, download_path)
+                outcome: DownloadOutcome = await traced(
+                    "size_chart.download",
+                    self.downloader.download_info(img_url, download_path),
+                    idx=idx,
+                )
                 download_duration = max(0.0, time.time() - download_started)
                 if self._autotune_enabled:									# 🤖 Якщо автотюнер ввімкнено — накопичуємо заміри
                     self._dl_durations.append(download_duration)			# 🧮 Збираємо статистику IO
@@ -659,11 +665,21 @@ class SizeChartService(ISizeChartService):
                     task_id=task_id,
                 )
                 ocr_started = time.time()									# 🕒 Початок OCR
-                async with sem_ocr:											# 🔐 OCR/CPU секція з власним лімітом
-                    ocr_result: SizeChartOcrResult = await self.ocr_service.recognize(
-                        str(downloaded_path),
-                        cast(PromptChartType, chart_type),
-                    )
+
+                async def _recognize(path: Path = downloaded_path) -> SizeChartOcrResult:
+                    async with sem_ocr:										# 🔐 OCR/CPU секція з власним лімітом
+                        return await traced(
+                            "ocr",
+                            self.ocr_service.recognize(str(path), cast(PromptChartType, chart_type)),
+                            idx=idx,
+                            chart_type=str(chart_type),
+                        )
+
+                ocr_result: SizeChartOcrResult = await single_flight(		# 🛬 Та сама таблиця в іншому товарі — один OCR
+                    "size_chart.ocr",
+                    fingerprint(outcome.sha256 or img_url, chart_type),
+                    _recognize,
+                )
                 ocr_duration = max(0.0, time.time() - ocr_started)
                 if self._autotune_enabled:									# 🤖 Оновлюємо статистику OCR
                     self._ocr_durations.append(ocr_duration)				# 🧮 Статистика OCR
@@ -752,7 +768,7 @@ class SizeChartService(ISizeChartService):
                 try:														# 🖼️ Запускаємо сам рендер PNG
                     generate_started = time.time()							# 🕒 Початок генерації PNG
                     async with sem_ocr:
-                        result_path = await generator.generate()
+                        result_path = await traced("table.generate", generator.generate(), idx=idx)
                     generate_duration = max(0.0, time.time() - generate_started)
                     if self._autotune_enabled:
                         self._ocr_durations.append(generate_duration)		# 🧮 Статистика генерації
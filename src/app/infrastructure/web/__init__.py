@@ -4,10 +4,13 @@
 
 🔹 Експортує реалізацію `WebDriverService`, сумісну з `IWebClient`.
 🔹 Використовується парсерами для стабільного та асинхронного отримання HTML.
+🔹 `HttpClientPool` — спільний `httpx.AsyncClient` з keep-alive для завантаження зображень.
 """
 
 from __future__ import annotations
 
+# 🔌 Пул HTTP-з'єднань
+from .http_client_pool import HttpClientPool, HttpPoolConfig
 # 🧭 Основний сервіс
 from .webdriver_service import WebDriverService
 # 🧾 Парсер та сервіс автоматизації кошика
@@ -15,6 +18,8 @@ from .youngla_order_parser import YoungLAOrderProduct, parse_youngla_order_file
 from .youngla_order_service import YoungLAOrderService
 
 __all__ = [
+    "HttpClientPool",
+    "HttpPoolConfig",
     "WebDriverService",
     "YoungLAOrderProduct",
     "parse_youngla_order_file",
@@ -0,0 +1,114 @@
+# 🔌 app/infrastructure/web/http_client_pool.py
+"""
+🔌 Довгоживучий пул `httpx.AsyncClient` для повторного використання з'єднань.
+
+🔹 Один клієнт на процес замість нового на кожну спробу — TCP+TLS з CDN встановлюється один раз.
+🔹 Ліміти з'єднань і keep-alive задаються конфігом (`http.image_pool`).
+🔹 HTTP/2 вмикається лише якщо встановлено `h2`; інакше — HTTP/1.1 з keep-alive.
+🔹 Клієнт створюється ліниво і перевідкривається, якщо його закрили або змінився event loop.
+🔹 Один пул на процес (його створює й закриває контейнер): CDN-фото, `products.json`, `suggest.json`;
+   таймаут і заголовки кожен викликач передає в запит.
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import asyncio                                                      # 🔁 Прив'язка клієнта до event loop
+import importlib.util                                               # 🧪 Перевірка наявності `h2`
+import logging                                                      # 🧾 Логування
+from dataclasses import dataclass                                   # 🧱 Налаштування пулу
+from typing import Optional                                         # 🧰 Типізація
+
+# 🌐 Зовнішні бібліотеки
+import httpx                                                        # 🌐 HTTP-клієнт
+
+# 🧩 Внутрішні модулі проєкту
+from app.shared.utils.logger import LOG_NAME                        # 🏷️ Базовий логер
+
+logger = logging.getLogger(f"{LOG_NAME}.http_pool")
+
+
+# ================================
+# ⚙️ НАЛАШТУВАННЯ ПУЛУ
+# ================================
+@dataclass(frozen=True)
+class HttpPoolConfig:
+    """⚙️ Ліміти пулу з'єднань."""
+
+    max_connections: int = 20                                       # 🔢 Загальна межа з'єднань
+    max_keepalive_connections: int = 10                             # ♻️ Скільки тримати «теплими»
+    keepalive_expiry_s: float = 30.0                                # ⏳ Час життя простою
+    http2: bool = True                                              # 🚀 Бажаний HTTP/2 (за наявності `h2`)
+
+
+def http2_available() -> bool:
+    """🧪 `True`, якщо встановлено пакет `h2`, потрібний httpx для HTTP/2."""
+    return importlib.util.find_spec("h2") is not None
+
+
+# ================================
+# 🔌 ПУЛ КЛІЄНТІВ
+# ================================
+class HttpClientPool:
+    """🔌 Лінива обгортка над одним спільним `httpx.AsyncClient`."""
+
+    def __init__(
+        self,
+        config: Optional[HttpPoolConfig] = None,
+        *,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.config = config or HttpPoolConfig()
+        self._transport = transport                                 # 🧪 Кастомний транспорт (тести/проксі)
+        self.http2 = bool(self.config.http2 and http2_available())  # 🚀 Фактичний режим
+        if self.config.http2 and not self.http2:
+            logger.info("ℹ️ http_pool: пакет h2 не встановлено — працюємо через HTTP/1.1 keep-alive")
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """📏 Ліміти пулу у форматі httpx."""
+        return httpx.Limits(
+            max_connections=max(1, int(self.config.max_connections)),
+            max_keepalive_connections=max(0, int(self.config.max_keepalive_connections)),
+            keepalive_expiry=max(0.0, float(self.config.keepalive_expiry_s)),
+        )
+
+    def client(self) -> httpx.AsyncClient:
+        """🌐 Повертає спільний клієнт, створюючи його за потреби."""
+        loop = asyncio.get_running_loop()
+        client = self._client
+        if client is not None and not client.is_closed and self._loop is loop:
+            return client
+        if client is not None and not client.is_closed:
+            # ⚠️ З'єднання прив'язані до старого loop — покидаємо їх, закрити тут не вийде
+            logger.debug("🔁 http_pool: event loop змінився — створюємо новий клієнт")
+        self._client = httpx.AsyncClient(
+            limits=self.limits,
+            http2=self.http2,
+            follow_redirects=True,
+            transport=self._transport,
+        )
+        self._loop = loop
+        logger.debug(
+            "🔌 http_pool: клієнт створено (max=%d keepalive=%d http2=%s)",
+            self.config.max_connections,
+            self.config.max_keepalive_connections,
+            self.http2,
+        )
+        return self._client
+
+    async def aclose(self) -> None:
+        """🧹 Закриває клієнт і всі з'єднання пулу (ідемпотентно)."""
+        client, self._client, self._loop = self._client, None, None
+        if client is None or client.is_closed:
+            return
+        try:
+            await client.aclose()
+            logger.info("🧹 http_pool: клієнт закрито")
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ http_pool: не вдалося закрити клієнт: %s", exc)
+
+
+__all__ = ["HttpClientPool", "HttpPoolConfig", "http2_available"]
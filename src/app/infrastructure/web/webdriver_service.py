@@ -205,6 +205,30 @@ class WebDriverService(IWebClient):
             self._playwright = None									# 🧹 Звільняємо ресурс
             logger.info("🔌 Playwright зупинено")
 
+    async def new_context(
+        self,
+        *,
+        user_agent: Optional[str] = None,
+        locale: Optional[str] = None,
+        viewport: Optional[Dict[str, int]] = None,
+    ) -> BrowserContext:
+        """
+        🪟 Створює окремий контекст у спільному (вже прогрітому) Chromium.
+
+        Використовується довгоживучими сценаріями (наприклад, warm-сторінкою пошуку),
+        яким потрібні власні cookies/стан, але не власний процес браузера.
+        Закривати контекст — відповідальність викликача.
+        """
+        await self.startup()											# 🚀 Браузер один на процес
+        if not self._browser:
+            raise RuntimeError("Browser not initialized")				# 🚨 Захист від некоректного стану
+        kwargs: Dict[str, Any] = {"user_agent": user_agent or self._user_agent}
+        if locale:
+            kwargs["locale"] = locale									# 🌍 Локаль контексту
+        if viewport:
+            kwargs["viewport"] = viewport								# 🖥️ Розмір вікна
+        return await self._browser.new_context(**kwargs)
+
     async def get_page_content(
         self,
         url: str,
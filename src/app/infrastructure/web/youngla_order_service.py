@@ -29,6 +29,7 @@ from typing import Any, Callable, Dict, Iterable, List
 
 # 🧩 Внутрішні модулі проєкту
 from app.config.config_service import ConfigService
+from app.infrastructure.catalog.product_catalog_index import ProductCatalogIndex
 from app.shared.utils.logger import LOG_NAME
 from .youngla_order_parser import YoungLAOrderProduct, parse_youngla_order_file
 
@@ -47,8 +48,14 @@ class YoungLAOrderService:
 
     BASE_URL = "https://www.youngla.com"
 
-    def __init__(self, config_service: ConfigService) -> None:
+    def __init__(
+        self,
+        config_service: ConfigService,
+        *,
+        catalog_index: ProductCatalogIndex | None = None,
+    ) -> None:
         self._config = config_service
+        self._catalog = catalog_index
         cfg = config_service.get("orders.youngla", {}) or {}
         self._headless = bool(cfg.get("headless", False))
         self._keep_browser_open = bool(cfg.get("keep_browser_open", True))
@@ -78,7 +85,7 @@ class YoungLAOrderService:
     # 🧮 ПУБЛІЧНИЙ API
     # ================================
     async def process_order_file(self, file_text: str) -> bool:
-        """Опрацьовує файл замовлення за допомогою Playwright."""
+        """Опрацьовує файл замовлення за допомогою Playwright.
 
         Args:
             file_text: Вміст .txt-файлу замовлень.
@@ -210,6 +217,9 @@ class YoungLAOrderService:
         return await self._open_product_via_search(page, product)
 
     async def _open_product_via_search(self, page: Page, product: YoungLAOrderProduct) -> bool:
+        if await self._open_product_via_catalog(page, product):
+            return True
+
         search_url = f"{self.BASE_URL}/search?q={product.sku}"
         await page.goto(search_url)
         await page.wait_for_load_state("domcontentloaded")
@@ -228,6 +238,28 @@ class YoungLAOrderService:
                 continue
         return False
 
+    async def _open_product_via_catalog(self, page: Page, product: YoungLAOrderProduct) -> bool:
+        """📚 Відкриває товар за URL з локального каталогу (SKU → назва), без сторінки пошуку."""
+        if self._catalog is None:
+            return False
+        entry = self._catalog.lookup_sku(product.sku)
+        if entry is None and product.name:
+            matches = self._catalog.search(product.name, limit=1)
+            entry = matches[0].entry if matches and matches[0].score >= 0.8 else None
+        if entry is None or not entry.url:
+            return False
+
+        logger.info("📚 SKU %s знайдено в каталозі → %s", product.sku, entry.url)
+        try:
+            response = await page.goto(entry.url)
+        except PlaywrightError as exc:
+            logger.warning("⚠️ URL з каталогу недоступний (%s): %s", entry.url, exc)
+            return False
+        if response and response.status == 200:
+            await page.wait_for_load_state("domcontentloaded")
+            return True
+        return False
+
     async def _select_color(
         self,
         page: Page,
@@ -5,6 +5,8 @@
 🔹 Надає асинхронний LRU+TTL кеш для веб-сторінок.
 🔹 Синхронізує паралельні запити через locks, запобігаючи штормах.
 🔹 Використовується інфраструктурними сервісами веб-парсингу.
+🔹 Зберігає легкі підказки про товари (title/images/stock) з колекцій.
+🔹 Тримає спільне контентно-адресоване сховище зображень (`MediaStore`).
 """
 
 from __future__ import annotations
@@ -12,7 +14,13 @@ from __future__ import annotations
 # 🔁 HTML кеш
 from .html_lru_cache import HtmlLruCache
 
+# 🗄️ Сховище зображень
+from .media_store import MediaStore, StoredMedia
+
+# 🧷 Підказки про товари з колекцій
+from .product_hints_cache import ProductHint, ProductHintsCache
+
 # ================================
 # 📦 ЕКСПОРТ ПАКЕТУ
 # ================================
-__all__ = ["HtmlLruCache"]
+__all__ = ["HtmlLruCache", "MediaStore", "ProductHint", "ProductHintsCache", "StoredMedia"]
@@ -0,0 +1,198 @@
+# 🗄️ app/shared/cache/media_store.py
+"""
+🗄️ Контентно-адресоване дискове сховище зображень, спільне для всіх споживачів.
+
+🔹 Блоби лежать у `blobs/<ab>/<cd>/<sha256>` — однаковий вміст зберігається один раз.
+🔹 Індекс `index.json`: URL → digest, розмір, content-type, час завантаження (TTL на URL).
+🔹 LRU-межа за сумарним розміром: найдавніше використані блоби витісняються разом з URL.
+🔹 Синхронний і потокобезпечний API — асинхронні викликачі обгортають його в `asyncio.to_thread`.
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import hashlib                                                      # 🔐 Адреса вмісту
+import json                                                         # 🧾 Індекс
+import logging                                                      # 🧾 Логування
+import os                                                           # 🔁 Атомарна заміна файлів
+import shutil                                                       # 📋 Копіювання файлів
+import threading                                                    # 🔒 Захист індексу
+import time                                                         # ⏱️ TTL / LRU
+from dataclasses import dataclass                                   # 🧱 DTO
+from pathlib import Path                                            # 📁 Шляхи
+from typing import Dict, Optional                                   # 🧰 Типи
+
+# 🧩 Внутрішні модулі проєкту
+from app.shared.metrics.media import MEDIA_STORE_TOTAL              # 📈 hit / miss / stored / evicted
+from app.shared.utils.logger import LOG_NAME                        # 🏷️ Базовий логер
+
+logger = logging.getLogger(f"{LOG_NAME}.media_store")
+
+_INDEX_VERSION = 1                                                  # 🔢 Версія формату індексу
+DEFAULT_MEDIA_STORE_DIR = "./var/media/store"                       # 📁 Корінь за замовчуванням
+
+
+@dataclass(frozen=True, slots=True)
+class StoredMedia:
+    """📦 Запис сховища для конкретного URL."""
+
+    url: str                                                        # 🌐 Джерельний URL
+    digest: str                                                     # 🔐 SHA256 вмісту
+    size: int                                                       # 📏 Розмір у байтах
+    content_type: Optional[str]                                     # 🏷️ Content-Type
+    fetched_at: float                                               # ⏱️ Коли завантажено
+
+
+class MediaStore:
+    """🗄️ Блоби за SHA256 + індекс URL → digest із TTL та LRU-межею розміру."""
+
+    def __init__(
+        self,
+        root: str | Path = DEFAULT_MEDIA_STORE_DIR,
+        *,
+        max_bytes: int = 512 * 1024 * 1024,
+        ttl_sec: float = 24 * 3600,
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = max(1, int(max_bytes))
+        self.ttl_sec = max(0.0, float(ttl_sec))
+        self._lock = threading.Lock()
+        self._urls: Dict[str, Dict[str, object]] = {}               # 🌐 url → {digest, fetched_at}
+        self._blobs: Dict[str, Dict[str, object]] = {}              # 🔐 digest → {size, content_type, last_access}
+        self._load_index()
+
+    # ================================
+    # 📖 ЧИТАННЯ
+    # ================================
+    def lookup(self, url: str) -> Optional[StoredMedia]:
+        """🔍 Свіжий (у межах TTL) запис для URL, блоб якого існує на диску."""
+        with self._lock:
+            entry = self._urls.get(url)
+            blob = self._blobs.get(str(entry["digest"])) if entry else None
+            if not entry or not blob:
+                MEDIA_STORE_TOTAL.labels(event="miss").inc()
+                return None
+            fetched_at = float(entry.get("fetched_at", 0.0))
+            digest = str(entry["digest"])
+            if self.ttl_sec and time.time() - fetched_at > self.ttl_sec:
+                MEDIA_STORE_TOTAL.labels(event="expired").inc()
+                return None
+            if not self.blob_path(digest).exists():
+                self._drop_blob(digest)
+                MEDIA_STORE_TOTAL.labels(event="miss").inc()
+                return None
+            blob["last_access"] = time.time()                       # 🧮 LRU-відмітка (персиститься з наступним записом)
+            MEDIA_STORE_TOTAL.labels(event="hit").inc()
+            return StoredMedia(
+                url=url,
+                digest=digest,
+                size=int(blob.get("size", 0)),
+                content_type=blob.get("content_type"),  # type: ignore[arg-type]
+                fetched_at=fetched_at,
+            )
+
+    def read(self, entry: StoredMedia) -> bytes:
+        """💾 Байти блобу."""
+        return self.blob_path(entry.digest).read_bytes()
+
+    def materialize(self, entry: StoredMedia, output_path: Path) -> Path:
+        """📋 Копіює блоб у `output_path` (для споживачів, яким потрібен файл)."""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(self.blob_path(entry.digest), output_path)
+        return output_path
+
+    def blob_path(self, digest: str) -> Path:
+        """📁 Шлях блобу: `blobs/<ab>/<cd>/<digest>`."""
+        return self.root / "blobs" / digest[:2] / digest[2:4] / digest
+
+    # ================================
+    # 💾 ЗАПИС
+    # ================================
+    def put(self, url: str, content: bytes, *, content_type: Optional[str], sha256: Optional[str] = None) -> StoredMedia:
+        """💾 Зберігає байти (якщо такого блобу ще немає) і прив'язує до нього URL."""
+        digest = (sha256 or hashlib.sha256(content).hexdigest()).lower()
+        path = self.blob_path(digest)
+        if not path.exists():
+            self._atomic_write(path, lambda tmp: tmp.write_bytes(content))
+        return self._register(url, digest, len(content), content_type)
+
+    def put_file(self, url: str, source: Path, *, content_type: Optional[str], sha256: Optional[str] = None) -> StoredMedia:
+        """💾 Як `put`, але з уже записаного файлу (без читання в пам'ять, якщо хеш відомий)."""
+        source = Path(source)
+        digest = (sha256 or _file_sha256(source)).lower()
+        path = self.blob_path(digest)
+        if not path.exists():
+            self._atomic_write(path, lambda tmp: shutil.copyfile(source, tmp))
+        return self._register(url, digest, source.stat().st_size, content_type)
+
+    # ================================
+    # 🧰 ВНУТРІШНЄ
+    # ================================
+    def _register(self, url: str, digest: str, size: int, content_type: Optional[str]) -> StoredMedia:
+        now = time.time()
+        with self._lock:
+            self._blobs[digest] = {"size": int(size), "content_type": content_type, "last_access": now}
+            self._urls[url] = {"digest": digest, "fetched_at": now}
+            self._evict_over_budget()
+            self._save_index()
+        MEDIA_STORE_TOTAL.labels(event="stored").inc()
+        return StoredMedia(url=url, digest=digest, size=int(size), content_type=content_type, fetched_at=now)
+
+    def _evict_over_budget(self) -> None:
+        total = sum(int(blob.get("size", 0)) for blob in self._blobs.values())
+        if total <= self.max_bytes:
+            return
+        for digest in sorted(self._blobs, key=lambda d: float(self._blobs[d].get("last_access", 0.0))):
+            if total <= self.max_bytes:
+                break
+            total -= int(self._blobs[digest].get("size", 0))
+            self._drop_blob(digest)
+            try:
+                self.blob_path(digest).unlink(missing_ok=True)
+            except OSError as exc:
+                logger.warning("⚠️ Не вдалося видалити блоб %s: %s", digest, exc)
+            MEDIA_STORE_TOTAL.labels(event="evicted").inc()
+
+    def _drop_blob(self, digest: str) -> None:
+        self._blobs.pop(digest, None)
+        for url in [url for url, entry in self._urls.items() if entry.get("digest") == digest]:
+            self._urls.pop(url, None)
+
+    def _atomic_write(self, path: Path, writer) -> None:  # type: ignore[no-untyped-def]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        writer(tmp)
+        os.replace(tmp, path)
+
+    def _load_index(self) -> None:
+        path = self.root / "index.json"
+        if not path.exists():
+            return
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            self._urls = dict(payload.get("urls") or {})
+            self._blobs = dict(payload.get("blobs") or {})
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Пошкоджений індекс медіа %s: %s — починаємо з нуля.", path, exc)
+
+    def _save_index(self) -> None:
+        payload = {"version": _INDEX_VERSION, "urls": self._urls, "blobs": self._blobs}
+        try:
+            self._atomic_write(
+                self.root / "index.json",
+                lambda tmp: tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8"),
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ Не вдалося записати індекс медіа: %s", exc)
+
+
+def _file_sha256(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(64 * 1024), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+__all__ = ["DEFAULT_MEDIA_STORE_DIR", "MediaStore", "StoredMedia"]
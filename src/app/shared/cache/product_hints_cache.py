@@ -0,0 +1,115 @@
+# 🧷 app/shared/cache/product_hints_cache.py
+"""
+🧷 Процесний LRU+TTL кеш «підказок» про товар (title / images / stock).
+
+🔹 Заповнюється пакетно з колекційних джерел (Shopify `products.json`).
+🔹 Дає змогу пропустити або скоротити повний парсинг сторінки товару,
+   коли потрібні лише базові поля (назва, фото, наявність).
+🔹 Ключ — нормалізований URL товару без query/fragment та трейлінг-слешу.
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import time                                            # ⏱️ TTL та freshness
+from collections import OrderedDict                   # 🔁 Реалізація LRU
+from dataclasses import dataclass, field              # 🧱 DTO підказки
+from typing import Dict, Iterable, Optional, Tuple    # 🧰 Типи
+
+
+# ================================
+# 🧱 DTO
+# ================================
+@dataclass(frozen=True, slots=True)
+class ProductHint:
+    """Легкий зліпок товару з колекційного джерела."""
+
+    url: str                                           # 🔗 Канонічний URL товару
+    handle: str                                        # 🏷️ Shopify handle
+    title: str                                         # 🏷️ Назва
+    images: Tuple[str, ...] = ()                       # 🖼️ URL зображень у порядку магазину
+    stock: Dict[str, Dict[str, bool]] = field(default_factory=dict)  # 📦 color → size → available
+    price: Optional[str] = None                        # 💰 Ціна першого варіанта (як у джерелі)
+    skus: Tuple[str, ...] = ()                         # 🔖 Артикули варіантів (Shopify `variant.sku`)
+    source: str = "collection"                         # 🧭 Звідки взяли підказку
+    fetched_at: float = field(default_factory=time.time)  # ⏱️ Момент отримання
+
+
+def hint_key(url: str) -> str:
+    """🔑 Нормалізує URL товару до ключа кешу."""
+    value = (url or "").strip().split("#", 1)[0].split("?", 1)[0]
+    return value.rstrip("/").lower()
+
+
+# ================================
+# 🧷 СИНГЛТОН КЕШУ ПІДКАЗОК
+# ================================
+class ProductHintsCache:
+    """Процесний кеш `ProductHint` з LRU та TTL."""
+
+    _instance: Optional["ProductHintsCache"] = None    # 🧠 Синглтон кешу
+    _max: int                                          # 🔢 Місткість
+    _ttl: int                                          # ⏳ TTL, сек (0 — без обмеження)
+    _data: "OrderedDict[str, ProductHint]"             # 🗂️ Сховище
+
+    def __new__(cls, max_entries: Optional[int] = None, ttl_sec: Optional[int] = None) -> "ProductHintsCache":
+        """
+        Забезпечує єдиний екземпляр кешу.
+
+        Явно передані параметри застосовуються завжди (і до вже створеного синглтона),
+        тож виклик без аргументів не фіксує дефолти раніше за конфіг.
+        """
+        if cls._instance is None:
+            instance = super().__new__(cls)
+            instance._max = 2048                       # 🔢 Максимальна кількість записів
+            instance._ttl = 900                        # ⏳ Час життя запису
+            instance._data = OrderedDict()             # 🗂️ key → ProductHint
+            cls._instance = instance
+        cls._instance.configure(max_entries=max_entries, ttl_sec=ttl_sec)
+        return cls._instance
+
+    def configure(self, *, max_entries: Optional[int] = None, ttl_sec: Optional[int] = None) -> None:
+        """⚙️ Оновлює місткість / TTL (None — лишити як є) та виселяє надлишок."""
+        if max_entries is not None:
+            self._max = max(1, int(max_entries))
+            while len(self._data) > self._max:
+                self._data.popitem(last=False)
+        if ttl_sec is not None:
+            self._ttl = int(ttl_sec)
+
+    def get(self, url: str) -> Optional[ProductHint]:
+        """Повертає свіжу підказку або None."""
+        key = hint_key(url)
+        hint = self._data.get(key)
+        if hint is None:
+            return None
+        if self._ttl > 0 and (time.time() - hint.fetched_at) > self._ttl:
+            self._data.pop(key, None)                  # 🧹 Застарілий запис
+            return None
+        self._data.move_to_end(key, last=True)         # 🔁 Найсвіжіше використання
+        return hint
+
+    def put(self, hint: ProductHint) -> None:
+        """Зберігає підказку та виселяє найстаріші записи."""
+        key = hint_key(hint.url)
+        if not key:
+            return
+        self._data[key] = hint
+        self._data.move_to_end(key, last=True)
+        while len(self._data) > self._max:
+            self._data.popitem(last=False)
+
+    def put_many(self, hints: Iterable[ProductHint]) -> int:
+        """Пакетно зберігає підказки, повертає кількість записаних."""
+        count = 0
+        for hint in hints:
+            self.put(hint)
+            count += 1
+        return count
+
+    def invalidate(self, url: str) -> None:
+        """Видаляє підказку для URL."""
+        self._data.pop(hint_key(url), None)
+
+    def __len__(self) -> int:
+        return len(self._data)
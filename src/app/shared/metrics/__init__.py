@@ -2,7 +2,7 @@
 """
 📊 Пакет агрегованих метрик Prometheus для застосунку.
 
-🔹 Охоплює контентні, OCR- та парсингові лічильники.
+🔹 Охоплює контентні, OCR-, парсингові, пошукові, доставкові, колекційні та медійні метрики.
 🔹 Містить легкий bootstrap експортер `/metrics`.
 🔹 Сприяє централізованому моніторингу сервісів.
 """
@@ -16,6 +16,29 @@ from .content import ALT_CACHE_HIT, ALT_FAILURE, ALT_SUCCESS
 from .ocr import OCR_CACHE_HIT, OCR_CACHE_MISS, OCR_FAILURE, OCR_SUCCESS
 from .parsing import PARSING_FAILURE, PARSING_SUCCESS
 
+# 🔍 Пошук товарів
+from .search import SEARCH_CACHE_HIT, SEARCH_CACHE_MISS
+
+# 📬 Доставка карток
+from .delivery import PRODUCT_TIME_TO_FIRST_MESSAGE, PRODUCT_TIME_TO_FULL_CARD
+
+# 🧺 Колекції
+from .collection import (
+    COLLECTION_CONCURRENCY_LIMIT,
+    COLLECTION_PIPELINE_BUFFER_DEPTH,
+    COLLECTION_SEND_LAG_SECONDS,
+)
+
+# 🖼️ Підготовка фото
+from .media import (
+    MEDIA_FILE_ID_CACHE_TOTAL,
+    MEDIA_IMAGE_FETCH_SECONDS,
+    MEDIA_NORMALIZE_BYTES_SAVED_TOTAL,
+    MEDIA_NORMALIZE_SECONDS,
+    MEDIA_STACK_PREPARE_SECONDS,
+    MEDIA_STORE_TOTAL,
+)
+
 # 🚀 Експортер Prometheus
 from .exporters import maybe_start_prometheus
 
@@ -32,5 +55,18 @@ __all__ = [
     "OCR_CACHE_MISS",
     "PARSING_SUCCESS",
     "PARSING_FAILURE",
+    "SEARCH_CACHE_HIT",
+    "SEARCH_CACHE_MISS",
+    "PRODUCT_TIME_TO_FIRST_MESSAGE",
+    "PRODUCT_TIME_TO_FULL_CARD",
+    "COLLECTION_CONCURRENCY_LIMIT",
+    "COLLECTION_PIPELINE_BUFFER_DEPTH",
+    "COLLECTION_SEND_LAG_SECONDS",
+    "MEDIA_FILE_ID_CACHE_TOTAL",
+    "MEDIA_IMAGE_FETCH_SECONDS",
+    "MEDIA_NORMALIZE_BYTES_SAVED_TOTAL",
+    "MEDIA_NORMALIZE_SECONDS",
+    "MEDIA_STACK_PREPARE_SECONDS",
+    "MEDIA_STORE_TOTAL",
     "maybe_start_prometheus",
 ]
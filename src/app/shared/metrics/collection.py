@@ -0,0 +1,44 @@
+# 🧺 app/shared/metrics/collection.py
+# -*- coding: utf-8 -*-
+"""
+🧺 Метрики Prometheus для обробки колекцій.
+
+🔹 Поточний ліміт паралелізму CollectionRunner (AIMD: росте на здорових вікнах, падає на тротлінгу).
+🔹 Глибина буферів конвеєра (лейбл `buffer`: `send_queue` | `reorder`).
+🔹 Затримка надсилання: від готовності картки до старту відправки.
+"""
+
+from __future__ import annotations
+
+# 🌐 Зовнішні бібліотеки
+from prometheus_client import Gauge, Histogram  # 📈 Реєстрація Prometheus-метрик
+
+_LAG_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60, 120)  # ⏱️ Секунди очікування відправки
+
+# ================================
+# 🚦 ЛІМІТ ПАРАЛЕЛІЗМУ
+# ================================
+COLLECTION_CONCURRENCY_LIMIT = Gauge(
+    "collection_concurrency_limit",                   # 🆔 Назва метрики
+    "Current adaptive concurrency limit of the collection runner",  # 📝 Опис метрики
+)
+
+# ================================
+# 📥 КОНВЕЄР НАДСИЛАННЯ
+# ================================
+COLLECTION_PIPELINE_BUFFER_DEPTH = Gauge(
+    "collection_pipeline_buffer_depth",               # 🆔 Назва метрики
+    "Prepared cards waiting in the collection send pipeline",  # 📝 Опис метрики
+    labelnames=("buffer",),                           # 🔖 send_queue | reorder
+)
+
+COLLECTION_SEND_LAG_SECONDS = Histogram(
+    "collection_send_lag_seconds",                    # 🆔 Назва метрики
+    "Seconds from a prepared card to the start of its Telegram send",  # 📝 Опис метрики
+    buckets=_LAG_BUCKETS,
+)
+
+# ================================
+# 📦 ЕКСПОРТ МОДУЛЯ
+# ================================
+__all__ = ["COLLECTION_CONCURRENCY_LIMIT", "COLLECTION_PIPELINE_BUFFER_DEPTH", "COLLECTION_SEND_LAG_SECONDS"]
@@ -0,0 +1,41 @@
+# 📬 app/shared/metrics/delivery.py
+# -*- coding: utf-8 -*-
+"""
+📬 Метрики Prometheus для доставки карток товару в Telegram.
+
+🔹 Час від отримання посилання до першого повідомлення картки (time-to-first-message).
+🔹 Час до повної картки (усі блоки надіслано).
+🔹 Лейбл `mode`: `streaming` (прогресивна доставка) або `batch` (уся картка після обробки).
+"""
+
+from __future__ import annotations
+
+# 🌐 Зовнішні бібліотеки
+from prometheus_client import Histogram  # 📈 Реєстрація Prometheus-гістограм
+
+_BUCKETS = (1, 2, 3, 5, 8, 13, 20, 30, 45, 60, 90, 120, 180)  # ⏱️ Секунди
+
+# ================================
+# ⏱️ ПЕРШЕ ПОВІДОМЛЕННЯ
+# ================================
+PRODUCT_TIME_TO_FIRST_MESSAGE = Histogram(
+    "product_time_to_first_message_seconds",          # 🆔 Назва метрики
+    "Seconds from product link to the first card message",  # 📝 Опис метрики
+    labelnames=("mode",),                             # 🔖 streaming | batch
+    buckets=_BUCKETS,
+)
+
+# ================================
+# 🏁 ПОВНА КАРТКА
+# ================================
+PRODUCT_TIME_TO_FULL_CARD = Histogram(
+    "product_time_to_full_card_seconds",              # 🆔 Назва метрики
+    "Seconds from product link to the last card block",  # 📝 Опис метрики
+    labelnames=("mode",),                             # 🔖 streaming | batch
+    buckets=_BUCKETS,
+)
+
+# ================================
+# 📦 ЕКСПОРТ МОДУЛЯ
+# ================================
+__all__ = ["PRODUCT_TIME_TO_FIRST_MESSAGE", "PRODUCT_TIME_TO_FULL_CARD"]
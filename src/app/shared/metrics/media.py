@@ -0,0 +1,84 @@
+# 🖼️ app/shared/metrics/media.py
+# -*- coding: utf-8 -*-
+"""
+🖼️ Метрики Prometheus для підготовки фото карток товару.
+
+🔹 Час завантаження кожного фото (лейбл `outcome`: `ok` | `failed`).
+🔹 Час підготовки всього стеку фото (паралельне завантаження з обмеженням).
+🔹 Події кешу Telegram `file_id` (лейбл `event`: `hit` | `miss` | `stored` | `invalidated`).
+🔹 Нормалізація фото перед upload: час (лейбл `outcome`) і заощаджені байти.
+🔹 Події спільного медіасховища (лейбл `event`: `hit` | `miss` | `expired` | `stored` | `evicted`).
+"""
+
+from __future__ import annotations
+
+# 🌐 Зовнішні бібліотеки
+from prometheus_client import Counter, Histogram  # 📈 Реєстрація Prometheus-метрик
+
+_IMAGE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30)  # ⏱️ Секунди на одне фото
+_STACK_BUCKETS = (0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60)         # ⏱️ Секунди на стек
+_NORMALIZE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5)  # ⏱️ Секунди на перекодування
+
+# ================================
+# 🖼️ ОДНЕ ФОТО
+# ================================
+MEDIA_IMAGE_FETCH_SECONDS = Histogram(
+    "media_image_fetch_seconds",                      # 🆔 Назва метрики
+    "Seconds to download one product image",          # 📝 Опис метрики
+    labelnames=("outcome",),                          # 🔖 ok | failed
+    buckets=_IMAGE_BUCKETS,
+)
+
+# ================================
+# 🗂️ СТЕК ФОТО
+# ================================
+MEDIA_STACK_PREPARE_SECONDS = Histogram(
+    "media_stack_prepare_seconds",                    # 🆔 Назва метрики
+    "Seconds to prepare the whole product photo stack",  # 📝 Опис метрики
+    buckets=_STACK_BUCKETS,
+)
+
+# ================================
+# 📎 КЕШ FILE_ID
+# ================================
+MEDIA_FILE_ID_CACHE_TOTAL = Counter(
+    "media_file_id_cache_total",                      # 🆔 Назва метрики
+    "Telegram file_id cache events for product photos",  # 📝 Опис метрики
+    labelnames=("event",),                            # 🔖 hit | miss | stored | invalidated
+)
+
+# ================================
+# 🪄 НОРМАЛІЗАЦІЯ
+# ================================
+MEDIA_NORMALIZE_SECONDS = Histogram(
+    "media_normalize_seconds",                        # 🆔 Назва метрики
+    "Seconds to resize/recompress one product photo",  # 📝 Опис метрики
+    labelnames=("outcome",),                          # 🔖 normalized | cached | skipped | failed
+    buckets=_NORMALIZE_BUCKETS,
+)
+
+MEDIA_NORMALIZE_BYTES_SAVED_TOTAL = Counter(
+    "media_normalize_bytes_saved_total",              # 🆔 Назва метрики
+    "Upload bytes saved by photo normalization",      # 📝 Опис метрики
+)
+
+# ================================
+# 🗄️ МЕДІАСХОВИЩЕ
+# ================================
+MEDIA_STORE_TOTAL = Counter(
+    "media_store_total",                              # 🆔 Назва метрики
+    "Content-addressed media store events",           # 📝 Опис метрики
+    labelnames=("event",),                            # 🔖 hit | miss | expired | stored | evicted
+)
+
+# ================================
+# 📦 ЕКСПОРТ МОДУЛЯ
+# ================================
+__all__ = [
+    "MEDIA_FILE_ID_CACHE_TOTAL",
+    "MEDIA_IMAGE_FETCH_SECONDS",
+    "MEDIA_NORMALIZE_BYTES_SAVED_TOTAL",
+    "MEDIA_NORMALIZE_SECONDS",
+    "MEDIA_STACK_PREPARE_SECONDS",
+    "MEDIA_STORE_TOTAL",
+]
@@ -0,0 +1,35 @@
+# 🔍 app/shared/metrics/search.py
+# -*- coding: utf-8 -*-
+"""
+🔍 Метрики Prometheus для пошуку товарів за текстовим запитом.
+
+🔹 Рахує потрапляння у кеш запит → URL (позитивні та негативні).
+🔹 Рахує промахи, що призвели до реального (браузерного) пошуку.
+"""
+
+from __future__ import annotations
+
+# 🌐 Зовнішні бібліотеки
+from prometheus_client import Counter  # 📈 Реєстрація Prometheus-лічильників
+
+# ================================
+# ♻️ ПОТРАПЛЯННЯ У КЕШ
+# ================================
+SEARCH_CACHE_HIT = Counter(
+    "search_cache_hit_total",                         # 🆔 Назва метрики
+    "Search query cache hits",                        # 📝 Опис метрики
+    labelnames=("kind",),                             # 🔖 positive | negative («нічого не знайдено»)
+)
+
+# ================================
+# 🕳️ ПРОМАХИ КЕШУ
+# ================================
+SEARCH_CACHE_MISS = Counter(
+    "search_cache_miss_total",                        # 🆔 Назва метрики
+    "Search query cache misses",                      # 📝 Опис метрики
+)
+
+# ================================
+# 📦 ЕКСПОРТ МОДУЛЯ
+# ================================
+__all__ = ["SEARCH_CACHE_HIT", "SEARCH_CACHE_MISS"]
@@ -0,0 +1,53 @@
+# 🧵 app/shared/tracing/__init__.py
+"""
+🧵 Пакет трасування запитів.
+
+🔹 Trace id у `contextvars`, вкладені спани з таймінгами етапів.
+🔹 JSONL-приймач завершених трейсів.
+🔹 Текстовий водоспад для адмін-команди `/traces`.
+"""
+
+from __future__ import annotations
+
+# 🧵 Трейсер і спани
+from .tracer import (
+    STATUS_ERROR,
+    STATUS_OK,
+    SpanRecord,
+    Trace,
+    TraceSink,
+    Tracer,
+    configure_tracer,
+    current_trace,
+    current_trace_id,
+    get_tracer,
+    span,
+    traced,
+)
+
+# 📤 Приймачі
+from .sink import DEFAULT_TRACES_PATH, JsonlTraceSink
+
+# 🌊 Візуалізація
+from .waterfall import render_waterfall
+
+# ================================
+# 📦 ЕКСПОРТ ПАКЕТУ
+# ================================
+__all__ = [
+    "DEFAULT_TRACES_PATH",
+    "JsonlTraceSink",
+    "STATUS_ERROR",
+    "STATUS_OK",
+    "SpanRecord",
+    "Trace",
+    "TraceSink",
+    "Tracer",
+    "configure_tracer",
+    "current_trace",
+    "current_trace_id",
+    "get_tracer",
+    "render_waterfall",
+    "span",
+    "traced",
+]
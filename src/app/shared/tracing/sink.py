@@ -0,0 +1,52 @@
+# 📤 app/shared/tracing/sink.py
+"""
+📤 JSONL-приймач завершених трейсів.
+
+🔹 Один трейс — один рядок JSON (append), директорія створюється автоматично.
+🔹 `min_total_ms` відсікає швидкі запити, щоб файл ріс лише на цікавих випадках.
+🔹 Будь-яка помилка запису лише логується — трасування ніколи не ламає обробку.
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import json                                                         # 🧾 Серіалізація трейсів
+import logging                                                      # 🧾 Логування
+import os                                                           # ↩️ Розділювач рядків
+import threading                                                    # 🔒 Послідовний append
+from pathlib import Path                                            # 📂 Підготовка директорії
+
+# 🧩 Внутрішні модулі проєкту
+from app.shared.tracing.tracer import Trace                         # 🧵 DTO трейсу
+from app.shared.utils.logger import LOG_NAME                        # 🏷️ Базовий логер
+
+logger = logging.getLogger(f"{LOG_NAME}.tracing")
+
+DEFAULT_TRACES_PATH = "var/telemetry/traces.jsonl"                  # 📁 Шлях за замовчуванням
+
+
+class JsonlTraceSink:
+    """📤 Дописує завершені трейси у JSONL-файл."""
+
+    def __init__(self, path: str | Path = DEFAULT_TRACES_PATH, *, min_total_ms: float = 0.0) -> None:
+        self.path = Path(path)
+        self.min_total_ms = max(0.0, float(min_total_ms))
+        self._lock = threading.Lock()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ tracing.path_init_failed | path=%s error=%s", self.path, exc)
+
+    def write(self, trace: Trace) -> None:
+        """📝 Один рядок JSON на трейс (швидкі трейси нижче порогу пропускаються)."""
+        if (trace.total_ms or 0.0) < self.min_total_ms:
+            return
+        line = json.dumps(trace.to_dict(), ensure_ascii=False, default=str)
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as file:
+                file.write(line + os.linesep)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("⚠️ tracing.file_write_failed | path=%s error=%s", self.path, exc)
+
+
+__all__ = ["DEFAULT_TRACES_PATH", "JsonlTraceSink"]
@@ -0,0 +1,292 @@
+# 🧵 app/shared/tracing/tracer.py
+"""
+🧵 Легковагове трасування запитів: trace id у `contextvars` + вкладені спани з таймінгами.
+
+🔹 `Tracer.trace(name)` відкриває кореневий трейс (або вкладений спан, якщо трейс уже активний).
+🔹 `span(name)` / `traced(name, awaitable)` — спани всередині поточного трейсу; без трейсу — no-op.
+🔹 Дочірні `asyncio`-задачі успадковують контекст, тож паралельні етапи потрапляють у той самий трейс.
+🔹 Завершені трейси йдуть у кільцевий буфер (для `/traces`) і в `TraceSink` (JSONL).
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import contextvars                                                  # 🧬 Пропагація трейсу між задачами
+import itertools                                                    # 🔢 Лічильник span id
+import logging                                                      # 🧾 Логування
+import threading                                                    # 🔒 Захист кільцевого буфера
+import time                                                         # ⏱️ Монотонний годинник
+import uuid                                                         # 🆔 Trace id
+from collections import deque                                       # 🔁 Кільцевий буфер трейсів
+from contextlib import contextmanager                               # 🧰 Контекст-менеджери спанів
+from dataclasses import dataclass, field                            # 🧱 DTO
+from typing import Any, Awaitable, Deque, Dict, Iterator, List, Optional, Protocol, TypeVar  # 🧰 Типи
+
+# 🧩 Внутрішні модулі проєкту
+from app.shared.utils.logger import LOG_NAME                        # 🏷️ Базовий логер
+
+logger = logging.getLogger(f"{LOG_NAME}.tracing")
+
+T = TypeVar("T")
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+_DEFAULT_MAX_SPANS = 256                                            # 🔢 Запобіжник для дуже «балакучих» трейсів
+
+
+# ================================
+# 🧱 DTO
+# ================================
+@dataclass(slots=True)
+class SpanRecord:
+    """⏱️ Один спан: час відносно старту трейсу (мс) і батьківський спан."""
+
+    span_id: int
+    parent_id: Optional[int]
+    name: str
+    start_ms: float
+    end_ms: Optional[float] = None
+    status: str = STATUS_OK
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return max(0.0, (self.end_ms if self.end_ms is not None else self.start_ms) - self.start_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.span_id,
+            "parent": self.parent_id,
+            "name": self.name,
+            "start_ms": round(self.start_ms, 1),
+            "duration_ms": round(self.duration_ms, 1),
+            "status": self.status,
+            "attrs": self.attrs,
+        }
+
+
+@dataclass(slots=True)
+class Trace:
+    """🧵 Трейс одного запиту (товар, елемент колекції тощо)."""
+
+    trace_id: str
+    name: str
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.time)            # 🕰️ Wall-clock (для JSONL)
+    spans: List[SpanRecord] = field(default_factory=list)
+    status: str = STATUS_OK
+    total_ms: Optional[float] = None
+    dropped_spans: int = 0
+    max_spans: int = _DEFAULT_MAX_SPANS
+    _origin: float = field(default_factory=time.perf_counter, repr=False)
+    _ids: Iterator[int] = field(default_factory=lambda: itertools.count(1), repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.total_ms is not None
+
+    def now_ms(self) -> float:
+        return (time.perf_counter() - self._origin) * 1000.0
+
+    def open_span(self, name: str, parent_id: Optional[int], attrs: Dict[str, Any]) -> Optional[SpanRecord]:
+        """➕ Реєструє спан; після `max_spans` лише рахує відкинуті."""
+        if len(self.spans) >= self.max_spans:
+            self.dropped_spans += 1
+            return None
+        record = SpanRecord(span_id=next(self._ids), parent_id=parent_id, name=name, start_ms=self.now_ms(), attrs=attrs)
+        self.spans.append(record)
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "started_at": round(self.started_at, 3),
+            "total_ms": round(self.total_ms or 0.0, 1),
+            "status": self.status,
+            "attrs": self.attrs,
+            "dropped_spans": self.dropped_spans,
+            "spans": [span.to_dict() for span in self.spans],
+        }
+
+
+class TraceSink(Protocol):
+    """📤 Куди віддавати завершені трейси (JSONL-файл, лог тощо)."""
+
+    def write(self, trace: Trace) -> None: ...
+
+
+# ================================
+# 🧬 КОНТЕКСТ
+# ================================
+_CURRENT_TRACE: "contextvars.ContextVar[Optional[Trace]]" = contextvars.ContextVar("trace", default=None)
+_CURRENT_SPAN: "contextvars.ContextVar[Optional[int]]" = contextvars.ContextVar("trace_span", default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    """🧵 Активний трейс у поточному контексті (або None)."""
+    return _CURRENT_TRACE.get()
+
+
+def current_trace_id() -> Optional[str]:
+    """🆔 Id активного трейсу — зручно для кореляції логів."""
+    trace = _CURRENT_TRACE.get()
+    return trace.trace_id if trace is not None else None
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Optional[SpanRecord]]:
+    """⏱️ Спан у поточному трейсі; без активного трейсу нічого не робить."""
+    trace = _CURRENT_TRACE.get()
+    record = trace.open_span(name, _CURRENT_SPAN.get(), attrs) if trace is not None and not trace.finished else None
+    if record is None:
+        yield None
+        return
+    token = _CURRENT_SPAN.set(record.span_id)
+    try:
+        yield record
+    except BaseException as exc:
+        record.status = STATUS_ERROR
+        record.attrs.setdefault("error", type(exc).__name__)
+        raise
+    finally:
+        record.end_ms = trace.now_ms()  # type: ignore[union-attr]
+        _CURRENT_SPAN.reset(token)
+
+
+async def traced(name: str, awaitable: Awaitable[T], **attrs: Any) -> T:
+    """⏱️ `await` під спаном — для `asyncio.gather(...)` та точкових викликів."""
+    with span(name, **attrs):
+        return await awaitable
+
+
+# ================================
+# 🧵 ТРЕЙСЕР
+# ================================
+class Tracer:
+    """🧵 Створює трейси, тримає останні завершені в пам'яті та віддає їх у sink."""
+
+    def __init__(
+        self,
+        sink: Optional[TraceSink] = None,
+        *,
+        enabled: bool = True,
+        keep: int = 200,
+        max_spans: int = _DEFAULT_MAX_SPANS,
+    ) -> None:
+        self.enabled = enabled                                      # 🔛 Вимкнений трейсер — повний no-op
+        self._sink = sink                                           # 📤 JSONL чи інший приймач
+        self._max_spans = max(1, int(max_spans))
+        self._recent: Deque[Trace] = deque(maxlen=max(1, int(keep)))
+        self._lock = threading.Lock()
+
+    # ================================
+    # ▶️ ЖИТТЄВИЙ ЦИКЛ
+    # ================================
+    def start(self, name: str, **attrs: Any) -> Optional[Trace]:
+        """▶️ Новий трейс без активації (для сценаріїв, де робота рознесена по місцях)."""
+        if not self.enabled:
+            return None
+        return Trace(trace_id=uuid.uuid4().hex[:16], name=name, attrs=attrs, max_spans=self._max_spans)
+
+    @contextmanager
+    def activate(self, trace: Optional[Trace]) -> Iterator[Optional[Trace]]:
+        """🧬 Робить трейс поточним на час блоку (None — no-op)."""
+        if trace is None:
+            yield None
+            return
+        trace_token = _CURRENT_TRACE.set(trace)
+        span_token = _CURRENT_SPAN.set(None)
+        try:
+            yield trace
+        finally:
+            _CURRENT_SPAN.reset(span_token)
+            _CURRENT_TRACE.reset(trace_token)
+
+    def finish(self, trace: Optional[Trace], *, status: Optional[str] = None) -> None:
+        """🏁 Закриває трейс (ідемпотентно), кладе у буфер і віддає у sink."""
+        if trace is None or trace.finished:
+            return
+        trace.total_ms = trace.now_ms()
+        if status is not None:
+            trace.status = status
+        with self._lock:
+            self._recent.append(trace)
+        if self._sink is not None:
+            try:
+                self._sink.write(trace)
+            except Exception:  # noqa: BLE001 — трасування не ламає запит
+                logger.debug("⚠️ Не вдалося записати трейс %s", trace.trace_id, exc_info=True)
+        logger.debug("🧵 trace.finished | %s %s %.0fms spans=%d", trace.name, trace.trace_id, trace.total_ms, len(trace.spans))
+
+    @contextmanager
+    def trace(self, name: str, **attrs: Any) -> Iterator[Optional[Trace]]:
+        """🧵 Кореневий трейс; якщо трейс уже активний — вкладений спан у ньому."""
+        active = _CURRENT_TRACE.get()
+        if active is not None and not active.finished:
+            with span(name, **attrs):
+                yield active
+            return
+        trace = self.start(name, **attrs)
+        if trace is None:
+            yield None
+            return
+        try:
+            with self.activate(trace):
+                yield trace
+        except BaseException:
+            self.finish(trace, status=STATUS_ERROR)
+            raise
+        self.finish(trace)
+
+    # ================================
+    # 🔎 ЧИТАННЯ
+    # ================================
+    def recent(self) -> List[Trace]:
+        """📜 Завершені трейси з буфера, від найновішого."""
+        with self._lock:
+            return list(reversed(self._recent))
+
+    def recent_slow(self, limit: int, *, min_ms: float = 0.0) -> List[Trace]:
+        """🐢 Останні `limit` трейсів, довших за `min_ms` (від найновішого)."""
+        slow = [trace for trace in self.recent() if (trace.total_ms or 0.0) >= min_ms]
+        return slow[: max(0, int(limit))]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._recent.clear()
+
+
+# ================================
+# 🌍 ГЛОБАЛЬНИЙ ТРЕЙСЕР
+# ================================
+_TRACER = Tracer()                                                  # 🧵 За замовчуванням — лише пам'ять
+
+
+def get_tracer() -> Tracer:
+    """🌍 Трейсер застосунку (налаштовується контейнером)."""
+    return _TRACER
+
+
+def configure_tracer(tracer: Tracer) -> Tracer:
+    """🔧 Підміняє глобальний трейсер (контейнер на старті, тести)."""
+    global _TRACER
+    _TRACER = tracer
+    return tracer
+
+
+__all__ = [
+    "STATUS_ERROR",
+    "STATUS_OK",
+    "SpanRecord",
+    "Trace",
+    "TraceSink",
+    "Tracer",
+    "configure_tracer",
+    "current_trace",
+    "current_trace_id",
+    "get_tracer",
+    "span",
+    "traced",
+]
@@ -0,0 +1,68 @@
+# 🌊 app/shared/tracing/waterfall.py
+"""
+🌊 Текстовий «водоспад» трейсу для Telegram/логів.
+
+🔹 Кожен спан — рядок: відступ за вкладеністю, смуга на спільній шкалі часу, тривалість.
+🔹 Моноширинний вивід (для `<pre>`), довгі трейси обрізаються за `max_rows`.
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import time                                                         # 🕰️ Час старту трейсу
+from typing import Dict, List, Optional                             # 🧰 Типи
+
+# 🧩 Внутрішні модулі проєкту
+from app.shared.tracing.tracer import STATUS_ERROR, SpanRecord, Trace  # 🧵 Трейс і спани
+
+_NAME_WIDTH = 22                                                    # 🏷️ Колонка з назвою спану
+_BAR = "█"
+_GAP = "·"
+
+
+def _format_ms(value: float) -> str:
+    return f"{value / 1000.0:.2f}s" if value >= 1000.0 else f"{value:.0f}ms"
+
+
+def _ordered_with_depth(spans: List[SpanRecord]) -> List[tuple[SpanRecord, int]]:
+    """🌳 Обхід у глибину: батько, потім його діти за часом старту."""
+    children: Dict[Optional[int], List[SpanRecord]] = {}
+    known = {span.span_id for span in spans}
+    for span in spans:
+        parent = span.parent_id if span.parent_id in known else None
+        children.setdefault(parent, []).append(span)
+    ordered: List[tuple[SpanRecord, int]] = []
+
+    def _walk(parent: Optional[int], depth: int) -> None:
+        for child in sorted(children.get(parent, []), key=lambda s: s.start_ms):
+            ordered.append((child, depth))
+            _walk(child.span_id, depth + 1)
+
+    _walk(None, 0)
+    return ordered
+
+
+def render_waterfall(trace: Trace, *, width: int = 24, max_rows: int = 40) -> str:
+    """🌊 Рендерить трейс як таблицю-водоспад (без HTML-екранування)."""
+    total = max(trace.total_ms or 0.0, max((s.start_ms + s.duration_ms for s in trace.spans), default=0.0), 1.0)
+    started = time.strftime("%H:%M:%S", time.localtime(trace.started_at))
+    subject = trace.attrs.get("url") or trace.attrs.get("title") or ""
+    lines = [f"{trace.name} · {_format_ms(trace.total_ms or 0.0)} · {started} · {trace.trace_id}"]
+    if subject:
+        lines.append(str(subject))
+
+    rows = _ordered_with_depth(trace.spans)
+    for record, depth in rows[:max_rows]:
+        offset = min(width - 1, int(record.start_ms / total * width))
+        length = max(1, min(width - offset, round(record.duration_ms / total * width)))
+        bar = (_GAP * offset + _BAR * length).ljust(width, " ")
+        label = ("  " * depth + record.name)[:_NAME_WIDTH].ljust(_NAME_WIDTH)
+        mark = " ✖" if record.status == STATUS_ERROR else ""
+        lines.append(f"{label} {bar} {_format_ms(record.duration_ms):>7}{mark}")
+    hidden = len(rows) - max_rows + trace.dropped_spans
+    if hidden > 0:
+        lines.append(f"… ще {hidden} спанів")
+    return "\n".join(lines)
+
+
+__all__ = ["render_waterfall"]
@@ -44,9 +44,29 @@ from .locale import lang_from_telegram_code, normalize_locale
 # 💰 Числові утиліти
 from .number import decimal_from_price_str, sanitize_price_text
 
+# 🔤 Нормалізація пошукових рядків
+from .search_text import normalize_query, tokenize_query
+
 # 📏 Нормалізація розмірів
 from .size_norm import normalize_size_token, normalize_stock_map
 
+# 🚦 Адаптивний паралелізм
+from .adaptive_limiter import (
+    AdaptiveConcurrencyLimiter,
+    AdaptiveLimitSettings,
+    LimiterPermit,
+    LimiterSignal,
+)
+
+# 🛬 Дедуплікація спільної роботи
+from .single_flight import (
+    SingleFlightRegistry,
+    activate as activate_single_flight,
+    current_single_flight,
+    fingerprint,
+    single_flight,
+)
+
 # 🧾 Результати
 from .result import Err, Ok, Result, is_err, is_ok, map_ok
 
@@ -90,9 +110,23 @@ __all__ = [
     # number utils
     "sanitize_price_text",
     "decimal_from_price_str",
+    # search text
+    "normalize_query",
+    "tokenize_query",
     # size normalization
     "normalize_size_token",
     "normalize_stock_map",
+    # adaptive concurrency
+    "AdaptiveConcurrencyLimiter",
+    "AdaptiveLimitSettings",
+    "LimiterPermit",
+    "LimiterSignal",
+    # single flight
+    "SingleFlightRegistry",
+    "activate_single_flight",
+    "current_single_flight",
+    "fingerprint",
+    "single_flight",
     # result
     "Ok",
     "Err",
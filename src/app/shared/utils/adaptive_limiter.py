@@ -0,0 +1,219 @@
+# 🚦 app/shared/utils/adaptive_limiter.py
+"""
+🚦 Адаптивний (AIMD) обмежувач паралелізму.
+
+🔹 Additive increase: після вікна здорових результатів (p95 ≤ цілі, частка помилок ≤ порогу) ліміт +1.
+🔹 Multiplicative decrease: сигнал тротлінгу (429 / Cloudflare / таймаут) або нездорове вікно — ліміт × factor.
+🔹 Одне зменшення на «покоління»: відповіді задач, стартованих до зменшення, ліміт повторно не ріжуть.
+🔹 Ліміт росте лише коли його справді вичерпано — простій не роздуває паралелізм.
+🔹 Межі `min_limit`/`max_limit`; поточне значення віддається через `on_change` (наприклад, Prometheus Gauge).
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import asyncio                                                      # 🔄 Очікування вільного слоту
+import contextlib                                                   # 🧰 asynccontextmanager
+import logging                                                      # 🧾 Логування змін ліміту
+import math                                                         # 🧮 Перцентиль
+from dataclasses import dataclass                                   # 🧱 Налаштування / дозвіл
+from enum import Enum                                               # 🏷️ Тип сигналу
+from typing import AsyncIterator, Callable, List, Optional          # 🧰 Типи
+
+# 🧩 Внутрішні модулі проєкту
+from app.shared.utils.logger import LOG_NAME                        # 🏷️ Базовий логер
+
+logger = logging.getLogger(f"{LOG_NAME}.adaptive_limiter")
+
+
+class LimiterSignal(str, Enum):
+    """Результат однієї операції з точки зору обмежувача."""
+
+    OK = "ok"
+    ERROR = "error"
+    THROTTLED = "throttled"
+
+
+# ================================
+# ⚙️ НАЛАШТУВАННЯ
+# ================================
+@dataclass(frozen=True)
+class AdaptiveLimitSettings:
+    """⚙️ Параметри AIMD."""
+
+    initial: int = 4                                                # 🚦 Стартовий ліміт
+    min_limit: int = 1                                              # ⬇️ Нижня межа
+    max_limit: int = 8                                              # ⬆️ Верхня межа
+    window: int = 8                                                 # 🪟 Скільки результатів на одне рішення
+    target_p95_sec: float = 45.0                                    # ⏱️ Здорова p95 латентність
+    max_error_rate: float = 0.25                                    # 🚨 Здорова частка помилок
+    decrease_factor: float = 0.5                                    # ✂️ Множник при зменшенні
+
+    def clamp(self, value: int) -> int:
+        """📏 Обрізає значення до [min_limit, max_limit]."""
+        low = max(1, int(self.min_limit))
+        return max(low, min(max(low, int(self.max_limit)), int(value)))
+
+
+@dataclass(frozen=True, slots=True)
+class LimiterPermit:
+    """🎫 Зайнятий слот: покоління ліміту, в якому стартувала задача."""
+
+    epoch: int
+
+
+# ================================
+# 🚦 ОБМЕЖУВАЧ
+# ================================
+class AdaptiveConcurrencyLimiter:
+    """🚦 Семафор зі змінним лімітом, який підлаштовується під латентність і тротлінг."""
+
+    def __init__(
+        self,
+        settings: Optional[AdaptiveLimitSettings] = None,
+        *,
+        on_change: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        self.settings = settings or AdaptiveLimitSettings()
+        self._limit = self.settings.clamp(self.settings.initial)
+        self._on_change = on_change
+        self._in_flight = 0
+        self._epoch = 0                                             # 🔢 Зростає з кожним зменшенням
+        self._saturated = False                                     # 📈 Чи впиралися в ліміт у поточному вікні
+        self._latencies: List[float] = []
+        self._errors = 0
+        self._cond: Optional[asyncio.Condition] = None
+        self._cond_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._publish()
+
+    # ================================
+    # 📖 СТАН
+    # ================================
+    @property
+    def limit(self) -> int:
+        """🚦 Поточний ліміт одночасних операцій."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """🏃 Скільки слотів зайнято зараз."""
+        return self._in_flight
+
+    # ================================
+    # 🎫 СЛОТИ
+    # ================================
+    async def acquire(self) -> LimiterPermit:
+        """⏳ Чекає, поки зайнятих слотів стане менше за ліміт."""
+        cond = self._condition()
+        async with cond:
+            await cond.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+            if self._in_flight >= self._limit:
+                self._saturated = True
+            return LimiterPermit(epoch=self._epoch)
+
+    async def release(self) -> None:
+        """🔓 Звільняє слот і будить очікувачів."""
+        cond = self._condition()
+        async with cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            cond.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[LimiterPermit]:
+        """🎫 `async with limiter.slot() as permit:` — acquire/release навколо блоку."""
+        permit = await self.acquire()
+        try:
+            yield permit
+        finally:
+            await self.release()
+
+    # ================================
+    # 📊 ЗВОРОТНИЙ ЗВ'ЯЗОК
+    # ================================
+    def record(self, permit: LimiterPermit, latency_s: float, signal: LimiterSignal) -> None:
+        """
+        📊 Фіксує результат операції й за потреби змінює ліміт.
+
+        THROTTLED ріже ліміт одразу (раз на покоління), OK/ERROR накопичуються у вікно.
+        """
+        if permit.epoch != self._epoch:
+            return                                                  # 🕰️ Стартувала до останнього зменшення
+        if signal is LimiterSignal.THROTTLED:
+            self._decrease("throttled")
+            return
+        self._latencies.append(max(0.0, float(latency_s)))
+        self._errors += int(signal is LimiterSignal.ERROR)
+        if len(self._latencies) < max(1, int(self.settings.window)):
+            return
+
+        p95 = _percentile(self._latencies, 0.95)
+        error_rate = self._errors / len(self._latencies)
+        reason = f"p95={p95:.1f}s errors={error_rate:.0%}"
+        if p95 > self.settings.target_p95_sec or error_rate > self.settings.max_error_rate:
+            self._decrease(reason)
+            return
+        if self._saturated:
+            self._set_limit(self._limit + 1, reason)                # ➕ Здорове вікно під навантаженням
+        self._reset_window()
+
+    # ================================
+    # 🧰 ВНУТРІШНЄ
+    # ================================
+    def _decrease(self, reason: str) -> None:
+        self._epoch += 1
+        self._set_limit(math.floor(self._limit * self.settings.decrease_factor), reason)
+        self._reset_window()
+
+    def _set_limit(self, value: int, reason: str) -> None:
+        value = self.settings.clamp(value)
+        if value == self._limit:
+            return
+        logger.info("🚦 Ліміт паралелізму %d → %d (%s)", self._limit, value, reason)
+        self._limit = value
+        self._publish()
+        cond = self._cond
+        if cond is not None and self._cond_loop is _running_loop():
+            asyncio.ensure_future(self._wake(cond))                 # 🔔 Більший ліміт — будимо очікувачів
+
+    @staticmethod
+    async def _wake(cond: asyncio.Condition) -> None:
+        async with cond:
+            cond.notify_all()
+
+    def _reset_window(self) -> None:
+        self._latencies.clear()
+        self._errors = 0
+        self._saturated = self._in_flight >= self._limit
+
+    def _publish(self) -> None:
+        if self._on_change is None:
+            return
+        try:
+            self._on_change(self._limit)
+        except Exception:  # noqa: BLE001
+            logger.debug("⚠️ on_change обмежувача впав", exc_info=True)
+
+    def _condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._cond is None or self._cond_loop is not loop:
+            self._cond = asyncio.Condition()                        # 🔁 Новий event loop — новий примітив
+            self._cond_loop = loop
+            self._in_flight = 0
+        return self._cond
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    rank = max(0, math.ceil(q * len(ordered)) - 1)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+__all__ = ["AdaptiveConcurrencyLimiter", "AdaptiveLimitSettings", "LimiterPermit", "LimiterSignal"]
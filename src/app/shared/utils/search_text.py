@@ -0,0 +1,42 @@
+# 🔤 app/shared/utils/search_text.py
+"""
+🔤 Нормалізація пошукових рядків для ключів кешу та локальних індексів.
+
+🔹 Нижній регістр, NFKC, транслітерація кирилиці (UA/RU) у латиницю.
+🔹 Пунктуація → пробіли, діакритика прибирається.
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import re                                                           # 🔤 Розбиття на токени
+import unicodedata                                                  # 🔤 NFKC/NFKD
+from typing import Dict, List                                       # 🧰 Типи
+
+_TRANSLIT: Dict[str, str] = {
+    "а": "a", "б": "b", "в": "v", "г": "h", "ґ": "g", "д": "d", "е": "e", "є": "ie",
+    "ж": "zh", "з": "z", "и": "y", "і": "i", "ї": "i", "й": "i", "к": "k", "л": "l",
+    "м": "m", "н": "n", "о": "o", "п": "p", "р": "r", "с": "s", "т": "t", "у": "u",
+    "ф": "f", "х": "kh", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "shch", "ь": "", "ю": "iu",
+    "я": "ia", "ы": "y", "э": "e", "ё": "e", "ъ": "", "'": "", "’": "", "ʼ": "",
+}                                                                   # 🔤 Спрощена транслітерація UA/RU → латиниця
+_NON_WORD_RE = re.compile(r"[^0-9a-z]+")                            # 🧹 Усе, крім латиниці та цифр
+
+
+def normalize_query(raw: str) -> str:
+    """🔤 Нижній регістр, транслітерація, без пунктуації, один пробіл між словами."""
+    text = unicodedata.normalize("NFKC", raw or "").lower()
+    text = "".join(_TRANSLIT.get(ch, ch) for ch in text)
+    text = "".join(ch for ch in unicodedata.normalize("NFKD", text) if not unicodedata.combining(ch))
+    return _NON_WORD_RE.sub(" ", text).strip()
+
+
+def tokenize_query(raw: str) -> List[str]:
+    """🔤 Унікальні токени нормалізованого рядка у порядку появи."""
+    seen: Dict[str, None] = {}
+    for token in normalize_query(raw).split():
+        seen.setdefault(token, None)
+    return list(seen)
+
+
+__all__ = ["normalize_query", "tokenize_query"]
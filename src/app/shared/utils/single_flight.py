@@ -0,0 +1,143 @@
+# 🛬 app/shared/utils/single_flight.py
+"""
+🛬 Single-flight реєстр спільної роботи в межах одного запуску.
+
+🔹 Ключ = (простір імен, ключ): дайджест зображення, хеш промпта, URL таблиці.
+🔹 Перший виклик запускає роботу окремою задачею, решта — чекають на той самий результат.
+🔹 Успішні результати живуть до кінця запуску; помилка не кешується — наступний виклик повторить роботу.
+🔹 Скасування одного споживача не скасовує спільну задачу (`asyncio.shield`).
+🔹 Реєстр активується через contextvar (`activate`), тому дочірні задачі підхоплюють його автоматично;
+   поза активним реєстром `single_flight()` просто виконує фабрику.
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import asyncio                                                      # 🔄 Спільні задачі
+import contextlib                                                   # 🧰 contextmanager
+import contextvars                                                  # 🧵 Реєстр поточного запуску
+import hashlib                                                      # 🔐 Ключі
+import logging                                                      # 🧾 Логування
+from collections import Counter                                     # 🧮 Лічильники по просторах імен
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple, TypeVar  # 🧰 Типи
+
+# 🧩 Внутрішні модулі проєкту
+from app.shared.utils.logger import LOG_NAME                        # 🏷️ Базовий логер
+
+logger = logging.getLogger(f"{LOG_NAME}.single_flight")
+
+T = TypeVar("T")
+_Key = Tuple[str, str]
+
+_CURRENT: contextvars.ContextVar[Optional["SingleFlightRegistry"]] = contextvars.ContextVar(
+    "single_flight_registry", default=None
+)
+
+
+def fingerprint(*parts: object) -> str:
+    """🔑 Стабільний sha256 від частин ключа (рядки/числа/None)."""
+    payload = "\x1f".join("" if part is None else str(part) for part in parts)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ================================
+# 🛬 РЕЄСТР
+# ================================
+class SingleFlightRegistry:
+    """🛬 Дедуплікація однакових асинхронних операцій у межах одного запуску."""
+
+    def __init__(self, name: str = "run") -> None:
+        self.name = name
+        self._tasks: Dict[_Key, asyncio.Task[Any]] = {}
+        self._dedup: Counter[str] = Counter()
+
+    # ================================
+    # 📖 СТАН
+    # ================================
+    @property
+    def deduplicated(self) -> int:
+        """♻️ Скільки викликів отримали чужий (спільний) результат."""
+        return sum(self._dedup.values())
+
+    def deduplicated_by_namespace(self) -> Dict[str, int]:
+        """🧮 Розбивка дедуплікацій за просторами імен."""
+        return dict(self._dedup)
+
+    # ================================
+    # ▶️ ВИКОНАННЯ
+    # ================================
+    async def run(self, namespace: str, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        ▶️ Повертає результат роботи `factory` для ключа, запускаючи її не більше одного разу.
+
+        `factory` — функція без аргументів, що повертає awaitable (а не готова корутина),
+        щоб споживачі, які приєдналися до наявної роботи, не створювали зайвих корутин.
+        """
+        if not key:
+            return await factory()
+        slot: _Key = (namespace, key)
+        task = self._tasks.get(slot)
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            task = asyncio.ensure_future(factory())
+            self._tasks[slot] = task
+            task.add_done_callback(lambda done, slot=slot: self._forget_failed(slot, done))
+        else:
+            self._dedup[namespace] += 1
+            logger.debug("♻️ single-flight %s: спільний результат для %s…", namespace, key[:12])
+        return await asyncio.shield(task)
+
+    def close(self) -> None:
+        """🧹 Скасовує незавершену спільну роботу (усі споживачі вже пішли) і чистить реєстр."""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+        self._tasks.clear()
+
+    # ================================
+    # 🧰 ВНУТРІШНЄ
+    # ================================
+    def _forget_failed(self, slot: _Key, task: asyncio.Task[Any]) -> None:
+        if self._tasks.get(slot) is not task:
+            return
+        if task.cancelled() or task.exception() is not None:
+            self._tasks.pop(slot, None)                             # 🔁 Помилку не кешуємо
+
+
+# ================================
+# 🧵 КОНТЕКСТ ЗАПУСКУ
+# ================================
+def current_single_flight() -> Optional[SingleFlightRegistry]:
+    """🧵 Активний реєстр поточного запуску (або None)."""
+    return _CURRENT.get()
+
+
+@contextlib.contextmanager
+def activate(registry: SingleFlightRegistry) -> Iterator[SingleFlightRegistry]:
+    """
+    🧵 Робить реєстр активним для поточного контексту й задач, створених усередині блоку.
+
+    Задачі копіюють контекст під час створення, тож достатньо створити їх у блоці;
+    `close()` викликає власник реєстру, коли запуск завершено.
+    """
+    token = _CURRENT.set(registry)
+    try:
+        yield registry
+    finally:
+        _CURRENT.reset(token)
+
+
+async def single_flight(namespace: str, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+    """🛬 Виконує `factory` через активний реєстр або напряму, якщо реєстру немає."""
+    registry = _CURRENT.get()
+    if registry is None:
+        return await factory()
+    return await registry.run(namespace, key, factory)
+
+
+__all__ = [
+    "SingleFlightRegistry",
+    "activate",
+    "current_single_flight",
+    "fingerprint",
+    "single_flight",
+]
@@ -0,0 +1,2 @@
+# ⏱️ tests/benchmarks/__init__.py
+"""⏱️ Мікро-бенчмарки шару екстракції (запуск: `python -m tests.benchmarks.parser_bench`)."""
@@ -0,0 +1,152 @@
+# 🖼️ tests/benchmarks/image_download_bench.py
+"""
+🖼️ Бенчмарк `ImageDownloader`: новий HTTP-клієнт на кожне фото проти спільного `HttpClientPool`.
+
+🔹 Піднімає локальний HTTP/1.1-сервер (keep-alive), що віддає N PNG-зображень.
+🔹 `--handshake-ms` імітує вартість TCP+TLS до CDN: затримка на кожне НОВЕ з'єднання.
+🔹 `per_request` — legacy-поведінка (клієнт на спробу), `pooled` — один клієнт на процес.
+🔹 Звіт — JSON із throughput (img/s) і кількістю відкритих з'єднань.
+
+Запуск:
+    python -m tests.benchmarks.image_download_bench --images 200 --concurrency 8 --handshake-ms 30
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import argparse															# 🧰 CLI-аргументи
+import asyncio															# 🔄 Event loop
+import json																# 🧾 Машиночитний звіт
+import logging															# 🔇 Глушимо логи під час вимірів
+import sys																# 🧭 sys.path для `app.*`
+import threading														# 🧵 Сервер у фоновому потоці
+import time																# ⏱️ Вимір часу
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer	# 🌐 Локальний сервер
+from pathlib import Path												# 📁 Шляхи
+from typing import Any, Dict, Optional, Sequence						# 🧰 Типізація
+
+ROOT = Path(__file__).resolve().parents[2]								# 🏠 Корінь репозиторію
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))										# 🧭 Як у tests/conftest.py
+
+# 🧩 Внутрішні модулі проєкту
+from app.infrastructure.size_chart.image_downloader import ImageDownloader	# 📥 Завантажувач
+from app.infrastructure.web.http_client_pool import HttpClientPool, HttpPoolConfig	# 🔌 Пул з'єднань
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 24 * 1024				# 🖼️ «Зображення» ~24 КБ
+
+
+# ================================
+# 🌐 ЛОКАЛЬНИЙ СЕРВЕР
+# ================================
+class ImageServer:
+    """🌐 Фоновий HTTP/1.1-сервер із лічильником з'єднань."""
+
+    def __init__(self, *, handshake_ms: float = 0.0, payload: bytes = PNG_BYTES) -> None:
+        self.connections = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"								# ♻️ Keep-alive
+
+            def setup(self) -> None:
+                with server._lock:
+                    server.connections += 1
+                if handshake_ms > 0:
+                    time.sleep(handshake_ms / 1000.0)					# 🤝 Імітація TCP+TLS
+                super().setup()
+
+            def do_GET(self) -> None:  # noqa: N802
+                self.send_response(200)
+                self.send_header("Content-Type", "image/png")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "ImageServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+# ================================
+# ⏱️ ВИМІРИ
+# ================================
+async def _download_all(urls: Sequence[str], concurrency: int, *, pooled: bool) -> float:
+    """⏱️ Завантажує всі URL з обмеженим паралелізмом; повертає тривалість у секундах."""
+
+    pool = HttpClientPool(HttpPoolConfig(max_connections=concurrency, max_keepalive_connections=concurrency))
+    shared = ImageDownloader(client_pool=pool)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(url: str) -> None:
+        async with semaphore:
+            if pooled:
+                await shared.fetch(url)
+                return
+            own_pool = HttpClientPool()									# 🐢 Legacy: новий клієнт на кожне фото
+            try:
+                await ImageDownloader(client_pool=own_pool).fetch(url)
+            finally:
+                await own_pool.aclose()
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(_one(url) for url in urls))
+    finally:
+        await pool.aclose()
+    return time.perf_counter() - started
+
+
+def run_benchmark(images: int, concurrency: int, *, handshake_ms: float = 0.0) -> Dict[str, Any]:
+    """📊 Міряє обидва режими на свіжому сервері й повертає звіт."""
+
+    report: Dict[str, Any] = {"images": images, "concurrency": concurrency, "handshake_ms": handshake_ms}
+    for mode in ("per_request", "pooled"):
+        with ImageServer(handshake_ms=handshake_ms) as server:
+            urls = [f"{server.base_url}/img/{idx}.png" for idx in range(images)]
+            elapsed = asyncio.run(_download_all(urls, concurrency, pooled=mode == "pooled"))
+            report[mode] = {
+                "seconds": round(elapsed, 4),
+                "images_per_sec": round(images / elapsed, 1) if elapsed > 0 else None,
+                "connections": server.connections,
+            }
+    per_request, pooled = report["per_request"]["seconds"], report["pooled"]["seconds"]
+    report["speedup"] = round(per_request / pooled, 2) if pooled else None
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """🚀 Точка входу CLI: друкує JSON-порівняння per_request vs pooled."""
+
+    parser = argparse.ArgumentParser(description="ImageDownloader per-request client vs pooled client")
+    parser.add_argument("--images", type=int, default=200, help="скільки зображень завантажити")
+    parser.add_argument("--concurrency", type=int, default=8, help="одночасних завантажень")
+    parser.add_argument("--handshake-ms", type=float, default=0.0, help="штучна затримка на нове з'єднання")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+    report = run_benchmark(args.images, args.concurrency, handshake_ms=args.handshake_ms)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,359 @@
+# ⏱️ tests/benchmarks/parser_bench.py
+"""
+⏱️ Мікро-бенчмарк шару екстракції над записаними сторінками магазину.
+
+🔹 Проганяє `HtmlDataExtractor`, `JsonLdMixin._offers_to_stock_map`,
+   `ImagesMixin.extract_all_images` та `UniversalCollectionParser._parse_from_dom`
+   по `html_pages/*.html` і `tests/fixtures/jsonld/*.json`.
+🔹 Рахує ops/sec, p50/p95 (мс) та піковий обсяг алокацій (tracemalloc).
+🔹 Друкує JSON-звіт і порівнює його зі збереженим baseline.
+
+Запуск:
+    python -m tests.benchmarks.parser_bench --iterations 20 --output bench.json
+    python -m tests.benchmarks.parser_bench --baseline tests/benchmarks/baseline_parsers.json
+    python -m tests.benchmarks.parser_bench --update-baseline
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import argparse															# 🧰 CLI-аргументи
+import json																# 🧾 Машиночитний звіт
+import logging															# 🔇 Глушимо логи під час вимірів
+import platform															# 🖥️ Метадані середовища
+import sys																# 🧭 sys.path для `app.*`
+import time																# ⏱️ Високоточний таймер
+import tracemalloc														# 🧠 Пікові алокації
+from dataclasses import asdict, dataclass, field						# 🧱 DTO результатів
+from pathlib import Path												# 📁 Шляхи до корпусу
+from typing import Any, Callable, Dict, List, Optional, Sequence		# 🧰 Типізація
+
+ROOT = Path(__file__).resolve().parents[2]								# 🏠 Корінь репозиторію
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))										# 🧭 Як у tests/conftest.py
+
+# 🌐 Зовнішні бібліотеки
+from bs4 import BeautifulSoup											# 🥣 DOM-дерево сторінок
+
+# 🧩 Внутрішні модулі проєкту
+from app.config.config_service import ConfigService						# ⚙️ Конфіг для URL-стратегії
+from app.infrastructure.parsers.collections.universal_collection_parser import (
+    UniversalCollectionParser,
+)																		# 📚 DOM-парсер колекцій
+from app.infrastructure.parsers.html_data_extractor import HtmlDataExtractor	# 🧾 Екстрактор товару
+from app.infrastructure.url import YoungLAUrlStrategy					# 🧭 Брендова стратегія
+from app.shared.utils.url_parser_service import UrlParserService		# 🔗 Нормалізація URL
+
+# ================================
+# 📦 КОНСТАНТИ
+# ================================
+HTML_PAGES_DIR = ROOT / "html_pages"									# 📄 Записані сторінки
+JSONLD_FIXTURES_DIR = ROOT / "tests" / "fixtures" / "jsonld"			# 📄 JSON-LD фікстури
+DEFAULT_BASELINE = Path(__file__).with_name("baseline_parsers.json")	# 📌 Збережений baseline
+REPORT_SCHEMA_VERSION = 1												# 🔢 Версія формату звіту
+DEFAULT_TOLERANCE = 0.25												# 📉 Допустиме відхилення від baseline
+_COLLECTION_URL = "https://www.youngla.com/collections/all"				# 🌐 Базовий URL для DOM-парсера
+
+
+# ================================
+# 🧱 DTO
+# ================================
+@dataclass(slots=True)
+class BenchDocument:
+    """📄 Один документ корпусу: готовий `soup` та offers з його JSON-LD."""
+
+    name: str
+    soup: BeautifulSoup
+    offers: List[Any] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class BenchResult:
+    """📊 Підсумок одного кейсу бенчмарку."""
+
+    case: str
+    ops: int
+    total_sec: float
+    ops_per_sec: float
+    p50_ms: float
+    p95_ms: float
+    peak_alloc_kb: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data.pop("case", None)
+        return data
+
+
+# ================================
+# 📚 КОРПУС
+# ================================
+def _wrap_jsonld(payload: Any) -> str:
+    """🧾 Обгортає JSON-LD payload у мінімальний HTML (як у jsonld_snapshot_test)."""
+
+    body = json.dumps(payload, ensure_ascii=False)
+    return f'<html><head><script type="application/ld+json">{body}</script></head><body></body></html>'
+
+
+def _collect_offers(soup: BeautifulSoup) -> List[Any]:
+    """📦 Дістає сирі `offers` з усіх Product-блоків документа."""
+
+    extractor = HtmlDataExtractor(soup, locale="uk")
+    return [product["offers"] for product in extractor._json_ld_products() if product.get("offers")]
+
+
+def load_corpus(
+    html_dir: Path = HTML_PAGES_DIR,
+    jsonld_dir: Path = JSONLD_FIXTURES_DIR,
+    *,
+    html_parser: str = "lxml",
+    limit: Optional[int] = None,
+) -> List[BenchDocument]:
+    """📚 Парсить корпус один раз, щоб у вимірах був лише код екстракторів."""
+
+    sources: List[tuple[str, str]] = []
+    for path in sorted(html_dir.glob("*.html")):
+        sources.append((f"html/{path.name}", path.read_text(encoding="utf-8", errors="ignore")))
+    for path in sorted(jsonld_dir.glob("*.json")):
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        sources.append((f"jsonld/{path.name}", _wrap_jsonld(payload)))
+    if limit is not None:
+        sources = sources[: max(0, int(limit))]
+
+    docs: List[BenchDocument] = []
+    previous_disable = logging.root.manager.disable
+    logging.disable(logging.CRITICAL)									# 🔇 Екстрактор логує кожен крок
+    try:
+        for name, html in sources:
+            soup = BeautifulSoup(html, html_parser)
+            docs.append(BenchDocument(name=name, soup=soup, offers=_collect_offers(soup)))
+    finally:
+        logging.disable(previous_disable)
+    return docs
+
+
+# ================================
+# 🎯 КЕЙСИ
+# ================================
+BenchCase = Callable[[BenchDocument], Any]
+
+
+def _case_html_extractor(doc: BenchDocument) -> Any:
+    extractor = HtmlDataExtractor(doc.soup, locale="uk")
+    return (
+        extractor.extract_title(),
+        extractor.extract_price(),
+        extractor.extract_description(),
+        extractor.extract_main_image(),
+        extractor.extract_all_images(limit=20),
+        extractor.extract_stock_from_json_ld(),
+        extractor.extract_stock_from_legacy(),
+    )
+
+
+def _case_offers_to_stock_map(doc: BenchDocument) -> Any:
+    extractor = HtmlDataExtractor(doc.soup, locale="uk")
+    return [extractor._offers_to_stock_map(offers) for offers in doc.offers]
+
+
+def _case_extract_all_images(doc: BenchDocument) -> Any:
+    return HtmlDataExtractor(doc.soup, locale="uk").extract_all_images()
+
+
+def _build_collection_case() -> BenchCase:
+    config = ConfigService()
+    url_parser = UrlParserService(strategies=[YoungLAUrlStrategy(config)])
+    parser = UniversalCollectionParser(
+        _COLLECTION_URL,
+        webdriver_service=None,  # type: ignore[arg-type]  # 🌐 Мережа не потрібна: міряємо лише DOM
+        config_service=config,
+        url_parser_service=url_parser,
+    )
+
+    def _case(doc: BenchDocument) -> Any:
+        return parser._parse_from_dom(doc.soup)
+
+    return _case
+
+
+def default_cases() -> Dict[str, BenchCase]:
+    """🎯 Повертає перелік кейсів у стабільному порядку."""
+
+    return {
+        "html_data_extractor.full": _case_html_extractor,
+        "json_ld.offers_to_stock_map": _case_offers_to_stock_map,
+        "images.extract_all_images": _case_extract_all_images,
+        "collection.parse_from_dom": _build_collection_case(),
+    }
+
+
+# ================================
+# ⏱️ ВИМІРИ
+# ================================
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    """📐 Перцентиль методом nearest-rank (без numpy)."""
+
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(q * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _peak_alloc_kb(case: BenchCase, docs: Sequence[BenchDocument]) -> float:
+    """🧠 Максимальний пік алокацій однієї операції (окремий прохід під tracemalloc)."""
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    peak = 0
+    try:
+        for doc in docs:
+            tracemalloc.reset_peak()
+            current_before, _ = tracemalloc.get_traced_memory()
+            case(doc)
+            _, op_peak = tracemalloc.get_traced_memory()
+            peak = max(peak, op_peak - current_before)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return round(peak / 1024, 2)
+
+
+def run_case(name: str, case: BenchCase, docs: Sequence[BenchDocument], *, iterations: int, warmup: int = 1) -> BenchResult:
+    """⏱️ Проганяє кейс по корпусу `iterations` разів і рахує статистику."""
+
+    for _ in range(max(0, warmup)):
+        for doc in docs:
+            case(doc)													# 🔥 Прогрів кешів конфігу/селекторів
+
+    timings: List[float] = []
+    started = time.perf_counter()
+    for _ in range(max(1, iterations)):
+        for doc in docs:
+            op_started = time.perf_counter()
+            case(doc)
+            timings.append(time.perf_counter() - op_started)
+    total = time.perf_counter() - started
+
+    timings.sort()
+    ops = len(timings)
+    return BenchResult(
+        case=name,
+        ops=ops,
+        total_sec=round(total, 6),
+        ops_per_sec=round(ops / total, 2) if total > 0 else 0.0,
+        p50_ms=round(_percentile(timings, 0.50) * 1000, 4),
+        p95_ms=round(_percentile(timings, 0.95) * 1000, 4),
+        peak_alloc_kb=_peak_alloc_kb(case, docs),
+    )
+
+
+def run_suite(
+    docs: Sequence[BenchDocument],
+    *,
+    iterations: int = 5,
+    warmup: int = 1,
+    cases: Optional[Dict[str, BenchCase]] = None,
+    only: Optional[Sequence[str]] = None,
+) -> Dict[str, BenchResult]:
+    """🏁 Запускає всі (або вибрані) кейси з вимкненим логуванням."""
+
+    selected = cases if cases is not None else default_cases()
+    if only:
+        selected = {name: fn for name, fn in selected.items() if name in set(only)}
+
+    results: Dict[str, BenchResult] = {}
+    previous_disable = logging.root.manager.disable
+    logging.disable(logging.CRITICAL)
+    try:
+        for name, case in selected.items():
+            results[name] = run_case(name, case, docs, iterations=iterations, warmup=warmup)
+    finally:
+        logging.disable(previous_disable)
+    return results
+
+
+# ================================
+# 🧾 ЗВІТ ТА BASELINE
+# ================================
+def build_report(results: Dict[str, BenchResult], *, iterations: int, documents: int) -> Dict[str, Any]:
+    """🧾 Формує JSON-сумісний звіт."""
+
+    return {
+        "schema": REPORT_SCHEMA_VERSION,
+        "python": platform.python_version(),
+        "iterations": int(iterations),
+        "documents": int(documents),
+        "results": {name: result.to_dict() for name, result in results.items()},
+    }
+
+
+def compare_with_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """
+    📉 Повертає список регресій відносно baseline.
+
+    Регресія — це падіння ops/sec або зростання p95/піку алокацій більше ніж на `tolerance`.
+    Кейси, яких немає в baseline, пропускаються.
+    """
+
+    regressions: List[str] = []
+    base_results = baseline.get("results") or {}
+    for name, current in (report.get("results") or {}).items():
+        base = base_results.get(name)
+        if not isinstance(base, dict):
+            continue
+        base_ops = float(base.get("ops_per_sec") or 0.0)
+        if base_ops and float(current.get("ops_per_sec") or 0.0) < base_ops * (1 - tolerance):
+            regressions.append(f"{name}: ops/sec {current['ops_per_sec']} < {base_ops} (-{tolerance:.0%})")
+        for metric in ("p95_ms", "peak_alloc_kb"):
+            base_value = float(base.get(metric) or 0.0)
+            value = float(current.get(metric) or 0.0)
+            if base_value and value > base_value * (1 + tolerance):
+                regressions.append(f"{name}: {metric} {value} > {base_value} (+{tolerance:.0%})")
+    return regressions
+
+
+# ================================
+# 🚀 CLI
+# ================================
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """🚀 Точка входу CLI. Повертає 1, якщо знайдено регресії."""
+
+    parser = argparse.ArgumentParser(description="Parser micro-benchmarks")
+    parser.add_argument("--iterations", type=int, default=5, help="проходів по корпусу на кейс")
+    parser.add_argument("--warmup", type=int, default=1, help="прогрівальних проходів")
+    parser.add_argument("--case", action="append", dest="cases", help="запустити лише вказаний кейс")
+    parser.add_argument("--output", type=Path, help="куди записати JSON-звіт")
+    parser.add_argument("--baseline", type=Path, help="порівняти з baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="допустиме відхилення (0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true", help=f"перезаписати {DEFAULT_BASELINE.name}")
+    args = parser.parse_args(argv)
+
+    docs = load_corpus()
+    results = run_suite(docs, iterations=args.iterations, warmup=args.warmup, only=args.cases)
+    report = build_report(results, iterations=args.iterations, documents=len(docs))
+    rendered = json.dumps(report, ensure_ascii=False, indent=2)
+    print(rendered)
+
+    if args.output:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    if args.update_baseline:
+        DEFAULT_BASELINE.write_text(rendered + "\n", encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare_with_baseline(report, baseline, tolerance=args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
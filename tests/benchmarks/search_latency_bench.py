@@ -0,0 +1,74 @@
+# ⏱️ tests/benchmarks/search_latency_bench.py
+"""
+⏱️ Живий бенчмарк латентності `ProductSearchResolver`: Chromium на запит проти теплої сторінки.
+
+🔹 `launch` — legacy-шлях без `WebDriverService` (запуск браузера на кожен запит).
+🔹 `cold`/`warm` — спільний браузер `WebDriverService`: перший запит відкриває головну
+   та діалог пошуку, наступні — лише fill + очікування predictive.
+🔹 Потрібні мережа та встановлений Chromium (`playwright install chromium`), тому в pytest не входить.
+
+Запуск:
+    python -m tests.benchmarks.search_latency_bench --query "essential tee" --query joggers --rounds 3
+"""
+
+from __future__ import annotations
+
+# 🔠 Системні імпорти
+import argparse															# 🧰 CLI-аргументи
+import asyncio															# 🔄 Event loop
+import json																# 🧾 Машиночитний звіт
+import logging															# 🔇 Глушимо логи під час вимірів
+import sys																# 🧭 sys.path для `app.*`
+from pathlib import Path												# 📁 Шляхи
+from typing import Any, Dict, List, Optional, Sequence					# 🧰 Типізація
+
+ROOT = Path(__file__).resolve().parents[2]								# 🏠 Корінь репозиторію
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))										# 🧭 Як у tests/conftest.py
+
+# 🧩 Внутрішні модулі проєкту
+from app.config.config_service import ConfigService						# ⚙️ Конфіг для WebDriverService
+from app.infrastructure.parsers.product_search.search_resolver import ProductSearchResolver	# 🔍 Резолвер
+from app.infrastructure.web.webdriver_service import WebDriverService	# 🧭 Спільний браузер
+
+DEFAULT_QUERIES = ("essential tee", "joggers", "hoodie")				# 🔎 Типові запити
+
+
+async def _measure(queries: Sequence[str], rounds: int, *, shared_browser: bool) -> Dict[str, Any]:
+    """⏱️ Проганяє запити `rounds` разів і повертає `latency_snapshot()` резолвера."""
+
+    webdriver: Optional[WebDriverService] = WebDriverService(ConfigService()) if shared_browser else None
+    resolver = ProductSearchResolver(webdriver_service=webdriver, config_service=ConfigService())
+    try:
+        for _ in range(rounds):
+            for query in queries:
+                await resolver.resolve_one(query)
+    finally:
+        await resolver.aclose()
+        if webdriver is not None:
+            await webdriver.shutdown()
+    return resolver.latency_snapshot()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """🚀 Точка входу CLI: друкує JSON із латентністю launch / cold / warm."""
+
+    parser = argparse.ArgumentParser(description="ProductSearchResolver cold vs warm latency")
+    parser.add_argument("--query", action="append", dest="queries", help="пошуковий запит (можна кілька)")
+    parser.add_argument("--rounds", type=int, default=2, help="скільки разів повторити набір запитів")
+    parser.add_argument("--skip-launch", action="store_true", help="не міряти legacy-шлях (браузер на запит)")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+    queries: List[str] = args.queries or list(DEFAULT_QUERIES)
+    report: Dict[str, Any] = {"queries": queries, "rounds": args.rounds}
+    if not args.skip_launch:
+        report.update(asyncio.run(_measure(queries, args.rounds, shared_browser=False)))
+    report.update(asyncio.run(_measure(queries, args.rounds, shared_browser=True)))
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
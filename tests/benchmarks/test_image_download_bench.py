@@ -0,0 +1,34 @@
+import asyncio
+
+from tests.benchmarks.image_download_bench import ImageServer, run_benchmark
+from app.infrastructure.size_chart.image_downloader import ImageDownloader
+from app.infrastructure.web.http_client_pool import HttpClientPool
+
+
+def test_pooled_mode_reuses_connections():
+    report = run_benchmark(12, 3)  # 🖼️ Маленький smoke-прогін на локальному сервері
+
+    assert report["per_request"]["connections"] == 12
+    assert report["pooled"]["connections"] <= 3
+    assert report["pooled"]["images_per_sec"] > 0
+
+
+def test_shared_pool_survives_downloads_and_closes():
+    pool = HttpClientPool()
+
+    async def _scenario(base_url):
+        downloader = ImageDownloader(client_pool=pool)
+        first = await downloader.fetch(f"{base_url}/a.png")
+        client = pool.client()
+        await downloader.fetch(f"{base_url}/b.png")
+        assert pool.client() is client
+        assert not client.is_closed
+        await pool.aclose()
+        assert client.is_closed
+        return first
+
+    with ImageServer() as server:
+        image = asyncio.run(_scenario(server.base_url))
+
+    assert image.content_type == "image/png" and image.content.startswith(b"\x89PNG")
+    assert server.connections == 1
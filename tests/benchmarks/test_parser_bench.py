@@ -0,0 +1,42 @@
+import json
+
+from tests.benchmarks.parser_bench import (
+    DEFAULT_BASELINE,
+    build_report,
+    compare_with_baseline,
+    default_cases,
+    load_corpus,
+    run_suite,
+)
+
+
+def test_suite_runs_over_jsonld_fixtures(tmp_path):
+    docs = load_corpus(html_dir=tmp_path)  # 📄 Лише JSON-LD фікстури — швидкий smoke-прогін
+    assert docs
+
+    results = run_suite(docs, iterations=1, warmup=0)
+    assert set(results) == set(default_cases())
+
+    report = build_report(results, iterations=1, documents=len(docs))
+    json.dumps(report)
+    for metrics in report["results"].values():
+        assert metrics["ops"] == len(docs)
+        assert metrics["ops_per_sec"] > 0
+        assert metrics["p95_ms"] >= metrics["p50_ms"]
+        assert metrics["peak_alloc_kb"] >= 0
+
+
+def test_compare_with_baseline_flags_regressions():
+    baseline = {"results": {"case": {"ops_per_sec": 100.0, "p95_ms": 2.0, "peak_alloc_kb": 10.0}}}
+    ok = {"results": {"case": {"ops_per_sec": 90.0, "p95_ms": 2.2, "peak_alloc_kb": 11.0}}}
+    slow = {"results": {"case": {"ops_per_sec": 50.0, "p95_ms": 5.0, "peak_alloc_kb": 30.0}}}
+    new_case = {"results": {"other": {"ops_per_sec": 1.0, "p95_ms": 100.0, "peak_alloc_kb": 1.0}}}
+
+    assert compare_with_baseline(ok, baseline, tolerance=0.25) == []
+    assert len(compare_with_baseline(slow, baseline, tolerance=0.25)) == 3
+    assert compare_with_baseline(new_case, baseline) == []
+
+
+def test_stored_baseline_covers_all_cases():
+    baseline = json.loads(DEFAULT_BASELINE.read_text(encoding="utf-8"))
+    assert set(baseline["results"]) == set(default_cases())
@@ -0,0 +1,73 @@
+# 🧪 tests/bot/handlers/test_collection_pipeline.py
+"""
+🧪 Конвеєр «підготовка → надсилання» в CollectionRunner.
+
+Перевіряє:
+- відправники працюють паралельно (не більше `send_concurrency`) і витримують `send_interval_sec`;
+- режим порядку джерела надсилає картки в порядку колекції, а підготовка не випереджає
+  надсилання більше ніж на `reorder_window`.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.bot.handlers.product.collection_runner import CollectionPipelineSettings, CollectionRunner
+
+URLS = [f"https://www.youngla.com/products/{i}" for i in range(8)]
+
+
+def _card(url):
+    data = SimpleNamespace(url=url, content=SimpleNamespace(title=url.rsplit("/", 1)[-1]))
+    return SimpleNamespace(result=SimpleNamespace(ok=True, data=data, alt_fallback_used=False), media_stack=["photo"])
+
+
+class _Handler:
+    def __init__(self, prepare_delays, send_delay):
+        self.prepare_delays, self.send_delay = prepare_delays, send_delay
+        self.prepared, self.sent, self.started = [], [], []
+        self.sending, self.peak_sending, self.send_starts = 0, 0, []
+
+    async def handle_url(self, update, context, *, url, **kwargs):
+        self.started.append((URLS.index(url), len(self.sent)))
+        await asyncio.sleep(self.prepare_delays[URLS.index(url)])
+        self.prepared.append(url)
+        return _card(url)
+
+    async def send_prepared_card(self, update, context, card, **kwargs):
+        self.sending += 1
+        self.peak_sending = max(self.peak_sending, self.sending)
+        self.send_starts.append(asyncio.get_running_loop().time())
+        await asyncio.sleep(self.send_delay)
+        self.sending -= 1
+        self.sent.append(card.result.data.url)
+
+
+async def _noop(snapshot):
+    return None
+
+
+def _run(handler, pipeline, concurrency=8):
+    runner = CollectionRunner(handler, concurrency=concurrency, per_item_retries=0, pipeline=pipeline)
+    return asyncio.run(runner.run(None, None, URLS, _noop, lambda: False))
+
+
+def test_senders_run_concurrently_within_rate_limit():
+    handler = _Handler(prepare_delays=[0.001] * len(URLS), send_delay=0.05)
+    sent, health = _run(handler, CollectionPipelineSettings(send_concurrency=3, send_interval_sec=0.01, queue_size=2))
+
+    assert sent == len(URLS) and health.ok == len(URLS)
+    assert handler.peak_sending == 3                                     # 📤 Повільні надсилання перекриваються
+    gaps = [later - earlier for earlier, later in zip(handler.send_starts, handler.send_starts[1:])]
+    assert min(gaps) >= 0.009                                            # ⏱️ Пауза між стартами витримана
+
+
+def test_preserve_order_uses_bounded_reorder_window():
+    delays = [0.04, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]                  # 🐢 Перша картка готується найдовше
+    handler = _Handler(prepare_delays=delays, send_delay=0.0)
+    window = 3
+    sent, _ = _run(handler, CollectionPipelineSettings(preserve_order=True, reorder_window=window))
+
+    assert sent == len(URLS)
+    assert handler.sent == URLS                                          # 🔢 Порядок колекції
+    assert all(idx < sent_before + window for idx, sent_before in handler.started)
+    assert handler.prepared[0] != URLS[0]                                # ⚡ Підготовка таки йшла не по порядку
@@ -0,0 +1,37 @@
+# 🧪 tests/bot/handlers/test_collection_progress.py
+"""
+🧪 Коалесований рендер прогресу в CollectionRunner.
+
+Перевіряє:
+- десятки змін статусів дають кілька рендерів (тікер + dirty-прапорець), а не рендер на кожну зміну;
+- фінальний рендер завжди відображає завершений стан;
+- раніше видані знімки не змінюються пізнішими оновленнями статусів.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.bot.handlers.product.collection_runner import CollectionItemState, CollectionRunner
+
+
+class _Handler:
+    async def handle_url(self, update, context, *, url, **kwargs):
+        await asyncio.sleep(0.005)
+        return SimpleNamespace(result=SimpleNamespace(ok=False, error_message="немає даних", data=None), media_stack=None)
+
+
+def test_progress_is_rendered_at_fixed_cadence():
+    urls = [f"https://www.youngla.com/products/{i}" for i in range(30)]
+    snapshots = []
+
+    async def _on_progress(snapshot):
+        snapshots.append(snapshot)
+
+    runner = CollectionRunner(_Handler(), concurrency=3, per_item_retries=0, progress_interval_sec=0.05)
+    asyncio.run(runner.run(None, None, urls, _on_progress, lambda: False))
+
+    assert 2 <= len(snapshots) < 15                                       # 🧮 Замість ~90 редагувань
+    first, final = snapshots[0], snapshots[-1]
+    assert final.completed == final.total == 30
+    assert all(status.state is CollectionItemState.FAILED for status in final.statuses)
+    assert all(status.state is CollectionItemState.PENDING for status in first.statuses)
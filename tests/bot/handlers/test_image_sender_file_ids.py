@@ -0,0 +1,112 @@
+# 🧪 tests/bot/handlers/test_image_sender_file_ids.py
+"""
+🧪 Кеш Telegram `file_id` в ImageSender.
+
+Перевіряє:
+- після надсилання альбому `file_id` найбільшого PhotoSize зберігається (і переживає перезапуск);
+- URL-ключ розрізняє версію CDN (`?v=`), а запис на диск відкладений до `flush()`;
+- повторний альбом іде за id замість upload;
+- «wrong file identifier» інвалідовує запис, фото надсилається оригіналом і кеш оновлюється.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from telegram.error import BadRequest
+
+import app.bot.handlers  # noqa: F401  — bot-пакет першим: services ↔ bot.handlers імпортуються циклічно
+from app.bot.handlers.product.image_sender import ImageSender
+from app.infrastructure.services.product_media_preparer import PreparedImageFile
+from app.infrastructure.services.telegram_file_id_cache import TelegramFileIdCache, image_cache_keys
+
+URLS = ["https://cdn.shopify.com/a.jpg?v=1", "https://cdn.shopify.com/b.jpg?v=1"]
+
+
+def _message(file_id):
+    sizes = [SimpleNamespace(file_id=f"{file_id}-small", width=90, height=90), SimpleNamespace(file_id=file_id, width=1280, height=1280)]
+    return SimpleNamespace(photo=sizes)
+
+
+class _Bot:
+    def __init__(self, stale_ids=()):
+        self.stale_ids, self.groups, self.photos = set(stale_ids), [], []
+
+    async def send_chat_action(self, *args, **kwargs):
+        return None
+
+    async def send_media_group(self, chat_id, media, **kwargs):
+        self.groups.append([item.media for item in media])
+        return tuple(_message(f"id-{idx}-{len(self.groups)}") for idx in range(len(media)))
+
+    async def send_photo(self, chat_id, photo, **kwargs):
+        self.photos.append(photo)
+        if photo in self.stale_ids:
+            raise BadRequest("Wrong file identifier/http url specified")
+        return _message(f"fresh-{len(self.photos)}")
+
+
+def _sender(cache):
+    async def _raise(error, update):
+        raise error
+
+    constants = SimpleNamespace(UI=SimpleNamespace(DEFAULT_PARSE_MODE="HTML"), SENDING=SimpleNamespace(BATCH_PAUSE_SEC=0))
+    return ImageSender(SimpleNamespace(handle=_raise), constants, file_id_cache=cache)
+
+
+def _send(sender, bot, images):
+    update = SimpleNamespace(message=None, effective_chat=SimpleNamespace(id=1))
+
+    async def scenario():
+        sent = await sender.send_images(update, SimpleNamespace(bot=bot), images)
+        await sender.file_id_cache.flush()                                 # 🧽 Як при зупинці бота
+        return sent
+
+    return asyncio.run(scenario())
+
+
+def _files():
+    return [PreparedImageFile(b"\x89PNG", filename=f"{i}.png", source_url=url, sha256=f"sha{i}") for i, url in enumerate(URLS)]
+
+
+def test_media_group_is_resent_by_cached_file_id(tmp_path):
+    path = tmp_path / "file_ids.json"
+    bot = _Bot()
+    _send(_sender(TelegramFileIdCache(path)), bot, _files())
+    assert all(isinstance(item, PreparedImageFile) for item in bot.groups[0])
+
+    reloaded = TelegramFileIdCache(path)                                   # 💾 Після перезапуску
+    assert reloaded.get(image_cache_keys(url="https://cdn.shopify.com/a.jpg?width=800&v=1")) == "id-0-1"
+    assert reloaded.get(image_cache_keys(url="https://cdn.shopify.com/a.jpg?v=2")) is None  # 🔢 Нова версія фото
+    assert reloaded.get(image_cache_keys(sha256="sha1")) == "id-1-1"
+
+    _send(_sender(reloaded), bot, _files())
+    assert bot.groups[1] == ["id-0-1", "id-1-1"]
+
+
+def test_wrong_file_identifier_invalidates_and_resends_original(tmp_path):
+    cache = TelegramFileIdCache(tmp_path / "file_ids.json")
+    cache.put(image_cache_keys(url=URLS[0]), "expired-id")
+    bot = _Bot(stale_ids={"expired-id"})
+
+    sent = _send(_sender(cache), bot, [URLS[0]])
+
+    assert len(sent) == 1
+    assert bot.photos == ["expired-id", URLS[0]]
+    assert cache.get(image_cache_keys(url=URLS[0])) == "fresh-2"
+
+
+def test_writes_are_debounced_off_the_event_loop(tmp_path):
+    path = tmp_path / "file_ids.json"
+    cache = TelegramFileIdCache(path, flush_sec=0.05)
+
+    async def scenario():
+        for idx in range(3):
+            cache.put(image_cache_keys(url=f"https://cdn.shopify.com/{idx}.jpg?v=1"), f"id-{idx}")
+        assert not path.exists()                                           # ⏳ Ще в debounce
+        await asyncio.sleep(0.2)
+        assert len(TelegramFileIdCache(path)) == 3
+        cache.invalidate(image_cache_keys(url="https://cdn.shopify.com/0.jpg?v=1"))
+        await cache.flush()
+
+    asyncio.run(scenario())
+    assert len(TelegramFileIdCache(path)) == 2
@@ -0,0 +1,100 @@
+"""🧪 test_progressive_card.py — прогресивна доставка картки товару.
+
+🔍 Перевіряє:
+- 🖼️ перше повідомлення — фото з назвою одразу після `parse`, фіксується TTFM;
+- ✏️ опис іде з плейсхолдером наявності та редагується, коли приходить `availability`;
+- ⏸️ музика, що прийшла раніше за опис, надсилається після нього.
+"""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.bot.handlers.product.progressive_card import AVAILABILITY_PENDING_TEXT, ProgressiveCardSender
+from app.domain.products.entities import ProductInfo
+from app.infrastructure.content.product_content_service import ContentBuildDiagnostics, ProductContentDTO
+from app.infrastructure.services.stage_graph import STATUS_OK, StageOutcome
+
+URL = "https://www.youngla.com/products/4003"
+
+
+class _Messenger:
+    def __init__(self):
+        self.calls = []
+
+    async def send_preview(self, update, context, *, title, media_stack):
+        self.calls.append(("preview", title, tuple(media_stack)))
+        return []
+
+    async def send_description(self, update, content):
+        self.calls.append(("description", content.colors_text))
+        return SimpleNamespace(id="desc")
+
+    async def edit_description(self, message, content):
+        self.calls.append(("edit", message.id, content.colors_text))
+
+    async def send_price(self, update, content):
+        self.calls.append(("price", content.price_message))
+
+    async def send_music_block(self, update, context, music_text, title):
+        self.calls.append(("music", music_text))
+
+    async def send_size_chart(self, update, context, *, url, page_source):
+        self.calls.append(("size_chart", url))
+
+
+class _Preparer:
+    async def prepare_stack(self, images, *, title):
+        return SimpleNamespace(files=[f"file:{img}" for img in images])
+
+
+def _content():
+    return ProductContentDTO(
+        title="Essential Tee", slogan="s", hashtags="#t", sections={}, colors_text="",
+        price_message="40$", images=["a.jpg"], alt_texts={}, alt_fallback_used=False,
+    )
+
+
+def _ok(name, value):
+    return StageOutcome(name, STATUS_OK, value=value)
+
+
+def test_preview_first_then_description_edited_with_availability():
+    messenger = _Messenger()
+    product = ProductInfo(title="Essential Tee", price=Decimal("40"), images=("https://cdn.shopify.com/a.jpg", "https://cdn.shopify.com/b.jpg"))
+    parser = SimpleNamespace(page_source="<html/>")
+
+    async def _scenario():
+        sender = ProgressiveCardSender(messenger, _Preparer(), SimpleNamespace(), SimpleNamespace(), url=URL)
+        consumer = asyncio.create_task(sender.run())
+        sender.on_stage(_ok("parse", (parser, product)))
+        sender.on_stage(_ok("music", SimpleNamespace(raw_text="track")))
+        sender.on_stage(_ok("size_chart", SimpleNamespace()))
+        sender.on_stage(_ok("content", (_content(), ContentBuildDiagnostics())))
+        sender.on_stage(_ok("availability", SimpleNamespace(reports=SimpleNamespace(public_report="Black: M"))))
+        sender.finish()
+        await consumer
+        return sender
+
+    sender = asyncio.run(_scenario())
+
+    assert messenger.calls[0] == ("preview", "Essential Tee", ("file:https://cdn.shopify.com/a.jpg", "file:https://cdn.shopify.com/b.jpg"))
+    assert sender.preview_sent and sender.first_message_sec is not None
+    names = [call[0] for call in messenger.calls]
+    assert names == ["preview", "description", "price", "music", "size_chart", "edit"]
+    assert messenger.calls[1] == ("description", AVAILABILITY_PENDING_TEXT)
+    assert messenger.calls[-1] == ("edit", "desc", "Black: M")
+
+
+def test_deferred_blocks_flush_even_without_description():
+    messenger = _Messenger()
+
+    async def _scenario():
+        sender = ProgressiveCardSender(messenger, _Preparer(), SimpleNamespace(), SimpleNamespace(), url=URL)
+        consumer = asyncio.create_task(sender.run())
+        sender.on_stage(_ok("music", SimpleNamespace(raw_text="track")))
+        sender.finish()
+        await consumer
+
+    asyncio.run(_scenario())
+    assert messenger.calls == [("music", "track")]
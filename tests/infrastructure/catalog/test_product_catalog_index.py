@@ -0,0 +1,120 @@
+# 🧪 tests/infrastructure/catalog/test_product_catalog_index.py
+"""
+🧪 ProductCatalogIndex: наповнення, інвертований пошук, SKU, freshness, персистентність.
+"""
+
+import asyncio
+import time
+
+from app.infrastructure.catalog import ProductCatalogIndex
+from app.infrastructure.parsers.product_search.search_resolver import ProductSearchResolver
+from app.shared.cache.product_hints_cache import ProductHint
+
+
+def _hint(handle: str, title: str, *, skus=(), fetched_at=None) -> ProductHint:
+    return ProductHint(
+        url=f"https://www.youngla.com/products/{handle}",
+        handle=handle,
+        title=title,
+        images=(f"https://cdn.shopify.com/{handle}.jpg",),
+        stock={"Black": {"M": True, "L": False}, "Heather Grey": {"M": True}},
+        skus=tuple(skus),
+        fetched_at=fetched_at or time.time(),
+    )
+
+
+def _catalog(tmp_path) -> ProductCatalogIndex:
+    catalog = ProductCatalogIndex(tmp_path / "index.json", flush_interval_sec=3600)
+    catalog.upsert_hints([
+        _hint("4007-essential-tee", "Essential Tee", skus=("4007-BLK-M",)),
+        _hint("4011-jogger", "Mesh Joggers", skus=("4011-GRY-L",)),
+        _hint("4050-hoodie", "Essential Hoodie"),
+    ])
+    return catalog
+
+
+def test_search_exact_prefix_and_fuzzy(tmp_path):
+    catalog = _catalog(tmp_path)
+
+    exact = catalog.search("essential tee")
+    assert [m.entry.handle for m in exact] == ["4007-essential-tee"]
+    assert exact[0].score == 1.0
+
+    prefix = catalog.search("ess")
+    assert {m.entry.handle for m in prefix} == {"4007-essential-tee", "4050-hoodie"}
+    assert all(m.score == 0.8 for m in prefix)
+
+    fuzzy = catalog.search("joggres")
+    assert [m.entry.handle for m in fuzzy] == ["4011-jogger"]
+    assert fuzzy[0].score < 0.8
+
+    assert catalog.search("essential jogger") == []                  # 🔒 Усі токени мають збігтися
+    assert [m.entry.handle for m in catalog.search("heather grey hoodie")] == ["4050-hoodie"]
+
+
+def test_lookup_sku_and_freshness(tmp_path):
+    catalog = _catalog(tmp_path)
+    assert catalog.lookup_sku("4011-gry-l").handle == "4011-jogger"
+    assert catalog.lookup_sku("4050-hoodie").title == "Essential Hoodie"
+
+    stale = ProductCatalogIndex(tmp_path / "stale.json", fresh_sec=60)
+    stale.upsert_hints([_hint("old-tee", "Old Tee", fetched_at=time.time() - 3600)])
+    assert stale.search("old tee") == []
+    assert stale.search("old tee", max_age_sec=0)[0].entry.handle == "old-tee"
+
+
+def test_persistence_roundtrip(tmp_path):
+    catalog = _catalog(tmp_path)
+    catalog.flush()
+
+    reloaded = ProductCatalogIndex(tmp_path / "index.json")
+    assert len(reloaded) == 3
+    entry = reloaded.lookup_sku("4007-BLK-M")
+    assert entry is not None
+    assert entry.colors == ("Black", "Heather Grey")
+    assert entry.sizes == ("M", "L")
+
+
+def test_search_resolver_answers_from_catalog(tmp_path):
+    resolver = ProductSearchResolver(catalog=_catalog(tmp_path))
+
+    async def _offline(*args, **kwargs):
+        raise AssertionError("мережа не повинна використовуватись")
+
+    resolver._suggest_json = _offline  # type: ignore[assignment]
+    resolver._search_many_with_retries = _offline  # type: ignore[assignment]
+
+    results = asyncio.run(resolver.resolve_many("Essential", 2))         # 📚 Каталог заповнив limit
+    assert [r.title for r in results] == ["Essential Hoodie", "Essential Tee"]
+    one = asyncio.run(resolver.resolve_one("4011-GRY-L"))                # 🔖 Точний артикул
+    assert one is not None and one.value == "https://www.youngla.com/products/4011-jogger"
+    assert resolver.latency_snapshot()["catalog"]["count"] == 2
+
+
+def test_search_resolver_merges_partial_catalog_with_live_results(tmp_path):
+    resolver = ProductSearchResolver(catalog=_catalog(tmp_path))
+
+    async def _live(query, limit):
+        return [("/products/9001-essential-shorts", "Essential Shorts"), ("/products/4007-essential-tee", "Essential Tee")]
+
+    resolver._suggest_json = _live  # type: ignore[assignment]
+
+    results = asyncio.run(resolver.resolve_many("Essential", 5))
+    assert [r.url.value for r in results] == [
+        "https://www.youngla.com/products/9001-essential-shorts",        # ⚡ Ранжування сайту першим
+        "https://www.youngla.com/products/4007-essential-tee",
+        "https://www.youngla.com/products/4050-hoodie",                  # 📚 Доповнення з каталогу
+    ]
+
+
+def test_upserts_flush_in_background_and_on_aflush(tmp_path):
+    path = tmp_path / "index.json"
+    catalog = ProductCatalogIndex(path, flush_interval_sec=3600)
+
+    async def scenario():
+        catalog.upsert_hints([_hint("4050-hoodie", "Essential Hoodie")])
+        assert not path.exists()                                          # ⏳ Під event loop — лише запланований запис
+        await catalog.aflush()
+
+    asyncio.run(scenario())
+    assert len(ProductCatalogIndex(path)) == 1
@@ -0,0 +1,255 @@
+# 🧪 tests/infrastructure/services/test_banner_drop_service.py
+"""
+🧪 BannerDropService: легкий збір назв і паралельна обробка банерів.
+
+Перевіряє:
+- назви беруться з підказок products.json, решта — header-only парсингом, без повної обробки;
+- колекції та товари обробляються паралельно, порядок назв — як у колекціях;
+- повільні товари відкидаються після бюджету часу, заглушки заголовків не потрапляють у пост;
+- банери та їхні колекції запускаються паралельно в межах `concurrency`, кожна колекція —
+  з порядком джерела, спільна для двох банерів колекція — один раз;
+- частини банера ріжуться один раз і беруться з MediaStore за digest, а опублікований банер
+  (навіть під новим URL) не повторюється після «рестарту» сервісу;
+- банер, замінений на CDN під тим самим шляхом з новим `?v=`, завантажується й публікується,
+  а нова версія з тим самим вмістом — ні.
+"""
+
+import asyncio
+import time
+from io import BytesIO
+from types import SimpleNamespace
+
+from PIL import Image
+
+import app.bot.handlers  # noqa: F401 — bot-пакет першим, щоб уникнути циклічного імпорту
+from app.infrastructure.services import banner_drop_service as banner_module
+from app.infrastructure.services.banner_drop_service import BannerDropService
+from app.infrastructure.services.processed_banner_index import ProcessedBannerIndex
+from app.shared.cache.media_store import MediaStore
+
+COLLECTIONS = {
+    "https://www.youngla.com/collections/new": [f"https://www.youngla.com/products/new-{i}" for i in range(3)],
+    "https://www.youngla.com/collections/tees": [f"https://www.youngla.com/products/tee-{i}" for i in range(3)],
+}
+
+
+class _Collections:
+    async def get_product_links(self, link):
+        await asyncio.sleep(0.05)
+        return COLLECTIONS[link]
+
+
+class _Headers:
+    def __init__(self, slow=(), placeholder=()):
+        self.slow, self.placeholder, self.calls = set(slow), set(placeholder), []
+
+    async def create_header(self, product_path, region="us"):
+        self.calls.append(product_path)
+        await asyncio.sleep(5 if product_path in self.slow else 0.05)
+        title = "🔗 ТОВАР" if product_path in self.placeholder else product_path.upper()
+        return SimpleNamespace(title=title)
+
+
+class _Hints:
+    def get(self, url):
+        return SimpleNamespace(title="Hinted Tee ") if url.endswith("tee-0") else None
+
+
+def _service(headers, **kwargs):
+    url_parser = SimpleNamespace(
+        extract_product_slug=lambda url: url.rsplit("/", 1)[-1],
+        normalize=lambda url: url,
+        is_collection_url=lambda url: "/collections/" in url,
+    )
+    deps = {
+        "webdriver_service": None,
+        "ai_service": None,
+        "image_downloader": None,
+        "image_sender": None,
+        "collection_handler": None,
+        "constants": None,
+        "exception_handler": None,
+        **kwargs,
+    }
+    return BannerDropService(
+        url_parser_service=url_parser,
+        collection_processing_service=_Collections(),
+        header_service=headers,
+        hints_cache=_Hints(),
+        **deps,
+    )
+
+
+def test_titles_come_from_hints_and_parallel_headers():
+    headers = _Headers(placeholder={"new-1"})
+    service = _service(headers, max_product_titles=4, title_concurrency=8)
+
+    started = time.monotonic()
+    titles = asyncio.run(service._collect_product_titles(list(COLLECTIONS)))
+
+    assert titles == ["NEW-0", "NEW-2", "Hinted Tee", "TEE-1"]             # 🔢 Порядок колекцій, без заглушки
+    assert "tee-0" not in headers.calls                                      # 🧷 Підказка — без мережі
+    assert time.monotonic() - started < 0.5                                  # ⚡ Паралельно, не 6 × 0.1 с
+
+
+def test_slow_products_are_dropped_after_budget():
+    headers = _Headers(slow={"new-1"})
+    service = _service(headers, max_product_titles=9, title_budget_sec=0.3)
+
+    started = time.monotonic()
+    titles = asyncio.run(service._collect_product_titles(list(COLLECTIONS)))
+
+    assert time.monotonic() - started < 1.0
+    assert "NEW-1" not in titles and titles[:2] == ["NEW-0", "NEW-2"]
+
+
+def _banner_html(*banners):
+    slides = "".join(
+        f'<section><div class="content-over-media"><img src="https://cdn.youngla.com/{image}.jpg">'
+        + "".join(f'<a href="/collections/{handle}">{handle}</a>' for handle in handles)
+        + "</div></section>"
+        for image, handles in banners
+    )
+    return f"<html><body>{slides}</body></html>"
+
+
+def test_banners_and_collections_fan_out_with_ordered_delivery():
+    png = BytesIO()
+    Image.new("RGB", (30, 10), "white").save(png, format="PNG")
+    runs = {"active": 0, "peak": 0, "calls": []}
+
+    class _CollectionHandler:
+        async def handle_collection(self, update, context, url=None, *, preserve_order=None):
+            runs["calls"].append((url.rsplit("/", 1)[-1], preserve_order))
+            runs["active"] += 1
+            runs["peak"] = max(runs["peak"], runs["active"])
+            await asyncio.sleep(0.05)
+            runs["active"] -= 1
+
+    async def _send_images(update, context, *, images, caption, parse_mode):
+        return None
+
+    async def _noop(*args, **kwargs):
+        return None
+
+    html = _banner_html(("a", ["men", "women"]), ("b", ["women", "gym", "sale"]))
+    service = _service(
+        _Headers(),
+        concurrency=2,
+        webdriver_service=SimpleNamespace(get_page_content=lambda url, wait_until: _resolved(html)),
+        image_downloader=SimpleNamespace(fetch=lambda url: _resolved(SimpleNamespace(content=png.getvalue()))),
+        image_sender=SimpleNamespace(send_images=_send_images),
+        ai_service=SimpleNamespace(generate_banner_post=lambda **kwargs: _resolved("Drop")),
+        collection_handler=_CollectionHandler(),
+        exception_handler=SimpleNamespace(handle=_noop),
+    )
+    update = SimpleNamespace(effective_message=SimpleNamespace(reply_text=_noop))
+
+    asyncio.run(service.process_homepage(update=update, context=SimpleNamespace(mode=None, url=None)))
+
+    handles = sorted(handle for handle, _ in runs["calls"])
+    assert handles == ["gym", "men", "sale", "women"]                       # 🔁 Спільна колекція — один раз
+    assert all(preserve_order is True for _, preserve_order in runs["calls"])
+    assert runs["peak"] == 2                                                 # 🧵 Паралельно, але в межах concurrency
+    assert service._banner_index.contains(url="https://cdn.youngla.com/a.jpg")
+    assert service._banner_index.contains(url="https://cdn.youngla.com/b.jpg")
+
+
+def test_slices_are_cached_by_digest_and_posted_banners_survive_restart(tmp_path, monkeypatch):
+    png = BytesIO()
+    Image.new("RGB", (30, 10), "white").save(png, format="PNG")
+    content = png.getvalue()
+    sliced, albums = [], []
+    real_slice = banner_module.slice_banner_bytes
+
+    def _counting_slice(raw_bytes, parts=3):
+        sliced.append(len(raw_bytes))
+        return real_slice(raw_bytes, parts)
+
+    monkeypatch.setattr(banner_module, "slice_banner_bytes", _counting_slice)
+
+    async def _send_images(update, context, *, images, caption, parse_mode):
+        albums.append([image.filename for image in images])
+
+    async def _noop(*args, **kwargs):
+        return None
+
+    def _restarted_service(image_url):
+        html = _banner_html((image_url, ["men"]))
+        return _service(
+            _Headers(),
+            webdriver_service=SimpleNamespace(get_page_content=lambda url, wait_until: _resolved(html)),
+            image_downloader=SimpleNamespace(fetch=lambda url: _resolved(SimpleNamespace(content=content))),
+            image_sender=SimpleNamespace(send_images=_send_images),
+            ai_service=SimpleNamespace(generate_banner_post=lambda **kwargs: _resolved("Drop")),
+            collection_handler=SimpleNamespace(handle_collection=_noop),
+            exception_handler=SimpleNamespace(handle=_noop),
+            media_store=MediaStore(tmp_path / "store"),
+            banner_index=ProcessedBannerIndex(tmp_path / "banners.json"),
+        )
+
+    update = SimpleNamespace(effective_message=SimpleNamespace(reply_text=_noop))
+    service = _restarted_service("hero")
+    asyncio.run(service.process_homepage(update=update, context=SimpleNamespace(mode=None, url=None)))
+    asyncio.run(service._slice_banner(content, "0" * 64))                   # ✂️ Інший digest — нова нарізка
+    cached = asyncio.run(service._slice_banner(content, "0" * 64))          # 🗄️ Той самий — зі сховища
+    service.shutdown()
+
+    assert albums == [["banner_1.png", "banner_2.png", "banner_3.png"]]
+    assert len(sliced) == 2 and [item.filename for item in cached] == albums[0]
+
+    for image_url in ("hero", "hero-v2"):                                    # 🔁 Рестарт: той самий URL і новий URL
+        restarted = _restarted_service(image_url)
+        asyncio.run(restarted.process_homepage(update=update, context=SimpleNamespace(mode=None, url=None)))
+        restarted.shutdown()
+    assert len(albums) == 1                                                  # 🪧 Повторно не публікуємо
+
+
+def test_replaced_banner_with_new_version_is_posted(tmp_path):
+    def _png(color):
+        buffer = BytesIO()
+        Image.new("RGB", (30, 10), color).save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    contents = {"1": _png("white"), "2": _png("black"), "3": _png("black")}
+    fetched, albums = [], []
+
+    async def _fetch(url):
+        fetched.append(url)
+        return SimpleNamespace(content=contents[url.rsplit("=", 1)[-1]])
+
+    async def _send_images(update, context, *, images, caption, parse_mode):
+        albums.append(caption)
+
+    async def _noop(*args, **kwargs):
+        return None
+
+    index = ProcessedBannerIndex(tmp_path / "banners.json")
+    update = SimpleNamespace(effective_message=SimpleNamespace(reply_text=_noop))
+    for version in ("1", "1", "2", "3"):
+        html = (
+            f'<html><body><section><div class="content-over-media">'
+            f'<img src="https://cdn.youngla.com/hero.jpg?v={version}"><a href="/collections/men">men</a>'
+            f"</div></section></body></html>"
+        )
+        service = _service(
+            _Headers(),
+            webdriver_service=SimpleNamespace(get_page_content=lambda url, wait_until, html=html: _resolved(html)),
+            image_downloader=SimpleNamespace(fetch=_fetch),
+            image_sender=SimpleNamespace(send_images=_send_images),
+            ai_service=SimpleNamespace(generate_banner_post=lambda **kwargs: _resolved("Drop")),
+            collection_handler=SimpleNamespace(handle_collection=_noop),
+            exception_handler=SimpleNamespace(handle=_noop),
+            media_store=MediaStore(tmp_path / "store"),
+            banner_index=index,
+        )
+        asyncio.run(service.process_homepage(update=update, context=SimpleNamespace(mode=None, url=None)))
+        service.shutdown()
+
+    assert len(albums) == 2                                                  # 🪧 v=1 і замінений v=2
+    assert [url.rsplit("=", 1)[-1] for url in fetched] == ["1", "2", "3"]   # 🔢 v=1 повторно не качаємо
+    assert index.contains(url="https://cdn.youngla.com/hero.jpg?v=3")      # 🔗 Той самий вміст під новою версією
+
+
+async def _resolved(value):
+    return value
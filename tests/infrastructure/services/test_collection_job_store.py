@@ -0,0 +1,71 @@
+# 🧪 tests/infrastructure/services/test_collection_job_store.py
+"""
+🧪 Чекпоінти завдань колекцій і продовження перерваного запуску.
+
+Перевіряє:
+- перерваний запуск лишає на диску стани товарів та id надісланих повідомлень;
+- повторна команда (новий процес) обробляє лише незавершені товари й звітує про продовження;
+- завершений запуск видаляє чекпоінт, тож наступна команда починає з нуля.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.bot.handlers.product.collection_runner import CollectionRunner
+from app.infrastructure.services.collection_job_store import CollectionJobStore
+
+COLLECTION = "https://www.youngla.com/collections/new-arrivals"
+URLS = [f"https://www.youngla.com/products/{handle}" for handle in "abcdef"]
+
+
+def _card(url):
+    data = SimpleNamespace(url=url, content=SimpleNamespace(title=url.rsplit("/", 1)[-1]))
+    return SimpleNamespace(result=SimpleNamespace(ok=True, data=data, alt_fallback_used=False), media_stack=["photo"])
+
+
+class _Handler:
+    def __init__(self, stop_after=None):
+        self.stop_after, self.handled, self.sent = stop_after, [], []
+
+    async def handle_url(self, update, context, *, url, **kwargs):
+        self.handled.append(url)
+        return _card(url)
+
+    async def send_prepared_card(self, update, context, card, **kwargs):
+        self.sent.append(card.result.data.url)
+        return [100 + len(self.sent)]
+
+    def cancelled(self):
+        return self.stop_after is not None and len(self.handled) >= self.stop_after
+
+
+async def _noop(snapshot):
+    return None
+
+
+def _run(store, handler):
+    runner = CollectionRunner(handler, concurrency=1, per_item_retries=0, job_store=store)
+    return asyncio.run(
+        runner.run(None, None, URLS, _noop, handler.cancelled, collection_url=COLLECTION, job_owner="42")
+    )
+
+
+def test_interrupted_job_resumes_from_unfinished_items(tmp_path):
+    first = _Handler(stop_after=2)
+    sent, _ = _run(CollectionJobStore(tmp_path), first)
+    assert sent == 2
+
+    (job,) = CollectionJobStore(tmp_path).unfinished()                   # 💾 Після «рестарту»
+    assert [url for url in URLS if job.is_done(url)] == first.sent
+    assert job.message_ids[first.sent[0]] == [101]
+
+    second = _Handler()
+    sent, health = _run(CollectionJobStore(tmp_path), second)
+    assert second.handled == [url for url in URLS if url not in first.sent]
+    assert sent == len(URLS) - 2
+    assert health.resumed and health.resumed_done == 2
+    assert CollectionJobStore(tmp_path).unfinished() == []               # 🏁 Чекпоінт прибрано
+
+    third = _Handler()
+    _, health = _run(CollectionJobStore(tmp_path), third)
+    assert third.handled == URLS and not health.resumed
@@ -0,0 +1,85 @@
+# 🧪 tests/infrastructure/services/test_image_normalizer.py
+"""
+🧪 Нормалізація фото перед upload.
+
+Перевіряє:
+- велике фото зменшується до `max_side`, втрачає EXIF і стає меншим; повтор береться з дискового кешу;
+- маленьке вже стиснене фото лишається оригіналом, а маркер у кеші прибирає повторний запуск Pillow;
+- ProductMediaPreparer віддає нормалізовані байти з новим розширенням і рахує заощаджені байти.
+"""
+
+import asyncio
+import io
+import random
+
+from PIL import Image
+
+import app.bot.handlers  # noqa: F401  — bot-пакет першим: services ↔ bot.handlers імпортуються циклічно
+from app.infrastructure.services import image_normalizer as normalizer_module
+from app.infrastructure.services.image_normalizer import ImageNormalizer, NormalizeSettings
+from app.infrastructure.services.product_media_preparer import ProductMediaPreparer
+from app.infrastructure.size_chart.image_downloader import ImageData
+
+
+def _photo(size, fmt="PNG", exif=False, **kwargs):
+    rnd = random.Random(7)
+    image = Image.new("RGB", size)
+    image.putdata([(rnd.randrange(256), 120, 80) for _ in range(size[0] * size[1])])
+    buffer = io.BytesIO()
+    if exif:
+        data = Image.Exif()
+        data[0x010F] = "CameraMaker"
+        kwargs["exif"] = data.tobytes()
+    image.save(buffer, format=fmt, **kwargs)
+    return buffer.getvalue()
+
+
+def _data(content, url="https://cdn.shopify.com/big.png"):
+    return ImageData(url=url, content=content, sha256=str(hash(content)), content_type="image/png")
+
+
+def test_large_photo_is_resized_stripped_and_cached(tmp_path, monkeypatch):
+    normalizer = ImageNormalizer(NormalizeSettings(max_side=320, quality=80), cache_dir=tmp_path)
+    original = _photo((960, 640), fmt="JPEG", exif=True)
+
+    first = asyncio.run(normalizer.normalize(_data(original)))
+    assert first.changed and first.content_type == "image/jpeg"
+    assert first.bytes_saved > 0
+    with Image.open(io.BytesIO(first.content)) as image:
+        assert max(image.size) == 320
+        assert not image.getexif()
+
+    assert len(list(tmp_path.rglob("*.jpg"))) == 1
+    second = asyncio.run(normalizer.normalize(_data(original)))
+    assert second.content == first.content
+
+    small = _photo((40, 40), fmt="JPEG", quality=20, optimize=True)
+    skipped = asyncio.run(normalizer.normalize(_data(small)))
+    assert not skipped.changed and skipped.content == small
+    assert [p.stat().st_size for p in tmp_path.rglob("*.jpg")].count(0) == 1   # 🏷️ Маркер «оригінал»
+
+    def _unexpected(*args):
+        raise AssertionError("Pillow не мав запускатися повторно")
+
+    monkeypatch.setattr(normalizer_module, "normalize_image_bytes", _unexpected)
+    again = asyncio.run(normalizer.normalize(_data(small)))
+    assert not again.changed and again.content == small and again.content_type == "image/png"
+    normalizer.shutdown()
+
+
+def test_preparer_uploads_normalized_bytes():
+    original = _photo((900, 300))
+
+    class _Downloader:
+        async def fetch(self, url):
+            return _data(original, url)
+
+    normalizer = ImageNormalizer(NormalizeSettings(max_side=300))
+    preparer = ProductMediaPreparer(_Downloader(), normalizer=normalizer)
+    stack = asyncio.run(preparer.prepare_stack(["https://cdn.shopify.com/big.png"]))
+    normalizer.shutdown()
+
+    (file,) = stack.files
+    assert file.filename == "big.jpg" and file.sha256 == str(hash(original))
+    assert len(file.input_file_content) < len(original)
+    assert stack.bytes_saved == len(original) - len(file.input_file_content)
@@ -0,0 +1,145 @@
+# 🧪 tests/infrastructure/services/test_processed_product_cache.py
+"""
+🧪 ProcessedProductCache у ProductProcessingService.
+
+Перевіряє:
+- повторне посилання віддається з кешу без парсингу/AI;
+- зміна курсів валют дає промах (новий ключ);
+- застаріла наявність перераховується, контент лишається з кешу;
+- дисковий шар переживає новий екземпляр кешу, а pickle/файли обробляються поза event loop;
+- пам'ять обмежена приблизним обсягом (HTML сторінок), а не лише кількістю записів.
+"""
+
+import asyncio
+import threading
+from decimal import Decimal
+from types import SimpleNamespace
+
+import app.bot.handlers  # noqa: F401  — bot-пакет першим: services ↔ bot.handlers імпортуються циклічно
+from app.domain.products.entities import ProductInfo
+from app.infrastructure.content.product_content_service import ContentBuildDiagnostics, ProductContentDTO
+from app.infrastructure.services.processed_product_cache import ProcessedProductCache, rates_fingerprint
+from app.infrastructure.services.product_processing_service import ProductProcessingService
+
+URL = "https://www.youngla.com/products/4003?variant=1"
+
+
+class _Counters:
+    def __init__(self):
+        self.parsed = 0
+        self.content = 0
+        self.availability = 0
+        self.report = "Black: M"
+
+
+def _service(counters, cache):
+    class _Parser:
+        page_source = ""
+
+        async def get_product_info(self):
+            counters.parsed += 1
+            return ProductInfo(title="Essential Tee", price=Decimal("40"))
+
+    class _Availability:
+        async def process(self, url):
+            counters.availability += 1
+            return SimpleNamespace(reports=SimpleNamespace(public_report=counters.report))
+
+    class _Content:
+        async def build_product_content(self, product, *, url, colors_text):
+            counters.content += 1
+            dto = ProductContentDTO(
+                title=product.title, slogan="s", hashtags="#t", sections={}, colors_text=colors_text,
+                price_message="40$", images=["a.jpg"], alt_texts={}, alt_fallback_used=False,
+            )
+            return dto, ContentBuildDiagnostics(images_found=1, images_ready=1)
+
+    async def _recommend(dto):
+        return SimpleNamespace(raw_text="track")
+
+    return ProductProcessingService(
+        parser_factory=SimpleNamespace(create_product_parser=lambda url: _Parser()),
+        availability_processing_service=_Availability(),
+        content_service=_Content(),
+        music_recommendation=SimpleNamespace(recommend=_recommend),
+        url_parser_service=SimpleNamespace(get_region_label=lambda url: "US"),
+        result_cache=cache,
+    )
+
+
+def test_repeat_link_served_from_cache_and_currency_change_misses():
+    counters = _Counters()
+    rates = {"USD": Decimal("41.5")}
+    cache = ProcessedProductCache(ttl_sec=60, availability_ttl_sec=60, currency_fingerprint=lambda: rates_fingerprint(rates))
+    service = _service(counters, cache)
+
+    first = asyncio.run(service.process_url(URL))
+    second = asyncio.run(service.process_url(URL.split("?")[0]))
+    assert first.ok and second.ok
+    assert (counters.parsed, counters.content) == (1, 1)
+    assert second.data.diagnostics.cache_hit and not first.data.diagnostics.cache_hit
+
+    rates["USD"] = Decimal("42.0")
+    asyncio.run(service.process_url(URL))
+    assert counters.content == 2
+
+
+def test_stale_availability_is_refreshed_on_hit():
+    counters = _Counters()
+    cache = ProcessedProductCache(ttl_sec=60, availability_ttl_sec=0.01)
+    service = _service(counters, cache)
+
+    asyncio.run(service.process_url(URL))
+    counters.report = "Black: SOLD OUT"
+
+    async def _later():
+        await asyncio.sleep(0.02)
+        return await service.process_url(URL)
+
+    result = asyncio.run(_later())
+    assert result.data.content.colors_text == "Black: SOLD OUT"
+    assert (counters.parsed, counters.content, counters.availability) == (1, 1, 2)
+
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    counters = _Counters()
+    disk_threads = []
+
+    class _TrackingCache(ProcessedProductCache):
+        def _read_disk(self, key, now):
+            disk_threads.append(threading.get_ident())
+            return super()._read_disk(key, now)
+
+        def _write_disk(self, key, entry):
+            disk_threads.append(threading.get_ident())
+            super()._write_disk(key, entry)
+
+    asyncio.run(_service(counters, _TrackingCache(ttl_sec=60, disk_dir=tmp_path)).process_url(URL))
+
+    fresh = _TrackingCache(ttl_sec=60, disk_dir=tmp_path)
+    result = asyncio.run(_service(counters, fresh).process_url(URL))
+    assert result.data.diagnostics.cache_hit
+    assert counters.parsed == 1
+    assert disk_threads and threading.get_ident() not in disk_threads     # 🧵 Диск — не в потоці event loop
+
+
+def test_memory_bound_counts_page_source_bytes():
+    cache = ProcessedProductCache(ttl_sec=60, max_entries=128, max_bytes=25_000)
+    pages = [SimpleNamespace(page_source="<html>" + "x" * 10_000, content="c") for _ in range(3)]
+
+    async def scenario():
+        for idx, data in enumerate(pages):
+            await cache.put(f"https://www.youngla.com/products/{idx}", "US", data)
+
+        assert len(cache) == 2                                            # 🧹 Третій HTML витіснив найстаріший
+        assert await cache.get("https://www.youngla.com/products/0", "US") is None
+        assert (await cache.get("https://www.youngla.com/products/2", "US")).data is pages[2]
+        assert cache.memory_bytes <= 25_000
+
+        await cache.invalidate("https://www.youngla.com/products/2", "US")
+        huge = SimpleNamespace(page_source="x" * 30_000, content="")
+        await cache.put("https://www.youngla.com/products/huge", "US", huge)
+        assert await cache.get("https://www.youngla.com/products/huge", "US") is None  # 📏 Завеликий запис не тримаємо
+        assert (await cache.get("https://www.youngla.com/products/1", "US")).data is pages[1]  # ♻️ і не витісняємо ним інші
+
+    asyncio.run(scenario())
@@ -0,0 +1,58 @@
+# 🧪 tests/infrastructure/services/test_product_media_preparer.py
+"""
+🧪 Паралельна підготовка стеку фото.
+
+Перевіряє:
+- одночасно качається не більше `max_concurrency` фото, а порядок стеку = порядок URL;
+- биті фото відкидаються (часткова успішність), жодного фото — помилка.
+"""
+
+import asyncio
+
+import pytest
+
+import app.bot.handlers  # noqa: F401  — bot-пакет першим: services ↔ bot.handlers імпортуються циклічно
+from app.infrastructure.services.product_media_preparer import ProductMediaPreparationError, ProductMediaPreparer
+from app.infrastructure.size_chart.image_downloader import ImageData
+
+
+class _Downloader:
+    def __init__(self, delays, broken=()):
+        self.delays, self.broken = delays, set(broken)
+        self.active = self.peak = 0
+
+    async def fetch(self, url):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(url, 0.0))
+            if url in self.broken:
+                raise RuntimeError("Image fetch failed: http_status")
+            return ImageData(url=url, content=url.encode(), sha256="x", content_type="image/jpeg")
+        finally:
+            self.active -= 1
+
+
+URLS = [f"https://cdn.shopify.com/p{i}.jpg" for i in range(6)]
+
+
+def test_bounded_concurrency_preserves_order():
+    delays = {url: 0.03 - i * 0.005 for i, url in enumerate(URLS)}   # 🔁 Пізніші завершуються раніше
+    downloader = _Downloader(delays)
+    preparer = ProductMediaPreparer(downloader, max_concurrency=3)
+
+    stack = asyncio.run(preparer.prepare_stack(URLS, title="Tee"))
+
+    assert downloader.peak == 3
+    assert [f.filename for f in stack.files] == [f"p{i}.jpg" for i in range(6)]
+    assert stack.failed_urls == []
+
+
+def test_partial_success_and_total_failure():
+    downloader = _Downloader({}, broken={URLS[1], URLS[4]})
+    stack = asyncio.run(ProductMediaPreparer(downloader).prepare_stack(URLS))
+    assert [f.filename for f in stack.files] == ["p0.jpg", "p2.jpg", "p3.jpg", "p5.jpg"]
+    assert stack.failed_urls == [URLS[1], URLS[4]]
+
+    with pytest.raises(ProductMediaPreparationError):
+        asyncio.run(ProductMediaPreparer(_Downloader({}, broken=URLS[:2])).prepare_stack(URLS[:2]))
@@ -0,0 +1,132 @@
+# 🧪 tests/infrastructure/services/test_product_processing_stages.py
+"""
+🧪 StageGraph та граф етапів у ProductProcessingService.
+
+Перевіряє:
+- контент і size chart стартують одразу після парсингу, не чекаючи на наявність;
+- `colors_text` з наявності потрапляє в уже зібраний контент;
+- таймаут необовʼязкового етапу деградує діагностику, а не всю картку;
+- критичний шлях та збій обовʼязкового етапу в самому графі.
+"""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+import app.bot.handlers  # noqa: F401  — bot-пакет першим: services ↔ bot.handlers імпортуються циклічно
+from app.domain.products.entities import ProductInfo
+from app.infrastructure.content.product_content_service import ContentBuildDiagnostics, ProductContentDTO
+from app.infrastructure.services.product_processing_service import ProductProcessingService
+from app.infrastructure.services.stage_graph import STATUS_CANCELLED, STATUS_FAILED, StageGraph
+
+URL = "https://www.youngla.com/products/4003"
+
+
+class _Parser:
+    page_source = "<html>size chart</html>"
+
+    async def get_product_info(self):
+        return ProductInfo(title="Essential Tee", price=Decimal("40"))
+
+
+class _Availability:
+    def __init__(self, events, delay):
+        self.events, self.delay = events, delay
+
+    async def process(self, url):
+        self.events.append("availability:start")
+        await asyncio.sleep(self.delay)
+        self.events.append("availability:end")
+        return SimpleNamespace(reports=SimpleNamespace(public_report="Black: M, L"))
+
+
+class _Content:
+    def __init__(self, events):
+        self.events = events
+
+    async def build_product_content(self, product, *, url, colors_text):
+        self.events.append("content:start")
+        await asyncio.sleep(0.01)
+        dto = ProductContentDTO(
+            title=product.title, slogan="s", hashtags="#t", sections={}, colors_text=colors_text,
+            price_message="40$", images=["a.jpg"], alt_texts={}, alt_fallback_used=False,
+        )
+        return dto, ContentBuildDiagnostics(images_found=1, images_ready=1)
+
+
+class _Music:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    async def recommend(self, dto):
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(raw_text="track")
+
+
+class _SizeCharts:
+    def __init__(self, events):
+        self.events = events
+
+    async def process_all_size_charts(self, page_source, *, product_sku=None):
+        self.events.append("size_chart:start")
+        return SimpleNamespace(ordered_paths=lambda: ["chart.png"], as_dict=lambda: {})
+
+
+def _service(events, *, availability_delay=0.05, music_delay=0.0, timeouts=None):
+    return ProductProcessingService(
+        parser_factory=SimpleNamespace(create_product_parser=lambda url: _Parser()),
+        availability_processing_service=_Availability(events, availability_delay),
+        content_service=_Content(events),
+        music_recommendation=_Music(music_delay),
+        url_parser_service=SimpleNamespace(get_region_label=lambda url: "US"),
+        size_chart_service=_SizeCharts(events),
+        stage_timeouts=timeouts,
+    )
+
+
+def test_independent_stages_start_before_availability_finishes():
+    events = []
+    result = asyncio.run(_service(events).process_url(URL))
+
+    assert result.ok
+    assert events.index("content:start") < events.index("availability:end")
+    assert events.index("size_chart:start") < events.index("availability:end")
+    assert result.data.content.colors_text == "Black: M, L"
+    diag = result.data.diagnostics
+    assert diag.has_size_chart and diag.ocr_status == "ok"
+    assert set(diag.stage_timings_ms) == {"parse", "availability", "music", "content", "size_chart"}
+    assert diag.critical_path == ("parse", "availability")
+
+
+def test_optional_stage_timeout_degrades_only_its_block():
+    events = []
+    service = _service(events, availability_delay=0.0, music_delay=1.0, timeouts={"music": 0.05})
+    result = asyncio.run(service.process_url(URL))
+
+    assert result.ok
+    assert not result.data.diagnostics.music_ok
+    assert "таймаут" in result.data.diagnostics.music_error
+    assert result.data.music_text == ""
+
+
+def test_required_stage_failure_cancels_rest_of_graph():
+    async def _slow(_deps):
+        await asyncio.sleep(5)
+
+    async def _boom(_deps):
+        raise RuntimeError("boom")
+
+    async def _root(_deps):
+        return 1
+
+    async def _run():
+        graph = StageGraph()
+        graph.add("root", _root)
+        graph.add("slow", _slow, deps=("root",))
+        graph.add("boom", _boom, deps=("root",), required=True)
+        return await graph.run()
+
+    run = asyncio.run(asyncio.wait_for(_run(), timeout=2))
+    assert run.outcomes["boom"].status == STATUS_FAILED
+    assert run.outcomes["slow"].status == STATUS_CANCELLED
+    assert run.critical_path == ("root", "boom")
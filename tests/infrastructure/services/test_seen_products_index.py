@@ -0,0 +1,94 @@
+# 🧪 tests/infrastructure/services/test_seen_products_index.py
+"""
+🧪 SeenProductsIndex + режим «лише змінені» у CollectionRunner.
+
+Перевіряє:
+- fingerprint реагує на ціну / наявність / фото, але не на `?v=` у URL фото;
+- індекс переживає перезапуск (читання з диска);
+- CollectionRunner пропускає незмінені товари та рахує їх у health.skipped.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.bot.handlers.product.collection_runner import CollectionRunner
+from app.infrastructure.services.seen_products_index import SeenProductsIndex, product_fingerprint
+from app.shared.cache.product_hints_cache import ProductHint, ProductHintsCache
+
+COLLECTION = "https://www.youngla.com/collections/new-arrivals"
+
+
+def _hint(handle: str, price: str = "40.00", available: bool = True, image: str = "//cdn/a.jpg?v=1") -> ProductHint:
+    return ProductHint(
+        url=f"https://www.youngla.com/products/{handle}",
+        handle=handle,
+        title=handle.upper(),
+        images=(image,),
+        stock={"Black": {"M": available}},
+        price=price,
+    )
+
+
+@pytest.fixture
+def hints_cache(monkeypatch):
+    monkeypatch.setattr(ProductHintsCache, "_instance", None)
+    return ProductHintsCache(max_entries=64, ttl_sec=0)
+
+
+def test_fingerprint_tracks_price_stock_and_images():
+    base = product_fingerprint(_hint("tee"))
+    assert product_fingerprint(_hint("tee", image="//cdn/a.jpg?v=2")) == base
+    assert product_fingerprint(_hint("tee", price="40")) == base
+    assert product_fingerprint(_hint("tee", price="35.00")) != base
+    assert product_fingerprint(_hint("tee", available=False)) != base
+    assert product_fingerprint(_hint("tee", image="//cdn/b.jpg")) != base
+
+
+def test_index_persists_between_instances(tmp_path):
+    fp = product_fingerprint(_hint("tee"))
+    SeenProductsIndex(tmp_path).record(COLLECTION + "?page=2", {"https://www.youngla.com/products/tee": fp})
+
+    reopened = SeenProductsIndex(tmp_path)
+    assert reopened.is_unchanged(COLLECTION, "https://www.youngla.com/products/tee/", fp)
+    assert not reopened.is_unchanged(COLLECTION, "https://www.youngla.com/products/tee", "other")
+    assert not reopened.is_unchanged(COLLECTION, "https://www.youngla.com/products/tee", None)
+
+
+class _FakeProductHandler:
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    async def handle_url(self, update, context, *, url, update_currency, send_immediately):
+        data = SimpleNamespace(url=url, content=SimpleNamespace(title=url.rsplit("/", 1)[-1]))
+        result = SimpleNamespace(ok=True, data=data, alt_fallback_used=False, error_message=None)
+        return SimpleNamespace(result=result, media_stack=["photo"])
+
+    async def send_prepared_card(self, update, context, card, include_region_notice):
+        self.sent.append(card.result.data.url)
+
+
+def test_runner_changed_only_skips_unchanged(tmp_path, hints_cache):
+    urls = [f"https://www.youngla.com/products/{h}" for h in ("a", "b", "c")]
+    hints_cache.put_many(_hint(h) for h in ("a", "b", "c"))
+    index = SeenProductsIndex(tmp_path)
+
+    async def _noop(_snapshot):
+        return None
+
+    def _run(handler):
+        runner = CollectionRunner(handler, concurrency=2, per_item_retries=0, seen_index=index)
+        return asyncio.run(
+            runner.run(None, None, urls, _noop, lambda: False, collection_url=COLLECTION, changed_only=True)
+        )
+
+    first = _FakeProductHandler()
+    sent, health = _run(first)
+    assert sent == 3 and health.skipped == 0
+
+    hints_cache.put(_hint("b", price="19.99"))                      # 💰 Змінилась ціна лише в «b»
+    second = _FakeProductHandler()
+    sent, health = _run(second)
+    assert second.sent == [urls[1]]
+    assert sent == 1 and health.skipped == 2 and health.total == 1
@@ -0,0 +1,115 @@
+# tests/parsers/test_collection_pagination.py
+import asyncio
+
+from app.infrastructure.parsers.collections.universal_collection_parser import UniversalCollectionParser
+
+BASE = "https://www.youngla.com/collections/men"
+_PAD = "<!--" + "x" * 1500 + "-->"
+
+
+def _page(links, pagination=""):
+    anchors = "".join(f'<a href="/products/{slug}">{slug}</a>' for slug in links)
+    return f"<html><body>{anchors}{pagination}{_PAD}</body></html>"
+
+
+class _FakeWebDriver:
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_page_content(self, url, **kwargs):
+        self.calls.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.pages.get(url, "")
+
+
+class _FakeUrlParser:
+    def get_currency(self, url):
+        return "USD"
+
+    def get_base_url(self, currency):
+        return "https://www.youngla.com"
+
+
+class _FakeConfig:
+    def __init__(self, **values):
+        self.values = values
+
+    def get(self, key, default=None, cast=None):
+        return self.values.get(key, default)
+
+
+def _parser(pages, **cfg):
+    driver = _FakeWebDriver(pages)
+    parser = UniversalCollectionParser(BASE, driver, _FakeConfig(**cfg), _FakeUrlParser())
+    return parser, driver
+
+
+def test_parallel_pages_keep_order_and_stop_early():
+    pagination = '<div class="pagination"><a href="?page=2">2</a><a href="?page=3">3</a><a href="?page=4">4</a></div>'
+    pages = {
+        BASE: _page(["a", "b"], pagination),
+        f"{BASE}?page=2": _page(["c", "b"]),
+        f"{BASE}?page=3": _page(["d"]),
+        f"{BASE}?page=4": _page(["a", "d"]),
+    }
+    parser, driver = _parser(pages, **{"parser.collection.pagination.concurrency": 3})
+
+    links = asyncio.run(parser.get_product_links())
+
+    assert links == [f"https://www.youngla.com/products/{slug}" for slug in ("a", "b", "c", "d")]
+    assert driver.max_in_flight == 3
+    assert sorted(driver.calls[1:]) == [f"{BASE}?page={n}" for n in (2, 3, 4)]
+
+
+def test_next_link_only_walks_pages_one_by_one_until_empty():
+    pages = {
+        BASE: _page(["a"], '<link rel="next" href="/collections/men?page=2">'),
+        f"{BASE}?page=2": _page(["b"]),
+        f"{BASE}?page=3": _page(["c"]),
+    }
+    parser, driver = _parser(pages, **{"parser.collection.pagination.concurrency": 3})
+
+    links = asyncio.run(parser.get_product_links())
+
+    assert links == [f"https://www.youngla.com/products/{slug}" for slug in ("a", "b", "c")]
+    assert driver.calls == [BASE, f"{BASE}?page=2", f"{BASE}?page=3", f"{BASE}?page=4"]
+    assert driver.max_in_flight == 1                                       # 🚶 Без спекулятивної хвилі
+
+
+def test_pages_keep_sort_and_filter_query():
+    url = f"{BASE}?sort_by=price-ascending&filter.v.size=M"
+    query = "/collections/men?sort_by=price-ascending&amp;filter.v.size=M&amp;page="
+    pagination = f'<div class="pagination"><a href="{query}2">2</a><a href="{query}3">3</a></div>'
+    pages = {
+        url: _page(["a"], f'<link rel="next" href="{query}2">{pagination}'),
+        f"{url}&page=2": _page(["b"], f'<link rel="next" href="{query}3">'),
+        f"{url}&page=3": _page(["c"]),
+    }
+    for parallel in (True, False):
+        driver = _FakeWebDriver(pages)
+        config = _FakeConfig(**{"parser.collection.pagination.parallel": parallel})
+        parser = UniversalCollectionParser(url, driver, config, _FakeUrlParser())
+
+        links = asyncio.run(parser.get_product_links())
+
+        assert links == [f"https://www.youngla.com/products/{slug}" for slug in ("a", "b", "c")]
+        assert sorted(driver.calls[1:]) == [f"{url}&page=2", f"{url}&page=3"]  # 🔎 Та сама вибірка на всіх сторінках
+
+
+def test_sequential_mode_follows_page_param():
+    pages = {
+        BASE: _page(["a"], '<link rel="next" href="/collections/men?page=2">'),
+        f"{BASE}?page=2": _page(["b"]),
+    }
+    parser, driver = _parser(pages, **{"parser.collection.pagination.parallel": False})
+
+    links = asyncio.run(parser.get_product_links())
+
+    assert links == ["https://www.youngla.com/products/a", "https://www.youngla.com/products/b"]
+    assert driver.calls == [BASE, f"{BASE}?page=2"]
@@ -0,0 +1,104 @@
+# 🧪 tests/parsers/test_search_query_cache.py
+"""
+🧪 CachedProductSearchProvider: нормалізація запиту, TTL, негативний кеш, злиття запитів, збої провайдера.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.domain.products.entities import Url
+from app.domain.products.interfaces import SearchResult
+from app.infrastructure.parsers.product_search.cached_search_provider import (
+    CachedProductSearchProvider,
+    normalize_query,
+)
+from app.infrastructure.parsers.product_search.search_resolver import ProductSearchResolver
+from app.shared.errors import NetworkError
+
+
+class _FakeProvider:
+    def __init__(self, known: dict[str, str]) -> None:
+        self.known = known
+        self.calls: list[tuple[str, str]] = []
+
+    async def resolve_one(self, query: str):
+        self.calls.append(("one", query))
+        await asyncio.sleep(0)
+        href = self.known.get(query.strip().lower())
+        return Url(href) if href else None
+
+    async def resolve_many(self, query: str, limit: int = 10):
+        self.calls.append(("many", query))
+        href = self.known.get(query.strip().lower())
+        return [SearchResult(url=Url(href))] if href else []
+
+
+def test_normalize_query_case_whitespace_and_translit():
+    assert normalize_query("  Essential   TEE!! ") == "essential tee"
+    assert normalize_query("Футболка чорна") == "futbolka chorna"
+    assert normalize_query("futbolka-chorna") == normalize_query("ФУТБОЛКА  чорна")
+
+
+def test_positive_negative_and_stats():
+    inner = _FakeProvider({"essential tee": "https://www.youngla.com/products/essential-tee"})
+    cache = CachedProductSearchProvider(inner, ttl_sec=60, negative_ttl_sec=60)
+
+    async def scenario():
+        first = await cache.resolve_one("Essential Tee")
+        again = await cache.resolve_one("  essential   TEE ")
+        missing = await cache.resolve_one("unknown thing")
+        missing_again = await cache.resolve_one("Unknown-Thing")
+        return first, again, missing, missing_again
+
+    first, again, missing, missing_again = asyncio.run(scenario())
+    assert first == again and first is not None
+    assert missing is None and missing_again is None
+    assert [kind for kind, _ in inner.calls] == ["one", "one"]
+
+    stats = cache.stats()
+    assert (stats.hits, stats.negative_hits, stats.misses) == (1, 1, 2)
+    assert stats.hit_rate == 0.5
+
+
+def test_zero_negative_ttl_disables_negative_cache_and_requests_coalesce():
+    inner = _FakeProvider({"tee": "https://www.youngla.com/products/tee"})
+    cache = CachedProductSearchProvider(inner, ttl_sec=60, negative_ttl_sec=0)
+
+    async def scenario():
+        await asyncio.gather(*(cache.resolve_one("tee") for _ in range(5)))
+        await cache.resolve_one("nothing")
+        await cache.resolve_one("nothing")
+        many = await cache.resolve_many("tee", 5)
+        return many
+
+    many = asyncio.run(scenario())
+    assert inner.calls.count(("one", "tee")) == 1
+    assert inner.calls.count(("one", "nothing")) == 2
+    assert [r.url.value for r in many] == ["https://www.youngla.com/products/tee"]
+
+
+def test_provider_failure_is_not_negative_cached():
+    class _BrokenWarmPage(ProductSearchResolver):
+        async def _ensure_warm_page(self, slot):
+            raise TimeoutError("predictive timeout")
+
+    webdriver = SimpleNamespace(new_context=lambda **kwargs: None)      # ♨️ Спільний браузер (тепла сторінка)
+    resolver = _BrokenWarmPage(webdriver, raise_on_failure=True, retry_attempts=0)
+    resolver._suggest_enabled = False
+    cache = CachedProductSearchProvider(resolver, ttl_sec=60, negative_ttl_sec=60)
+
+    async def scenario():
+        try:
+            await resolver.resolve_one("tee")
+        except NetworkError:
+            raised = True
+        else:
+            raised = False
+        results = (await cache.resolve_one("tee"), await cache.resolve_many("tee", 3))
+        return raised, results
+
+    raised, (one, many) = asyncio.run(scenario())
+    assert raised
+    assert one is None and many == []
+    assert len(cache) == 0                                                # 🔁 Наступний запит шукатиме знову
+    assert cache.stats().negative_hits == 0
@@ -0,0 +1,162 @@
+# 🧪 tests/parsers/test_search_resolver_warm.py
+"""
+🧪 ProductSearchResolver: тепла сторінка у спільному браузері.
+
+Перевіряє:
+- один контекст/навігація на кілька запитів (cold → warm);
+- підказки читаються після відповіді `/search/suggest` для поточного запиту;
+- латентність рахується окремо для cold та warm;
+- паралельні запити розходяться по пулу теплих сторінок, надлишок — у разовий контекст.
+"""
+
+import asyncio
+
+import httpx
+
+from app.infrastructure.parsers.product_search.search_resolver import ProductSearchResolver
+from app.infrastructure.web.http_client_pool import HttpClientPool
+
+
+class _Element:
+    def __init__(self, href: str) -> None:
+        self._href = href
+
+    async def get_attribute(self, name: str):
+        return self._href
+
+
+class _ResponseInfo:
+    def __init__(self, page: "_FakePage", predicate) -> None:
+        self._page = page
+        self._predicate = predicate
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    def value(self):
+        async def _resolve():
+            response = type("R", (), {"url": f"https://www.youngla.com/search/suggest?q={self._page.query}&section_id=x"})()
+            assert self._predicate(response)
+            return response
+        return _resolve()
+
+
+class _FakePage:
+    def __init__(self) -> None:
+        self.query = ""
+        self.gotos = 0
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def goto(self, url, **kwargs):
+        self.gotos += 1
+
+    async def wait_for_load_state(self, *args, **kwargs):
+        return None
+
+    async def wait_for_selector(self, *args, **kwargs):
+        return None
+
+    async def evaluate(self, *args, **kwargs):
+        return None
+
+    async def wait_for_timeout(self, ms):
+        return None
+
+    async def fill(self, selector, value):
+        self.query = value
+        if value:
+            await asyncio.sleep(0.02)                                      # ⌛ Predictive на сайті
+
+    def expect_response(self, predicate, timeout=None):
+        return _ResponseInfo(self, predicate)
+
+    async def query_selector_all(self, selector):
+        if self.query and "predictive-search__products a.product-title" in selector:
+            return [_Element(f"/products/{self.query.replace(' ', '-')}")]
+        return []
+
+
+class _FakeContext:
+    def __init__(self) -> None:
+        self.pages: list[_FakePage] = []
+        self.closed = False
+
+    async def new_page(self):
+        page = _FakePage()
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+        for page in self.pages:
+            page.closed = True
+
+
+class _FakeWebDriver:
+    def __init__(self) -> None:
+        self.contexts: list[_FakeContext] = []
+
+    async def new_context(self, **kwargs):
+        ctx = _FakeContext()
+        self.contexts.append(ctx)
+        return ctx
+
+
+def test_warm_page_is_reused_between_queries():
+    driver = _FakeWebDriver()
+    empty_suggest = httpx.MockTransport(lambda request: httpx.Response(200, json={"resources": {"results": {"products": []}}}))
+    resolver = ProductSearchResolver(webdriver_service=driver, retry_attempts=0, client_pool=HttpClientPool(transport=empty_suggest))
+
+    async def scenario():
+        first = await resolver.resolve_one("essential tee")
+        second = await resolver.resolve_one("joggers")
+        await resolver.aclose()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first.value == "https://www.youngla.com/products/essential-tee"
+    assert second.value == "https://www.youngla.com/products/joggers"
+    assert len(driver.contexts) == 1 and driver.contexts[0].closed
+    assert driver.contexts[0].pages[0].gotos == 1
+
+    snapshot = resolver.latency_snapshot()
+    assert snapshot["cold"]["count"] == 1
+    assert snapshot["warm"]["count"] == 1
+
+
+def test_concurrent_queries_use_warm_pool_and_overflow_context():
+    driver = _FakeWebDriver()
+    empty_suggest = httpx.MockTransport(lambda request: httpx.Response(200, json={"resources": {"results": {"products": []}}}))
+    resolver = ProductSearchResolver(webdriver_service=driver, retry_attempts=0, client_pool=HttpClientPool(transport=empty_suggest))
+
+    async def scenario():
+        found = await asyncio.gather(*(resolver.resolve_one(query) for query in ("tee", "joggers", "hoodie")))
+        contexts_after_burst = list(driver.contexts)
+        await resolver.resolve_one("shorts")
+        await resolver.aclose()
+        return found, contexts_after_burst
+
+    found, burst_contexts = asyncio.run(scenario())
+
+    assert [url.value for url in found] == [
+        "https://www.youngla.com/products/tee",
+        "https://www.youngla.com/products/joggers",
+        "https://www.youngla.com/products/hoodie",
+    ]
+    assert len(burst_contexts) == 3                                        # ♨️ 2 теплі + 1 разовий
+    assert burst_contexts[2].closed                                        # 🪟 Разовий контекст закрито одразу
+    assert len(driver.contexts) == 3                                       # ♻️ Наступний запит — на теплій сторінці
+    assert all(ctx.closed for ctx in driver.contexts)
+
+    snapshot = resolver.latency_snapshot()
+    assert snapshot["cold"]["count"] == 2
+    assert snapshot["overflow"]["count"] == 1
+    assert snapshot["warm"]["count"] == 1
@@ -0,0 +1,94 @@
+# 🧪 tests/parsers/test_search_suggest_json.py
+"""
+🧪 ProductSearchResolver: fast path через Shopify `/search/suggest.json`.
+
+Перевіряє:
+- результати JSON канонізуються через `_canonicalize` та несуть назви;
+- при помилці HTTP пошук падає у Playwright-сценарій;
+- запити йдуть через один клієнт спільного `HttpClientPool`, без пулу fast path вимкнено.
+"""
+
+import asyncio
+
+import httpx
+
+from app.infrastructure.parsers.product_search.search_resolver import ProductSearchResolver
+from app.infrastructure.web.http_client_pool import HttpClientPool
+
+_PAYLOAD = {
+    "resources": {
+        "results": {
+            "products": [
+                {"handle": "essential-tee", "title": "Essential Tee", "url": "/products/essential-tee?_pos=1&_sid=a&_ss=r"},
+                {"handle": "essential-tee", "title": "Essential Tee", "url": "/products/essential-tee?_pos=2"},
+                {"handle": "", "title": "Joggers", "url": "/products/joggers?_pos=3&_sid=a&_ss=r"},
+            ]
+        }
+    }
+}
+
+
+class _UrlParser:
+    @staticmethod
+    def normalize(url: str) -> str:
+        return url.replace("https://www.", "https://")
+
+
+def test_resolve_many_uses_suggest_json():
+    seen_requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_requests.append(request)
+        return httpx.Response(200, json=_PAYLOAD)
+
+    resolver = ProductSearchResolver(url_parser_service=_UrlParser(), client_pool=HttpClientPool(transport=httpx.MockTransport(handler)))
+
+    async def _no_browser(query, limit):
+        raise AssertionError("Playwright не повинен запускатись")
+
+    resolver._search_many_with_retries = _no_browser  # type: ignore[assignment]
+    results = asyncio.run(resolver.resolve_many("  essential tee ", 5))
+
+    assert [r.url.value for r in results] == [
+        "https://youngla.com/products/essential-tee",
+        "https://youngla.com/products/joggers",
+    ]
+    assert [r.title for r in results] == ["Essential Tee", "Joggers"]
+    assert seen_requests[0].url.path == "/search/suggest.json"
+    assert seen_requests[0].url.params["q"] == "essential tee"
+    assert seen_requests[0].url.params["resources[type]"] == "product"
+
+
+def test_resolve_one_falls_back_to_browser_on_http_error():
+    transport = httpx.MockTransport(lambda request: httpx.Response(503))
+    resolver = ProductSearchResolver(client_pool=HttpClientPool(transport=transport))
+
+    async def _browser(query, limit):
+        return ["/products/fallback-hoodie"]
+
+    resolver._search_many_impl = _browser  # type: ignore[assignment]
+    url = asyncio.run(resolver.resolve_one("hoodie"))
+
+    assert url is not None and url.value == "https://www.youngla.com/products/fallback-hoodie"
+
+
+def test_suggest_json_reuses_shared_pool_client():
+    pool = HttpClientPool(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=_PAYLOAD)))
+    resolver = ProductSearchResolver(client_pool=pool)
+    clients: list[httpx.AsyncClient] = []
+
+    async def scenario():
+        for query in ("tee", "joggers"):
+            await resolver._suggest_json(query, 5)
+            clients.append(pool.client())
+        await pool.aclose()
+
+    asyncio.run(scenario())
+
+    assert clients[0] is clients[1] and clients[0].is_closed
+
+
+def test_suggest_json_disabled_without_pool():
+    resolver = ProductSearchResolver()
+
+    assert asyncio.run(resolver._suggest_json("tee", 5)) == []
@@ -0,0 +1,136 @@
+# tests/parsers/test_shopify_collection_provider.py
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.infrastructure.availability.availability_manager import AvailabilityManager
+from app.infrastructure.parsers.collections.shopify_collection_provider import (
+    ShopifyCollectionJsonProvider,
+    products_json_base,
+    variants_to_stock,
+)
+from app.infrastructure.web.http_client_pool import HttpClientPool
+from app.shared.cache.product_hints_cache import ProductHint, ProductHintsCache
+
+PRODUCT = {
+    "handle": "w3155-tee",
+    "title": "W3155 Tee",
+    "options": [{"name": "Color"}, {"name": "Size"}],
+    "images": [{"src": "//cdn.shopify.com/a.jpg"}, {"src": "https://cdn.shopify.com/b.jpg"}],
+    "variants": [
+        {"option1": "Black", "option2": "S", "available": True, "price": "32.00"},
+        {"option1": "Black", "option2": "M", "available": False, "price": "32.00"},
+        {"option1": "White", "option2": "S", "available": True, "price": "32.00"},
+    ],
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_hints_cache(monkeypatch):
+    """🧷 Кожен тест — з власним синглтоном; після тесту повертається попередній."""
+    monkeypatch.setattr(ProductHintsCache, "_instance", None)
+
+
+class _UrlParser:
+    def normalize(self, url):
+        return url
+
+
+class _Fallback:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_product_links(self):
+        self.calls += 1
+        return ["https://www.youngla.com/products/from-dom"]
+
+
+def _provider(handler, url="https://www.youngla.com/collections/men"):
+    fallback = _Fallback()
+    provider = ShopifyCollectionJsonProvider(
+        url,
+        fallback=fallback,
+        url_parser_service=_UrlParser(),
+        hints_cache=ProductHintsCache(),
+        client_pool=HttpClientPool(transport=httpx.MockTransport(handler)),
+    )
+    return provider, fallback
+
+
+def test_products_json_base_keeps_region_prefix():
+    assert products_json_base("https://uk.youngla.com/en/collections/men/?x=1") == (
+        "https://uk.youngla.com/en/collections/men/products.json"
+    )
+    assert products_json_base("https://www.youngla.com/products/x") is None
+
+
+def test_variants_to_stock_maps_color_and_size():
+    assert variants_to_stock(PRODUCT) == {"Black": {"S": True, "M": False}, "White": {"S": True}}
+
+
+def test_json_links_seed_hints_without_fallback():
+    pages = []
+
+    def handler(request):
+        pages.append(request.url.params["page"])
+        products = [PRODUCT] if request.url.params["page"] == "1" else []
+        return httpx.Response(200, json={"products": products})
+
+    provider, fallback = _provider(handler)
+    links = asyncio.run(provider.get_product_links())
+
+    assert links == ["https://www.youngla.com/products/w3155-tee"]
+    assert provider.source == "json" and fallback.calls == 0
+    assert pages == ["1"]  # 🏁 Неповна сторінка — далі не йдемо
+    hint = ProductHintsCache().get("https://www.youngla.com/products/w3155-tee/")
+    assert hint is not None and hint.title == "W3155 Tee"
+    assert hint.images == ("https://cdn.shopify.com/a.jpg", "https://cdn.shopify.com/b.jpg")
+    assert hint.price == "32.00"
+
+
+def test_http_error_and_filters_fall_back_to_dom():
+    provider, fallback = _provider(lambda request: httpx.Response(404))
+    assert asyncio.run(provider.get_product_links()) == ["https://www.youngla.com/products/from-dom"]
+    assert provider.source == "fallback"
+
+    calls = []
+    filtered, fallback2 = _provider(
+        lambda request: calls.append(request) or httpx.Response(200, json={"products": [PRODUCT]}),
+        url="https://www.youngla.com/collections/men?filter.v.option.size=M",
+    )
+    asyncio.run(filtered.get_product_links())
+    assert calls == [] and fallback2.calls == 1
+
+
+def test_seeded_stock_skips_region_page_and_config_applies_to_singleton():
+    cache = ProductHintsCache()
+    ProductHintsCache(max_entries=1)                                       # ⚙️ Конфіг діє і на готовий синглтон
+    assert cache._max == 1
+    ProductHintsCache(max_entries=2048)
+    cache.put(ProductHint(url="https://www.youngla.com/products/w3155-tee", handle="w3155-tee",
+                          title="W3155 Tee", stock={"Black": {"S": True, "M": False}}))
+
+    parsed = []
+
+    class _Factory:
+        def create_product_parser(self, url, **kwargs):
+            parsed.append(url)
+
+            async def _info():
+                return SimpleNamespace(title="W3155 Tee", stock_data={"Black": {"S": False}})
+
+            return SimpleNamespace(get_product_info=_info)
+
+    settings = {"regions": {"us": {}, "eu": {}}}
+    config = SimpleNamespace(get=lambda key, default=None, cast=None: settings.get(key, default))
+    hosts = {"us": "https://www.youngla.com", "eu": "https://eu.youngla.com"}
+    url_parser = SimpleNamespace(build_product_url=lambda region, path: f"{hosts[region]}/products/{path}")
+    manager = AvailabilityManager(None, _Factory(), None, None, config, url_parser)
+
+    us = asyncio.run(manager._fetch_region_data("us", "w3155-tee"))
+    eu = asyncio.run(manager._fetch_region_data("eu", "w3155-tee"))
+    assert parsed == ["https://eu.youngla.com/products/w3155-tee"]     # 🧷 US — з підказки, без сторінки
+    assert {size: status.value for size, status in us.stock_data["Black"].items()} == {"S": "yes", "M": "no"}
+    assert eu.stock_data["Black"]["S"].value == "no"
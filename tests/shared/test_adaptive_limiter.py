@@ -0,0 +1,81 @@
+# 🧪 tests/shared/test_adaptive_limiter.py
+"""
+🧪 AIMD-обмежувач паралелізму та його використання в CollectionRunner.
+
+Перевіряє:
+- здорове насичене вікно піднімає ліміт на 1 (не вище max), тротлінг ріже його один раз на покоління;
+- повільне вікно (p95 вище цілі) зменшує ліміт, але не нижче min;
+- CollectionRunner знижує ліміт на 429 і не перевищує його під час обробки.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.bot.handlers.product.collection_runner import CollectionRunner
+from app.shared.utils.adaptive_limiter import AdaptiveConcurrencyLimiter, AdaptiveLimitSettings, LimiterSignal
+
+
+def _limiter(**kwargs):
+    published = []
+    settings = AdaptiveLimitSettings(**{"initial": 2, "min_limit": 1, "max_limit": 3, "window": 2, "target_p95_sec": 1.0, **kwargs})
+    return AdaptiveConcurrencyLimiter(settings, on_change=published.append), published
+
+
+def test_additive_increase_and_single_decrease_per_epoch():
+    limiter, published = _limiter()
+
+    async def scenario():
+        for _ in range(3):                                               # 📈 Три здорові насичені вікна
+            first, second = await limiter.acquire(), await limiter.acquire()
+            limiter.record(first, 0.1, LimiterSignal.OK)
+            limiter.record(second, 0.2, LimiterSignal.OK)
+            await limiter.release()
+            await limiter.release()
+        assert limiter.limit == 3                                        # ⬆️ Уперлися в max
+
+        async with limiter.slot() as early, limiter.slot() as late:
+            limiter.record(early, 0.1, LimiterSignal.THROTTLED)
+            limiter.record(late, 0.1, LimiterSignal.THROTTLED)           # 🕰️ Те саме покоління — без повторного зрізу
+        assert limiter.limit == 1
+
+    asyncio.run(scenario())
+    assert published == [2, 3, 1]
+
+
+def test_slow_window_decreases_down_to_min():
+    limiter, _ = _limiter(initial=3, min_limit=2)
+
+    async def scenario():
+        for _ in range(2):
+            async with limiter.slot() as permit:
+                limiter.record(permit, 5.0, LimiterSignal.OK)
+                limiter.record(permit, 5.0, LimiterSignal.OK)
+
+    asyncio.run(scenario())
+    assert limiter.limit == 2
+
+
+def test_runner_backs_off_on_rate_limit():
+    limiter, published = _limiter(initial=4, max_limit=4, window=100)
+    active = {"now": 0, "peak_after_throttle": 0}
+
+    class _Handler:
+        async def handle_url(self, update, context, *, url, **kwargs):
+            active["now"] += 1
+            if published[-1] == 2:
+                active["peak_after_throttle"] = max(active["peak_after_throttle"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            if url.endswith("/0"):
+                raise RuntimeError("HTTP 429 Too Many Requests")
+            return SimpleNamespace(result=SimpleNamespace(ok=False, error_message="немає даних"), media_stack=None)
+
+    async def _noop(snapshot):
+        return None
+
+    urls = [f"https://www.youngla.com/products/{i}" for i in range(12)]
+    runner = CollectionRunner(_Handler(), per_item_retries=0, limiter=limiter)
+    asyncio.run(runner.run(None, None, urls, _noop, lambda: False))
+
+    assert published == [4, 2]
+    assert 0 < active["peak_after_throttle"] <= 4 and limiter.in_flight == 0
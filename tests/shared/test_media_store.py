@@ -0,0 +1,69 @@
+# 🧪 tests/shared/test_media_store.py
+"""
+🧪 Спільне контентно-адресоване сховище зображень.
+
+Перевіряє:
+- два ImageDownloader зі спільним MediaStore качають URL один раз (fetch і download_info);
+- однаковий вміст під різними URL — один блоб; індекс переживає перезапуск;
+- LRU-межа розміру витісняє найдавніше використані блоби, TTL робить URL застарілим.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+from app.infrastructure.size_chart.image_downloader import DownloadResult, ImageData, ImageDownloader
+from app.infrastructure.web.http_client_pool import HttpClientPool
+from app.shared.cache.media_store import MediaStore
+
+URL = "https://cdn.shopify.com/files/chart.png"
+PNG = b"\x89PNG\r\n\x1a\n" + b"x" * 64
+
+
+class _Network(ImageDownloader):
+    """📡 ImageDownloader без мережі: рахує «справжні» завантаження."""
+
+    def __init__(self, calls, **kwargs):
+        super().__init__(client_pool=HttpClientPool(), **kwargs)          # 🔌 Клієнт лінивий — мережі не буде
+        self.calls = calls
+
+    async def _run_with_retries(self, *, img_url, handler, output_path=None):
+        self.calls.append(img_url)
+        if output_path is None:
+            return ImageData(url=img_url, content=PNG, sha256="", content_type="image/png")
+        Path(output_path).write_bytes(PNG)
+        return DownloadResult(output_path, "image/png", len(PNG), len(PNG), None)
+
+
+def test_downloaders_share_one_fetch_per_url(tmp_path):
+    store = MediaStore(tmp_path / "store")
+    calls = []
+    cards, charts = _Network(calls, media_store=store), _Network(calls, media_store=store)
+
+    first = asyncio.run(cards.fetch(URL))
+    again = asyncio.run(cards.fetch(URL))
+    chart = asyncio.run(charts.download_info(URL, tmp_path / "tmp" / "download_0.png"))
+
+    assert calls == [URL]
+    assert again.content == first.content == PNG and again.sha256 == store.lookup(URL).digest
+    assert chart.path.read_bytes() == PNG and chart.sha256 == again.sha256
+
+    asyncio.run(charts.download_info("https://cdn.shopify.com/other.png", tmp_path / "tmp" / "download_1.png"))
+    assert len(list((tmp_path / "store" / "blobs").rglob("*"))) == 3          # 📁 ab/ + cd/ + один блоб
+    assert MediaStore(tmp_path / "store").lookup("https://cdn.shopify.com/other.png").digest == again.sha256
+
+
+def test_lru_budget_and_ttl(tmp_path):
+    store = MediaStore(tmp_path, max_bytes=250)
+    store.put("u1", b"1" * 100, content_type="image/png")
+    store.put("u2", b"2" * 100, content_type="image/png")
+    assert store.lookup("u1")                                               # 🧮 u1 — свіжіше використаний
+    store.put("u3", b"3" * 100, content_type="image/png")
+
+    assert store.lookup("u2") is None
+    assert store.lookup("u1") and store.lookup("u3")
+
+    short = MediaStore(tmp_path / "ttl", ttl_sec=0.01)
+    short.put("u", b"data", content_type=None)
+    time.sleep(0.02)
+    assert short.lookup("u") is None
@@ -0,0 +1,98 @@
+# 🧪 tests/shared/test_single_flight.py
+"""
+🧪 Single-flight реєстр спільної роботи та його використання в CollectionRunner.
+
+Перевіряє:
+- однакові ключі виконуються один раз, різні — окремо; помилка не кешується;
+- без активного реєстру фабрика виконується напряму;
+- товари колекції з однаковим промптом роблять один виклик LLM, а health-звіт рахує дедуплікації.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import app.bot.handlers  # noqa: F401 — bot-пакет першим, щоб уникнути циклічного імпорту
+from app.bot.handlers.product.collection_runner import CollectionRunner
+from app.infrastructure.content.alt_text_generator import AltTextGenerator
+from app.shared.utils.single_flight import SingleFlightRegistry, activate, fingerprint, single_flight
+
+
+def test_registry_runs_identical_work_once():
+    registry = SingleFlightRegistry()
+    calls = []
+
+    async def _work(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    async def _failing():
+        calls.append("boom")
+        raise RuntimeError("boom")
+
+    async def scenario():
+        results = await asyncio.gather(
+            *(registry.run("ocr", key, lambda key=key: _work(key)) for key in ["a", "a", "b", "a"])
+        )
+        assert results == ["A", "A", "B", "A"]
+        assert await registry.run("ocr", "a", lambda: _work("a")) == "A"   # ♻️ Успіх живе до кінця запуску
+
+        for _ in range(2):
+            try:
+                await registry.run("ai", "x", _failing)
+            except RuntimeError:
+                pass
+
+    asyncio.run(scenario())
+    assert calls == ["a", "b", "boom", "boom"]                            # 🔁 Помилку повторили
+    assert registry.deduplicated == 3
+    assert registry.deduplicated_by_namespace() == {"ocr": 3}
+
+
+def test_single_flight_without_registry_runs_directly():
+    calls = []
+
+    async def _work():
+        calls.append(1)
+        return "ok"
+
+    async def scenario():
+        first = await single_flight("ai", "same", _work)
+        second = await single_flight("ai", "same", _work)
+        with activate(SingleFlightRegistry()):
+            pass
+        third = await single_flight("ai", "same", _work)                  # 🧵 Реєстр більше не активний
+        return first, second, third
+
+    assert asyncio.run(scenario()) == ("ok", "ok", "ok")
+    assert calls == [1, 1, 1]
+    assert fingerprint("sha", "general") != fingerprint("sha", "men")
+
+
+def test_collection_run_shares_identical_llm_calls():
+    llm_calls = []
+
+    class _OpenAI:
+        async def chat_completion(self, prompt):
+            llm_calls.append(prompt)
+            await asyncio.sleep(0.01)
+            return '["Фото спереду"]'
+
+    prompts = SimpleNamespace(raw_prompt=lambda name, lang: "{title} {description} {features}")
+    generator = AltTextGenerator(_OpenAI(), prompts, max_concurrency=4)
+
+    class _Handler:
+        async def handle_url(self, update, context, *, url, **kwargs):
+            product = SimpleNamespace(title="Tee", description="Cotton", sections={})
+            await generator.generate(product, [f"{url}/front.jpg"])
+            return SimpleNamespace(result=SimpleNamespace(ok=False, error_message="немає даних"), media_stack=None)
+
+    async def _noop(snapshot):
+        return None
+
+    urls = [f"https://www.youngla.com/products/{i}" for i in range(5)]
+    runner = CollectionRunner(_Handler(), concurrency=5, per_item_retries=0)
+    _, health = asyncio.run(runner.run(None, None, urls, _noop, lambda: False))
+
+    assert len(llm_calls) == 1
+    assert health.deduplicated == 4
@@ -0,0 +1,145 @@
+# 🧪 tests/shared/test_tracing.py
+"""
+🧪 Трасування запитів.
+
+Перевіряє:
+- паралельні етапи ProductProcessingService потрапляють в один трейс зі спанами AI/наявності;
+- JSONL-приймач пише трейс рядком, водоспад показує вкладені спани;
+- `recent_slow` фільтрує за порогом, а спан без трейсу — no-op;
+- `/traces` без `admin_user_ids` недоступна нікому, з ними — лише адмінам.
+"""
+
+import asyncio
+import json
+from decimal import Decimal
+from types import SimpleNamespace
+
+import app.bot.handlers  # noqa: F401  — bot-пакет першим: services ↔ bot.handlers імпортуються циклічно
+from app.bot.commands.traces_feature import TracesFeature
+from app.bot.ui import static_messages as msg
+from app.domain.products.entities import ProductInfo
+from app.infrastructure.content.product_content_service import ContentBuildDiagnostics, ProductContentDTO
+from app.infrastructure.services.product_processing_service import ProductProcessingService
+from app.shared.tracing import (
+    STATUS_ERROR,
+    JsonlTraceSink,
+    Tracer,
+    configure_tracer,
+    current_trace_id,
+    get_tracer,
+    render_waterfall,
+    span,
+    traced,
+)
+
+URL = "https://www.youngla.com/products/4003"
+
+
+def _service():
+    class _Parser:
+        page_source = ""
+
+        async def get_product_info(self):
+            return await traced("fetch", asyncio.sleep(0, ProductInfo(title="Essential Tee", price=Decimal("40"))))
+
+    class _Availability:
+        async def process(self, url):
+            await asyncio.gather(traced("availability.US", asyncio.sleep(0.01)), traced("availability.UK", asyncio.sleep(0.01)))
+            return SimpleNamespace(reports=SimpleNamespace(public_report="Black: M"))
+
+    class _Content:
+        async def build_product_content(self, product, *, url, colors_text):
+            await traced("ai.slogan", asyncio.sleep(0))
+            dto = ProductContentDTO(
+                title=product.title, slogan="s", hashtags="#t", sections={}, colors_text=colors_text,
+                price_message="40$", images=["a.jpg"], alt_texts={}, alt_fallback_used=False,
+            )
+            return dto, ContentBuildDiagnostics(images_found=1, images_ready=1)
+
+    async def _recommend(dto):
+        return SimpleNamespace(raw_text="track")
+
+    return ProductProcessingService(
+        parser_factory=SimpleNamespace(create_product_parser=lambda url: _Parser()),
+        availability_processing_service=_Availability(),
+        content_service=_Content(),
+        music_recommendation=SimpleNamespace(recommend=_recommend),
+        url_parser_service=SimpleNamespace(get_region_label=lambda url: "US"),
+    )
+
+
+def test_process_url_records_nested_spans_and_writes_jsonl(tmp_path):
+    sink_path = tmp_path / "traces.jsonl"
+    previous = get_tracer()
+    tracer = configure_tracer(Tracer(JsonlTraceSink(sink_path)))
+    try:
+        result = asyncio.run(_service().process_url(URL))
+    finally:
+        configure_tracer(previous)
+
+    assert result.ok
+    (trace,) = tracer.recent()
+    assert trace.name == "product" and trace.attrs["url"] == URL
+    by_name = {s.name: s for s in trace.spans}
+    assert {"parse", "fetch", "availability", "availability.US", "availability.UK", "content", "ai.slogan", "music"} <= set(by_name)
+    assert by_name["fetch"].parent_id == by_name["parse"].span_id
+    assert by_name["availability.UK"].parent_id == by_name["availability"].span_id
+
+    (line,) = sink_path.read_text(encoding="utf-8").splitlines()
+    assert json.loads(line)["trace_id"] == trace.trace_id
+
+    waterfall = render_waterfall(trace)
+    assert "  availability.US" in waterfall and "█" in waterfall
+
+
+def test_recent_slow_and_noop_without_trace():
+    tracer = Tracer(keep=10)
+
+    with span("orphan") as record:
+        assert record is None and current_trace_id() is None
+
+    with tracer.trace("fast"):
+        pass
+    try:
+        with tracer.trace("slow") as trace:
+            trace.attrs["url"] = URL
+            asyncio.run(asyncio.sleep(0.02))
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    slow = tracer.recent_slow(5, min_ms=15)
+    assert [t.name for t in slow] == ["slow"]
+    assert slow[0].status == STATUS_ERROR
+    assert [t.name for t in tracer.recent_slow(5)] == ["slow", "fast"]
+
+
+def test_traces_command_is_closed_without_admin_ids():
+    tracer = Tracer(keep=10)
+    with tracer.trace("slow"):
+        pass
+    constants = SimpleNamespace(UI=SimpleNamespace(DEFAULT_PARSE_MODE="HTML"))
+
+    def _update(user_id):
+        replies = []
+
+        async def _reply(text, **kwargs):
+            replies.append(text)
+
+        message = SimpleNamespace(text="/traces", reply_text=_reply)
+        return SimpleNamespace(message=message, effective_user=SimpleNamespace(id=user_id)), replies
+
+    closed = TracesFeature(tracer, constants, SimpleNamespace())
+    admins = TracesFeature(tracer, constants, SimpleNamespace(), admin_user_ids=[42])
+
+    update, replies = _update(7)
+    asyncio.run(closed.show_traces(update, None))
+    assert replies == [msg.TRACES_FORBIDDEN]                              # 🔐 Порожній список — нікому
+
+    update, replies = _update(7)
+    asyncio.run(admins.show_traces(update, None))
+    assert replies == [msg.TRACES_FORBIDDEN]
+
+    update, replies = _update(42)
+    asyncio.run(admins.show_traces(update, None))
+    assert len(replies) == 1 and replies[0].startswith("<pre>")